@@ -15,6 +15,7 @@ from api.models import (
     conversation,  # noqa: F401
     file_ingestion,  # noqa: F401
     note,  # noqa: F401
+    semantic_chunk,  # noqa: F401
     user_memory,  # noqa: F401
     user_settings,  # noqa: F401
     website,  # noqa: F401
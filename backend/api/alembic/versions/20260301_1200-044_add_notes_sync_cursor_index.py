@@ -0,0 +1,32 @@
+"""Add keyset index for paginated notes sync.
+
+Revision ID: 044_add_notes_sync_cursor_index
+Revises: 043_add_websites_reading_time
+Create Date: 2026-03-01 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "044_add_notes_sync_cursor_index"
+down_revision: str | None = "043_add_websites_reading_time"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index notes by (user_id, updated_at, id) for cursor pagination."""
+    op.create_index(
+        "idx_notes_user_updated_id",
+        "notes",
+        ["user_id", "updated_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove the notes sync cursor index."""
+    op.drop_index(
+        "idx_notes_user_updated_id", table_name="notes", if_exists=True
+    )
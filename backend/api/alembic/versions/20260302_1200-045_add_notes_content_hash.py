@@ -0,0 +1,30 @@
+"""Add content_hash column to notes.
+
+Revision ID: 045_add_notes_content_hash
+Revises: 044_add_notes_sync_cursor_index
+Create Date: 2026-03-02 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "045_add_notes_content_hash"
+down_revision: str | None = "044_add_notes_sync_cursor_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add content_hash and backfill it from existing content."""
+    op.execute("ALTER TABLE notes ADD COLUMN IF NOT EXISTS content_hash text")
+    op.execute(
+        "UPDATE notes "
+        "SET content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex') "
+        "WHERE content_hash IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Remove content_hash column from notes."""
+    op.execute("ALTER TABLE notes DROP COLUMN IF EXISTS content_hash")
@@ -0,0 +1,39 @@
+"""Add prefix indexes for folder move and rename.
+
+Revision ID: 046_add_folder_prefix_indexes
+Revises: 045_add_notes_content_hash
+Create Date: 2026-03-03 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "046_add_folder_prefix_indexes"
+down_revision: str | None = "045_add_notes_content_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index file paths and note folders for LIKE 'prefix/%' lookups."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_ingested_files_user_path_prefix
+        ON ingested_files (user_id, path text_pattern_ops)
+        WHERE deleted_at IS NULL
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_notes_user_folder_prefix
+        ON notes (user_id, (metadata ->> 'folder') text_pattern_ops)
+        WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove folder prefix indexes."""
+    op.execute("DROP INDEX IF EXISTS idx_notes_user_folder_prefix")
+    op.execute("DROP INDEX IF EXISTS idx_ingested_files_user_path_prefix")
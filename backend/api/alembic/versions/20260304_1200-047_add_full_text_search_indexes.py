@@ -0,0 +1,57 @@
+"""Add full-text and trigram search indexes for notes and websites.
+
+Revision ID: 047_add_full_text_search_indexes
+Revises: 046_add_folder_prefix_indexes
+Create Date: 2026-03-04 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "047_add_full_text_search_indexes"
+down_revision: str | None = "046_add_folder_prefix_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+SEARCH_TABLES = ("notes", "websites")
+
+
+def upgrade() -> None:
+    """Add generated tsvector columns with GIN indexes, plus trigram indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table in SEARCH_TABLES:
+        op.execute(
+            f"""
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED
+            """
+        )
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_search_vector
+            ON {table} USING gin (search_vector)
+            """
+        )
+        # Substring fallback for ILIKE '%q%' on partial words.
+        for column in ("title", "content"):
+            op.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_{column}_trgm
+                ON {table} USING gin ({column} gin_trgm_ops)
+                """
+            )
+
+
+def downgrade() -> None:
+    """Remove full-text and trigram search indexes."""
+    for table in reversed(SEARCH_TABLES):
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_content_trgm")
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_title_trgm")
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
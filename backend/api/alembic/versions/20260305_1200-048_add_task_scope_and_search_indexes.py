@@ -0,0 +1,88 @@
+"""Add partial scope indexes and a search vector for tasks.
+
+idx_tasks_today_lookup from 035 was dropped along with scheduled_date in
+036, so the scope lists had no composite index left.
+
+Revision ID: 048_add_task_scope_and_search_indexes
+Revises: 047_add_full_text_search_indexes
+Create Date: 2026-03-05 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "048_add_task_scope_and_search_indexes"
+down_revision: str | None = "047_add_full_text_search_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+OPEN_TASKS_PREDICATE = "deleted_at IS NULL AND status NOT IN ('completed', 'trashed')"
+
+
+def upgrade() -> None:
+    """Add open/completed partial indexes and a GIN-indexed search vector."""
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_user_deadline
+        ON tasks (user_id, deadline, status)
+        WHERE {OPEN_TASKS_PREDICATE}
+        """
+    )
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_user_project
+        ON tasks (user_id, project_id)
+        WHERE {OPEN_TASKS_PREDICATE}
+        """
+    )
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_user_group
+        ON tasks (user_id, group_id)
+        WHERE {OPEN_TASKS_PREDICATE}
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_tasks_completed_user_completed_at
+        ON tasks (user_id, completed_at DESC)
+        WHERE deleted_at IS NULL AND status = 'completed'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE tasks
+        ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(notes, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_tasks_search_vector
+        ON tasks USING gin (search_vector)
+        """
+    )
+    # Trigram indexes for the ILIKE fallback (re-created if 035 was skipped).
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_title_trgm "
+        "ON tasks USING gin (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_notes_trgm "
+        "ON tasks USING gin (notes gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Remove task scope indexes and the search vector."""
+    op.execute("DROP INDEX IF EXISTS idx_tasks_search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP INDEX IF EXISTS idx_tasks_completed_user_completed_at")
+    op.execute("DROP INDEX IF EXISTS idx_tasks_open_user_group")
+    op.execute("DROP INDEX IF EXISTS idx_tasks_open_user_project")
+    op.execute("DROP INDEX IF EXISTS idx_tasks_open_user_deadline")
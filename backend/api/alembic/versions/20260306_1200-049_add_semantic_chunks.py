@@ -0,0 +1,95 @@
+"""Add semantic chunk embeddings for notes, websites and files.
+
+Embeddings are stored as real[]; when pgvector is available an HNSW index
+over the vector(512) cast serves nearest-neighbour queries.
+
+Revision ID: 049_add_semantic_chunks
+Revises: 048_add_task_scope_and_search_indexes
+Create Date: 2026-03-06 12:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "049_add_semantic_chunks"
+down_revision: str | None = "048_add_task_scope_and_search_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match api.services.embeddings.EMBEDDING_DIMENSIONS.
+EMBEDDING_DIMENSIONS = 512
+
+USER_ISOLATION_POLICY = """
+CREATE POLICY {policy}
+ON {table}
+USING (user_id = (SELECT current_setting('app.user_id', true)))
+WITH CHECK (user_id = (SELECT current_setting('app.user_id', true)))
+"""
+
+
+def upgrade() -> None:
+    """Create the semantic_chunks table, RLS policy and vector index."""
+    op.create_table(
+        "semantic_chunks",
+        sa.Column(
+            "id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False
+        ),
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("content_type", sa.Text(), nullable=False),
+        sa.Column("content_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("chunk_hash", sa.Text(), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("embedding", postgresql.ARRAY(sa.REAL()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "content_type",
+            "content_id",
+            "chunk_index",
+            name="uq_semantic_chunks_content_chunk",
+        ),
+    )
+    op.create_index(
+        "idx_semantic_chunks_user_content",
+        "semantic_chunks",
+        ["user_id", "content_type", "content_id"],
+    )
+
+    op.execute("ALTER TABLE semantic_chunks ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        "DROP POLICY IF EXISTS semantic_chunks_user_isolation ON semantic_chunks"
+    )
+    op.execute(
+        USER_ISOLATION_POLICY.format(
+            policy="semantic_chunks_user_isolation", table="semantic_chunks"
+        )
+    )
+
+    has_pgvector = (
+        op.get_bind()
+        .execute(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'"))
+        .scalar()
+    )
+    if has_pgvector:
+        op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS idx_semantic_chunks_embedding_hnsw
+            ON semantic_chunks
+            USING hnsw ((embedding::vector({EMBEDDING_DIMENSIONS})) vector_cosine_ops)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the semantic_chunks table and its policy."""
+    op.execute("DROP INDEX IF EXISTS idx_semantic_chunks_embedding_hnsw")
+    op.execute(
+        "DROP POLICY IF EXISTS semantic_chunks_user_isolation ON semantic_chunks"
+    )
+    op.execute("ALTER TABLE semantic_chunks DISABLE ROW LEVEL SECURITY")
+    op.drop_index("idx_semantic_chunks_user_content", table_name="semantic_chunks")
+    op.drop_table("semantic_chunks")
@@ -0,0 +1,35 @@
+"""Add a partial index for claiming queued ingestion jobs.
+
+Workers claim with status = 'queued', an expired or empty lease, ordered by
+updated_at. The partial index keeps that lookup (and the next-retry lookup)
+off the processed and failed rows that make up most of the table.
+
+Revision ID: 050_add_ingestion_claim_index
+Revises: 049_add_semantic_chunks
+Create Date: 2026-03-07 12:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "050_add_ingestion_claim_index"
+down_revision: str | None = "049_add_semantic_chunks"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the queued-job claim index."""
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_file_processing_jobs_queued_claim
+        ON file_processing_jobs (status, lease_expires_at, updated_at)
+        WHERE status = 'queued'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove the queued-job claim index."""
+    op.execute("DROP INDEX IF EXISTS idx_file_processing_jobs_queued_claim")
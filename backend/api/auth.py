@@ -1,10 +1,13 @@
 """Unified authentication for both MCP and REST endpoints."""
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import text
+from sqlalchemy import select, text
 
 from api.config import settings
 from api.models.user_settings import UserSettings
@@ -14,6 +17,59 @@ from api.supabase_jwt import JWTValidationError, SupabaseJWTValidator
 bearer_scheme = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
 
+# Shortcuts PAT -> (user_id, expires_at). Rotation invalidates the old token in
+# this process; the TTL bounds how long other workers keep accepting it.
+SHORTCUTS_PAT_CACHE_TTL_SECONDS = 60.0
+SHORTCUTS_PAT_CACHE_MAX_ENTRIES = 1024
+_shortcuts_pat_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_shortcuts_pat_lock = threading.Lock()
+
+
+def resolve_shortcuts_pat(token: str) -> str | None:
+    """Return the user ID that owns a Shortcuts PAT.
+
+    Args:
+        token: Shortcuts PAT (sb_pat_...).
+
+    Returns:
+        Owning user ID, or None if the token is unknown.
+    """
+    now = time.monotonic()
+    with _shortcuts_pat_lock:
+        cached = _shortcuts_pat_cache.get(token)
+        if cached and now < cached[1]:
+            _shortcuts_pat_cache.move_to_end(token)
+            return cached[0]
+
+    from api.db.session import SessionLocal
+
+    with SessionLocal() as db:
+        db.execute(text("SET app.pat_token = :token"), {"token": token})
+        user_id = db.execute(
+            select(UserSettings.user_id).where(UserSettings.shortcuts_pat == token)
+        ).scalar_one_or_none()
+    if not user_id:
+        return None
+
+    with _shortcuts_pat_lock:
+        _shortcuts_pat_cache[token] = (
+            user_id,
+            now + SHORTCUTS_PAT_CACHE_TTL_SECONDS,
+        )
+        _shortcuts_pat_cache.move_to_end(token)
+        while len(_shortcuts_pat_cache) > SHORTCUTS_PAT_CACHE_MAX_ENTRIES:
+            _shortcuts_pat_cache.popitem(last=False)
+    return user_id
+
+
+def invalidate_shortcuts_pat(token: str | None = None) -> None:
+    """Forget a cached Shortcuts PAT (or all of them when token is None)."""
+    with _shortcuts_pat_lock:
+        if token is None:
+            _shortcuts_pat_cache.clear()
+        else:
+            _shortcuts_pat_cache.pop(token, None)
+
 
 async def verify_bearer_token(
     request: Request,
@@ -38,23 +94,15 @@ async def verify_bearer_token(
 
     token = credentials.credentials
     if token.startswith("sb_pat_"):
-        from api.db.session import SessionLocal
-
-        with SessionLocal() as db:
-            db.execute(text("SET app.pat_token = :token"), {"token": token})
-            record = (
-                db.query(UserSettings)
-                .filter(UserSettings.shortcuts_pat == token)
-                .first()
-            )
-        if not record:
+        user_id = resolve_shortcuts_pat(token)
+        if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        request.state.user_id = record.user_id
-        return {"sub": record.user_id}
+        request.state.user_id = user_id
+        return {"sub": user_id}
 
     validator = SupabaseJWTValidator()
     try:
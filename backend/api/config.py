@@ -144,6 +144,28 @@ class Settings(BaseSettings):
     r2_access_key: str = ""
     r2_secret_access_key: str = ""
 
+    # Shared cache for chat prompt recent activity (redis:// URL); empty keeps
+    # a per-process in-memory cache.
+    recent_activity_cache_url: str = os.getenv("RECENT_ACTIVITY_CACHE_URL", "")
+
+    # Quiet period after task mutations before the tasks AI snapshot rebuilds.
+    tasks_snapshot_debounce_seconds: float = float(
+        os.getenv("TASKS_SNAPSHOT_DEBOUNCE_SECONDS", "5")
+    )
+
+    # Semantic index: embedder ("local" or "openai"; empty disables indexing),
+    # query backend ("auto", "pgvector" or "numpy") and the quiet period
+    # before changed notes/websites are re-embedded.
+    semantic_index_embedder: str = os.getenv("SEMANTIC_INDEX_EMBEDDER", "")
+    semantic_index_backend: str = os.getenv("SEMANTIC_INDEX_BACKEND", "auto")
+    semantic_index_delay_seconds: float = float(
+        os.getenv("SEMANTIC_INDEX_DELAY_SECONDS", "10")
+    )
+    openai_api_key: str = ""
+    openai_embedding_model: str = os.getenv(
+        "OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"
+    )
+
     # APNs push notifications
     apns_key_id: str | None = os.getenv("APNS_KEY_ID") or None
     apns_team_id: str | None = os.getenv("APNS_TEAM_ID") or None
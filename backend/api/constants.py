@@ -14,6 +14,8 @@ class ChatConstants:
     TITLE_MAX_WORDS = 5
     # Prevent tool loops while allowing multi-step workflows.
     MAX_TOOL_ROUNDS = 5
+    # Anthropic prompt-cache breakpoint (5 minute TTL, refreshed on each hit).
+    PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class PromptContextLimits:
@@ -27,3 +29,7 @@ class PromptContextLimits:
     MAX_OPEN_FILE_CHARS = 20000
     # Attachment payload cap for contextual snippets.
     MAX_ATTACHMENT_CHARS = 8000
+    # Parallel storage reads when loading open file and attachment content.
+    CONTEXT_FETCH_WORKERS = 8
+    # Truncated ai_md prefixes kept in memory (at most ~80KB each).
+    CONTENT_PREFIX_CACHE_MAX_ENTRIES = 64
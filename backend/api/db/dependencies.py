@@ -4,11 +4,9 @@ import os
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy import text
 
-from api.auth import bearer_scheme
+from api.auth import bearer_scheme, resolve_shortcuts_pat
 from api.config import settings
-from api.models.user_settings import UserSettings
 from api.supabase_jwt import JWTValidationError, SupabaseJWTValidator
 
 _test_user_id = os.getenv("TEST_USER_ID") if os.getenv("TESTING") else None
@@ -35,23 +33,15 @@ async def get_current_user_id(
 
     token = credentials.credentials
     if token.startswith("sb_pat_"):
-        from api.db.session import SessionLocal
-
-        with SessionLocal() as db:
-            db.execute(text("SET app.pat_token = :token"), {"token": token})
-            record = (
-                db.query(UserSettings)
-                .filter(UserSettings.shortcuts_pat == token)
-                .first()
-            )
-        if not record:
+        user_id = resolve_shortcuts_pat(token)
+        if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        request.state.user_id = record.user_id
-        return record.user_id
+        request.state.user_id = user_id
+        return user_id
 
     validator = SupabaseJWTValidator()
     try:
@@ -6,13 +6,14 @@ import time
 from collections.abc import Generator
 
 from fastapi import Depends
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
 
 from api.config import settings
 from api.db.dependencies import get_current_user_id
 from api.metrics import db_connections_active
+from api.request_stats import record_db_query
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +39,23 @@ engine = create_engine(
 )
 
 _slow_query_ms = settings.db_slow_query_ms
-if _slow_query_ms > 0:
 
-    @event.listens_for(engine, "before_cursor_execute")
-    def _track_query_start(conn, cursor, statement, parameters, context, executemany):
-        context._query_start_time = time.monotonic()
+
+# Registered on the Engine class so requests are charged for queries on any
+# engine (tests bind the app to their own).
+@event.listens_for(Engine, "before_cursor_execute")
+def _track_query_start(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.monotonic()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_request_query(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start_time", None)
+    if start is not None:
+        record_db_query(time.monotonic() - start)
+
+
+if _slow_query_ms > 0:
 
     @event.listens_for(engine, "after_cursor_execute")
     def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
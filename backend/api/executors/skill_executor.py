@@ -7,10 +7,12 @@ import os
 import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from api.config import settings
+from api.request_stats import record_skill_execution
 from api.security.audit_logger import AuditLogger
 
 logger = logging.getLogger(__name__)
@@ -179,15 +181,19 @@ class SkillExecutor:
                         env[key] = os.environ[key]
 
                 # Execute with strict timeout and no shell
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    timeout=settings.skill_timeout_seconds,
-                    shell=False,  # Explicit: never use shell
-                    cwd=self.workspace_base,  # Run in workspace (not skills dir)
-                )
+                run_start = time.monotonic()
+                try:
+                    result = subprocess.run(
+                        cmd,
+                        capture_output=True,
+                        text=True,
+                        env=env,
+                        timeout=settings.skill_timeout_seconds,
+                        shell=False,  # Explicit: never use shell
+                        cwd=self.workspace_base,  # Run in workspace (not skills dir)
+                    )
+                finally:
+                    record_skill_execution(time.monotonic() - run_start)
 
                 # Enforce output size limits
                 stdout_bytes = len(result.stdout.encode("utf-8"))
@@ -289,3 +295,16 @@ class SkillExecutor:
                     user_id=user_id,
                 )
                 return {"success": False, "error": error_msg}
+
+
+@lru_cache(maxsize=1)
+def get_skill_executor() -> SkillExecutor:
+    """Return the process-wide skill executor.
+
+    Sharing one executor keeps skill_max_concurrent a global limit rather
+    than a per-request one.
+
+    Returns:
+        Shared SkillExecutor instance.
+    """
+    return SkillExecutor(settings.skills_dir, settings.workspace_base)
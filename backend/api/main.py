@@ -1,8 +1,8 @@
 """sideBar Skills API - FastAPI + MCP integration."""
 
+import asyncio
 import logging
 import os
-import time
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from types import ModuleType
@@ -13,13 +13,13 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastmcp import FastMCP
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError, OperationalError
 
 from api.config import settings
 from api.exceptions import APIError
-from api.executors.skill_executor import SkillExecutor
+from api.executors.skill_executor import get_skill_executor
 from api.mcp.tools import register_mcp_tools
+from api.middleware.auth import AuthMiddleware, RequestLogMiddleware
 from api.middleware.deprecation import DeprecationMiddleware
 from api.middleware.error_handler import (
     api_error_handler,
@@ -28,7 +28,6 @@ from api.middleware.error_handler import (
     unhandled_exception_handler,
 )
 from api.middleware.metrics import MetricsMiddleware
-from api.models.user_settings import UserSettings
 from api.routers import (
     chat,
     conversations,
@@ -41,6 +40,7 @@ from api.routers import (
     notes,
     places,
     scratchpad,
+    search,
     skills,
     tasks,
     weather,
@@ -48,7 +48,11 @@ from api.routers import (
 )
 from api.routers import settings as user_settings
 from api.security.path_validator import PathValidator
-from api.supabase_jwt import JWTValidationError, SupabaseJWTValidator
+from api.services.claude_client import ClaudeClient
+from api.services.semantic_index_service import get_semantic_index_scheduler
+from api.services.tasks_snapshot_scheduler import get_tasks_snapshot_scheduler
+from api.services.tool_mapper import ToolMapper
+from api.services.upstream_http import close_upstream_http_client
 
 sentry_fastapi_module: ModuleType | None
 try:  # pragma: no cover - depends on sentry_sdk version
@@ -84,16 +88,6 @@ if settings.sentry_dsn:
     )
 
 
-def _auth_error(
-    status_code: int, code: str, message: str, headers: dict | None = None
-) -> JSONResponse:
-    return JSONResponse(
-        status_code=status_code,
-        content={"error": {"code": code, "message": message, "details": {}}},
-        headers=headers,
-    )
-
-
 # Create FastMCP server and get its HTTP app
 mcp = FastMCP("sidebar-skills")
 register_mcp_tools(mcp)
@@ -107,15 +101,23 @@ async def lifespan(app: FastAPI):
     # Use MCP's lifespan context
     async with mcp_app.lifespan(app):
         # Initialize our app state
-        app.state.executor = SkillExecutor(
-            skills_dir=settings.skills_dir, workspace_base=settings.workspace_base
-        )
+        app.state.executor = get_skill_executor()
         app.state.path_validator = PathValidator(
             workspace_base=settings.workspace_base,
             writable_paths=settings.writable_paths,
         )
-        yield
-        # Cleanup happens here if needed
+        app.state.tool_mapper = ToolMapper(executor=app.state.executor)
+        app.state.claude_client = ClaudeClient(
+            settings, tool_mapper=app.state.tool_mapper
+        )
+        try:
+            yield
+        finally:
+            await app.state.claude_client.aclose()
+            await close_upstream_http_client()
+            get_tasks_snapshot_scheduler().shutdown()
+            # Index pending edits now; nothing re-queues them after a restart.
+            await asyncio.to_thread(get_semantic_index_scheduler().flush)
 
 
 # Create main FastAPI app with combined lifespan
@@ -156,108 +158,11 @@ app.add_middleware(DeprecationMiddleware)
 app.add_middleware(MetricsMiddleware)
 
 # Optional request tracing for debugging hangs/timeouts.
-_log_requests = os.getenv("LOG_REQUESTS", "").lower() in {"1", "true", "yes", "on"}
-
-if _log_requests:
-    request_logger = logging.getLogger("api.request")
-
-    @app.middleware("http")
-    async def request_log_middleware(request: Request, call_next):
-        """Log request start/end with latency for debugging."""
-        request_logger.info(
-            "Request start %s %s",
-            request.method,
-            request.url.path,
-        )
-        start = time.monotonic()
-        try:
-            response = await call_next(request)
-        except Exception:
-            request_logger.exception(
-                "Request failed %s %s",
-                request.method,
-                request.url.path,
-            )
-            raise
-        else:
-            elapsed_ms = int((time.monotonic() - start) * 1000)
-            request_logger.info(
-                "Request end %s %s %s %sms",
-                request.method,
-                request.url.path,
-                response.status_code,
-                elapsed_ms,
-            )
-            return response
-
-
-# Unified authentication middleware
-@app.middleware("http")
-async def auth_middleware(request: Request, call_next):
-    """Apply JWT auth to all endpoints except health/metrics."""
-    # Skip auth for health check + metrics
-    if request.url.path in {"/api/health", "/api/v1/health", "/metrics"}:
-        response = await call_next(request)
-        return response
-
-    if settings.auth_dev_mode:
-        if not settings.allow_auth_dev_mode:
-            logger.warning("AUTH_DEV_MODE is enabled outside local/test environment.")
-            return _auth_error(
-                403, "AUTH_DEV_MODE_FORBIDDEN", "AUTH_DEV_MODE requires APP_ENV=local"
-            )
-        response = await call_next(request)
-        return response
-
-    # Check for Authorization header
-    auth_header = request.headers.get("Authorization")
-    if not auth_header:
-        return _auth_error(
-            401,
-            "MISSING_AUTHORIZATION",
-            "Missing Authorization header",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    # Verify JWT token or Shortcuts PAT
-    try:
-        scheme, token = auth_header.split()
-        if scheme.lower() != "bearer":
-            raise ValueError("Invalid scheme")
-        if token.startswith("sb_pat_"):
-            from api.db.session import SessionLocal
-
-            with SessionLocal() as db:
-                db.execute(text("SET app.pat_token = :token"), {"token": token})
-                settings_record = (
-                    db.query(UserSettings)
-                    .filter(UserSettings.shortcuts_pat == token)
-                    .first()
-                )
-            if not settings_record:
-                return _auth_error(
-                    401,
-                    "INVALID_API_TOKEN",
-                    "Invalid API token",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            request.state.user_id = settings_record.user_id
-        else:
-            validator = SupabaseJWTValidator()
-            payload = await validator.validate_token(token)
-            request.state.user_id = payload.get("sub")
-            if not request.state.user_id:
-                raise JWTValidationError("Missing user ID")
-    except (ValueError, AttributeError, JWTValidationError):
-        return _auth_error(
-            401,
-            "INVALID_AUTHORIZATION",
-            "Invalid Authorization header",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+if os.getenv("LOG_REQUESTS", "").lower() in {"1", "true", "yes", "on"}:
+    app.add_middleware(RequestLogMiddleware)
 
-    response = await call_next(request)
-    return response
+# Unified authentication middleware (outermost)
+app.add_middleware(AuthMiddleware)
 
 
 # Add REST routers BEFORE mounting MCP (auth handled by middleware)
@@ -275,6 +180,7 @@ app.include_router(places.router, prefix="/api/v1", tags=["places"])
 app.include_router(skills.router, prefix="/api/v1", tags=["skills"])
 app.include_router(weather.router, prefix="/api/v1", tags=["weather"])
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
+app.include_router(search.router, prefix="/api/v1", tags=["search"])
 app.include_router(events.router, prefix="/api/v1", tags=["events"])
 app.include_router(device_tokens.router, prefix="/api/v1", tags=["device-tokens"])
 
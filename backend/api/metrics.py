@@ -17,6 +17,43 @@ http_request_duration_seconds = Histogram(
     ["method", "endpoint"],
 )
 
+# Per-request resource metrics (see api.request_stats)
+_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250, 500)
+
+http_request_db_queries = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    ["method", "endpoint"],
+    buckets=_COUNT_BUCKETS,
+)
+
+http_request_db_duration_seconds = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per request",
+    ["method", "endpoint"],
+)
+
+http_request_storage_operations = Histogram(
+    "http_request_storage_operations",
+    "Storage backend calls per request",
+    ["method", "endpoint"],
+    buckets=_COUNT_BUCKETS,
+)
+
+http_request_storage_bytes = Histogram(
+    "http_request_storage_bytes",
+    "Storage bytes read or written per request",
+    ["method", "endpoint"],
+    buckets=(0, 1024, 16384, 131072, 1048576, 8388608, 67108864),
+)
+
+http_request_skill_executions = Histogram(
+    "http_request_skill_executions",
+    "Skill subprocess executions per request",
+    ["method", "endpoint"],
+    buckets=(0, 1, 2, 3, 5, 10),
+)
+
 # Chat metrics
 chat_messages_total = Counter(
     "chat_messages_total",
@@ -50,6 +87,12 @@ chat_tool_duration_seconds = Histogram(
     ["tool_name", "status"],
 )
 
+chat_prompt_tokens_total = Counter(
+    "chat_prompt_tokens_total",
+    "Chat prompt input tokens by prompt-cache outcome",
+    ["cache"],
+)
+
 # Tool execution metrics
 tool_executions_total = Counter(
     "tool_executions_total",
@@ -63,6 +106,13 @@ tool_execution_duration_seconds = Histogram(
     ["skill_id"],
 )
 
+# Search metrics
+universal_search_provider_duration_seconds = Histogram(
+    "universal_search_provider_duration_seconds",
+    "Universal search provider latency",
+    ["content_type", "status"],
+)
+
 # Database metrics
 db_connections_active = Gauge(
     "db_connections_active",
@@ -0,0 +1,137 @@
+"""Authentication and request logging middleware."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from api.auth import resolve_shortcuts_pat
+from api.config import settings
+from api.supabase_jwt import JWTValidationError, SupabaseJWTValidator
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+request_logger = logging.getLogger("api.request")
+
+PUBLIC_PATHS = {"/api/health", "/api/v1/health", "/metrics"}
+
+
+def _auth_error(
+    status_code: int, code: str, message: str, headers: dict | None = None
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"code": code, "message": message, "details": {}}},
+        headers=headers,
+    )
+
+
+async def _authenticate(scope: Scope) -> JSONResponse | None:
+    """Resolve the caller's user ID into the request state.
+
+    Returns:
+        An error response when the request is not authenticated, else None.
+    """
+    if settings.auth_dev_mode:
+        if not settings.allow_auth_dev_mode:
+            logger.warning("AUTH_DEV_MODE is enabled outside local/test environment.")
+            return _auth_error(
+                403, "AUTH_DEV_MODE_FORBIDDEN", "AUTH_DEV_MODE requires APP_ENV=local"
+            )
+        return None
+
+    # Check for Authorization header
+    auth_header = Headers(scope=scope).get("Authorization")
+    if not auth_header:
+        return _auth_error(
+            401,
+            "MISSING_AUTHORIZATION",
+            "Missing Authorization header",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Verify JWT token or Shortcuts PAT
+    state = scope.setdefault("state", {})
+    try:
+        scheme, token = auth_header.split()
+        if scheme.lower() != "bearer":
+            raise ValueError("Invalid scheme")
+        if token.startswith("sb_pat_"):
+            pat_user_id = resolve_shortcuts_pat(token)
+            if not pat_user_id:
+                return _auth_error(
+                    401,
+                    "INVALID_API_TOKEN",
+                    "Invalid API token",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            state["user_id"] = pat_user_id
+        else:
+            validator = SupabaseJWTValidator()
+            payload = await validator.validate_token(token)
+            state["user_id"] = payload.get("sub")
+            if not state["user_id"]:
+                raise JWTValidationError("Missing user ID")
+    except (ValueError, AttributeError, JWTValidationError):
+        return _auth_error(
+            401,
+            "INVALID_AUTHORIZATION",
+            "Invalid Authorization header",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return None
+
+
+class AuthMiddleware:
+    """Apply JWT/PAT auth to all HTTP endpoints except health and metrics."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject unauthenticated requests before they reach the app."""
+        if scope["type"] == "http" and scope["path"] not in PUBLIC_PATHS:
+            error = await _authenticate(scope)
+            if error is not None:
+                await error(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class RequestLogMiddleware:
+    """Log request start/end with latency for debugging hangs/timeouts."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log around the downstream app; the end line is written at first byte."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        request_logger.info("Request start %s %s", method, path)
+        start = time.monotonic()
+
+        async def send_with_log(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = int((time.monotonic() - start) * 1000)
+                request_logger.info(
+                    "Request end %s %s %s %sms",
+                    method,
+                    path,
+                    message["status"],
+                    elapsed_ms,
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_log)
+        except Exception:
+            request_logger.exception("Request failed %s %s", method, path)
+            raise
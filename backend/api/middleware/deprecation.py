@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -24,27 +24,44 @@ DEPRECATED_PATHS = {
 }
 
 
-class DeprecationMiddleware(BaseHTTPMiddleware):
+def _deprecated_prefix(path: str) -> tuple[str, str] | None:
+    for old_path, new_path in DEPRECATED_PATHS.items():
+        if path.startswith(old_path):
+            return old_path, new_path
+    return None
+
+
+class DeprecationMiddleware:
     """Add deprecation warnings to legacy endpoints."""
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle request and append deprecation warnings when needed."""
-        path = request.url.path
-
-        for old_path, new_path in DEPRECATED_PATHS.items():
-            if path.startswith(old_path):
-                logger.warning(
-                    "Deprecated API path used",
-                    extra={
-                        "path": path,
-                        "client": request.client.host if request.client else None,
-                    },
-                )
-                response = await call_next(request)
-                response.headers["X-API-Deprecated"] = "true"
-                response.headers["X-API-Deprecated-Path"] = old_path
-                response.headers["X-API-New-Path"] = new_path
-                response.headers["X-API-Sunset-Date"] = "2026-06-01"
-                return response
-
-        return await call_next(request)
+        match = _deprecated_prefix(scope["path"]) if scope["type"] == "http" else None
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        old_path, new_path = match
+        client = scope.get("client")
+        logger.warning(
+            "Deprecated API path used",
+            extra={
+                "path": scope["path"],
+                "client": client[0] if client else None,
+            },
+        )
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-API-Deprecated"] = "true"
+                headers["X-API-Deprecated-Path"] = old_path
+                headers["X-API-New-Path"] = new_path
+                headers["X-API-Sunset-Date"] = "2026-06-01"
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
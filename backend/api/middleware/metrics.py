@@ -4,32 +4,76 @@ from __future__ import annotations
 
 import time
 
-from api.metrics import http_request_duration_seconds, http_requests_total
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from api.config import settings
+from api.metrics import (
+    http_request_db_duration_seconds,
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_request_skill_executions,
+    http_request_storage_bytes,
+    http_request_storage_operations,
+    http_requests_total,
+)
+from api.request_stats import RequestStats, server_timing_header, track_request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Collect request metrics."""
+class MetricsMiddleware:
+    """Collect request metrics.
+
+    Request duration is measured to the start of the response, so long-lived
+    SSE streams report their time to first byte. Resource histograms are
+    observed once the body has been sent and include work done while
+    streaming; the Server-Timing header only covers work before the headers.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Record request metrics around the downstream app."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
-        """Record request metrics around the downstream handler."""
         start_time = time.time()
-        response = await call_next(request)
-        duration = time.time() - start_time
+        status_code = 500
+        duration: float | None = None
+
+        with track_request() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code, duration
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    duration = time.time() - start_time
+                    if settings.app_env not in {"prod", "production"}:
+                        MutableHeaders(scope=message).append(
+                            "Server-Timing", server_timing_header(stats, duration)
+                        )
+                await send(message)
 
-        route = request.scope.get("route")
-        endpoint = getattr(route, "path", request.url.path)
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                if duration is None:
+                    duration = time.time() - start_time
+                _observe(scope, status_code, duration, stats)
 
-        http_requests_total.labels(
-            method=request.method,
-            endpoint=endpoint,
-            status=response.status_code,
-        ).inc()
 
-        http_request_duration_seconds.labels(
-            method=request.method,
-            endpoint=endpoint,
-        ).observe(duration)
+def _observe(
+    scope: Scope, status_code: int, duration: float, stats: RequestStats
+) -> None:
+    route = scope.get("route")
+    endpoint = getattr(route, "path", scope["path"])
+    labels = {"method": scope["method"], "endpoint": endpoint}
 
-        return response
+    http_requests_total.labels(status=status_code, **labels).inc()
+    http_request_duration_seconds.labels(**labels).observe(duration)
+    http_request_db_queries.labels(**labels).observe(stats.db_queries)
+    http_request_db_duration_seconds.labels(**labels).observe(stats.db_seconds)
+    http_request_storage_operations.labels(**labels).observe(stats.storage_operations)
+    http_request_storage_bytes.labels(**labels).observe(stats.storage_bytes)
+    http_request_skill_executions.labels(**labels).observe(stats.skill_executions)
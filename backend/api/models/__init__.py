@@ -4,6 +4,7 @@ from api.models.conversation import Conversation
 from api.models.device_token import DeviceToken
 from api.models.file_ingestion import FileDerivative, FileProcessingJob, IngestedFile
 from api.models.note import Note
+from api.models.semantic_chunk import SemanticChunk
 from api.models.task import Task
 from api.models.task_group import TaskGroup
 from api.models.task_operation_log import TaskOperationLog
@@ -22,6 +23,7 @@ __all__ = [
     "IngestedFile",
     "FileDerivative",
     "FileProcessingJob",
+    "SemanticChunk",
     "Task",
     "TaskGroup",
     "TaskOperationLog",
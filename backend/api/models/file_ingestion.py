@@ -4,7 +4,16 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,6 +32,13 @@ class IngestedFile(Base):
         Index("idx_ingested_files_last_opened_at", "last_opened_at"),
         Index("idx_ingested_files_user_last_opened", "user_id", "last_opened_at"),
         Index("idx_ingested_files_path", "path"),
+        Index(
+            "idx_ingested_files_user_path_prefix",
+            "user_id",
+            "path",
+            postgresql_ops={"path": "text_pattern_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -85,6 +101,13 @@ class FileProcessingJob(Base):
         Index("idx_file_processing_jobs_file_id", "file_id"),
         Index("idx_file_processing_jobs_status", "status"),
         Index("idx_file_processing_jobs_lease_expires_at", "lease_expires_at"),
+        Index(
+            "idx_file_processing_jobs_queued_claim",
+            "status",
+            "lease_expires_at",
+            "updated_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
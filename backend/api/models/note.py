@@ -4,11 +4,12 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import Boolean, Computed, DateTime, Index, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, Column, Computed, DateTime, Index, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from api.db.base import Base
+from api.utils.content_hash import compute_content_hash
 
 
 class Note(Base):
@@ -20,14 +21,37 @@ class Note(Base):
         Index(
             "idx_notes_user_deleted_opened", "user_id", "deleted_at", "last_opened_at"
         ),
+        Index("idx_notes_user_updated_id", "user_id", "updated_at", "id"),
+        Index(
+            "idx_notes_user_folder_prefix",
+            "user_id",
+            text("(metadata ->> 'folder') text_pattern_ops"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Weighted full-text vector (title A, content B) for indexed search.
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        Index("idx_notes_search_vector", "search_vector", postgresql_using="gin"),
     )
 
+    # search_vector is table-only: writes never RETURN it and loads never
+    # select it. Query it via Note.__table__.c.search_vector.
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     title: Mapped[str] = mapped_column(Text, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str | None] = mapped_column(Text, nullable=True)
     metadata_: Mapped[dict[str, Any]] = mapped_column(
         "metadata", JSONB, nullable=False, default=dict
     )
@@ -54,6 +78,12 @@ class Note(Base):
         DateTime(timezone=True), nullable=True, index=True
     )
 
+    @validates("content")
+    def _sync_content_hash(self, key: str, value: str) -> str:
+        """Keep content_hash in step with content assignments."""
+        self.content_hash = compute_content_hash(value)
+        return value
+
     def __repr__(self):
         """Return a readable representation for debugging."""
         return f"<Note(id={self.id}, title='{self.title}')>"
@@ -0,0 +1,61 @@
+"""Embedded content chunks for semantic search."""
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import REAL, DateTime, Index, Integer, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from api.db.base import Base
+
+
+class SemanticChunk(Base):
+    """One embedded chunk of a note, website or file ai.md derivative.
+
+    Embeddings are stored as ``real[]`` so the table works without pgvector;
+    when the extension is installed, migration 049 adds an HNSW index over
+    the ``vector`` cast of the column.
+    """
+
+    __tablename__ = "semantic_chunks"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[str] = mapped_column(Text, nullable=False)
+    content_type: Mapped[str] = mapped_column(Text, nullable=False)
+    content_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    # sha256 of the embedder model and chunk text; unchanged chunks keep
+    # their embedding when a document is re-indexed.
+    chunk_hash: Mapped[str] = mapped_column(Text, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    embedding: Mapped[list[float]] = mapped_column(ARRAY(REAL), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "content_type",
+            "content_id",
+            "chunk_index",
+            name="uq_semantic_chunks_content_chunk",
+        ),
+        Index(
+            "idx_semantic_chunks_user_content",
+            "user_id",
+            "content_type",
+            "content_id",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """Return a readable representation for debugging."""
+        return (
+            f"<SemanticChunk(content_type={self.content_type}, "
+            f"content_id={self.content_id}, chunk_index={self.chunk_index})>"
+        )
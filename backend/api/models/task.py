@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import (
     Boolean,
+    Column,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
@@ -16,7 +18,7 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from api.db.base import Base
@@ -49,8 +51,56 @@ class Task(Base):
             unique=True,
             postgresql_where=text("repeat_template_id IS NOT NULL"),
         ),
+        # Scope lists (inbox/today/upcoming/project/group) only read open tasks,
+        # so these partial indexes skip the completed and trashed history.
+        Index(
+            "idx_tasks_open_user_deadline",
+            "user_id",
+            "deadline",
+            "status",
+            postgresql_where=text(
+                "deleted_at IS NULL AND status NOT IN ('completed', 'trashed')"
+            ),
+        ),
+        Index(
+            "idx_tasks_open_user_project",
+            "user_id",
+            "project_id",
+            postgresql_where=text(
+                "deleted_at IS NULL AND status NOT IN ('completed', 'trashed')"
+            ),
+        ),
+        Index(
+            "idx_tasks_open_user_group",
+            "user_id",
+            "group_id",
+            postgresql_where=text(
+                "deleted_at IS NULL AND status NOT IN ('completed', 'trashed')"
+            ),
+        ),
+        Index(
+            "idx_tasks_completed_user_completed_at",
+            "user_id",
+            text("completed_at DESC"),
+            postgresql_where=text("deleted_at IS NULL AND status = 'completed'"),
+        ),
+        # Weighted full-text vector (title A, notes B) for indexed search.
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(notes, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        Index("idx_tasks_search_vector", "search_vector", postgresql_using="gin"),
     )
 
+    # search_vector is table-only: writes never RETURN it and loads never
+    # select it. Query it via Task.__table__.c.search_vector.
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -4,8 +4,17 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Index, Text, UniqueConstraint, text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from api.db.base import Base
@@ -25,8 +34,23 @@ class Website(Base):
             "deleted_at",
             "last_opened_at",
         ),
+        # Weighted full-text vector (title A, content B) for indexed search.
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        Index("idx_websites_search_vector", "search_vector", postgresql_using="gin"),
     )
 
+    # search_vector is table-only: writes never RETURN it and loads never
+    # select it. Query it via Website.__table__.c.search_vector.
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -25,6 +25,7 @@ _PROMPT_CONFIG = load_prompt_config()
 DEFAULT_COMMUNICATION_STYLE = _PROMPT_CONFIG["default_communication_style"]
 DEFAULT_WORKING_RELATIONSHIP = _PROMPT_CONFIG["default_working_relationship"]
 SYSTEM_PROMPT_TEMPLATE = _PROMPT_CONFIG["system_prompt_template"]
+MESSAGE_CONTEXT_TEMPLATE = _PROMPT_CONFIG["message_context_template"]
 CONTEXT_GUIDANCE_TEMPLATE = _PROMPT_CONFIG["context_guidance_template"]
 FIRST_MESSAGE_TEMPLATE = _PROMPT_CONFIG["first_message_template"]
 RECENT_ACTIVITY_WRAPPER_TEMPLATE = _PROMPT_CONFIG["recent_activity_wrapper_template"]
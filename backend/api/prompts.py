@@ -18,6 +18,7 @@ from api.prompt_config import (
     DEFAULT_COMMUNICATION_STYLE,
     DEFAULT_WORKING_RELATIONSHIP,
     FIRST_MESSAGE_TEMPLATE,
+    MESSAGE_CONTEXT_TEMPLATE,
     RECENT_ACTIVITY_CHATS_HEADER,
     RECENT_ACTIVITY_EMPTY_TEXT,
     RECENT_ACTIVITY_FILES_HEADER,
@@ -46,6 +47,8 @@ __all__ = [
     "build_recent_activity_block",
     "build_open_context_block",
     "build_system_prompt",
+    "build_system_prompt_prefix",
+    "build_message_context_block",
     "build_first_message_prompt",
 ]
 
@@ -375,6 +378,38 @@ def build_system_prompt(
     now: datetime,
 ) -> str:
     """Build the system prompt for the chat model."""
+    return "\n\n".join(
+        [
+            build_system_prompt_prefix(settings_record, now),
+            build_message_context_block(
+                settings_record,
+                current_location,
+                current_location_levels,
+                current_weather,
+                now,
+            ),
+        ]
+    )
+
+
+def build_system_prompt_prefix(settings_record: Any, now: datetime) -> str:
+    """Build the stable part of the system prompt.
+
+    The prefix only depends on the user's profile, so it stays byte-identical
+    between requests and can be marked as a prompt-cache breakpoint.
+    """
+    variables = build_prompt_variables(settings_record, "", None, None, None, now)
+    return resolve_template(SYSTEM_PROMPT_TEMPLATE, variables)
+
+
+def build_message_context_block(
+    settings_record: Any,
+    current_location: str,
+    current_location_levels: dict[str, Any] | str | None,
+    current_weather: dict[str, Any] | str | None,
+    now: datetime,
+) -> str:
+    """Build the per-request context block (time, location, weather, tasks)."""
     variables = build_prompt_variables(
         settings_record,
         current_location,
@@ -383,7 +418,7 @@ def build_system_prompt(
         None,
         now,
     )
-    return resolve_template(SYSTEM_PROMPT_TEMPLATE, variables)
+    return resolve_template(MESSAGE_CONTEXT_TEMPLATE, variables).strip()
 
 
 def build_first_message_prompt(
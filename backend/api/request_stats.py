@@ -0,0 +1,111 @@
+"""Per-request resource accounting (DB, storage, skill subprocesses).
+
+MetricsMiddleware opens a RequestStats for every request. The engine's cursor
+listeners, the storage backends and the skill executor add to whichever one
+is current, so a handler that issues one query per row shows up as a high
+query count on its route instead of needing code review to find.
+
+The stats object lives in a context variable. Sync handlers and dependencies
+run in worker threads with a copy of the request context, which still points
+at the same RequestStats, so their work is counted too. Work done while a
+streaming body is sent reaches the histograms but not the Server-Timing
+header, which is sent before the body.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class RequestStats:
+    """Resources used while handling one request."""
+
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    storage_operations: int = 0
+    storage_bytes: int = 0
+    skill_executions: int = 0
+    skill_seconds: float = 0.0
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> RequestStats | None:
+    """Return the stats for the request being handled, if any."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_request() -> Iterator[RequestStats]:
+    """Collect resource usage for the enclosed request.
+
+    Yields:
+        The RequestStats that instrumented code adds to.
+    """
+    stats = RequestStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_db_query(seconds: float) -> None:
+    """Count one SQL statement against the current request."""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.db_queries += 1
+    stats.db_seconds += seconds
+
+
+def record_storage_io(nbytes: int = 0) -> None:
+    """Count one storage call (and bytes read or written) against the request."""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.storage_operations += 1
+    stats.storage_bytes += nbytes
+
+
+def record_skill_execution(seconds: float) -> None:
+    """Count one skill subprocess run against the current request."""
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.skill_executions += 1
+    stats.skill_seconds += seconds
+
+
+def server_timing_header(stats: RequestStats, total_seconds: float) -> str:
+    """Format request stats as a Server-Timing header value.
+
+    Args:
+        stats: Stats collected for the request.
+        total_seconds: Wall-clock time spent in the handler.
+
+    Returns:
+        Header value with db, storage, skill and total entries.
+    """
+    entries = [
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.db_queries} queries"',
+    ]
+    if stats.storage_operations:
+        entries.append(
+            f'storage;desc="{stats.storage_operations} ops, '
+            f'{stats.storage_bytes} bytes"'
+        )
+    if stats.skill_executions:
+        entries.append(
+            f"skill;dur={stats.skill_seconds * 1000:.1f};"
+            f'desc="{stats.skill_executions} runs"'
+        )
+    entries.append(f"total;dur={total_seconds * 1000:.1f}")
+    return ", ".join(entries)
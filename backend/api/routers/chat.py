@@ -27,7 +27,6 @@ from api.metrics import (
     chat_streaming_duration_seconds,
 )
 from api.schemas.tool_context import ToolExecutionContext
-from api.services.claude_client import ClaudeClient
 from api.services.conversation_service import ConversationService
 from api.services.prompt_context_service import PromptContextService
 from api.services.skill_catalog_service import SkillCatalogService
@@ -223,7 +222,7 @@ async def stream_chat(
     settings_record = UserSettingsService.get_settings(db, user_id)
     user_agent = request.headers.get("user-agent")
     now = datetime.now(UTC)
-    system_prompt, first_message_prompt = PromptContextService.build_prompts(
+    system_prompt, first_message_prompt = PromptContextService.build_prompt_blocks(
         db=db,
         user_id=user_id,
         open_context=open_context,
@@ -238,8 +237,8 @@ async def stream_chat(
     if not history:
         history = [{"role": "user", "content": first_message_prompt}]
 
-    # Create Claude client
-    claude_client = ClaudeClient(settings)
+    # Shared client created at startup; reuses its connection pool and tools.
+    claude_client = request.app.state.claude_client
     tool_context = ToolExecutionContext(
         db=db,
         user_id=user_id,
@@ -30,6 +30,7 @@ from api.services.file_ingestion_service import FileIngestionService
 from api.services.files_sync_service import FilesSyncService
 from api.services.storage.service import get_storage_backend
 from api.services.website_transcript_service import WebsiteTranscriptService
+from api.utils.etag import build_etag, conditional_response
 from api.utils.timestamps import parse_client_timestamp
 from api.utils.validation import parse_uuid
 
@@ -117,11 +118,20 @@ def ingest_youtube(
 
 @router.get("")
 def list_ingestions(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     token: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
-    """List ingestion records for the current user."""
+    """List ingestion records for the current user.
+
+    Responds 304 when If-None-Match carries the current ETag.
+    """
+    etag = build_etag("ingestion", *FileIngestionService.list_version(db, user_id))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     records = FileIngestionService.list_ingestions(db, user_id, limit=50)
 
     items = []
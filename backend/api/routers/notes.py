@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import uuid
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request
 from fastapi.responses import Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -19,6 +19,7 @@ from api.services.notes_helpers import note_sync_payload
 from api.services.notes_service import NotesService
 from api.services.notes_sync_service import NotesSyncService
 from api.services.notes_workspace_service import NotesWorkspaceService
+from api.utils.etag import build_etag, conditional_response
 from api.utils.timestamps import parse_client_timestamp
 
 router = APIRouter(prefix="/notes", tags=["notes"])
@@ -35,13 +36,19 @@ class NotesSearchRequest(BaseModel):
 
 @router.get("/tree")
 def list_notes_tree(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """Return the hierarchical notes tree for the current user.
 
+    Responds 304 when If-None-Match carries the current ETag.
+
     Args:
+        request: Incoming request (for If-None-Match).
+        response: Outgoing response (for the ETag header).
         user_id: Current authenticated user ID.
         _: Authorization token (validated).
         db: Database session.
@@ -49,6 +56,10 @@ def list_notes_tree(
     Returns:
         Tree structure of folders and notes.
     """
+    etag = build_etag("notes-tree", *NotesService.tree_version(db, user_id))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     tree = NotesWorkspaceService.list_tree(db, user_id, include_archived=False)
     summary = NotesService.archived_summary(db, user_id)
     return {**tree, **summary}
@@ -275,7 +286,12 @@ def sync_notes(
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
-    """Apply offline note operations and return updates since last sync."""
+    """Apply offline note operations and return updates since last sync.
+
+    Initial syncs can be paged by passing `limit` (and the returned
+    `nextCursor` as `cursor`), and `include_content: false` returns metadata
+    only so content can be fetched via `POST /notes/sync/content`.
+    """
     result = NotesSyncService.sync_operations(db, user_id, request)
     return {
         "applied": result.applied_ids,
@@ -285,14 +301,34 @@ def sync_notes(
         ],
         "conflicts": result.conflicts,
         "updates": {
-            "notes": [note_sync_payload(note) for note in result.updated_notes],
+            "notes": [
+                note_sync_payload(note, include_content=result.include_content)
+                for note in result.updated_notes
+            ],
         },
         "serverUpdatedSince": result.server_updated_since.isoformat()
         if result.server_updated_since
         else None,
+        "nextCursor": result.next_cursor,
+        "hasMore": result.next_cursor is not None,
     }
 
 
+@router.post("/sync/content")
+def sync_notes_content(
+    request: dict,
+    user_id: str = Depends(get_current_user_id),
+    _: str = Depends(verify_bearer_token),
+    db: Session = Depends(get_db),
+):
+    """Return full note payloads for a batch of note ids.
+
+    Used after a metadata-only sync to load note content lazily or in batches.
+    """
+    notes = NotesSyncService.get_notes_content(db, user_id, request.get("ids"))
+    return {"notes": [note_sync_payload(note) for note in notes]}
+
+
 @router.get("/{note_id}/download")
 def download_note(
     note_id: uuid.UUID,
@@ -378,9 +414,12 @@ def update_note(
 ):
     """Update a note's content.
 
+    Accepts either the full `content`, or `base_hash` plus `edits` (splices
+    against the content with that hash) to send only the change.
+
     Args:
         note_id: Note UUID.
-        request: Request payload with content.
+        request: Request payload with content, or base_hash and edits.
         user_id: Current authenticated user ID.
         _: Authorization token (validated).
         db: Database session.
@@ -392,6 +431,24 @@ def update_note(
         BadRequestError: For invalid request.
         NotFoundError: If not found.
     """
+    if "edits" in request:
+        base_hash = request.get("base_hash")
+        if not base_hash:
+            raise BadRequestError("base_hash required")
+        try:
+            return NotesWorkspaceService.patch_note(
+                db,
+                user_id,
+                str(note_id),
+                str(base_hash),
+                request.get("edits"),
+                content_hash=request.get("content_hash"),
+            )
+        except ValueError as exc:
+            raise BadRequestError(str(exc)) from exc
+        except NoteNotFoundError as exc:
+            raise NotFoundError("Note", str(note_id)) from exc
+
     content = request.get("content")
     client_updated_at = parse_client_timestamp(
         request.get("client_updated_at") or request.get("clientUpdatedAt"),
@@ -2,21 +2,75 @@
 
 import json
 import logging
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import Any
 
 from fastapi import APIRouter, Depends
-from fastapi.concurrency import run_in_threadpool
 
 from api.auth import verify_bearer_token
 from api.config import settings
 from api.exceptions import ExternalServiceError, ServiceUnavailableError
+from api.services.upstream_http import get_upstream_http_client
+from api.utils.async_cache import AsyncTTLCache
 
 router = APIRouter(prefix="/places", tags=["places"])
 logger = logging.getLogger(__name__)
 
+GOOGLE_PLACES_BASE_URL = "https://maps.googleapis.com/maps/api/place"
+_AUTOCOMPLETE_CACHE_TTL_SECONDS = 600
+_PLACE_CACHE_TTL_SECONDS = 86400
+_CACHE_MAX_ENTRIES = 2048
+# Reverse lookups are keyed to ~100m so nearby devices share an entry.
+_REVERSE_COORD_PRECISION = 3
+
+_autocomplete_cache: AsyncTTLCache[dict] = AsyncTTLCache(
+    max_entries=_CACHE_MAX_ENTRIES, ttl_seconds=_AUTOCOMPLETE_CACHE_TTL_SECONDS
+)
+_details_cache: AsyncTTLCache[dict] = AsyncTTLCache(
+    max_entries=_CACHE_MAX_ENTRIES, ttl_seconds=_PLACE_CACHE_TTL_SECONDS
+)
+_reverse_cache: AsyncTTLCache[dict] = AsyncTTLCache(
+    max_entries=_CACHE_MAX_ENTRIES, ttl_seconds=_PLACE_CACHE_TTL_SECONDS
+)
+
+
+async def _get_places_json(
+    endpoint: str, params: dict[str, Any], log_message: str, extra: dict
+) -> dict:
+    """Call a Google Places endpoint and parse its JSON body.
 
-def _fetch_autocomplete(input_text: str) -> dict:
+    Args:
+        endpoint: Endpoint path under the Places API (e.g. "autocomplete").
+        params: Query parameters (the API key is added here).
+        log_message: Message logged if the body is not valid JSON.
+        extra: Extra logging context.
+
+    Returns:
+        Parsed JSON response payload.
+
+    Raises:
+        ExternalServiceError: If the response body is not valid JSON.
+    """
+    response = await get_upstream_http_client().get(
+        f"{GOOGLE_PLACES_BASE_URL}/{endpoint}/json",
+        params={**params, "key": settings.google_places_api_key},
+    )
+    response.raise_for_status()
+    data = response.content
+    try:
+        return json.loads(data.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        preview = data[:500].decode("utf-8", errors="ignore")
+        logger.error(
+            log_message,
+            exc_info=exc,
+            extra={"response_preview": preview, **extra},
+        )
+        raise ExternalServiceError(
+            "Google Places", "Places returned invalid data"
+        ) from exc
+
+
+async def _fetch_autocomplete(input_text: str) -> dict:
     """Fetch autocomplete predictions from Google Places.
 
     Args:
@@ -25,32 +79,15 @@ def _fetch_autocomplete(input_text: str) -> dict:
     Returns:
         Parsed JSON response payload.
     """
-    query = urlencode(
-        {
-            "input": input_text,
-            "key": settings.google_places_api_key,
-            "types": "(cities)",
-        }
+    return await _get_places_json(
+        "autocomplete",
+        {"input": input_text, "types": "(cities)"},
+        "Failed to parse places autocomplete response",
+        {"query": input_text},
     )
-    url = f"https://maps.googleapis.com/maps/api/place/autocomplete/json?{query}"
-    request = Request(url, headers={"Accept": "application/json"})
-    with urlopen(request, timeout=10) as response:
-        data = response.read()
-        try:
-            return json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError as exc:
-            preview = data[:500].decode("utf-8", errors="ignore")
-            logger.error(
-                "Failed to parse places autocomplete response",
-                exc_info=exc,
-                extra={"response_preview": preview, "query": input_text},
-            )
-            raise ExternalServiceError(
-                "Google Places", "Places returned invalid data"
-            ) from exc
-
-
-def _fetch_nearby_place(lat: float, lng: float) -> dict:
+
+
+async def _fetch_nearby_place(lat: float, lng: float) -> dict:
     """Fetch nearby place results for coordinates.
 
     Args:
@@ -60,33 +97,15 @@ def _fetch_nearby_place(lat: float, lng: float) -> dict:
     Returns:
         Parsed JSON response payload.
     """
-    query = urlencode(
-        {
-            "location": f"{lat},{lng}",
-            "rankby": "distance",
-            "type": "locality",
-            "key": settings.google_places_api_key,
-        }
+    return await _get_places_json(
+        "nearbysearch",
+        {"location": f"{lat},{lng}", "rankby": "distance", "type": "locality"},
+        "Failed to parse nearby places response",
+        {"lat": lat, "lng": lng},
     )
-    url = f"https://maps.googleapis.com/maps/api/place/nearbysearch/json?{query}"
-    request = Request(url, headers={"Accept": "application/json"})
-    with urlopen(request, timeout=10) as response:
-        data = response.read()
-        try:
-            return json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError as exc:
-            preview = data[:500].decode("utf-8", errors="ignore")
-            logger.error(
-                "Failed to parse nearby places response",
-                exc_info=exc,
-                extra={"response_preview": preview, "lat": lat, "lng": lng},
-            )
-            raise ExternalServiceError(
-                "Google Places", "Places returned invalid data"
-            ) from exc
-
-
-def _fetch_place_details(place_id: str) -> dict:
+
+
+async def _fetch_place_details(place_id: str) -> dict:
     """Fetch detailed place info by place ID.
 
     Args:
@@ -95,29 +114,12 @@ def _fetch_place_details(place_id: str) -> dict:
     Returns:
         Parsed JSON response payload.
     """
-    query = urlencode(
-        {
-            "place_id": place_id,
-            "fields": "address_component,name",
-            "key": settings.google_places_api_key,
-        }
+    return await _get_places_json(
+        "details",
+        {"place_id": place_id, "fields": "address_component,name"},
+        "Failed to parse place details response",
+        {"place_id": place_id},
     )
-    url = f"https://maps.googleapis.com/maps/api/place/details/json?{query}"
-    request = Request(url, headers={"Accept": "application/json"})
-    with urlopen(request, timeout=10) as response:
-        data = response.read()
-        try:
-            return json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError as exc:
-            preview = data[:500].decode("utf-8", errors="ignore")
-            logger.error(
-                "Failed to parse place details response",
-                exc_info=exc,
-                extra={"response_preview": preview, "place_id": place_id},
-            )
-            raise ExternalServiceError(
-                "Google Places", "Places returned invalid data"
-            ) from exc
 
 
 def _extract_component(components: list[dict], component_type: str) -> str | None:
@@ -161,32 +163,20 @@ def _collect_levels(components: list[dict]) -> dict[str, str]:
     return levels
 
 
-@router.get("/autocomplete")
-async def autocomplete_places(
-    input: str,
-    _: str = Depends(verify_bearer_token),
-):
-    """Return place autocomplete predictions.
+async def _load_autocomplete(input_text: str) -> dict:
+    """Fetch autocomplete predictions and shape them for the client.
 
     Args:
-        input: User input string.
-        _: Authorization token (validated).
+        input_text: Trimmed user input string.
 
     Returns:
         Predictions list payload.
 
     Raises:
-        ServiceUnavailableError: If API key missing.
         ExternalServiceError: On upstream failure.
     """
-    if not settings.google_places_api_key:
-        raise ServiceUnavailableError("Google Places API key not configured")
-    trimmed = input.strip()
-    if len(trimmed) < 2:
-        return {"predictions": []}
-
     try:
-        data = await run_in_threadpool(_fetch_autocomplete, trimmed)
+        data = await _fetch_autocomplete(input_text)
     except ExternalServiceError:
         raise
     except Exception as exc:
@@ -208,31 +198,49 @@ async def autocomplete_places(
     return {"predictions": predictions}
 
 
-@router.get("/reverse")
-async def reverse_geocode(
-    lat: float,
-    lng: float,
-    _: str = Depends(verify_bearer_token),
-):
-    """Reverse geocode coordinates into a locality label.
+async def _load_place_details(place_id: str) -> dict:
+    """Fetch place details, raising on upstream errors.
+
+    Args:
+        place_id: Google Places place ID.
+
+    Returns:
+        Parsed details payload.
+
+    Raises:
+        ExternalServiceError: On upstream failure.
+    """
+    try:
+        details = await _fetch_place_details(place_id)
+    except ExternalServiceError:
+        raise
+    except Exception as exc:
+        raise ExternalServiceError("Google Places", "Places lookup failed") from exc
+
+    detail_status = details.get("status")
+    if detail_status not in {"OK", "ZERO_RESULTS"}:
+        raise ExternalServiceError(
+            "Google Places",
+            details.get("error_message", "Places lookup failed"),
+        )
+    return details
+
+
+async def _load_reverse(lat: float, lng: float) -> dict:
+    """Resolve coordinates to a locality label via nearby search and details.
 
     Args:
         lat: Latitude.
         lng: Longitude.
-        _: Authorization token (validated).
 
     Returns:
         Label and administrative levels payload.
 
     Raises:
-        ServiceUnavailableError: If API key missing.
         ExternalServiceError: On upstream failure.
     """
-    if not settings.google_places_api_key:
-        raise ServiceUnavailableError("Google Places API key not configured")
-
     try:
-        data = await run_in_threadpool(_fetch_nearby_place, lat, lng)
+        data = await _fetch_nearby_place(lat, lng)
     except ExternalServiceError:
         raise
     except Exception as exc:
@@ -252,19 +260,9 @@ async def reverse_geocode(
     if not place_id:
         return {"label": None}
 
-    try:
-        details = await run_in_threadpool(_fetch_place_details, place_id)
-    except ExternalServiceError:
-        raise
-    except Exception as exc:
-        raise ExternalServiceError("Google Places", "Places lookup failed") from exc
-
-    detail_status = details.get("status")
-    if detail_status not in {"OK", "ZERO_RESULTS"}:
-        raise ExternalServiceError(
-            "Google Places",
-            details.get("error_message", "Places lookup failed"),
-        )
+    details = await _details_cache.get_or_load(
+        place_id, lambda: _load_place_details(place_id)
+    )
 
     components = (details.get("result") or {}).get("address_components") or []
     levels = _collect_levels(components)
@@ -275,3 +273,62 @@ async def reverse_geocode(
         return {"label": None, "levels": levels}
 
     return {"label": f"{locality}, {country}", "levels": levels}
+
+
+@router.get("/autocomplete")
+async def autocomplete_places(
+    input: str,
+    _: str = Depends(verify_bearer_token),
+):
+    """Return place autocomplete predictions.
+
+    Args:
+        input: User input string.
+        _: Authorization token (validated).
+
+    Returns:
+        Predictions list payload.
+
+    Raises:
+        ServiceUnavailableError: If API key missing.
+        ExternalServiceError: On upstream failure.
+    """
+    if not settings.google_places_api_key:
+        raise ServiceUnavailableError("Google Places API key not configured")
+    trimmed = input.strip()
+    if len(trimmed) < 2:
+        return {"predictions": []}
+
+    return await _autocomplete_cache.get_or_load(
+        trimmed.casefold(), lambda: _load_autocomplete(trimmed)
+    )
+
+
+@router.get("/reverse")
+async def reverse_geocode(
+    lat: float,
+    lng: float,
+    _: str = Depends(verify_bearer_token),
+):
+    """Reverse geocode coordinates into a locality label.
+
+    Args:
+        lat: Latitude.
+        lng: Longitude.
+        _: Authorization token (validated).
+
+    Returns:
+        Label and administrative levels payload.
+
+    Raises:
+        ServiceUnavailableError: If API key missing.
+        ExternalServiceError: On upstream failure.
+    """
+    if not settings.google_places_api_key:
+        raise ServiceUnavailableError("Google Places API key not configured")
+
+    rounded_lat = round(lat, _REVERSE_COORD_PRECISION)
+    rounded_lng = round(lng, _REVERSE_COORD_PRECISION)
+    return await _reverse_cache.get_or_load(
+        (rounded_lat, rounded_lng), lambda: _load_reverse(rounded_lat, rounded_lng)
+    )
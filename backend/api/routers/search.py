@@ -0,0 +1,70 @@
+"""Universal local search router."""
+# ruff: noqa: B008
+
+import json
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from api.auth import verify_bearer_token
+from api.db.dependencies import get_current_user_id
+from api.exceptions import BadRequestError
+from api.services.universal_search_service import (
+    DEFAULT_SEARCH_LIMIT,
+    UniversalSearchService,
+)
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def _parse_content_types(value) -> list[str] | None:
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise BadRequestError("contentTypes must be a list of strings")
+    return value
+
+
+def _parse_limit(value) -> int:
+    if value is None:
+        return DEFAULT_SEARCH_LIMIT
+    try:
+        return int(value)
+    except (TypeError, ValueError) as exc:
+        raise BadRequestError("limit must be an integer") from exc
+
+
+@router.post("")
+async def universal_search(
+    request: dict,
+    user_id: str = Depends(get_current_user_id),
+    _: str = Depends(verify_bearer_token),
+):
+    """Search notes, websites, files, conversations and memories at once.
+
+    With ``stream: true`` the response is an SSE stream of ``provider``
+    events (one per content type, as each finishes) followed by a
+    ``complete`` event with the merged results.
+    """
+    service = UniversalSearchService()
+    query = str(request.get("query") or "")
+    content_types = _parse_content_types(request.get("contentTypes"))
+    limit = _parse_limit(request.get("limit"))
+    if not request.get("stream"):
+        return await service.search(
+            user_id, query, content_types=content_types, limit=limit
+        )
+
+    events = service.stream(user_id, query, content_types=content_types, limit=limit)
+
+    async def event_generator():
+        """Generate SSE events."""
+        async for event in events:
+            event_type = event.pop("type")
+            yield f"event: {event_type}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
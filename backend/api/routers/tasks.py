@@ -3,13 +3,13 @@
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from api.auth import verify_bearer_token
 from api.config import settings
 from api.db.dependencies import get_current_user_id
-from api.db.session import SessionLocal, get_db, set_session_user_id
+from api.db.session import get_db, set_session_user_id
 from api.exceptions import BadRequestError
 from api.services.change_bus import change_bus
 from api.services.device_token_service import DeviceTokenService
@@ -18,8 +18,11 @@ from api.services.recurrence_service import RecurrenceService
 from api.services.task_change_service import TaskChangeService
 from api.services.task_service import TaskService
 from api.services.task_sync_service import TaskSyncService
-from api.services.tasks_snapshot_service import TasksSnapshotService
-from api.services.user_settings_service import UserSettingsService
+from api.services.tasks_snapshot_scheduler import (
+    get_tasks_snapshot_scheduler,
+    mark_tasks_changed,
+)
+from api.utils.etag import build_etag, conditional_response
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -85,38 +88,28 @@ def _group_sync_payload(group) -> dict:
     return payload
 
 
-def _update_snapshot_background(user_id: str, today_payload: dict) -> None:
-    with SessionLocal() as db:
-        set_session_user_id(db, user_id)
-        try:
-            upcoming_tasks, projects, groups = TaskService.list_tasks_by_scope(
-                db, user_id, "upcoming"
-            )
-            upcoming_payload = [_task_payload(task) for task in upcoming_tasks]
-            completed_tasks = TaskService.list_completed_today(db, user_id)
-            completed_payload = [_task_payload(task) for task in completed_tasks]
-            snapshot = TasksSnapshotService.build_snapshot(
-                today_tasks=today_payload.get("tasks", []),
-                tomorrow_tasks=TasksSnapshotService.filter_tomorrow(upcoming_payload),
-                completed_today=completed_payload,
-                groups=[_group_payload(group) for group in groups],
-                projects=[_project_payload(project) for project in projects],
-            )
-            UserSettingsService.update_tasks_snapshot(db, user_id, snapshot)
-        except Exception:
-            return
+def _tasks_not_modified(
+    request: Request, response: Response, db: Session, user_id: str, *key: str
+) -> Response | None:
+    """Return a 304 if the client's task list is still current."""
+    etag = build_etag("tasks", *key, *TaskService.list_version(db, user_id))
+    return conditional_response(request, response, etag)
 
 
 @router.get("/lists/{scope}")
 def get_tasks_list(
     scope: str,
-    background_tasks: BackgroundTasks,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """Fetch a task list for the requested scope."""
     set_session_user_id(db, user_id)
+    not_modified = _tasks_not_modified(request, response, db, user_id, "lists", scope)
+    if not_modified:
+        return not_modified
     tasks, projects, groups = TaskService.list_tasks_by_scope(db, user_id, scope)
     response = {
         "scope": scope,
@@ -126,7 +119,7 @@ def get_tasks_list(
         "groups": [_group_payload(group) for group in groups],
     }
     if scope == "today":
-        background_tasks.add_task(_update_snapshot_background, user_id, response)
+        get_tasks_snapshot_scheduler().schedule_if_stale(user_id)
     return response
 
 
@@ -272,6 +265,7 @@ def rename_task_group(
         raise BadRequestError("title required")
     set_session_user_id(db, user_id)
     group = TaskService.update_task_group(db, user_id, group_id, title=title)
+    mark_tasks_changed(db, user_id)
     db.commit()
     return _group_payload(group)
 
@@ -286,6 +280,7 @@ def delete_task_group(
     """Delete a task group and its nested projects/tasks."""
     set_session_user_id(db, user_id)
     group = TaskService.delete_task_group(db, user_id, group_id)
+    mark_tasks_changed(db, user_id)
     db.commit()
     return _group_sync_payload(group)
 
@@ -322,6 +317,7 @@ def rename_task_project(
         raise BadRequestError("title required")
     set_session_user_id(db, user_id)
     project = TaskService.update_task_project(db, user_id, project_id, title=title)
+    mark_tasks_changed(db, user_id)
     db.commit()
     return _project_payload(project)
 
@@ -336,6 +332,7 @@ def delete_task_project(
     """Delete a task project and its tasks."""
     set_session_user_id(db, user_id)
     project = TaskService.delete_task_project(db, user_id, project_id)
+    mark_tasks_changed(db, user_id)
     db.commit()
     return _project_sync_payload(project)
 
@@ -343,12 +340,19 @@ def delete_task_project(
 @router.get("/projects/{project_id}/tasks")
 def get_project_tasks(
     project_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """Fetch tasks for a project."""
     set_session_user_id(db, user_id)
+    not_modified = _tasks_not_modified(
+        request, response, db, user_id, "project", project_id
+    )
+    if not_modified:
+        return not_modified
     tasks = TaskService.list_tasks_by_project(db, user_id, project_id)
     projects = TaskService.list_task_projects(db, user_id)
     groups = TaskService.list_task_groups(db, user_id)
@@ -364,12 +368,19 @@ def get_project_tasks(
 @router.get("/groups/{group_id}/tasks")
 def get_group_tasks(
     group_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """Fetch tasks for a group."""
     set_session_user_id(db, user_id)
+    not_modified = _tasks_not_modified(
+        request, response, db, user_id, "group", group_id
+    )
+    if not_modified:
+        return not_modified
     tasks = TaskService.list_tasks_by_group(db, user_id, group_id)
     projects = TaskService.list_task_projects(db, user_id)
     groups = TaskService.list_task_groups(db, user_id)
@@ -384,12 +395,17 @@ def get_group_tasks(
 
 @router.get("/counts")
 def get_counts(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """Fetch task counts for list badges."""
     set_session_user_id(db, user_id)
+    not_modified = _tasks_not_modified(request, response, db, user_id, "counts")
+    if not_modified:
+        return not_modified
     counts = TaskService.get_counts(db, user_id)
     return {
         "generatedAt": datetime.now(UTC).isoformat(),
@@ -4,24 +4,25 @@ from __future__ import annotations
 
 import json
 import logging
-import ssl
 import time
 from typing import Any
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 from fastapi import APIRouter, Depends
-from fastapi.concurrency import run_in_threadpool
 
 from api.auth import verify_bearer_token
-from api.config import settings
 from api.exceptions import ExternalServiceError
+from api.services.upstream_http import get_upstream_http_client
+from api.utils.async_cache import AsyncTTLCache
 
 router = APIRouter(prefix="/weather", tags=["weather"])
 logger = logging.getLogger(__name__)
 
+OPEN_METEO_BASE_URL = "https://api.open-meteo.com"
 _CACHE_TTL_SECONDS = 1800
-_weather_cache: dict[str, dict[str, Any]] = {}
+_CACHE_MAX_ENTRIES = 2048
+_weather_cache: AsyncTTLCache[dict[str, Any]] = AsyncTTLCache(
+    max_entries=_CACHE_MAX_ENTRIES, ttl_seconds=_CACHE_TTL_SECONDS
+)
 
 
 def _as_list(value: Any) -> list:
@@ -38,7 +39,7 @@ def _as_list(value: Any) -> list:
     return []
 
 
-def _fetch_weather(lat: float, lon: float) -> dict:
+async def _fetch_weather(lat: float, lon: float) -> dict:
     """Fetch weather data from Open-Meteo.
 
     Args:
@@ -48,44 +49,35 @@ def _fetch_weather(lat: float, lon: float) -> dict:
     Returns:
         Parsed JSON response payload.
     """
-    query = urlencode(
-        {
-            "latitude": lat,
-            "longitude": lon,
-            "current": "temperature_2m,apparent_temperature,weather_code,is_day,wind_speed_10m,wind_direction_10m,precipitation,cloud_cover",
-            "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_probability_max",
-            "forecast_days": 3,
-            "timezone": "Europe/London",
-        }
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "current": "temperature_2m,apparent_temperature,weather_code,is_day,wind_speed_10m,wind_direction_10m,precipitation,cloud_cover",
+        "daily": "weather_code,temperature_2m_max,temperature_2m_min,precipitation_probability_max",
+        "forecast_days": 3,
+        "timezone": "Europe/London",
+    }
+    response = await get_upstream_http_client().get(
+        f"{OPEN_METEO_BASE_URL}/v1/forecast", params=params
     )
-    url = f"https://api.open-meteo.com/v1/forecast?{query}"
-    request = Request(url, headers={"Accept": "application/json"})
-    if settings.disable_ssl_verify:
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-    elif settings.custom_ca_bundle:
-        ssl_context = ssl.create_default_context(cafile=settings.custom_ca_bundle)
-    else:
-        ssl_context = ssl.create_default_context()
-    with urlopen(request, timeout=10, context=ssl_context) as response:
-        data = response.read()
-        try:
-            return json.loads(data.decode("utf-8"))
-        except json.JSONDecodeError as exc:
-            preview = data[:500].decode("utf-8", errors="ignore")
-            logger.error(
-                "Failed to parse weather API response",
-                exc_info=exc,
-                extra={
-                    "response_preview": preview,
-                    "lat": lat,
-                    "lon": lon,
-                },
-            )
-            raise ExternalServiceError(
-                "Open-Meteo", "Weather service returned invalid data"
-            ) from exc
+    response.raise_for_status()
+    data = response.content
+    try:
+        return json.loads(data.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        preview = data[:500].decode("utf-8", errors="ignore")
+        logger.error(
+            "Failed to parse weather API response",
+            exc_info=exc,
+            extra={
+                "response_preview": preview,
+                "lat": lat,
+                "lon": lon,
+            },
+        )
+        raise ExternalServiceError(
+            "Open-Meteo", "Weather service returned invalid data"
+        ) from exc
 
 
 def _cache_key(lat: float, lon: float) -> str:
@@ -101,18 +93,12 @@ def _cache_key(lat: float, lon: float) -> str:
     return f"{round(lat, 2)}:{round(lon, 2)}"
 
 
-@router.get("")
-async def get_weather(
-    lat: float,
-    lon: float,
-    _: str = Depends(verify_bearer_token),
-):
-    """Fetch weather data with caching.
+async def _load_weather(lat: float, lon: float) -> dict[str, Any]:
+    """Fetch weather upstream and summarise it for the client.
 
     Args:
         lat: Latitude.
         lon: Longitude.
-        _: Authorization token (validated).
 
     Returns:
         Weather payload with current and daily summary.
@@ -120,14 +106,9 @@ async def get_weather(
     Raises:
         ExternalServiceError: If upstream lookup fails.
     """
-    cache_key = _cache_key(lat, lon)
     now = time.time()
-    cached = _weather_cache.get(cache_key)
-    if cached and now - cached["fetched_at"] < _CACHE_TTL_SECONDS:
-        return cached["payload"]
-
     try:
-        data = await run_in_threadpool(_fetch_weather, lat, lon)
+        data = await _fetch_weather(lat, lon)
     except ExternalServiceError:
         raise
     except Exception as exc:
@@ -177,6 +158,41 @@ async def get_weather(
         "daily": daily_summary,
         "fetched_at": now,
     }
-
-    _weather_cache[cache_key] = {"fetched_at": now, "payload": payload}
     return payload
+
+
+async def _get_cached_weather(lat: float, lon: float) -> dict[str, Any]:
+    """Return weather for a rounded coordinate, coalescing concurrent misses.
+
+    Args:
+        lat: Latitude.
+        lon: Longitude.
+
+    Returns:
+        Weather payload with current and daily summary.
+    """
+    return await _weather_cache.get_or_load(
+        _cache_key(lat, lon), lambda: _load_weather(lat, lon)
+    )
+
+
+@router.get("")
+async def get_weather(
+    lat: float,
+    lon: float,
+    _: str = Depends(verify_bearer_token),
+):
+    """Fetch weather data with caching.
+
+    Args:
+        lat: Latitude.
+        lon: Longitude.
+        _: Authorization token (validated).
+
+    Returns:
+        Weather payload with current and daily summary.
+
+    Raises:
+        ExternalServiceError: If upstream lookup fails.
+    """
+    return await _get_cached_weather(lat, lon)
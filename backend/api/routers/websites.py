@@ -19,6 +19,7 @@ from api.services.website_transcript_service import WebsiteTranscriptService
 from api.services.websites_service import WebsitesService
 from api.services.websites_sync_service import WebsitesSyncService
 from api.services.websites_utils import website_sync_payload
+from api.utils.etag import build_etag, conditional_response
 from api.utils.timestamps import parse_client_timestamp
 from api.utils.validation import parse_uuid
 
@@ -29,13 +30,19 @@ ARCHIVED_LIST_MAX_LIMIT = 500
 
 @router.get("")
 def list_websites(
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
     _: str = Depends(verify_bearer_token),
     db: Session = Depends(get_db),
 ):
     """List websites for the current user.
 
+    Responds 304 when If-None-Match carries the current ETag.
+
     Args:
+        request: Incoming request (for If-None-Match).
+        response: Outgoing response (for the ETag header).
         user_id: Current authenticated user ID.
         _: Authorization token (validated).
         db: Database session.
@@ -43,6 +50,10 @@ def list_websites(
     Returns:
         List of website summaries.
     """
+    etag = build_etag("websites", *WebsitesService.list_version(db, user_id))
+    not_modified = conditional_response(request, response, etag)
+    if not_modified:
+        return not_modified
     websites = WebsitesService.list_websites(
         db,
         user_id,
@@ -132,7 +143,14 @@ def search_websites(
         raise BadRequestError("query required")
 
     websites = WebsitesService.search_websites(db, user_id, query, limit=limit)
-    return {"items": [website_summary(site) for site in websites]}
+    snippets = WebsitesService.search_snippets(db, query, websites)
+    items = []
+    for site in websites:
+        item = website_summary(site)
+        if site.id in snippets:
+            item["snippet"] = snippets[site.id]
+        items.append(item)
+    return {"items": items}
 
 
 @router.post("/quick-save")
@@ -12,22 +12,33 @@ from api.schemas.tool_context import ToolExecutionContext
 from api.services.claude_streaming import stream_with_tools
 from api.services.tool_mapper import ToolMapper
 
+# Connection pool for the shared Anthropic client. Streams are long-lived, so
+# keep enough connections for concurrent chats and reuse them between turns.
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
 
 class ClaudeClient:
     """Handles Claude API interactions with streaming and tool execution."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, tool_mapper: ToolMapper | None = None):
         """Initialize the client with model settings and HTTP configuration.
 
+        The app creates one instance at startup (see ``api.main.lifespan``) so
+        the HTTP connection pool and tool registry are reused across requests.
+
         Args:
             settings: Application settings object.
+            tool_mapper: Optional shared tool mapper. Defaults to a new one.
         """
+        self.http_client = self._create_http_client(settings)
         self.client = AsyncAnthropic(
             api_key=settings.anthropic_api_key,
-            http_client=self._create_http_client(settings),
+            http_client=self.http_client,
         )
         self.model = settings.model_name
-        self.tool_mapper = ToolMapper()
+        self.tool_mapper = tool_mapper or ToolMapper()
 
     def _create_http_client(self, settings: Settings) -> httpx.AsyncClient:
         """Create HTTP client with SSL configuration.
@@ -58,13 +69,22 @@ class ClaudeClient:
         return httpx.AsyncClient(
             verify=ssl_verify,
             timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
         )
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.http_client.aclose()
+
     async def stream_with_tools(
         self,
         message: str,
         conversation_history: list[dict[str, Any]] | None = None,
-        system_prompt: str | None = None,
+        system_prompt: str | list[dict[str, Any]] | None = None,
         allowed_skills: list[str] | None = None,
         tool_context: ToolExecutionContext | dict[str, Any] | None = None,
     ) -> AsyncIterator[dict[str, Any]]:
@@ -73,7 +93,7 @@ class ClaudeClient:
         Args:
             message: User message text.
             conversation_history: Prior chat messages.
-            system_prompt: Optional system prompt.
+            system_prompt: Optional system prompt string or text blocks.
             allowed_skills: Optional list of enabled skills.
             tool_context: Optional tool execution context.
 
@@ -8,6 +8,7 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 from api.constants import ChatConstants
+from api.metrics import chat_prompt_tokens_total
 from api.schemas.tool_context import ToolExecutionContext
 from api.services.web_search_builder import (
     build_web_search_location,
@@ -18,6 +19,69 @@ from api.services.web_search_builder import (
 logger = logging.getLogger(__name__)
 
 
+def _cache_control() -> dict[str, str]:
+    return dict(ChatConstants.PROMPT_CACHE_CONTROL)
+
+
+def build_system_blocks(
+    system_prompt: str | list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Normalize a system prompt into text blocks with a cache breakpoint.
+
+    Plain strings are cached whole, which still pays off across tool rounds
+    within a turn. Block lists are passed through as-is so callers can place
+    the breakpoint between stable and per-request content.
+    """
+    if isinstance(system_prompt, str):
+        return [
+            {"type": "text", "text": system_prompt, "cache_control": _cache_control()}
+        ]
+    return system_prompt
+
+
+def with_cache_breakpoints(
+    messages: list[dict[str, Any]], indices: set[int]
+) -> list[dict[str, Any]]:
+    """Return a copy of messages with cache_control on the given positions.
+
+    The stored conversation is left untouched; only the outgoing request
+    carries the breakpoints.
+    """
+    marked = list(messages)
+    for index in indices:
+        if not 0 <= index < len(marked):
+            continue
+        message = marked[index]
+        content = message.get("content")
+        if isinstance(content, str):
+            if not content:
+                continue
+            blocks: list[Any] = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = list(content)
+        else:
+            continue
+        if not isinstance(blocks[-1], dict):
+            continue
+        blocks[-1] = {**blocks[-1], "cache_control": _cache_control()}
+        marked[index] = {**message, "content": blocks}
+    return marked
+
+
+def record_prompt_cache_usage(usage: Any) -> None:
+    """Export prompt-cache read/write/miss token counts from a usage object."""
+    if usage is None:
+        return
+    counts = {
+        "read": getattr(usage, "cache_read_input_tokens", None),
+        "write": getattr(usage, "cache_creation_input_tokens", None),
+        "miss": getattr(usage, "input_tokens", None),
+    }
+    for label, value in counts.items():
+        if isinstance(value, int) and value > 0:
+            chat_prompt_tokens_total.labels(cache=label).inc(value)
+
+
 async def stream_with_tools(
     *,
     client: Any,
@@ -25,7 +89,7 @@ async def stream_with_tools(
     model: str,
     message: str,
     conversation_history: list[dict[str, Any]] | None = None,
-    system_prompt: str | None = None,
+    system_prompt: str | list[dict[str, Any]] | None = None,
     allowed_skills: list[str] | None = None,
     tool_context: ToolExecutionContext | dict[str, Any] | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
@@ -37,7 +101,7 @@ async def stream_with_tools(
         model: Claude model identifier.
         message: User message.
         conversation_history: Previous messages (optional).
-        system_prompt: System prompt override (optional).
+        system_prompt: System prompt string or text blocks (optional).
         allowed_skills: Allowed skill names (optional).
         tool_context: Context passed to tool execution (optional).
 
@@ -53,8 +117,13 @@ async def stream_with_tools(
 
     messages = conversation_history or []
     messages.append({"role": "user", "content": message})
+    # Cache breakpoints: tools, the stable system prefix, history up to the
+    # previous turn, and the latest message so later tool rounds reuse it.
+    previous_turn_index = len(messages) - 2
 
     tools = tool_mapper.get_claude_tools(allowed_skills)
+    if tools:
+        tools[-1] = {**tools[-1], "cache_control": _cache_control()}
     if allowed_skills is None or "web-search" in allowed_skills:
         user_location = None
         if context_dict:
@@ -81,7 +150,9 @@ async def stream_with_tools(
             stream_args: dict[str, Any] = {
                 "model": model,
                 "max_tokens": 4096,
-                "messages": messages,
+                "messages": with_cache_breakpoints(
+                    messages, {previous_turn_index, len(messages) - 1}
+                ),
                 "tools": tools,
             }
             if allowed_skills is None or "memory" in allowed_skills:
@@ -89,7 +160,7 @@ async def stream_with_tools(
                     "anthropic-beta": "context-management-2025-06-27"
                 }
             if system_prompt:
-                stream_args["system"] = system_prompt
+                stream_args["system"] = build_system_blocks(system_prompt)
 
             async with client.messages.stream(**stream_args) as stream:
                 content_blocks = []
@@ -102,7 +173,9 @@ async def stream_with_tools(
                 suppress_web_search_preamble = False
 
                 async for event in stream:
-                    if event.type == "content_block_start":
+                    if event.type == "message_start":
+                        record_prompt_cache_usage(getattr(event.message, "usage", None))
+                    elif event.type == "content_block_start":
                         if hasattr(event.content_block, "type"):
                             if event.content_block.type == "text":
                                 current_text = ""
@@ -0,0 +1,154 @@
+"""Pluggable text embedders for the semantic index."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from api.config import settings
+
+# Fixed so the pgvector index in migration 049 can cast to vector(N).
+EMBEDDING_DIMENSIONS = 512
+EMBEDDING_BATCH_SIZE = 64
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class Embedder(ABC):
+    """Turns text into unit-length vectors of EMBEDDING_DIMENSIONS floats."""
+
+    # Stored with each chunk so a model change re-embeds existing content.
+    model: str
+
+    @abstractmethod
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed one batch of texts.
+
+        Args:
+            texts: Texts to embed (at most EMBEDDING_BATCH_SIZE).
+
+        Returns:
+            One unit-length vector per text, in order.
+        """
+
+    def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts in batches of EMBEDDING_BATCH_SIZE.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One unit-length vector per text, in order.
+        """
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            vectors.extend(
+                self.embed_batch(texts[start : start + EMBEDDING_BATCH_SIZE])
+            )
+        return vectors
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return vector
+    return [value / norm for value in vector]
+
+
+class HashingEmbedder(Embedder):
+    """Deterministic local embedder for offline use and tests.
+
+    Words and character trigrams are hashed into signed buckets, so texts
+    sharing vocabulary land close together. It has no notion of synonyms;
+    use a model-backed embedder for real semantic recall.
+    """
+
+    model = "local-hashing-v1"
+
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts by feature hashing."""
+        return [self._embed_one(text) for text in texts]
+
+    @staticmethod
+    def _embed_one(text: str) -> list[float]:
+        vector = [0.0] * EMBEDDING_DIMENSIONS
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            padded = f" {token} "
+            # Whole words count more than their trigrams.
+            features = [(token, 2.0)]
+            features.extend((padded[i : i + 3], 0.5) for i in range(len(padded) - 2))
+            for feature, weight in features:
+                digest = hashlib.blake2b(
+                    feature.encode("utf-8"), digest_size=8
+                ).digest()
+                bucket = int.from_bytes(digest[:4], "little") % EMBEDDING_DIMENSIONS
+                sign = 1.0 if digest[4] & 1 else -1.0
+                vector[bucket] += sign * weight
+        return _normalize(vector)
+
+
+class OpenAIEmbedder(Embedder):
+    """Embeddings from the OpenAI API."""
+
+    def __init__(self, api_key: str, model: str = "text-embedding-3-small") -> None:
+        """Initialize the embedder.
+
+        Args:
+            api_key: OpenAI API key.
+            model: Embedding model name.
+        """
+        from openai import OpenAI
+
+        self.model = model
+        self._client = OpenAI(api_key=api_key)
+
+    def embed_batch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts with one API request."""
+        response = self._client.embeddings.create(
+            model=self.model,
+            input=list(texts),
+            dimensions=EMBEDDING_DIMENSIONS,
+        )
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [_normalize(list(item.embedding)) for item in ordered]
+
+
+_embedder: Embedder | None = None
+
+
+def get_embedder() -> Embedder | None:
+    """Return the configured embedder, or None when semantic indexing is off.
+
+    Returns:
+        Shared Embedder instance, or None.
+
+    Raises:
+        RuntimeError: If the configured embedder is unknown or misconfigured.
+    """
+    global _embedder
+    if _embedder is None:
+        name = settings.semantic_index_embedder
+        if not name:
+            return None
+        if name == "local":
+            _embedder = HashingEmbedder()
+        elif name == "openai":
+            if not settings.openai_api_key:
+                raise RuntimeError(
+                    "SEMANTIC_INDEX_EMBEDDER=openai requires OPENAI_API_KEY."
+                )
+            _embedder = OpenAIEmbedder(
+                settings.openai_api_key, model=settings.openai_embedding_model
+            )
+        else:
+            raise RuntimeError(f"Unknown SEMANTIC_INDEX_EMBEDDER: {name}")
+    return _embedder
+
+
+def set_embedder(embedder: Embedder | None) -> None:
+    """Override the embedder (None restores the configured default)."""
+    global _embedder
+    _embedder = embedder
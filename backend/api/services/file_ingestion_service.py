@@ -7,16 +7,20 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
 from api.exceptions import ConflictError, InternalServerError
 from api.models.file_ingestion import FileDerivative, FileProcessingJob, IngestedFile
+from api.services.semantic_index_service import mark_content_changed
 from api.services.storage.service import get_storage_backend
+from api.utils.etag import resource_watermark
 from api.utils.pinned_order import lock_pinned_order
 
 STAGING_ROOT = Path("/tmp/sidebar-ingestion")
+# Workers LISTEN on this channel; payload is the queued file ID.
+INGESTION_JOBS_CHANNEL = "ingestion_jobs"
 
 
 class FileIngestionService:
@@ -70,6 +74,7 @@ class FileIngestionService:
                         updated_at=now,
                     )
                     db.add(job)
+                    FileIngestionService.notify_job_queued(db, file_id)
                     db.commit()
                 return existing, job
         path_value = path or filename_original
@@ -98,9 +103,26 @@ class FileIngestionService:
             updated_at=now,
         )
         db.add(job)
+        FileIngestionService.notify_job_queued(db, file_id)
         db.commit()
         return record, job
 
+    @staticmethod
+    def notify_job_queued(db: Session, file_id: uuid.UUID) -> None:
+        """Wake idle ingestion workers when the current transaction commits.
+
+        NOTIFY is transactional: Postgres delivers it on commit and drops it
+        on rollback, so call this before the commit that queues the job.
+
+        Args:
+            db: Database session.
+            file_id: File whose job was queued.
+        """
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": INGESTION_JOBS_CHANNEL, "payload": str(file_id)},
+        )
+
     @staticmethod
     def get_file(
         db: Session,
@@ -127,6 +149,25 @@ class FileIngestionService:
             .first()
         )
 
+    @staticmethod
+    def list_version(db: Session, user_id: str) -> tuple:
+        """Return a change marker for the ingestion list, including job state.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+
+        Returns:
+            Watermark tuple suitable for build_etag.
+        """
+        last_job_update = (
+            db.query(func.max(FileProcessingJob.updated_at))
+            .join(IngestedFile, IngestedFile.id == FileProcessingJob.file_id)
+            .filter(IngestedFile.user_id == user_id)
+            .scalar()
+        )
+        return (*resource_watermark(db, IngestedFile, user_id), last_job_update)
+
     @staticmethod
     def list_ingestions(
         db: Session,
@@ -224,6 +265,8 @@ class FileIngestionService:
         job.error_code = error_code
         job.error_message = error_message
         job.updated_at = datetime.now(UTC)
+        if status == "queued":
+            FileIngestionService.notify_job_queued(db, file_id)
         db.commit()
         return job
 
@@ -236,6 +279,7 @@ class FileIngestionService:
         now = datetime.now(UTC)
         record.deleted_at = now
         record.updated_at = now
+        mark_content_changed(db, record.user_id, "file", record.id)
         db.commit()
         return record
 
@@ -84,14 +84,21 @@ def build_notes_tree(notes: Iterable[Note]) -> dict[str, Any]:
     return root
 
 
-def note_sync_payload(note: Note) -> dict[str, object]:
-    """Build a sync payload for a note."""
+def note_sync_payload(note: Note, *, include_content: bool = True) -> dict[str, object]:
+    """Build a sync payload for a note.
+
+    Args:
+        note: Note to serialize.
+        include_content: When False, omit content (fetched lazily by id).
+
+    Returns:
+        Sync payload dict.
+    """
     metadata = note.metadata_ or {}
     folder = metadata.get("folder") or ""
-    return {
+    payload: dict[str, object] = {
         "id": str(note.id),
         "name": f"{note.title}.md",
-        "content": note.content or "",
         "path": str(note.id),
         "modified": note.updated_at.timestamp() if note.updated_at else None,
         "created": note.created_at.timestamp() if note.created_at else None,
@@ -100,7 +107,11 @@ def note_sync_payload(note: Note) -> dict[str, object]:
         "pinned_order": metadata.get("pinned_order"),
         "archived": bool(note.is_archived),
         "deleted_at": note.deleted_at.isoformat() if note.deleted_at else None,
+        "content_hash": note.content_hash,
     }
+    if include_content:
+        payload["content"] = note.content or ""
+    return payload
 
 
 def note_conflict_payload(
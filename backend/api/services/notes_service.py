@@ -6,17 +6,21 @@ import re
 import uuid
 from collections.abc import Iterable
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import func
+from sqlalchemy import func, literal, update
 from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
 from sqlalchemy.orm.exc import ObjectDeletedError
 
-from api.exceptions import BadRequestError, NoteNotFoundError
+from api.exceptions import BadRequestError, ConflictError, NoteNotFoundError
 from api.models.note import Note
 from api.schemas.filters import NoteFilters
-from api.services.notes_helpers import ensure_note_no_conflict
+from api.services.notes_helpers import ensure_note_no_conflict, note_conflict_payload
+from api.services.semantic_index_service import mark_content_changed
+from api.utils.content_hash import compute_content_hash
+from api.utils.etag import resource_watermark
 from api.utils.metadata_helpers import get_max_pinned_order
 from api.utils.pinned_order import lock_pinned_order
 from api.utils.validation import parse_uuid
@@ -119,6 +123,7 @@ class NotesService:
                     existing.metadata_ = metadata
                     flag_modified(existing, "metadata_")
                     existing.updated_at = now
+                    mark_content_changed(db, user_id, "note", existing.id)
                     db.commit()
                 return existing
 
@@ -136,6 +141,7 @@ class NotesService:
         db.add(note)
         db.flush()
         snapshot_id = note.id
+        mark_content_changed(db, user_id, "note", snapshot_id)
         db.commit()
         try:
             db.refresh(note)
@@ -182,6 +188,7 @@ class NotesService:
         """
         note = (
             db.query(Note)
+            .options(defer(Note.content))
             .filter(
                 Note.user_id == user_id,
                 Note.id == note_id,
@@ -192,15 +199,161 @@ class NotesService:
         if not note:
             raise NoteNotFoundError(f"Note not found: {note_id}")
 
+        # Identical saves are no-ops so other devices' sync state stays valid.
+        if note.content_hash == compute_content_hash(content) and (
+            title is None or title == note.title
+        ):
+            set_committed_value(note, "content", content)
+            return note
+
         ensure_note_no_conflict(note, client_updated_at, op="update")
 
         if title is not None:
             note.title = title
         note.content = content
         note.updated_at = datetime.now(UTC)
+        mark_content_changed(db, user_id, "note", note.id)
         db.commit()
         return note
 
+    @staticmethod
+    def patch_note_content(
+        db: Session,
+        user_id: str,
+        note_id: uuid.UUID,
+        base_hash: str,
+        edits: list[dict[str, Any]],
+        *,
+        content_hash: str | None = None,
+    ) -> Note:
+        """Apply text edits to a note's content without sending the full body.
+
+        Edits are splices against the content identified by `base_hash`, each
+        `{"start": int, "end": int, "text": str}` with offsets in Unicode code
+        points. They are applied inside Postgres so the content never
+        round-trips through the API.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            note_id: Note UUID.
+            base_hash: content_hash of the content the edits were made against.
+            edits: Non-overlapping splice edits.
+            content_hash: Optional expected hash of the patched content.
+
+        Returns:
+            Updated Note (content left unloaded).
+
+        Raises:
+            NoteNotFoundError: If the note does not exist.
+            ConflictError: If the note content no longer matches base_hash.
+            BadRequestError: If edits are invalid or the result hash mismatches.
+        """
+        note = (
+            db.query(Note)
+            .options(defer(Note.content))
+            .filter(
+                Note.user_id == user_id,
+                Note.id == note_id,
+                Note.deleted_at.is_(None),
+            )
+            .first()
+        )
+        if not note:
+            raise NoteNotFoundError(f"Note not found: {note_id}")
+        if not base_hash or note.content_hash != base_hash:
+            NotesService._raise_base_hash_conflict(note)
+
+        spans = NotesService._normalize_edits(edits)
+        if not spans:
+            return note
+        length = (
+            db.query(func.char_length(Note.content)).filter(Note.id == note.id).scalar()
+        )
+        if spans[-1][1] > (length or 0):
+            raise BadRequestError("edit range exceeds note length")
+
+        pieces: list[Any] = []
+        position = 0
+        for start, end, text in spans:
+            if start > position:
+                pieces.append(func.substr(Note.content, position + 1, start - position))
+            if text:
+                pieces.append(literal(text))
+            position = end
+        pieces.append(func.substr(Note.content, position + 1))
+
+        now = datetime.now(UTC)
+        result = db.execute(
+            update(Note)
+            .where(
+                Note.id == note.id,
+                Note.user_id == user_id,
+                Note.content_hash == base_hash,
+            )
+            .values(content=func.concat(*pieces), updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            db.refresh(note)
+            NotesService._raise_base_hash_conflict(note)
+
+        new_hash = db.execute(
+            update(Note)
+            .where(Note.id == note.id)
+            .values(
+                content_hash=func.encode(
+                    func.sha256(func.convert_to(Note.content, "UTF8")), "hex"
+                )
+            )
+            .returning(Note.content_hash)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+        if content_hash and new_hash != content_hash:
+            db.rollback()
+            raise BadRequestError("Patched content does not match content_hash")
+        mark_content_changed(db, user_id, "note", note.id)
+        db.commit()
+
+        set_committed_value(note, "content_hash", new_hash)
+        set_committed_value(note, "updated_at", now)
+        db.expire(note, ["content"])
+        return note
+
+    @staticmethod
+    def _normalize_edits(edits: Any) -> list[tuple[int, int, str]]:
+        if not isinstance(edits, list):
+            raise BadRequestError("edits must be a list")
+        spans: list[tuple[int, int, str]] = []
+        for edit in edits:
+            if not isinstance(edit, dict):
+                raise BadRequestError("edits must be objects")
+            start, end, text = edit.get("start"), edit.get("end"), edit.get("text", "")
+            if (
+                not isinstance(start, int)
+                or not isinstance(end, int)
+                or not isinstance(text, str)
+                or start < 0
+                or end < start
+            ):
+                raise BadRequestError("edit requires start <= end and text")
+            spans.append((start, end, text))
+        spans.sort(key=lambda span: (span[0], span[1]))
+        for previous, current in zip(spans, spans[1:], strict=False):
+            if current[0] < previous[1]:
+                raise BadRequestError("edits must not overlap")
+        return spans
+
+    @staticmethod
+    def _raise_base_hash_conflict(note: Note) -> None:
+        conflict = note_conflict_payload(
+            note, op="patch", client_updated_at=None, reason="base_hash_mismatch"
+        )
+        raise ConflictError(
+            "Note content has changed since base_hash", {"conflict": conflict}
+        )
+
     @staticmethod
     def rename_note(
         db: Session,
@@ -431,6 +584,7 @@ class NotesService:
         now = datetime.now(UTC)
         note.deleted_at = now
         note.updated_at = now
+        mark_content_changed(db, user_id, "note", note.id)
         db.commit()
         return note
 
@@ -568,6 +722,19 @@ class NotesService:
 
         return query.all()
 
+    @staticmethod
+    def tree_version(db: Session, user_id: str) -> tuple:
+        """Return a change marker for the notes tree and archived summary.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+
+        Returns:
+            Watermark tuple suitable for build_etag.
+        """
+        return resource_watermark(db, Note, user_id)
+
     @staticmethod
     def archived_summary(db: Session, user_id: str) -> dict[str, object]:
         """Return archived note count and last updated timestamp."""
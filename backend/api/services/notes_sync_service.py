@@ -8,14 +8,19 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, defer
 
 from api.exceptions import BadRequestError, ConflictError, NoteNotFoundError
 from api.models.note import Note
 from api.services.notes_service import NotesService
+from api.utils.sync_cursor import decode_sync_cursor, encode_sync_cursor
 from api.utils.timestamps import parse_client_timestamp
 from api.utils.validation import parse_uuid
 
+SYNC_PAGE_MAX_LIMIT = 500
+SYNC_CONTENT_MAX_IDS = 200
+
 
 @dataclass
 class NotesApplyOutcome:
@@ -35,6 +40,8 @@ class NotesSyncResult:
     conflicts: list[dict[str, Any]]
     updated_notes: list[Note]
     server_updated_since: datetime
+    next_cursor: str | None = None
+    include_content: bool = True
 
 
 class NotesSyncService:
@@ -52,31 +59,124 @@ class NotesSyncService:
         if operations and not isinstance(operations, list):
             raise BadRequestError("operations must be a list")
 
+        cursor = decode_sync_cursor(payload.get("cursor"))
+        limit = NotesSyncService._parse_limit(payload.get("limit"))
+        include_content = payload.get("include_content", True) is not False
+
         outcome = NotesSyncService._apply_operations(db, user_id, operations)
-        updated_notes = NotesSyncService.list_updates_since(db, user_id, last_sync)
-        server_updated_since = NotesSyncService._max_updated_at(
-            updated_notes,
-            outcome.notes,
+        updated_notes = NotesSyncService.list_updates_since(
+            db,
+            user_id,
+            last_sync,
+            cursor=cursor,
+            limit=limit + 1 if limit else None,
+            include_content=include_content,
         )
+        next_cursor = None
+        if limit and len(updated_notes) > limit:
+            updated_notes = updated_notes[:limit]
+            last = updated_notes[-1]
+            next_cursor = encode_sync_cursor(last.updated_at, last.id)
+            # Mid-pagination the watermark must not jump past unsent pages.
+            server_updated_since = NotesSyncService._max_updated_at(updated_notes)
+        else:
+            server_updated_since = NotesSyncService._max_updated_at(
+                updated_notes,
+                outcome.notes,
+            )
         return NotesSyncResult(
             applied_ids=outcome.applied_ids,
             notes=outcome.notes,
             conflicts=outcome.conflicts,
             updated_notes=updated_notes,
             server_updated_since=server_updated_since,
+            next_cursor=next_cursor,
+            include_content=include_content,
         )
 
     @staticmethod
     def list_updates_since(
-        db: Session, user_id: str, last_sync: datetime | None
+        db: Session,
+        user_id: str,
+        last_sync: datetime | None,
+        *,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+        limit: int | None = None,
+        include_content: bool = True,
     ) -> list[Note]:
-        """List notes updated since the provided timestamp."""
+        """List notes updated since the provided timestamp.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            last_sync: Last sync timestamp, or None for an initial sync.
+            cursor: Optional (updated_at, id) position to resume after.
+            limit: Optional maximum number of notes to return.
+            include_content: Whether to load note content.
+
+        Returns:
+            Notes ordered by (updated_at, id).
+        """
         query = db.query(Note).filter(Note.user_id == user_id)
         if last_sync is None:
             query = query.filter(Note.deleted_at.is_(None))
         else:
             query = query.filter(Note.updated_at >= last_sync)
-        return query.order_by(Note.updated_at.asc()).all()
+        if cursor is not None:
+            query = query.filter(tuple_(Note.updated_at, Note.id) > tuple_(*cursor))
+        if not include_content:
+            query = query.options(defer(Note.content))
+        query = query.order_by(Note.updated_at.asc(), Note.id.asc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def get_notes_content(
+        db: Session, user_id: str, note_ids: list[Any]
+    ) -> list[Note]:
+        """Fetch full notes for a batch of ids (lazy content loading).
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            note_ids: Note ids to load.
+
+        Returns:
+            Matching non-deleted notes; unknown ids are omitted.
+
+        Raises:
+            BadRequestError: If ids are missing, invalid, or exceed the batch limit.
+        """
+        if not isinstance(note_ids, list) or not note_ids:
+            raise BadRequestError("ids required")
+        if len(note_ids) > SYNC_CONTENT_MAX_IDS:
+            raise BadRequestError(
+                f"At most {SYNC_CONTENT_MAX_IDS} ids may be requested at once"
+            )
+        parsed = {parse_uuid(str(value), "note", "id") for value in note_ids}
+        return (
+            db.query(Note)
+            .filter(
+                Note.user_id == user_id,
+                Note.id.in_(parsed),
+                Note.deleted_at.is_(None),
+            )
+            .order_by(Note.updated_at.asc(), Note.id.asc())
+            .all()
+        )
+
+    @staticmethod
+    def _parse_limit(value: Any) -> int | None:
+        if value is None:
+            return None
+        try:
+            limit = int(value)
+        except (TypeError, ValueError) as exc:
+            raise BadRequestError("limit must be an integer") from exc
+        if limit < 1:
+            raise BadRequestError("limit must be positive")
+        return min(limit, SYNC_PAGE_MAX_LIMIT)
 
     @staticmethod
     def _apply_operations(
@@ -130,6 +230,9 @@ class NotesSyncService:
                         db, user_id, operation, client_updated_at
                     )
                     notes.append(note)
+                elif op == "patch":
+                    note = NotesSyncService._apply_patch(db, user_id, operation)
+                    notes.append(note)
                 elif op == "rename":
                     note = NotesSyncService._apply_rename(
                         db, user_id, operation, client_updated_at
@@ -197,6 +300,25 @@ class NotesSyncService:
             client_updated_at=client_updated_at,
         )
 
+    @staticmethod
+    def _apply_patch(
+        db: Session,
+        user_id: str,
+        operation: dict[str, Any],
+    ) -> Note:
+        note_id = NotesSyncService._parse_note_id(operation)
+        base_hash = operation.get("base_hash")
+        if not base_hash:
+            raise BadRequestError("base_hash required")
+        return NotesService.patch_note_content(
+            db,
+            user_id,
+            note_id,
+            str(base_hash),
+            operation.get("edits") or [],
+            content_hash=operation.get("content_hash"),
+        )
+
     @staticmethod
     def _apply_rename(
         db: Session,
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
+from sqlalchemy import func, or_, update
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.orm import Session, load_only
-from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.orm.exc import ObjectDeletedError
 
 from api.exceptions import NoteNotFoundError
@@ -15,7 +17,11 @@ from api.schemas.filters import NoteFilters
 from api.services.notes_helpers import build_notes_tree
 from api.services.notes_service import NotesService
 from api.services.workspace_service import WorkspaceService
-from api.utils.search import build_text_search_filter
+from api.utils.search import (
+    build_text_search_filter,
+    build_text_search_rank,
+    fetch_search_headlines,
+)
 from api.utils.validation import parse_uuid
 
 
@@ -34,6 +40,7 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         }
         if include_content:
             payload["content"] = note.content
+            payload["content_hash"] = note.content_hash
         return payload
 
     @classmethod
@@ -96,6 +103,7 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         limit: int,
         **kwargs: object,
     ) -> list[Note]:
+        search_vector = Note.__table__.c.search_vector
         return (
             db.query(Note)
             .filter(
@@ -104,13 +112,27 @@ class NotesWorkspaceService(WorkspaceService[Note]):
                 build_text_search_filter(
                     [Note.title, Note.content],
                     query,
+                    search_vector=search_vector,
                 ),
             )
-            .order_by(Note.updated_at.desc())
+            .order_by(
+                build_text_search_rank(search_vector, query).desc(),
+                Note.updated_at.desc(),
+            )
             .limit(limit)
             .all()
         )
 
+    @classmethod
+    def _search_snippets(
+        cls,
+        db: Session,
+        user_id: str,
+        query: str,
+        items: list[Note],
+    ) -> dict[uuid.UUID, str]:
+        return fetch_search_headlines(db, Note, query, [item.id for item in items])
+
     @classmethod
     def _item_to_dict(cls, item: Note, **kwargs: object) -> dict:
         metadata = item.metadata_ or {}
@@ -162,6 +184,45 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         db.commit()
         return {"success": True, "id": str(note.id)}
 
+    @staticmethod
+    def _repath_folder(
+        db: Session, user_id: str, old_path: str, new_folder: str
+    ) -> int:
+        """Rewrite the folder prefix of every note under a folder in one UPDATE.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            old_path: Existing folder path.
+            new_folder: Replacement folder path.
+
+        Returns:
+            Number of notes updated.
+        """
+        folder = Note.metadata_["folder"].astext
+        updated_folder = func.concat(new_folder, func.substr(folder, len(old_path) + 1))
+        result = db.execute(
+            update(Note)
+            .where(
+                Note.user_id == user_id,
+                Note.deleted_at.is_(None),
+                or_(
+                    folder == old_path,
+                    folder.startswith(f"{old_path}/", autoescape=True),
+                ),
+            )
+            .values(
+                metadata_=func.jsonb_set(
+                    Note.metadata_,
+                    array(["folder"]),
+                    func.to_jsonb(updated_folder),
+                ),
+                updated_at=datetime.now(UTC),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     @staticmethod
     def rename_folder(db: Session, user_id: str, old_path: str, new_name: str) -> dict:
         """Rename a folder and update note metadata paths.
@@ -178,19 +239,7 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         parent = "/".join(old_path.split("/")[:-1])
         new_folder = f"{parent}/{new_name}".strip("/") if parent else new_name
 
-        notes = (
-            db.query(Note)
-            .filter(Note.user_id == user_id, Note.deleted_at.is_(None))
-            .all()
-        )
-        for note in notes:
-            folder = (note.metadata_ or {}).get("folder") or ""
-            if folder == old_path or folder.startswith(f"{old_path}/"):
-                updated_folder = folder.replace(old_path, new_folder, 1)
-                note.metadata_ = {**(note.metadata_ or {}), "folder": updated_folder}
-                if hasattr(note, "_sa_instance_state"):
-                    flag_modified(note, "metadata_")
-                note.updated_at = datetime.now(UTC)
+        NotesWorkspaceService._repath_folder(db, user_id, old_path, new_folder)
         db.commit()
         return {"success": True, "newPath": f"folder:{new_folder}"}
 
@@ -218,19 +267,7 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         basename = old_path.split("/")[-1]
         new_folder = f"{new_parent}/{basename}".strip("/") if new_parent else basename
 
-        notes = (
-            db.query(Note)
-            .filter(Note.user_id == user_id, Note.deleted_at.is_(None))
-            .all()
-        )
-        for note in notes:
-            folder = (note.metadata_ or {}).get("folder") or ""
-            if folder == old_path or folder.startswith(f"{old_path}/"):
-                updated_folder = folder.replace(old_path, new_folder, 1)
-                note.metadata_ = {**(note.metadata_ or {}), "folder": updated_folder}
-                if hasattr(note, "_sa_instance_state"):
-                    flag_modified(note, "metadata_")
-                note.updated_at = datetime.now(UTC)
+        NotesWorkspaceService._repath_folder(db, user_id, old_path, new_folder)
         db.commit()
         return {"success": True, "newPath": f"folder:{new_folder}"}
 
@@ -377,6 +414,50 @@ class NotesWorkspaceService(WorkspaceService[Note]):
         )
         return NotesWorkspaceService.build_note_payload(updated, include_content=True)
 
+    @staticmethod
+    def patch_note(
+        db: Session,
+        user_id: str,
+        note_id: str,
+        base_hash: str,
+        edits: list[dict],
+        *,
+        content_hash: str | None = None,
+    ) -> dict:
+        """Apply text edits to a note using workspace request data.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            note_id: Note ID (UUID string).
+            base_hash: Hash of the content the edits apply to.
+            edits: Splice edits to apply.
+            content_hash: Optional expected hash of the result.
+
+        Returns:
+            Update result payload without content.
+
+        Raises:
+            ValueError: If note_id is invalid.
+        """
+        note_uuid = NotesService.parse_note_id(note_id)
+        if not note_uuid:
+            raise ValueError("Invalid note ID")
+
+        updated = NotesService.patch_note_content(
+            db,
+            user_id,
+            note_uuid,
+            base_hash,
+            edits,
+            content_hash=content_hash,
+        )
+        payload = NotesWorkspaceService.build_note_payload(
+            updated, include_content=False
+        )
+        payload["content_hash"] = updated.content_hash
+        return payload
+
     @staticmethod
     def rename_note(
         db: Session,
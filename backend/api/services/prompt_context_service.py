@@ -4,31 +4,54 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import UTC, datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy.orm import Session, load_only
+from sqlalchemy import (
+    Integer,
+    Select,
+    Text,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
 
-from api.constants import PromptContextLimits
+from api.constants import ChatConstants, PromptContextLimits
 from api.models.conversation import Conversation
-from api.models.file_ingestion import IngestedFile
+from api.models.file_ingestion import FileDerivative, IngestedFile
 from api.models.note import Note
 from api.models.website import Website
 from api.prompts import (
     CONTEXT_GUIDANCE_TEMPLATE,
     build_first_message_prompt,
+    build_message_context_block,
     build_open_context_block,
     build_recent_activity_block,
-    build_system_prompt,
+    build_system_prompt_prefix,
     detect_operating_system,
     resolve_template,
 )
-from api.services.file_ingestion_service import FileIngestionService
+from api.services.recent_activity_cache import (
+    RECENT_ACTIVITY_CACHE_TTL,
+    get_recent_activity_cache,
+)
 from api.services.storage.service import get_storage_backend
 from api.services.user_settings_service import UserSettingsService
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for storage reads; storage backends are synchronous.
+_CONTEXT_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PromptContextLimits.CONTEXT_FETCH_WORKERS,
+    thread_name_prefix="prompt-context",
+)
+
 
 class PromptContextService:
     """Build prompt context blocks from DB and open UI state."""
@@ -37,10 +60,16 @@ class PromptContextService:
     MAX_FIRST_MESSAGE_CHARS = PromptContextLimits.MAX_FIRST_MESSAGE_CHARS
     MAX_OPEN_FILE_CHARS = PromptContextLimits.MAX_OPEN_FILE_CHARS
     MAX_ATTACHMENT_CHARS = PromptContextLimits.MAX_ATTACHMENT_CHARS
-    RECENT_ACTIVITY_CACHE_TTL = timedelta(minutes=5)
-    _recent_activity_cache: dict[
-        str, tuple[datetime, tuple[list[dict], list[dict], list[dict], list[dict]]]
-    ] = {}
+    RECENT_ACTIVITY_CACHE_TTL = RECENT_ACTIVITY_CACHE_TTL
+    STABLE_PROMPT_CACHE_MAX_ENTRIES = 512
+    # Rendered stable system prompt per user, keyed on settings.updated_at so
+    # any settings write invalidates it.
+    _stable_prompt_cache: dict[str, tuple[datetime | None, str]] = {}
+    CONTENT_PREFIX_CACHE_MAX_ENTRIES = (
+        PromptContextLimits.CONTENT_PREFIX_CACHE_MAX_ENTRIES
+    )
+    # Truncated ai_md prefixes keyed by (derivative sha256, max_chars).
+    _content_prefix_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
 
     @staticmethod
     def build_prompts(
@@ -70,36 +99,77 @@ class PromptContextService:
         Returns:
             Tuple of (system_prompt, first_message_prompt).
         """
+        system_blocks, first_message_prompt = PromptContextService.build_prompt_blocks(
+            db=db,
+            user_id=user_id,
+            open_context=open_context,
+            attachments=attachments,
+            user_agent=user_agent,
+            current_location=current_location,
+            current_location_levels=current_location_levels,
+            current_weather=current_weather,
+            now=now,
+        )
+        system_prompt = "\n\n".join(block["text"] for block in system_blocks)
+        return system_prompt, first_message_prompt
+
+    @staticmethod
+    def build_prompt_blocks(
+        db: Session,
+        user_id: str,
+        open_context: dict[str, Any] | None,
+        attachments: list[dict[str, Any]] | None,
+        user_agent: str | None,
+        current_location: str | None = None,
+        current_location_levels: dict[str, Any] | str | None = None,
+        current_weather: dict[str, Any] | str | None = None,
+        now: datetime | None = None,
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Build the system prompt as cacheable text blocks.
+
+        The first block holds the stable instructions and carries a
+        ``cache_control`` breakpoint. The second holds per-request context
+        (time, location, weather, open items, recent activity) so changes to
+        it do not invalidate the cached prefix.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            open_context: Open note/website/file context payload.
+            attachments: Optional file attachments metadata list.
+            user_agent: User agent string.
+            current_location: Current location label.
+            current_location_levels: Structured location levels.
+            current_weather: Weather payload.
+            now: Optional timestamp override.
+
+        Returns:
+            Tuple of (system_blocks, first_message_prompt).
+        """
         timestamp = now or datetime.now(UTC)
         settings_record = UserSettingsService.get_settings(db, user_id)
         resolved_location = current_location or "Current location not available"
         operating_system = detect_operating_system(user_agent)
 
-        system_prompt = build_system_prompt(
+        stable_prompt = PromptContextService._get_stable_prompt(
+            user_id, settings_record, timestamp
+        )
+        message_context = build_message_context_block(
             settings_record,
             resolved_location,
             current_location_levels,
             current_weather,
             timestamp,
         )
-        context_guidance = resolve_template(
-            CONTEXT_GUIDANCE_TEMPLATE,
-            {
-                "name": settings_record.name.strip()
-                if settings_record and settings_record.name
-                else "the user"
-            },
-        )
         open_note = open_context.get("note") if isinstance(open_context, dict) else None
         open_website = (
             open_context.get("website") if isinstance(open_context, dict) else None
         )
         open_file = open_context.get("file") if isinstance(open_context, dict) else None
-        resolved_file = PromptContextService._resolve_file_context(
-            db, user_id, open_file, PromptContextService.MAX_OPEN_FILE_CHARS
-        )
-        resolved_attachments = PromptContextService._resolve_attachment_contexts(
-            db, user_id, attachments or [], PromptContextService.MAX_ATTACHMENT_CHARS
+        resolved_file, resolved_attachments = (
+            PromptContextService._resolve_file_contexts(
+                db, user_id, open_file, attachments or []
+            )
         )
         open_block = build_open_context_block(
             open_note,
@@ -118,18 +188,29 @@ class PromptContextService:
             file_items,
         )
 
-        system_prompt = "\n\n".join(
+        volatile_prompt = "\n\n".join(
             [
-                system_prompt,
-                context_guidance,
+                message_context,
                 open_block,
                 recent_activity_block,
             ]
         )
-        system_prompt = PromptContextService._truncate_text(
-            system_prompt,
-            PromptContextService.MAX_SYSTEM_PROMPT_CHARS,
+        volatile_prompt = PromptContextService._truncate_text(
+            volatile_prompt,
+            max(
+                PromptContextService.MAX_SYSTEM_PROMPT_CHARS - len(stable_prompt) - 2,
+                0,
+            ),
         )
+        system_blocks: list[dict[str, Any]] = [
+            {
+                "type": "text",
+                "text": stable_prompt,
+                "cache_control": dict(ChatConstants.PROMPT_CACHE_CONTROL),
+            }
+        ]
+        if volatile_prompt:
+            system_blocks.append({"type": "text", "text": volatile_prompt})
 
         first_message_prompt = build_first_message_prompt(
             settings_record,
@@ -141,105 +222,245 @@ class PromptContextService:
             PromptContextService.MAX_FIRST_MESSAGE_CHARS,
         )
 
-        return system_prompt, first_message_prompt
+        return system_blocks, first_message_prompt
+
+    @classmethod
+    def _get_stable_prompt(
+        cls, user_id: str, settings_record: Any, now: datetime
+    ) -> str:
+        """Return the cached stable system prompt section for a user.
+
+        Args:
+            user_id: Current user ID.
+            settings_record: User settings record or None.
+            now: Current timestamp.
+
+        Returns:
+            Rendered identity, guidance and context-guidance text.
+        """
+        version = settings_record.updated_at if settings_record else None
+        cached = cls._stable_prompt_cache.get(user_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        context_guidance = resolve_template(
+            CONTEXT_GUIDANCE_TEMPLATE,
+            {
+                "name": settings_record.name.strip()
+                if settings_record and settings_record.name
+                else "the user"
+            },
+        )
+        stable_prompt = "\n\n".join(
+            [build_system_prompt_prefix(settings_record, now), context_guidance]
+        )
+        cls._stable_prompt_cache.pop(user_id, None)
+        if len(cls._stable_prompt_cache) >= cls.STABLE_PROMPT_CACHE_MAX_ENTRIES:
+            cls._stable_prompt_cache.pop(next(iter(cls._stable_prompt_cache)))
+        cls._stable_prompt_cache[user_id] = (version, stable_prompt)
+        return stable_prompt
 
     @staticmethod
-    def _resolve_file_context(
-        db: Session,
-        user_id: str,
-        file_ref: dict[str, Any] | None,
-        max_chars: int,
-    ) -> dict[str, Any] | None:
-        if not file_ref:
-            return None
-        file_id = file_ref.get("id") or file_ref.get("file_id")
-        if not file_id:
+    def _parse_file_id(value: Any) -> uuid.UUID | None:
+        """Parse a file id from a context payload, ignoring invalid values."""
+        if not value:
             return None
         try:
-            file_uuid = uuid.UUID(str(file_id))
+            return uuid.UUID(str(value))
         except ValueError:
             return None
-        record = FileIngestionService.get_file(db, user_id, file_uuid)
-        if not record:
-            return None
-        derivative = FileIngestionService.get_derivative(db, file_uuid, "ai_md")
-        content = None
-        if derivative:
-            storage = get_storage_backend()
+
+    @staticmethod
+    def _resolve_file_contexts(
+        db: Session,
+        user_id: str,
+        file_ref: dict[str, Any] | None,
+        attachments: list[dict[str, Any]],
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """Resolve the open file and attachments into prompt context payloads.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            file_ref: Open file reference from the UI, if any.
+            attachments: Attachment references from the UI.
+
+        Returns:
+            Tuple of (open file context or None, attachment contexts).
+        """
+        requests: list[tuple[uuid.UUID, str | None, int]] = []
+        open_file_id = None
+        if file_ref:
+            open_file_id = PromptContextService._parse_file_id(
+                file_ref.get("id") or file_ref.get("file_id")
+            )
+            if open_file_id:
+                requests.append(
+                    (
+                        open_file_id,
+                        file_ref.get("category"),
+                        PromptContextService.MAX_OPEN_FILE_CHARS,
+                    )
+                )
+        for attachment in attachments:
+            attachment_id = PromptContextService._parse_file_id(
+                attachment.get("file_id") or attachment.get("id")
+            )
+            if attachment_id:
+                requests.append(
+                    (
+                        attachment_id,
+                        attachment.get("category"),
+                        PromptContextService.MAX_ATTACHMENT_CHARS,
+                    )
+                )
+
+        loaded = PromptContextService._load_file_contexts(db, user_id, requests)
+        resolved_file = loaded.pop(0) if open_file_id else None
+        return resolved_file, [item for item in loaded if item]
+
+    @classmethod
+    def _load_file_contexts(
+        cls,
+        db: Session,
+        user_id: str,
+        requests: list[tuple[uuid.UUID, str | None, int]],
+    ) -> list[dict[str, Any] | None]:
+        """Load file records and truncated ai_md content for several files.
+
+        Records and derivatives are fetched with one query each, and only the
+        prefix of each derivative needed for the prompt is read from storage,
+        concurrently.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            requests: (file_id, category, max_chars) tuples.
+
+        Returns:
+            Context payloads aligned with requests; None for missing files.
+        """
+        if not requests:
+            return []
+        file_ids = {file_id for file_id, _, _ in requests}
+        records = {
+            record.id: record
+            for record in db.query(IngestedFile).filter(
+                IngestedFile.id.in_(file_ids),
+                IngestedFile.user_id == user_id,
+                IngestedFile.deleted_at.is_(None),
+            )
+        }
+        derivatives = {}
+        if records:
+            derivatives = {
+                derivative.file_id: derivative
+                for derivative in db.query(FileDerivative).filter(
+                    FileDerivative.file_id.in_(records.keys()),
+                    FileDerivative.kind == "ai_md",
+                )
+            }
+
+        contents: dict[tuple[uuid.UUID, int], str | None] = {}
+        pending: dict[tuple[uuid.UUID, int], tuple[FileDerivative, Future[str]]] = {}
+        storage = None
+        for file_id, _, max_chars in requests:
+            key = (file_id, max_chars)
+            derivative = derivatives.get(file_id)
+            if not derivative or key in contents or key in pending:
+                continue
+            cached = cls._get_cached_prefix(derivative.sha256, max_chars)
+            if cached is not None:
+                contents[key] = cached
+                continue
+            storage = storage or get_storage_backend()
+            pending[key] = (
+                derivative,
+                _CONTEXT_FETCH_EXECUTOR.submit(
+                    cls._read_content_prefix, storage, derivative, max_chars
+                ),
+            )
+
+        for key, (derivative, future) in pending.items():
             try:
-                content_bytes = storage.get_object(derivative.storage_key)
-                content = content_bytes.decode("utf-8", errors="ignore")
+                content = future.result()
             except Exception as exc:
                 logger.warning(
                     "Failed to load file context content",
                     exc_info=exc,
                     extra={
                         "user_id": user_id,
-                        "file_id": str(file_uuid),
+                        "file_id": str(key[0]),
                         "storage_key": derivative.storage_key,
                     },
                 )
                 content = None
-        if content:
-            content = PromptContextService._truncate_text(content, max_chars)
-        return {
-            "id": str(record.id),
-            "filename": record.filename_original,
-            "mime": record.mime_original,
-            "category": file_ref.get("category"),
-            "content": content,
-        }
+            else:
+                cls._store_cached_prefix(derivative.sha256, key[1], content)
+            contents[key] = content
 
-    @staticmethod
-    def _resolve_attachment_contexts(
-        db: Session,
-        user_id: str,
-        attachments: list[dict[str, Any]],
-        max_chars: int,
-    ) -> list[dict[str, Any]]:
-        resolved: list[dict[str, Any]] = []
-        for attachment in attachments:
-            file_id = attachment.get("file_id") or attachment.get("id")
-            if not file_id:
-                continue
-            try:
-                file_uuid = uuid.UUID(str(file_id))
-            except ValueError:
-                continue
-            record = FileIngestionService.get_file(db, user_id, file_uuid)
+        resolved: list[dict[str, Any] | None] = []
+        for file_id, category, max_chars in requests:
+            record = records.get(file_id)
             if not record:
+                resolved.append(None)
                 continue
-            derivative = FileIngestionService.get_derivative(db, file_uuid, "ai_md")
-            content = None
-            if derivative:
-                storage = get_storage_backend()
-                try:
-                    content_bytes = storage.get_object(derivative.storage_key)
-                    content = content_bytes.decode("utf-8", errors="ignore")
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to load attachment context content",
-                        exc_info=exc,
-                        extra={
-                            "user_id": user_id,
-                            "file_id": str(file_uuid),
-                            "storage_key": derivative.storage_key,
-                        },
-                    )
-                    content = None
-            if content:
-                content = PromptContextService._truncate_text(content, max_chars)
             resolved.append(
                 {
                     "id": str(record.id),
                     "filename": record.filename_original,
                     "mime": record.mime_original,
-                    "category": attachment.get("category"),
-                    "content": content,
+                    "category": category,
+                    "content": contents.get((file_id, max_chars)),
                 }
             )
         return resolved
 
+    @staticmethod
+    def _read_content_prefix(storage: Any, derivative: Any, max_chars: int) -> str:
+        """Read just enough of a derivative to fill max_chars characters.
+
+        Args:
+            storage: Storage backend.
+            derivative: FileDerivative record.
+            max_chars: Maximum characters to keep.
+
+        Returns:
+            Decoded and truncated content.
+        """
+        # UTF-8 needs at most 4 bytes per character.
+        byte_limit = max_chars * 4
+        if derivative.size_bytes <= byte_limit:
+            data = storage.get_object(derivative.storage_key)
+        else:
+            data = storage.get_object_range(derivative.storage_key, 0, byte_limit - 1)
+        return PromptContextService._truncate_text(
+            data.decode("utf-8", errors="ignore"), max_chars
+        )
+
+    @classmethod
+    def _get_cached_prefix(cls, sha256: str | None, max_chars: int) -> str | None:
+        """Return a cached content prefix for a derivative hash."""
+        if not sha256:
+            return None
+        key = (sha256, max_chars)
+        content = cls._content_prefix_cache.get(key)
+        if content is not None:
+            cls._content_prefix_cache.move_to_end(key)
+        return content
+
+    @classmethod
+    def _store_cached_prefix(
+        cls, sha256: str | None, max_chars: int, content: str
+    ) -> None:
+        """Store a content prefix, evicting the least recently used entry."""
+        if not sha256:
+            return
+        cls._content_prefix_cache[(sha256, max_chars)] = content
+        cls._content_prefix_cache.move_to_end((sha256, max_chars))
+        while len(cls._content_prefix_cache) > cls.CONTENT_PREFIX_CACHE_MAX_ENTRIES:
+            cls._content_prefix_cache.popitem(last=False)
+
     @staticmethod
     def _start_of_today(now: datetime) -> datetime:
         """Return a timezone-aware start-of-day timestamp."""
@@ -269,125 +490,120 @@ class PromptContextService:
         Returns:
             Tuple of (note_items, website_items, conversation_items, file_items).
         """
-        cached = cls._recent_activity_cache.get(user_id)
-        if cached:
-            cached_at, cached_items = cached
-            if now - cached_at <= cls.RECENT_ACTIVITY_CACHE_TTL:
-                return cached_items
-            cls._recent_activity_cache.pop(user_id, None)
+        cache = get_recent_activity_cache()
+        cached = cache.get(user_id, now)
+        if cached is not None:
+            return cached
 
         start_of_day = PromptContextService._start_of_today(now)
+        rows = db.execute(
+            PromptContextService._recent_activity_query(user_id, start_of_day)
+        ).all()
 
-        notes = (
-            db.query(Note)
-            .options(
-                load_only(Note.id, Note.title, Note.last_opened_at, Note.metadata_)
-            )
-            .filter(Note.last_opened_at >= start_of_day)
-            .filter(Note.user_id == user_id)
-            .order_by(Note.last_opened_at.desc())
-            .all()
-        )
-        websites = (
-            db.query(Website)
-            .options(
-                load_only(
-                    Website.id,
-                    Website.title,
-                    Website.last_opened_at,
-                    Website.domain,
-                    Website.url_full,
-                    Website.url,
+        note_items: list[dict] = []
+        website_items: list[dict] = []
+        conversation_items: list[dict] = []
+        file_items: list[dict] = []
+        for row in rows:
+            opened_at = row.opened_at.isoformat() if row.opened_at else None
+            if row.kind == "note":
+                note_items.append(
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "last_opened_at": opened_at,
+                        "folder": row.detail,
+                    }
                 )
-            )
-            .filter(Website.last_opened_at >= start_of_day)
-            .filter(Website.user_id == user_id)
-            .order_by(Website.last_opened_at.desc())
-            .all()
-        )
-        conversations = (
-            db.query(Conversation)
-            .options(
-                load_only(
-                    Conversation.id,
-                    Conversation.title,
-                    Conversation.updated_at,
-                    Conversation.message_count,
+            elif row.kind == "website":
+                website_items.append(
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "last_opened_at": opened_at,
+                        "domain": row.detail,
+                        "url": row.url,
+                    }
                 )
-            )
-            .filter(
-                Conversation.user_id == user_id,
-                Conversation.is_archived.is_(False),
-                Conversation.updated_at >= start_of_day,
-            )
-            .order_by(Conversation.updated_at.desc())
-            .all()
-        )
-        files = (
-            db.query(IngestedFile)
-            .options(
-                load_only(
-                    IngestedFile.id,
-                    IngestedFile.filename_original,
-                    IngestedFile.last_opened_at,
-                    IngestedFile.mime_original,
+            elif row.kind == "conversation":
+                conversation_items.append(
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "last_opened_at": opened_at,
+                        "message_count": row.message_count,
+                    }
+                )
+            else:
+                file_items.append(
+                    {
+                        "id": row.id,
+                        "filename": row.title,
+                        "last_opened_at": opened_at,
+                        "mime": row.detail,
+                    }
                 )
-            )
-            .filter(
-                IngestedFile.last_opened_at >= start_of_day,
-                IngestedFile.user_id == user_id,
-                IngestedFile.deleted_at.is_(None),
-            )
-            .order_by(IngestedFile.last_opened_at.desc())
-            .all()
-        )
-
-        note_items = [
-            {
-                "id": str(note.id),
-                "title": note.title,
-                "last_opened_at": note.last_opened_at.isoformat()
-                if note.last_opened_at
-                else None,
-                "folder": note.metadata_.get("folder") if note.metadata_ else None,
-            }
-            for note in notes
-        ]
-        website_items = [
-            {
-                "id": str(website.id),
-                "title": website.title,
-                "last_opened_at": website.last_opened_at.isoformat()
-                if website.last_opened_at
-                else None,
-                "domain": website.domain,
-                "url": website.url_full or website.url,
-            }
-            for website in websites
-        ]
-        conversation_items = [
-            {
-                "id": str(conversation.id),
-                "title": conversation.title,
-                "last_opened_at": conversation.updated_at.isoformat()
-                if conversation.updated_at
-                else None,
-                "message_count": conversation.message_count,
-            }
-            for conversation in conversations
-        ]
-        file_items = [
-            {
-                "id": str(file.id),
-                "filename": file.filename_original,
-                "last_opened_at": file.last_opened_at.isoformat()
-                if file.last_opened_at
-                else None,
-                "mime": file.mime_original,
-            }
-            for file in files
-        ]
 
         items = (note_items, website_items, conversation_items, file_items)
-        cls._recent_activity_cache[user_id] = (now, items)
+        cache.set(user_id, now, items)
         return items
+
+    @staticmethod
+    def _recent_activity_query(user_id: str, start_of_day: datetime) -> Select:
+        """Build one UNION ALL query over today's notes, websites, chats and files.
+
+        Args:
+            user_id: Current user ID.
+            start_of_day: Lower bound for activity timestamps.
+
+        Returns:
+            Select yielding (kind, id, title, opened_at, detail, url,
+            message_count) rows, most recent first.
+        """
+        no_text = null().cast(Text)
+        notes = select(
+            literal("note").label("kind"),
+            cast(Note.id, Text).label("id"),
+            Note.title.label("title"),
+            Note.last_opened_at.label("opened_at"),
+            Note.metadata_["folder"].astext.label("detail"),
+            no_text.label("url"),
+            null().cast(Integer).label("message_count"),
+        ).where(Note.user_id == user_id, Note.last_opened_at >= start_of_day)
+        websites = select(
+            literal("website"),
+            cast(Website.id, Text),
+            Website.title,
+            Website.last_opened_at,
+            Website.domain,
+            func.coalesce(func.nullif(Website.url_full, ""), Website.url),
+            null().cast(Integer),
+        ).where(Website.user_id == user_id, Website.last_opened_at >= start_of_day)
+        conversations = select(
+            literal("conversation"),
+            cast(Conversation.id, Text),
+            Conversation.title,
+            Conversation.updated_at,
+            no_text,
+            no_text,
+            Conversation.message_count,
+        ).where(
+            Conversation.user_id == user_id,
+            Conversation.is_archived.is_(False),
+            Conversation.updated_at >= start_of_day,
+        )
+        files = select(
+            literal("file"),
+            cast(IngestedFile.id, Text),
+            IngestedFile.filename_original,
+            IngestedFile.last_opened_at,
+            IngestedFile.mime_original,
+            no_text,
+            null().cast(Integer),
+        ).where(
+            IngestedFile.user_id == user_id,
+            IngestedFile.last_opened_at >= start_of_day,
+            IngestedFile.deleted_at.is_(None),
+        )
+        combined = union_all(notes, websites, conversations, files).subquery()
+        return select(combined).order_by(combined.c.opened_at.desc())
@@ -0,0 +1,234 @@
+"""Pluggable cache for the recent-activity block of the chat prompt."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.conversation import Conversation
+from api.models.file_ingestion import IngestedFile
+from api.models.note import Note
+from api.models.website import Website
+
+logger = logging.getLogger(__name__)
+
+RecentActivityItems = tuple[list[dict], list[dict], list[dict], list[dict]]
+
+# Models whose changes affect a user's recent-activity block.
+_TRACKED_MODELS = (Note, Website, IngestedFile, Conversation)
+
+
+class RecentActivityCache:
+    """Interface for recent-activity cache backends."""
+
+    def get(self, user_id: str, now: datetime) -> RecentActivityItems | None:
+        """Return cached items for a user, or None on a miss.
+
+        Args:
+            user_id: Current user ID.
+            now: Current timestamp, used for expiry.
+
+        Returns:
+            Cached items or None.
+        """
+        raise NotImplementedError
+
+    def set(self, user_id: str, now: datetime, items: RecentActivityItems) -> None:
+        """Store items for a user.
+
+        Args:
+            user_id: Current user ID.
+            now: Timestamp the items were computed at.
+            items: Recent activity items.
+        """
+        raise NotImplementedError
+
+    def invalidate(self, user_ids: set[str]) -> None:
+        """Drop cached items for the given users.
+
+        Args:
+            user_ids: Users whose activity changed.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop all cached items."""
+        raise NotImplementedError
+
+
+class MemoryRecentActivityCache(RecentActivityCache):
+    """Bounded per-process LRU cache with a TTL backstop."""
+
+    def __init__(self, *, max_entries: int, ttl: timedelta) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum users kept before evicting the oldest.
+            ttl: Maximum age of an entry.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[datetime, RecentActivityItems]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, now: datetime) -> RecentActivityItems | None:
+        """Return cached items for a user, or None on a miss."""
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if not cached:
+                return None
+            cached_at, items = cached
+            if not timedelta(0) <= now - cached_at <= self.ttl:
+                self._entries.pop(user_id, None)
+                return None
+            self._entries.move_to_end(user_id)
+            return items
+
+    def set(self, user_id: str, now: datetime, items: RecentActivityItems) -> None:
+        """Store items for a user, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[user_id] = (now, items)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: set[str]) -> None:
+        """Drop cached items for the given users."""
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached items."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached users."""
+        return len(self._entries)
+
+
+class RedisRecentActivityCache(RecentActivityCache):
+    """Redis-backed cache shared by every API worker."""
+
+    KEY_PREFIX = "sidebar:recent-activity:"
+
+    def __init__(self, client: Any, *, ttl: timedelta) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: Redis client (or any object with get/set/delete).
+            ttl: Entry expiry.
+        """
+        self.client = client
+        self.ttl = ttl
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    def get(self, user_id: str, now: datetime) -> RecentActivityItems | None:
+        """Return cached items for a user, or None on a miss."""
+        raw = self.client.get(self._key(user_id))
+        if not raw:
+            return None
+        payload = json.loads(raw)
+        cached_at = datetime.fromisoformat(payload["cached_at"])
+        if not timedelta(0) <= now - cached_at <= self.ttl:
+            return None
+        notes, websites, conversations, files = payload["items"]
+        return notes, websites, conversations, files
+
+    def set(self, user_id: str, now: datetime, items: RecentActivityItems) -> None:
+        """Store items for a user with a TTL."""
+        payload = json.dumps({"cached_at": now.isoformat(), "items": list(items)})
+        self.client.set(
+            self._key(user_id), payload, ex=int(self.ttl.total_seconds()) or 1
+        )
+
+    def invalidate(self, user_ids: set[str]) -> None:
+        """Drop cached items for the given users."""
+        if user_ids:
+            self.client.delete(*(self._key(user_id) for user_id in user_ids))
+
+    def clear(self) -> None:
+        """Drop all cached items."""
+        keys = list(self.client.scan_iter(f"{self.KEY_PREFIX}*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+RECENT_ACTIVITY_CACHE_TTL = timedelta(minutes=5)
+RECENT_ACTIVITY_CACHE_MAX_ENTRIES = 1024
+
+_cache: RecentActivityCache | None = None
+
+
+def get_recent_activity_cache() -> RecentActivityCache:
+    """Return the configured recent-activity cache.
+
+    Uses Redis when RECENT_ACTIVITY_CACHE_URL is set so hits and
+    invalidations are shared across workers; otherwise a per-process LRU.
+
+    Returns:
+        RecentActivityCache implementation based on settings.
+    """
+    global _cache
+    if _cache is None:
+        url = settings.recent_activity_cache_url
+        if url:
+            try:
+                import redis
+            except ImportError as exc:
+                raise RuntimeError(
+                    "RECENT_ACTIVITY_CACHE_URL requires the redis package."
+                ) from exc
+            _cache = RedisRecentActivityCache(
+                redis.Redis.from_url(url), ttl=RECENT_ACTIVITY_CACHE_TTL
+            )
+        else:
+            _cache = MemoryRecentActivityCache(
+                max_entries=RECENT_ACTIVITY_CACHE_MAX_ENTRIES,
+                ttl=RECENT_ACTIVITY_CACHE_TTL,
+            )
+    return _cache
+
+
+def set_recent_activity_cache(cache: RecentActivityCache | None) -> None:
+    """Override the cache backend (None restores the configured default)."""
+    global _cache
+    _cache = cache
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_recent_activity(session: Session, _flush_context) -> None:
+    """Invalidate recent activity for users whose tracked rows changed."""
+    user_ids: set[str] = set()
+    changed = [*session.new, *session.deleted]
+    changed.extend(
+        instance
+        for instance in session.dirty
+        if isinstance(instance, _TRACKED_MODELS)
+        and session.is_modified(instance, include_collections=False)
+    )
+    for instance in changed:
+        if isinstance(instance, _TRACKED_MODELS):
+            # Read from the instance dict so no lazy load is issued mid-flush.
+            user_id = inspect(instance).dict.get("user_id")
+            if user_id:
+                user_ids.add(user_id)
+    if not user_ids:
+        return
+    try:
+        get_recent_activity_cache().invalidate(user_ids)
+    except Exception as exc:
+        logger.warning("Failed to invalidate recent activity cache", exc_info=exc)
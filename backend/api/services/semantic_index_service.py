@@ -0,0 +1,629 @@
+"""Chunked embedding index for semantic search over notes, websites and files."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import delete, event, insert, select, text
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.db.session import SessionLocal, set_session_user_id
+from api.models.file_ingestion import IngestedFile
+from api.models.note import Note
+from api.models.semantic_chunk import SemanticChunk
+from api.models.website import Website
+from api.services.embeddings import EMBEDDING_DIMENSIONS, Embedder, get_embedder
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CONTENT_TYPES = ("note", "website", "file")
+
+# Chunks close on a content-defined paragraph boundary once they reach the
+# minimum size, so an edit only shifts the chunks around it.
+CHUNK_MIN_CHARS = 400
+CHUNK_MAX_CHARS = 1500
+
+# Session.info key holding documents changed in the open transaction.
+_PENDING_DOCUMENTS_KEY = "semantic_index_pending_documents"
+
+_FRONTMATTER_PATTERN = re.compile(r"\A---\n.*?\n---\n", re.DOTALL)
+
+DocumentKey = tuple[str, uuid.UUID]
+
+
+@dataclass
+class ChunkMatch:
+    """A chunk returned by a vector search."""
+
+    content_type: str
+    content_id: uuid.UUID
+    chunk_index: int
+    text: str
+    score: float
+
+
+def _split_long(paragraph: str) -> list[str]:
+    pieces: list[str] = []
+    while len(paragraph) > CHUNK_MAX_CHARS:
+        cut = paragraph.rfind(" ", 0, CHUNK_MAX_CHARS)
+        if cut <= 0:
+            cut = CHUNK_MAX_CHARS
+        pieces.append(paragraph[:cut].strip())
+        paragraph = paragraph[cut:].strip()
+    if paragraph:
+        pieces.append(paragraph)
+    return pieces
+
+
+def _is_boundary(paragraph: str) -> bool:
+    return hashlib.sha1(paragraph.encode("utf-8")).digest()[0] % 4 == 0
+
+
+def chunk_text(content: str) -> list[str]:
+    """Split markdown into paragraph-aligned chunks for embedding.
+
+    Leading YAML frontmatter is dropped. Chunk boundaries depend only on the
+    paragraphs around them, so editing one paragraph leaves the other
+    chunks (and their embeddings) unchanged.
+
+    Args:
+        content: Markdown text.
+
+    Returns:
+        Chunks of at most CHUNK_MAX_CHARS characters.
+    """
+    body = _FRONTMATTER_PATTERN.sub("", content or "", count=1)
+    pieces = [
+        piece
+        for paragraph in re.split(r"\n\s*\n", body)
+        if paragraph.strip()
+        for piece in _split_long(paragraph.strip())
+    ]
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in pieces:
+        if current and size + len(piece) > CHUNK_MAX_CHARS:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(piece)
+        size += len(piece) + 2
+        if size >= CHUNK_MIN_CHARS and _is_boundary(piece):
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _chunk_hash(model: str, chunk: str) -> str:
+    return hashlib.sha256(f"{model}\0{chunk}".encode()).hexdigest()
+
+
+def _vector_literal(embedding: Sequence[float]) -> str:
+    return "[" + ",".join(f"{value:.7g}" for value in embedding) + "]"
+
+
+class VectorIndex(ABC):
+    """Nearest-neighbour lookup over stored chunk embeddings."""
+
+    @abstractmethod
+    def search(
+        self,
+        db: Session,
+        user_id: str,
+        embedding: Sequence[float],
+        *,
+        content_types: Sequence[str],
+        limit: int,
+    ) -> list[ChunkMatch]:
+        """Return the chunks closest to an embedding by cosine similarity.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            embedding: Unit-length query embedding.
+            content_types: Content types to search.
+            limit: Max number of chunks.
+
+        Returns:
+            Matches ordered by similarity, highest first.
+        """
+
+
+class PgVectorIndex(VectorIndex):
+    """Approximate search through the pgvector HNSW index."""
+
+    def search(
+        self,
+        db: Session,
+        user_id: str,
+        embedding: Sequence[float],
+        *,
+        content_types: Sequence[str],
+        limit: int,
+    ) -> list[ChunkMatch]:
+        """Search with the HNSW index on the embedding cast."""
+        distance = (
+            f"embedding::vector({EMBEDDING_DIMENSIONS}) "
+            f"<=> CAST(:query AS vector({EMBEDDING_DIMENSIONS}))"
+        )
+        rows = db.execute(
+            text(
+                f"""
+                SELECT content_type, content_id, chunk_index, text,
+                       1 - ({distance}) AS score
+                FROM semantic_chunks
+                WHERE user_id = :user_id AND content_type = ANY(:content_types)
+                ORDER BY {distance}
+                LIMIT :limit
+                """
+            ),
+            {
+                "query": _vector_literal(embedding),
+                "user_id": user_id,
+                "content_types": list(content_types),
+                "limit": limit,
+            },
+        ).all()
+        return [
+            ChunkMatch(
+                content_type=row.content_type,
+                content_id=row.content_id,
+                chunk_index=row.chunk_index,
+                text=row.text,
+                score=float(row.score),
+            )
+            for row in rows
+        ]
+
+
+class NumpyVectorIndex(VectorIndex):
+    """Exact brute-force search in NumPy, for databases without pgvector."""
+
+    def search(
+        self,
+        db: Session,
+        user_id: str,
+        embedding: Sequence[float],
+        *,
+        content_types: Sequence[str],
+        limit: int,
+    ) -> list[ChunkMatch]:
+        """Score every chunk of the user's content and keep the best."""
+        import numpy as np
+
+        rows = db.execute(
+            select(SemanticChunk.id, SemanticChunk.embedding).where(
+                SemanticChunk.user_id == user_id,
+                SemanticChunk.content_type.in_(content_types),
+            )
+        ).all()
+        if not rows:
+            return []
+        matrix = np.asarray([row.embedding for row in rows], dtype=np.float32)
+        scores = matrix @ np.asarray(embedding, dtype=np.float32)
+        count = min(limit, len(rows))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top])]
+        chunks = {
+            chunk.id: chunk
+            for chunk in db.query(SemanticChunk).filter(
+                SemanticChunk.id.in_([rows[position].id for position in top])
+            )
+        }
+        return [
+            ChunkMatch(
+                content_type=chunk.content_type,
+                content_id=chunk.content_id,
+                chunk_index=chunk.chunk_index,
+                text=chunk.text,
+                score=float(scores[position]),
+            )
+            for position in top
+            if (chunk := chunks.get(rows[position].id)) is not None
+        ]
+
+
+_pgvector_installed: bool | None = None
+
+
+def get_vector_index(db: Session) -> VectorIndex:
+    """Return the configured vector index backend.
+
+    With SEMANTIC_INDEX_BACKEND=auto, pgvector is used when the extension is
+    installed in the database.
+
+    Args:
+        db: Database session used to detect pgvector.
+
+    Returns:
+        VectorIndex implementation.
+    """
+    global _pgvector_installed
+    backend = settings.semantic_index_backend
+    if backend == "pgvector":
+        return PgVectorIndex()
+    if backend == "numpy":
+        return NumpyVectorIndex()
+    if _pgvector_installed is None:
+        _pgvector_installed = bool(
+            db.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'vector'")
+            ).scalar()
+        )
+    return PgVectorIndex() if _pgvector_installed else NumpyVectorIndex()
+
+
+class SemanticIndexService:
+    """Maintain and query chunk embeddings for a user's content."""
+
+    @staticmethod
+    def index_documents(
+        db: Session,
+        user_id: str,
+        documents: Sequence[tuple[str, uuid.UUID, str]],
+        *,
+        embedder: Embedder,
+    ) -> int:
+        """Re-index documents, embedding only chunks that changed.
+
+        Chunks whose text is unchanged keep their stored embedding; new
+        chunks across all documents are embedded in shared batches. The
+        caller commits.
+
+        Args:
+            db: Database session.
+            user_id: Owner of the documents.
+            documents: (content_type, content_id, text) triples.
+            embedder: Embedder for new chunks.
+
+        Returns:
+            Number of chunks that were embedded.
+        """
+        if not documents:
+            return 0
+        keys = [(content_type, content_id) for content_type, content_id, _ in documents]
+        stored: dict[DocumentKey, list[tuple[str, list[float]]]] = defaultdict(list)
+        for row in db.execute(
+            select(
+                SemanticChunk.content_type,
+                SemanticChunk.content_id,
+                SemanticChunk.chunk_hash,
+                SemanticChunk.embedding,
+            )
+            .where(
+                SemanticChunk.user_id == user_id,
+                SemanticChunk.content_id.in_([content_id for _, content_id in keys]),
+            )
+            .order_by(SemanticChunk.chunk_index)
+        ):
+            stored[(row.content_type, row.content_id)].append(
+                (row.chunk_hash, row.embedding)
+            )
+
+        planned: list[tuple[DocumentKey, list[str], list[str]]] = []
+        known: dict[str, list[float]] = {}
+        missing: dict[str, str] = {}
+        for content_type, content_id, content in documents:
+            key = (content_type, content_id)
+            chunks = chunk_text(content)
+            hashes = [_chunk_hash(embedder.model, chunk) for chunk in chunks]
+            existing = stored.get(key, [])
+            if hashes == [chunk_hash for chunk_hash, _ in existing]:
+                continue
+            known.update(existing)
+            for chunk_hash, chunk in zip(hashes, chunks, strict=True):
+                if chunk_hash not in known:
+                    missing[chunk_hash] = chunk
+            planned.append((key, chunks, hashes))
+        if not planned:
+            return 0
+
+        if missing:
+            vectors = embedder.embed(list(missing.values()))
+            known.update(zip(missing.keys(), vectors, strict=True))
+
+        SemanticIndexService.remove_documents(
+            db, user_id, [key for key, _, _ in planned]
+        )
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "content_type": content_type,
+                "content_id": content_id,
+                "chunk_index": index,
+                "chunk_hash": chunk_hash,
+                "text": chunk,
+                "embedding": known[chunk_hash],
+            }
+            for (content_type, content_id), chunks, hashes in planned
+            for index, (chunk, chunk_hash) in enumerate(
+                zip(chunks, hashes, strict=True)
+            )
+        ]
+        if rows:
+            db.execute(insert(SemanticChunk), rows)
+        return len(missing)
+
+    @staticmethod
+    def index_document(
+        db: Session,
+        user_id: str,
+        content_type: str,
+        content_id: uuid.UUID,
+        content: str,
+        *,
+        embedder: Embedder,
+    ) -> int:
+        """Re-index a single document. The caller commits.
+
+        Args:
+            db: Database session.
+            user_id: Owner of the document.
+            content_type: "note", "website" or "file".
+            content_id: Source record ID.
+            content: Document text.
+            embedder: Embedder for new chunks.
+
+        Returns:
+            Number of chunks that were embedded.
+        """
+        return SemanticIndexService.index_documents(
+            db, user_id, [(content_type, content_id, content)], embedder=embedder
+        )
+
+    @staticmethod
+    def remove_documents(
+        db: Session, user_id: str, keys: Sequence[DocumentKey]
+    ) -> None:
+        """Delete stored chunks for documents. The caller commits.
+
+        Args:
+            db: Database session.
+            user_id: Owner of the documents.
+            keys: (content_type, content_id) pairs.
+        """
+        by_type: dict[str, list[uuid.UUID]] = defaultdict(list)
+        for content_type, content_id in keys:
+            by_type[content_type].append(content_id)
+        for content_type, content_ids in by_type.items():
+            db.execute(
+                delete(SemanticChunk).where(
+                    SemanticChunk.user_id == user_id,
+                    SemanticChunk.content_type == content_type,
+                    SemanticChunk.content_id.in_(content_ids),
+                )
+            )
+
+    @staticmethod
+    def search(
+        db: Session,
+        user_id: str,
+        query: str,
+        *,
+        content_types: Sequence[str] | None = None,
+        limit: int = 10,
+        embedder: Embedder | None = None,
+        index: VectorIndex | None = None,
+    ) -> list[ChunkMatch]:
+        """Return the best-matching chunk for each of the closest documents.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+            query: Natural-language query.
+            content_types: Content types to search (all when omitted).
+            limit: Max number of documents.
+            embedder: Embedder for the query (defaults to the configured one).
+            index: Vector index backend (defaults to get_vector_index).
+
+        Returns:
+            One match per document, most similar first.
+        """
+        embedder = embedder or get_embedder()
+        if embedder is None or not query.strip():
+            return []
+        (embedding,) = embedder.embed([query])
+        # Several chunks of one document can crowd the top; over-fetch so
+        # the per-document collapse still fills the limit.
+        matches = (index or get_vector_index(db)).search(
+            db,
+            user_id,
+            embedding,
+            content_types=list(content_types or SEMANTIC_CONTENT_TYPES),
+            limit=limit * 4,
+        )
+        best: dict[DocumentKey, ChunkMatch] = {}
+        for match in matches:
+            best.setdefault((match.content_type, match.content_id), match)
+        return list(best.values())[:limit]
+
+
+def _load_documents(
+    db: Session, user_id: str, keys: Sequence[DocumentKey]
+) -> tuple[list[tuple[str, uuid.UUID, str]], list[DocumentKey]]:
+    """Split changed documents into ones to re-index and ones to drop.
+
+    File text comes from the ai.md derivative, which the ingestion worker
+    indexes directly, so files are only ever dropped here.
+    """
+    ids: dict[str, list[uuid.UUID]] = defaultdict(list)
+    for content_type, content_id in keys:
+        ids[content_type].append(content_id)
+    documents: list[tuple[str, uuid.UUID, str]] = []
+    live: set[DocumentKey] = set()
+    for content_type, model in (("note", Note), ("website", Website)):
+        if not ids.get(content_type):
+            continue
+        for content_id, content in db.execute(
+            select(model.id, model.content).where(
+                model.user_id == user_id,
+                model.id.in_(ids[content_type]),
+                model.deleted_at.is_(None),
+            )
+        ):
+            documents.append((content_type, content_id, content or ""))
+            live.add((content_type, content_id))
+    if ids.get("file"):
+        live.update(
+            ("file", file_id)
+            for (file_id,) in db.execute(
+                select(IngestedFile.id).where(
+                    IngestedFile.user_id == user_id,
+                    IngestedFile.id.in_(ids["file"]),
+                    IngestedFile.deleted_at.is_(None),
+                )
+            )
+        )
+    return documents, [key for key in keys if key not in live]
+
+
+class SemanticIndexScheduler:
+    """Batch re-indexing of changed notes and websites.
+
+    The first change opens a batch window; every document changed during the
+    window is re-indexed once when it closes, with embeddings requested in
+    shared batches.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay_seconds: float,
+        session_factory: Callable[[], Session] | None = None,
+        embedder: Embedder | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            delay_seconds: Length of the batch window.
+            session_factory: Session factory (defaults to SessionLocal).
+            embedder: Embedder (defaults to the configured one).
+        """
+        self.delay_seconds = delay_seconds
+        self._session_factory = session_factory
+        self._embedder = embedder
+        self._pending: dict[str, set[DocumentKey]] = defaultdict(set)
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def schedule(self, user_id: str, content_type: str, content_id: uuid.UUID) -> None:
+        """Queue a document for re-indexing.
+
+        Args:
+            user_id: Owner of the document.
+            content_type: "note", "website" or "file".
+            content_id: Source record ID.
+        """
+        with self._lock:
+            self._pending[user_id].add((content_type, content_id))
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay_seconds, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Re-index every queued document now."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(set)
+            timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        for user_id, keys in pending.items():
+            try:
+                self._reindex(user_id, sorted(keys, key=str))
+            except Exception as exc:
+                logger.warning("Failed to update semantic index", exc_info=exc)
+
+    def shutdown(self) -> None:
+        """Cancel the open batch window without indexing."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            self._pending = defaultdict(set)
+        if timer is not None:
+            timer.cancel()
+
+    def _reindex(self, user_id: str, keys: list[DocumentKey]) -> None:
+        embedder = self._embedder or get_embedder()
+        if embedder is None:
+            return
+        with (self._session_factory or SessionLocal)() as db:
+            set_session_user_id(db, user_id)
+            documents, removed = _load_documents(db, user_id, keys)
+            SemanticIndexService.remove_documents(db, user_id, removed)
+            SemanticIndexService.index_documents(
+                db, user_id, documents, embedder=embedder
+            )
+            db.commit()
+
+
+_scheduler: SemanticIndexScheduler | None = None
+
+
+def get_semantic_index_scheduler() -> SemanticIndexScheduler:
+    """Return the process-wide semantic index scheduler.
+
+    Returns:
+        Shared SemanticIndexScheduler instance.
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = SemanticIndexScheduler(
+            delay_seconds=settings.semantic_index_delay_seconds
+        )
+    return _scheduler
+
+
+def set_semantic_index_scheduler(scheduler: SemanticIndexScheduler | None) -> None:
+    """Override the scheduler (None restores the configured default)."""
+    global _scheduler
+    _scheduler = scheduler
+
+
+def mark_content_changed(
+    db: Session, user_id: str, content_type: str, content_id: uuid.UUID
+) -> None:
+    """Re-index a document once the session's transaction commits.
+
+    A no-op while semantic indexing is disabled.
+
+    Args:
+        db: Session carrying the change.
+        user_id: Owner of the document.
+        content_type: "note", "website" or "file".
+        content_id: Source record ID.
+    """
+    if not settings.semantic_index_embedder:
+        return
+    db.info.setdefault(_PENDING_DOCUMENTS_KEY, set()).add(
+        (user_id, content_type, content_id)
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _schedule_committed_documents(session: Session) -> None:
+    """Queue re-indexing for documents whose changes just committed."""
+    documents = session.info.pop(_PENDING_DOCUMENTS_KEY, None)
+    if not documents:
+        return
+    scheduler = get_semantic_index_scheduler()
+    for user_id, content_type, content_id in documents:
+        scheduler.schedule(user_id, content_type, content_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_documents(session: Session) -> None:
+    """Drop queued re-indexing for a rolled back transaction."""
+    session.info.pop(_PENDING_DOCUMENTS_KEY, None)
@@ -7,6 +7,7 @@ import secrets
 
 from fastapi import HTTPException
 
+from api.auth import invalidate_shortcuts_pat
 from api.config import settings
 from api.services.skill_catalog_service import SkillCatalogService
 from api.services.storage.service import get_storage_backend
@@ -419,6 +420,10 @@ class SettingsService:
     @staticmethod
     def rotate_shortcuts_pat(db, user_id: str) -> str:
         """Rotate the shortcuts PAT token for a user."""
+        settings_record = UserSettingsService.get_settings(db, user_id)
+        previous = settings_record.shortcuts_pat if settings_record else None
         token = SettingsService._generate_shortcuts_pat()
         UserSettingsService.upsert_settings(db, user_id, shortcuts_pat=token)
+        if previous:
+            invalidate_shortcuts_pat(previous)
         return token
@@ -12,10 +12,57 @@ from api.services.tools.skill_metadata import EXPOSED_SKILLS, SKILL_DISPLAY
 class SkillCatalogService:
     """Load skill metadata from SKILL.md frontmatter."""
 
+    # Parsed catalogs keyed by skills_dir, stored with the mtime signature they
+    # were built from so edits to SKILL.md files are picked up.
+    _catalog_cache: dict[Path, tuple[tuple, list[dict[str, str]]]] = {}
+
     @staticmethod
     def list_skills(skills_dir: Path) -> list[dict[str, str]]:
         """List available skills with display metadata.
 
+        The catalog is parsed once and reused until a skill directory or
+        SKILL.md file changes.
+
+        Args:
+            skills_dir: Root directory containing skills.
+
+        Returns:
+            List of skill metadata dicts.
+        """
+        if not skills_dir.exists():
+            return []
+
+        signature = SkillCatalogService._catalog_signature(skills_dir)
+        cached = SkillCatalogService._catalog_cache.get(skills_dir)
+        if cached is None or cached[0] != signature:
+            cached = (signature, SkillCatalogService._load_skills(skills_dir))
+            SkillCatalogService._catalog_cache[skills_dir] = cached
+        return [dict(skill) for skill in cached[1]]
+
+    @staticmethod
+    def _catalog_signature(skills_dir: Path) -> tuple:
+        """Return an mtime signature for the skills directory.
+
+        Args:
+            skills_dir: Root directory containing skills.
+
+        Returns:
+            Tuple of the directory mtime and each SKILL.md mtime.
+        """
+        entries: list[tuple[str, int]] = []
+        for skill_path in skills_dir.iterdir():
+            try:
+                entries.append(
+                    (skill_path.name, (skill_path / "SKILL.md").stat().st_mtime_ns)
+                )
+            except OSError:
+                continue
+        return skills_dir.stat().st_mtime_ns, tuple(sorted(entries))
+
+    @staticmethod
+    def _load_skills(skills_dir: Path) -> list[dict[str, str]]:
+        """Parse skill metadata from every SKILL.md under skills_dir.
+
         Args:
             skills_dir: Root directory containing skills.
 
@@ -25,9 +72,6 @@ class SkillCatalogService:
         skills: list[dict[str, str]] = []
         category_map = SkillCatalogService._category_map()
 
-        if not skills_dir.exists():
-            return skills
-
         for skill_path in sorted(p for p in skills_dir.iterdir() if p.is_dir()):
             skill_md = skill_path / "SKILL.md"
             if not skill_md.exists():
@@ -129,6 +173,7 @@ class SkillCatalogService:
             "fs": "Documents",
             "notes": "Productivity",
             "tasks": "Productivity",
+            "local-search": "Productivity",
             "docx": "Documents",
             "pdf": "Documents",
             "pptx": "Documents",
@@ -11,8 +11,11 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import func, update
+
 from api.db.session import set_session_user_id
 from api.models.file_ingestion import FileDerivative, FileProcessingJob, IngestedFile
+from api.services.file_ingestion_service import FileIngestionService
 from api.services.skill_file_ops_helpers import (
     build_frontmatter,
     find_record_by_path,
@@ -501,6 +504,7 @@ def write_text(
             )
 
         db.query(FileDerivative).filter(FileDerivative.file_id == record.id).delete()
+        FileIngestionService.notify_job_queued(db, record.id)
         db.commit()
 
     if os.getenv("TESTING", "").lower() in {"1", "true", "yes", "on"}:
@@ -624,6 +628,7 @@ def upload_file(
                 updated_at=now,
             )
         )
+        FileIngestionService.notify_job_queued(db, record.id)
         db.commit()
         return record
 
@@ -721,40 +726,54 @@ def move_path(user_id: str, source: str, destination: str) -> dict:
         if record:
             record.path = dest
             record.filename_original = Path(dest).name
+            record.updated_at = now_utc()
             db.commit()
             return {"source": src, "destination": dest, "type": "file"}
 
         prefix = f"{src}/"
-        records = (
-            db.query(IngestedFile)
+        source_exists = (
+            db.query(IngestedFile.id)
             .filter(
                 IngestedFile.user_id == user_id,
                 IngestedFile.deleted_at.is_(None),
-                IngestedFile.path.like(f"{prefix}%"),
+                IngestedFile.path.startswith(prefix, autoescape=True),
             )
-            .all()
+            .first()
         )
-        if not records:
+        if not source_exists:
             raise FileNotFoundError(f"Source not found: {source}")
 
         dest_prefix = f"{dest}/"
         dest_conflict = (
-            db.query(IngestedFile)
+            db.query(IngestedFile.id)
             .filter(
                 IngestedFile.user_id == user_id,
                 IngestedFile.deleted_at.is_(None),
-                IngestedFile.path.like(f"{dest_prefix}%"),
+                IngestedFile.path.startswith(dest_prefix, autoescape=True),
             )
             .first()
         )
         if dest_conflict:
             raise FileExistsError(f"Destination already exists: {destination}")
 
-        for item in records:
-            suffix = item.path[len(prefix) :]
-            item.path = f"{dest}/{suffix}" if suffix else dest
-            item.filename_original = Path(item.path).name
-
+        # Rewrite the whole subtree in one statement; the basename is unchanged
+        # by a prefix swap, so filename_original is derived from the old path.
+        db.execute(
+            update(IngestedFile)
+            .where(
+                IngestedFile.user_id == user_id,
+                IngestedFile.deleted_at.is_(None),
+                IngestedFile.path.startswith(prefix, autoescape=True),
+            )
+            .values(
+                path=func.concat(
+                    dest_prefix, func.substr(IngestedFile.path, len(prefix) + 1)
+                ),
+                filename_original=func.regexp_replace(IngestedFile.path, "^.*/", ""),
+                updated_at=now_utc(),
+            )
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
 
     return {"source": src, "destination": dest, "type": "directory"}
@@ -6,6 +6,9 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 
+from api.metrics import storage_operations_total
+from api.request_stats import record_storage_io
+
 
 @dataclass(frozen=True)
 class StorageObject:
@@ -18,6 +21,18 @@ class StorageObject:
     last_modified: datetime | None = None
 
 
+def record_storage_operation(operation: str, status: str, nbytes: int = 0) -> None:
+    """Count a storage call globally and against the current request.
+
+    Args:
+        operation: Operation name (get, put, list, ...).
+        status: "success" or "error".
+        nbytes: Bytes read or written by the call.
+    """
+    storage_operations_total.labels(operation, status).inc()
+    record_storage_io(nbytes)
+
+
 class StorageBackend:
     """Interface for storage backends."""
 
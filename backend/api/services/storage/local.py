@@ -5,8 +5,11 @@ from __future__ import annotations
 from collections.abc import Iterable
 from pathlib import Path
 
-from api.metrics import storage_operations_total
-from api.services.storage.base import StorageBackend, StorageObject
+from api.services.storage.base import (
+    StorageBackend,
+    StorageObject,
+    record_storage_operation,
+)
 
 
 class LocalStorage(StorageBackend):
@@ -40,12 +43,12 @@ class LocalStorage(StorageBackend):
         root = self._resolve_key(prefix)
         try:
             if not root.exists():
-                storage_operations_total.labels("list", "success").inc()
+                record_storage_operation("list", "success")
                 return []
 
             if root.is_file():
                 stat = root.stat()
-                storage_operations_total.labels("list", "success").inc()
+                record_storage_operation("list", "success")
                 return [
                     StorageObject(
                         key=str(root.relative_to(self.base_path)),
@@ -67,20 +70,20 @@ class LocalStorage(StorageBackend):
                         last_modified=None,
                     )
                 )
-            storage_operations_total.labels("list", "success").inc()
+            record_storage_operation("list", "success")
             return objects
         except Exception:
-            storage_operations_total.labels("list", "error").inc()
+            record_storage_operation("list", "error")
             raise
 
     def get_object(self, key: str) -> bytes:
         """Read object bytes from local storage."""
         try:
             data = self._resolve_key(key).read_bytes()
-            storage_operations_total.labels("get", "success").inc()
+            record_storage_operation("get", "success", len(data))
             return data
         except Exception:
-            storage_operations_total.labels("get", "error").inc()
+            record_storage_operation("get", "error")
             raise
 
     def get_object_range(self, key: str, start: int, end: int) -> bytes:
@@ -90,10 +93,10 @@ class LocalStorage(StorageBackend):
             with path.open("rb") as handle:
                 handle.seek(start)
                 data = handle.read(end - start + 1)
-            storage_operations_total.labels("get_range", "success").inc()
+            record_storage_operation("get_range", "success", len(data))
             return data
         except Exception:
-            storage_operations_total.labels("get_range", "error").inc()
+            record_storage_operation("get_range", "error")
             raise
 
     def put_object(
@@ -105,7 +108,7 @@ class LocalStorage(StorageBackend):
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_bytes(data)
             stat = path.stat()
-            storage_operations_total.labels("put", "success").inc()
+            record_storage_operation("put", "success", len(data))
             return StorageObject(
                 key=str(path.relative_to(self.base_path)),
                 size=stat.st_size,
@@ -113,7 +116,7 @@ class LocalStorage(StorageBackend):
                 last_modified=None,
             )
         except Exception:
-            storage_operations_total.labels("put", "error").inc()
+            record_storage_operation("put", "error")
             raise
 
     def delete_object(self, key: str) -> None:
@@ -122,9 +125,9 @@ class LocalStorage(StorageBackend):
         try:
             if path.exists():
                 path.unlink()
-            storage_operations_total.labels("delete", "success").inc()
+            record_storage_operation("delete", "success")
         except Exception:
-            storage_operations_total.labels("delete", "error").inc()
+            record_storage_operation("delete", "error")
             raise
 
     def copy_object(self, source_key: str, destination_key: str) -> None:
@@ -134,17 +137,17 @@ class LocalStorage(StorageBackend):
         try:
             dest.parent.mkdir(parents=True, exist_ok=True)
             dest.write_bytes(source.read_bytes())
-            storage_operations_total.labels("copy", "success").inc()
+            record_storage_operation("copy", "success")
         except Exception:
-            storage_operations_total.labels("copy", "error").inc()
+            record_storage_operation("copy", "error")
             raise
 
     def object_exists(self, key: str) -> bool:
         """Return True if the local object exists."""
         try:
             exists = self._resolve_key(key).exists()
-            storage_operations_total.labels("exists", "success").inc()
+            record_storage_operation("exists", "success")
             return exists
         except Exception:
-            storage_operations_total.labels("exists", "error").inc()
+            record_storage_operation("exists", "error")
             raise
@@ -10,8 +10,11 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from api.config import settings
-from api.metrics import storage_operations_total
-from api.services.storage.base import StorageBackend, StorageObject
+from api.services.storage.base import (
+    StorageBackend,
+    StorageObject,
+    record_storage_operation,
+)
 
 
 class R2Storage(StorageBackend):
@@ -95,10 +98,10 @@ class R2Storage(StorageBackend):
                     continue
                 break
 
-            storage_operations_total.labels("list", "success").inc()
+            record_storage_operation("list", "success")
             return results
         except Exception:
-            storage_operations_total.labels("list", "error").inc()
+            record_storage_operation("list", "error")
             raise
 
     def get_object(self, key: str) -> bytes:
@@ -107,10 +110,10 @@ class R2Storage(StorageBackend):
         try:
             response = self.client.get_object(Bucket=self.bucket, Key=normalized)
             data = response["Body"].read()
-            storage_operations_total.labels("get", "success").inc()
+            record_storage_operation("get", "success", len(data))
             return data
         except Exception:
-            storage_operations_total.labels("get", "error").inc()
+            record_storage_operation("get", "error")
             raise
 
     def get_object_range(self, key: str, start: int, end: int) -> bytes:
@@ -123,10 +126,10 @@ class R2Storage(StorageBackend):
                 Range=f"bytes={start}-{end}",
             )
             data = response["Body"].read()
-            storage_operations_total.labels("get_range", "success").inc()
+            record_storage_operation("get_range", "success", len(data))
             return data
         except Exception:
-            storage_operations_total.labels("get_range", "error").inc()
+            record_storage_operation("get_range", "error")
             raise
 
     def put_object(
@@ -144,12 +147,12 @@ class R2Storage(StorageBackend):
         try:
             response = self.client.put_object(**params)
             etag = response.get("ETag")
-            storage_operations_total.labels("put", "success").inc()
+            record_storage_operation("put", "success", len(data))
             return StorageObject(
                 key=normalized, size=len(data), etag=etag, content_type=content_type
             )
         except Exception:
-            storage_operations_total.labels("put", "error").inc()
+            record_storage_operation("put", "error")
             raise
 
     def delete_object(self, key: str) -> None:
@@ -157,9 +160,9 @@ class R2Storage(StorageBackend):
         normalized = self._normalize_key(key)
         try:
             self.client.delete_object(Bucket=self.bucket, Key=normalized)
-            storage_operations_total.labels("delete", "success").inc()
+            record_storage_operation("delete", "success")
         except Exception:
-            storage_operations_total.labels("delete", "error").inc()
+            record_storage_operation("delete", "error")
             raise
 
     def copy_object(self, source_key: str, destination_key: str) -> None:
@@ -170,9 +173,9 @@ class R2Storage(StorageBackend):
             self.client.copy_object(
                 Bucket=self.bucket, CopySource=source, Key=destination
             )
-            storage_operations_total.labels("copy", "success").inc()
+            record_storage_operation("copy", "success")
         except Exception:
-            storage_operations_total.labels("copy", "error").inc()
+            record_storage_operation("copy", "error")
             raise
 
     def object_exists(self, key: str) -> bool:
@@ -180,13 +183,13 @@ class R2Storage(StorageBackend):
         normalized = self._normalize_key(key)
         try:
             self.client.head_object(Bucket=self.bucket, Key=normalized)
-            storage_operations_total.labels("exists", "success").inc()
+            record_storage_operation("exists", "success")
             return True
         except ClientError as exc:
-            storage_operations_total.labels("exists", "success").inc()
+            record_storage_operation("exists", "success")
             if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
                 return False
             return False
         except Exception:
-            storage_operations_total.labels("exists", "error").inc()
+            record_storage_operation("exists", "error")
             raise
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -19,6 +19,8 @@ from api.models.task import Task
 from api.models.task_group import TaskGroup
 from api.models.task_project import TaskProject
 from api.services.recurrence_service import RecurrenceService
+from api.utils.etag import resource_watermark
+from api.utils.search import build_text_search_filter, build_text_search_rank
 from api.utils.validation import parse_optional_uuid, parse_uuid
 
 
@@ -337,11 +339,33 @@ class TaskService:
         )
 
     @staticmethod
-    def list_tasks_by_scope(
-        db: Session, user_id: str, scope: str
-    ) -> tuple[list[Task], list[TaskProject], list[TaskGroup]]:
-        """List tasks by scope with related groups/projects."""
-        today = date.today()
+    def list_version(db: Session, user_id: str) -> tuple:
+        """Return a change marker for task lists.
+
+        Includes the current date because scopes and next-instance dates
+        roll over at midnight even when no rows change.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+
+        Returns:
+            Watermark tuple suitable for build_etag.
+        """
+        return (
+            date.today().isoformat(),
+            *resource_watermark(db, Task, user_id),
+            *resource_watermark(db, TaskProject, user_id),
+            *resource_watermark(db, TaskGroup, user_id),
+        )
+
+    @staticmethod
+    def _scope_query(db: Session, user_id: str, scope: str, today: date):
+        """Build the ordered task query for a list scope.
+
+        Open scopes filter on the same predicate as the idx_tasks_open_*
+        partial indexes; completed uses idx_tasks_completed_user_completed_at.
+        """
         base_query = TaskService._task_query_with_relations(db).filter(
             Task.user_id == user_id,
             Task.deleted_at.is_(None),
@@ -349,15 +373,15 @@ class TaskService:
         )
 
         if scope == "completed":
-            query = TaskService._task_query_with_relations(db).filter(
-                Task.user_id == user_id,
-                Task.deleted_at.is_(None),
-                Task.status == "completed",
+            return (
+                TaskService._task_query_with_relations(db)
+                .filter(
+                    Task.user_id == user_id,
+                    Task.deleted_at.is_(None),
+                    Task.status == "completed",
+                )
+                .order_by(Task.completed_at.desc())
             )
-            tasks = query.order_by(Task.completed_at.desc()).all()
-            projects = TaskService.list_task_projects(db, user_id)
-            groups = TaskService.list_task_groups(db, user_id)
-            return tasks, projects, groups
         if scope == "today":
             query = base_query.filter(
                 Task.status != "someday",
@@ -377,8 +401,14 @@ class TaskService:
             query = base_query.filter(Task.status == "inbox")
         else:
             query = base_query
+        return query.order_by(Task.updated_at.desc())
 
-        tasks = query.order_by(Task.updated_at.desc()).all()
+    @staticmethod
+    def list_tasks_by_scope(
+        db: Session, user_id: str, scope: str
+    ) -> tuple[list[Task], list[TaskProject], list[TaskGroup]]:
+        """List tasks by scope with related groups/projects."""
+        tasks = TaskService._scope_query(db, user_id, scope, date.today()).all()
         projects = TaskService.list_task_projects(db, user_id)
         groups = TaskService.list_task_groups(db, user_id)
         return tasks, projects, groups
@@ -402,39 +432,61 @@ class TaskService:
     @staticmethod
     def list_tasks_by_group(db: Session, user_id: str, group_id: str) -> list[Task]:
         """List tasks for a specific group."""
+        return TaskService._group_tasks_query(db, user_id, group_id).all()
+
+    @staticmethod
+    def _group_tasks_query(db: Session, user_id: str, group_id: str):
+        """Build the query for open tasks in a group or its projects.
+
+        The group's project IDs are an uncorrelated subquery, so Postgres
+        hashes them once instead of probing task_projects per task row.
+        """
         parsed_id = parse_uuid(group_id, "task group", "id")
+        group_project_ids = select(TaskProject.id).where(
+            TaskProject.user_id == user_id,
+            TaskProject.group_id == parsed_id,
+        )
         return (
             TaskService._task_query_with_relations(db)
             .filter(
                 Task.user_id == user_id,
                 or_(
                     Task.group_id == parsed_id,
-                    Task.project.has(TaskProject.group_id == parsed_id),
+                    Task.project_id.in_(group_project_ids),
                 ),
                 Task.deleted_at.is_(None),
                 Task.status.notin_(["completed", "trashed"]),
             )
             .order_by(Task.updated_at.desc())
-            .all()
         )
 
     @staticmethod
     def search_tasks(db: Session, user_id: str, query: str) -> list[Task]:
-        """Search tasks by title or notes."""
+        """Search tasks by title or notes, most relevant first."""
+        return TaskService._search_query(db, user_id, query).all()
+
+    @staticmethod
+    def _search_query(db: Session, user_id: str, query: str):
+        """Build the ranked task search query.
+
+        Matches the GIN-indexed search_vector, with the trigram-indexed
+        ILIKE on title/notes as a substring fallback.
+        """
+        search_vector = Task.__table__.c.search_vector
         return (
             TaskService._task_query_with_relations(db)
             .filter(
                 Task.user_id == user_id,
                 Task.deleted_at.is_(None),
-                Task.status != "trashed",
-                Task.status != "completed",
-                or_(
-                    Task.title.ilike(f"%{query}%"),
-                    Task.notes.ilike(f"%{query}%"),
+                Task.status.notin_(["completed", "trashed"]),
+                build_text_search_filter(
+                    [Task.title, Task.notes], query, search_vector=search_vector
                 ),
             )
-            .order_by(Task.updated_at.desc())
-            .all()
+            .order_by(
+                build_text_search_rank(search_vector, query).desc(),
+                Task.updated_at.desc(),
+            )
         )
 
     @staticmethod
@@ -16,6 +16,7 @@ from api.models.task_operation_log import TaskOperationLog
 from api.models.task_project import TaskProject
 from api.services.recurrence_service import RecurrenceService
 from api.services.task_service import TaskService
+from api.services.tasks_snapshot_scheduler import mark_tasks_changed
 from api.utils.validation import parse_optional_uuid
 
 
@@ -141,6 +142,7 @@ class TaskSyncService:
         tasks: list[Task] = []
         next_tasks: list[Task] = []
         conflicts: list[dict[str, Any]] = []
+        mutated = False
 
         for operation in operations:
             operation_id = str(operation.get("operation_id") or "").strip()
@@ -234,7 +236,10 @@ class TaskSyncService:
 
             TaskSyncService._log_operation(db, user_id, operation_id, op, operation)
             applied_ids.append(operation_id)
+            mutated = True
 
+        if mutated:
+            mark_tasks_changed(db, user_id)
         return ApplyOutcome(
             applied_ids=applied_ids,
             tasks=tasks,
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import uuid
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from typing import Any
 
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 
 from api.models.task import Task
 from api.models.task_group import TaskGroup
 from api.models.task_project import TaskProject
 
+# Rows per INSERT ... ON CONFLICT statement; keeps bind parameters well
+# under the Postgres limit for the widest (tasks) row.
+IMPORT_BATCH_SIZE = 500
+
 
 @dataclass
 class TasksImportStats:
@@ -36,6 +42,9 @@ class TasksImportService:
     ) -> TasksImportStats:
         """Import external data using a prepared payload.
 
+        Existing rows are looked up once per table and every write is a
+        batched upsert, so round-trips do not grow with the payload size.
+
         Args:
             db: Database session.
             user_id: Current user ID.
@@ -53,32 +62,33 @@ class TasksImportService:
             TasksImportService._coerce_list(payload.get("tasks"))
         )
 
-        group_map: dict[str, TaskGroup] = {}
+        existing_groups = TasksImportService._existing_rows(db, TaskGroup, user_id)
+        existing_projects = TasksImportService._existing_rows(db, TaskProject, user_id)
+        existing_tasks = TasksImportService._existing_rows(db, Task, user_id)
+
+        group_rows: dict[str, dict[str, Any]] = {}
         for group_data in groups_data:
             source_id = str(group_data.get("id") or "").strip()
             if not source_id:
                 continue
-            existing_group = TasksImportService._find_group(db, user_id, source_id)
-            title = str(group_data.get("title") or "Untitled Group")
+            existing_id, deleted = existing_groups.get(source_id, (None, False))
+            if deleted:
+                continue
             updated_at = TasksImportService._parse_datetime(group_data.get("updatedAt"))
-            if existing_group:
-                existing_group.title = title
-                existing_group.updated_at = updated_at or now
-                group_record = existing_group
-            else:
-                group_record = TaskGroup(
-                    user_id=user_id,
-                    source_id=source_id,
-                    title=title,
-                    created_at=updated_at or now,
-                    updated_at=updated_at or now,
-                    deleted_at=None,
-                )
-                db.add(group_record)
+            if existing_id is None and source_id not in group_rows:
                 stats.groups_imported += 1
-            group_map[source_id] = group_record
+            group_rows[source_id] = {
+                "id": existing_id or uuid.uuid4(),
+                "user_id": user_id,
+                "source_id": source_id,
+                "title": str(group_data.get("title") or "Untitled Group"),
+                "created_at": updated_at or now,
+                "updated_at": updated_at or now,
+                "deleted_at": None,
+            }
+        group_ids = {source_id: row["id"] for source_id, row in group_rows.items()}
 
-        project_map: dict[str, TaskProject] = {}
+        project_rows: dict[str, dict[str, Any]] = {}
         for project_data in projects_data:
             status = str(project_data.get("status") or "active")
             if status in {"completed", "canceled"}:
@@ -87,36 +97,33 @@ class TasksImportService:
             source_id = str(project_data.get("id") or "").strip()
             if not source_id:
                 continue
-            title = str(project_data.get("title") or "Untitled Project")
+            existing_id, deleted = existing_projects.get(source_id, (None, False))
+            if deleted:
+                stats.projects_skipped += 1
+                continue
             updated_at = TasksImportService._parse_datetime(
                 project_data.get("updatedAt")
             )
             group_id = project_data.get("groupId")
-            project_group = group_map.get(str(group_id)) if group_id else None
-            existing_project = TasksImportService._find_project(db, user_id, source_id)
-            if existing_project:
-                existing_project.title = title
-                existing_project.status = status
-                existing_project.updated_at = updated_at or now
-                existing_project.group_id = project_group.id if project_group else None
-                project_record = existing_project
-            else:
-                project_record = TaskProject(
-                    user_id=user_id,
-                    source_id=source_id,
-                    group_id=project_group.id if project_group else None,
-                    title=title,
-                    status=status,
-                    notes=None,
-                    created_at=updated_at or now,
-                    updated_at=updated_at or now,
-                    completed_at=None,
-                    deleted_at=None,
-                )
-                db.add(project_record)
+            if existing_id is None and source_id not in project_rows:
                 stats.projects_imported += 1
-            project_map[source_id] = project_record
+            project_rows[source_id] = {
+                "id": existing_id or uuid.uuid4(),
+                "user_id": user_id,
+                "source_id": source_id,
+                "group_id": group_ids.get(str(group_id)) if group_id else None,
+                "title": str(project_data.get("title") or "Untitled Project"),
+                "status": status,
+                "notes": None,
+                "created_at": updated_at or now,
+                "updated_at": updated_at or now,
+                "completed_at": None,
+                "deleted_at": None,
+            }
+        project_ids = {source_id: row["id"] for source_id, row in project_rows.items()}
 
+        task_rows: list[dict[str, Any]] = []
+        new_repeating_ids: list[uuid.UUID] = []
         for task_data in tasks_data:
             status = str(task_data.get("status") or "inbox")
             if status in {"completed", "trashed", "canceled"}:
@@ -127,7 +134,10 @@ class TasksImportService:
             source_id = str(task_data.get("id") or "").strip()
             if not source_id:
                 continue
-            title = str(task_data.get("title") or "Untitled Task")
+            existing_id, deleted = existing_tasks.get(source_id, (None, False))
+            if deleted:
+                stats.tasks_skipped += 1
+                continue
             updated_at = TasksImportService._parse_datetime(task_data.get("updatedAt"))
             deadline = TasksImportService._parse_date(task_data.get("deadline"))
             scheduled_date = TasksImportService._parse_date(
@@ -135,54 +145,121 @@ class TasksImportService:
             )
             if deadline is None and scheduled_date is not None:
                 deadline = scheduled_date
-            recurrence_rule = task_data.get("recurrenceRule")
-            repeat_template = bool(task_data.get("repeatTemplate"))
             project_id = task_data.get("projectId")
             group_id = task_data.get("groupId")
-            task_project = project_map.get(str(project_id)) if project_id else None
-            task_group = group_map.get(str(group_id)) if group_id else None
-            existing_task = TasksImportService._find_task(db, user_id, source_id)
-            if existing_task:
-                existing_task.title = title
-                existing_task.status = status
-                existing_task.notes = task_data.get("notes")
-                existing_task.deadline = deadline
-                existing_task.project_id = task_project.id if task_project else None
-                existing_task.group_id = task_group.id if task_group else None
-                existing_task.updated_at = updated_at or now
-                existing_task.repeating = bool(task_data.get("repeating"))
-                existing_task.repeat_template = repeat_template
-                existing_task.recurrence_rule = recurrence_rule
-                flag_modified(existing_task, "recurrence_rule")
-            else:
-                task = Task(
-                    user_id=user_id,
-                    source_id=source_id,
-                    project_id=task_project.id if task_project else None,
-                    group_id=task_group.id if task_group else None,
-                    title=title,
-                    notes=task_data.get("notes"),
-                    status=status,
-                    deadline=deadline,
-                    repeating=bool(task_data.get("repeating")),
-                    repeat_template=repeat_template,
-                    repeat_template_id=None,
-                    recurrence_rule=recurrence_rule,
-                    next_instance_date=None,
-                    created_at=updated_at or now,
-                    updated_at=updated_at or now,
-                    completed_at=None,
-                    trashed_at=None,
-                    deleted_at=None,
-                )
-                db.add(task)
-                db.flush()
-                if task.repeating and task.repeat_template_id is None:
-                    task.repeat_template_id = task.id
+            repeating = bool(task_data.get("repeating"))
+            task_id = existing_id or uuid.uuid4()
+            if existing_id is None:
                 stats.tasks_imported += 1
+                if repeating:
+                    new_repeating_ids.append(task_id)
+            task_rows.append(
+                {
+                    "id": task_id,
+                    "user_id": user_id,
+                    "source_id": source_id,
+                    "project_id": project_ids.get(str(project_id))
+                    if project_id
+                    else None,
+                    "group_id": group_ids.get(str(group_id)) if group_id else None,
+                    "title": str(task_data.get("title") or "Untitled Task"),
+                    "notes": task_data.get("notes"),
+                    "status": status,
+                    "deadline": deadline,
+                    "repeating": repeating,
+                    "repeat_template": bool(task_data.get("repeatTemplate")),
+                    "repeat_template_id": None,
+                    "recurrence_rule": task_data.get("recurrenceRule"),
+                    "next_instance_date": None,
+                    "created_at": updated_at or now,
+                    "updated_at": updated_at or now,
+                    "completed_at": None,
+                    "trashed_at": None,
+                    "deleted_at": None,
+                }
+            )
+
+        TasksImportService._upsert(
+            db, TaskGroup, list(group_rows.values()), ("title", "updated_at")
+        )
+        TasksImportService._upsert(
+            db,
+            TaskProject,
+            list(project_rows.values()),
+            ("group_id", "title", "status", "updated_at"),
+        )
+        TasksImportService._upsert(
+            db,
+            Task,
+            task_rows,
+            (
+                "project_id",
+                "group_id",
+                "title",
+                "notes",
+                "status",
+                "deadline",
+                "repeating",
+                "repeat_template",
+                "recurrence_rule",
+                "updated_at",
+            ),
+        )
+        if new_repeating_ids:
+            # New repeating tasks are their own series template.
+            db.execute(
+                update(Task)
+                .where(
+                    Task.id.in_(new_repeating_ids),
+                    Task.repeat_template_id.is_(None),
+                )
+                .values(repeat_template_id=Task.id)
+                .execution_options(synchronize_session=False)
+            )
 
         return stats
 
+    @staticmethod
+    def _existing_rows(
+        db: Session, model: Any, user_id: str
+    ) -> dict[str, tuple[uuid.UUID, bool]]:
+        """Map a user's imported source IDs to (row ID, soft-deleted)."""
+        rows = db.execute(
+            select(model.source_id, model.id, model.deleted_at).where(
+                model.user_id == user_id,
+                model.source_id.is_not(None),
+            )
+        )
+        return {
+            source_id: (row_id, deleted_at is not None)
+            for source_id, row_id, deleted_at in rows
+        }
+
+    @staticmethod
+    def _upsert(
+        db: Session,
+        model: Any,
+        rows: list[dict[str, Any]],
+        update_columns: tuple[str, ...],
+    ) -> None:
+        """Insert or update rows keyed on (user_id, source_id) in batches.
+
+        Soft-deleted rows are left untouched so an import never revives
+        something the user removed.
+        """
+        table = model.__table__
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            statement = insert(table).values(rows[start : start + IMPORT_BATCH_SIZE])
+            db.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[table.c.user_id, table.c.source_id],
+                    set_={
+                        column: statement.excluded[column] for column in update_columns
+                    },
+                    where=table.c.deleted_at.is_(None),
+                )
+            )
+
     @staticmethod
     def _coerce_list(value: Any) -> list[dict[str, Any]]:
         if isinstance(value, list):
@@ -214,39 +291,3 @@ class TasksImportService:
     def _parse_date(value: Any) -> date | None:
         parsed = TasksImportService._parse_datetime(value)
         return parsed.date() if parsed else None
-
-    @staticmethod
-    def _find_group(db: Session, user_id: str, source_id: str) -> TaskGroup | None:
-        return (
-            db.query(TaskGroup)
-            .filter(
-                TaskGroup.user_id == user_id,
-                TaskGroup.source_id == source_id,
-                TaskGroup.deleted_at.is_(None),
-            )
-            .one_or_none()
-        )
-
-    @staticmethod
-    def _find_project(db: Session, user_id: str, source_id: str) -> TaskProject | None:
-        return (
-            db.query(TaskProject)
-            .filter(
-                TaskProject.user_id == user_id,
-                TaskProject.source_id == source_id,
-                TaskProject.deleted_at.is_(None),
-            )
-            .one_or_none()
-        )
-
-    @staticmethod
-    def _find_task(db: Session, user_id: str, source_id: str) -> Task | None:
-        return (
-            db.query(Task)
-            .filter(
-                Task.user_id == user_id,
-                Task.source_id == source_id,
-                Task.deleted_at.is_(None),
-            )
-            .one_or_none()
-        )
@@ -0,0 +1,227 @@
+"""Debounced, mutation-driven maintenance of the tasks AI snapshot."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.db.session import SessionLocal, set_session_user_id
+from api.models.task import Task
+from api.services.task_service import TaskService
+from api.services.tasks_snapshot_service import TasksSnapshotService
+from api.services.user_settings_service import UserSettingsService
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding users whose tasks changed in the open transaction.
+_PENDING_USERS_KEY = "tasks_snapshot_pending_users"
+
+RENDERED_ON_MAX_ENTRIES = 4096
+
+
+def _snapshot_task(task: Task) -> dict[str, Any]:
+    return {
+        "id": str(task.id),
+        "title": task.title,
+        "deadline": task.deadline.isoformat() if task.deadline else None,
+        "notes": task.notes,
+        "projectId": str(task.project_id) if task.project_id else None,
+        "groupId": str(task.group_id) if task.group_id else None,
+    }
+
+
+def build_user_snapshot(db: Session, user_id: str, now: datetime) -> str:
+    """Render the tasks snapshot for a user from the database.
+
+    Args:
+        db: Database session.
+        user_id: Current user ID.
+        now: Timestamp the snapshot is rendered for.
+
+    Returns:
+        Snapshot markdown.
+    """
+    today = now.date()
+    today_tasks = TaskService._scope_query(db, user_id, "today", today).all()
+    upcoming_tasks = TaskService._scope_query(db, user_id, "upcoming", today).all()
+    completed_tasks = TaskService.list_completed_today(db, user_id)
+    projects = TaskService.list_task_projects(db, user_id)
+    groups = TaskService.list_task_groups(db, user_id)
+    return TasksSnapshotService.build_snapshot(
+        today_tasks=[_snapshot_task(task) for task in today_tasks],
+        tomorrow_tasks=TasksSnapshotService.filter_tomorrow(
+            [_snapshot_task(task) for task in upcoming_tasks], now=now
+        ),
+        completed_today=[_snapshot_task(task) for task in completed_tasks],
+        groups=[{"id": str(group.id), "title": group.title} for group in groups],
+        projects=[
+            {"id": str(project.id), "title": project.title} for project in projects
+        ],
+        now=now,
+    )
+
+
+class TasksSnapshotScheduler:
+    """Coalesce snapshot rebuilds per user and skip unchanged writes.
+
+    Each ``schedule`` call (re)starts a per-user timer, so a burst of task
+    mutations produces one rebuild after the burst settles. The rebuilt
+    snapshot is only written when it differs from the stored one.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay_seconds: float,
+        session_factory: Callable[[], Session] | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            delay_seconds: Quiet period before a scheduled rebuild runs.
+            session_factory: Session factory (defaults to SessionLocal).
+            clock: Current-time source (overridable in tests).
+        """
+        self.delay_seconds = delay_seconds
+        self._session_factory = session_factory
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._timers: dict[str, threading.Timer] = {}
+        # user_id -> date the snapshot was last rendered for
+        self._rendered_on: OrderedDict[str, date] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def schedule(self, user_id: str) -> None:
+        """Rebuild a user's snapshot once their task changes settle.
+
+        Args:
+            user_id: User whose tasks changed.
+        """
+        timer = threading.Timer(self.delay_seconds, self.refresh, args=(user_id,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.pop(user_id, None)
+            if previous is not None:
+                previous.cancel()
+            self._timers[user_id] = timer
+        timer.start()
+
+    def schedule_if_stale(self, user_id: str) -> None:
+        """Schedule a rebuild if the snapshot was not rendered today.
+
+        Overdue and tomorrow sections depend on the date, so a snapshot goes
+        stale at midnight even without task mutations.
+
+        Args:
+            user_id: User whose snapshot is being read.
+        """
+        today = self._clock().date()
+        with self._lock:
+            if user_id in self._timers or self._rendered_on.get(user_id) == today:
+                return
+        self.schedule(user_id)
+
+    def refresh(self, user_id: str) -> bool:
+        """Rebuild a user's snapshot now.
+
+        Args:
+            user_id: User to rebuild.
+
+        Returns:
+            True if the stored snapshot was written.
+        """
+        with self._lock:
+            timer = self._timers.get(user_id)
+            if timer is not None and timer is threading.current_thread():
+                self._timers.pop(user_id, None)
+        try:
+            return self._refresh(user_id)
+        except Exception as exc:
+            logger.warning("Failed to refresh tasks snapshot", exc_info=exc)
+            return False
+
+    def flush(self) -> None:
+        """Run every pending rebuild immediately."""
+        with self._lock:
+            timers, self._timers = self._timers, {}
+        for user_id, timer in timers.items():
+            timer.cancel()
+            self.refresh(user_id)
+
+    def shutdown(self) -> None:
+        """Cancel pending rebuilds."""
+        with self._lock:
+            timers, self._timers = self._timers, {}
+        for timer in timers.values():
+            timer.cancel()
+
+    def _refresh(self, user_id: str) -> bool:
+        now = self._clock()
+        with (self._session_factory or SessionLocal)() as db:
+            set_session_user_id(db, user_id)
+            snapshot = build_user_snapshot(db, user_id, now)
+            written = UserSettingsService.update_tasks_snapshot(db, user_id, snapshot)
+        with self._lock:
+            self._rendered_on[user_id] = now.date()
+            self._rendered_on.move_to_end(user_id)
+            while len(self._rendered_on) > RENDERED_ON_MAX_ENTRIES:
+                self._rendered_on.popitem(last=False)
+        return written
+
+
+_scheduler: TasksSnapshotScheduler | None = None
+
+
+def get_tasks_snapshot_scheduler() -> TasksSnapshotScheduler:
+    """Return the process-wide snapshot scheduler.
+
+    Returns:
+        Shared TasksSnapshotScheduler instance.
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TasksSnapshotScheduler(
+            delay_seconds=settings.tasks_snapshot_debounce_seconds
+        )
+    return _scheduler
+
+
+def set_tasks_snapshot_scheduler(scheduler: TasksSnapshotScheduler | None) -> None:
+    """Override the scheduler (None restores the configured default)."""
+    global _scheduler
+    _scheduler = scheduler
+
+
+def mark_tasks_changed(db: Session, user_id: str) -> None:
+    """Schedule a snapshot rebuild once the session's transaction commits.
+
+    Args:
+        db: Session carrying the task mutations.
+        user_id: User whose tasks changed.
+    """
+    db.info.setdefault(_PENDING_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _schedule_committed_changes(session: Session) -> None:
+    """Schedule rebuilds for users whose task changes just committed."""
+    user_ids = session.info.pop(_PENDING_USERS_KEY, None)
+    if not user_ids:
+        return
+    scheduler = get_tasks_snapshot_scheduler()
+    for user_id in user_ids:
+        scheduler.schedule(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session) -> None:
+    """Drop pending rebuilds for a rolled back transaction."""
+    session.info.pop(_PENDING_USERS_KEY, None)
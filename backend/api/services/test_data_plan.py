@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import uuid
 from calendar import monthrange
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -91,6 +91,16 @@ class SeedTask:
     next_instance_date: date | None = None
 
 
+@dataclass(frozen=True)
+class SeedFile:
+    """Seed ingested file payload (metadata only, already processed)."""
+
+    filename: str
+    mime: str
+    size_bytes: int
+    derivatives: tuple[str, ...] = ("ai_md",)
+
+
 @dataclass(frozen=True)
 class SeedSettings:
     """Seed user settings payload."""
@@ -124,10 +134,23 @@ class SeedPlan:
     task_projects: list[SeedTaskProject]
     tasks: list[SeedTask]
     settings: SeedSettings
+    files: list[SeedFile] = field(default_factory=list)
+
 
+def build_seed_plan(
+    seed_tag: str, *, now: datetime | None = None, scale: int = 0
+) -> SeedPlan:
+    """Build a deterministic seed plan.
 
-def build_seed_plan(seed_tag: str, *, now: datetime | None = None) -> SeedPlan:
-    """Build a deterministic seed plan."""
+    Args:
+        seed_tag: Marker used to find seeded data again.
+        now: Reference time for dates. Defaults to the current time.
+        scale: Extra generated notes, websites, tasks and files to add on top
+            of the hand-written content (for load testing).
+
+    Returns:
+        The seed plan.
+    """
     timestamp = now or datetime.now(UTC)
     today = timestamp.date()
     tomorrow = today + timedelta(days=1)
@@ -394,6 +417,11 @@ def build_seed_plan(seed_tag: str, *, now: datetime | None = None) -> SeedPlan:
         tasks_ai_snapshot=None,
     )
 
+    if scale > 0:
+        notes += _scaled_notes(seed_tag, folders, scale)
+        websites += _scaled_websites(seed_tag, title_prefix, timestamp, scale)
+        tasks += _scaled_tasks(task_projects, today, scale)
+
     return SeedPlan(
         seed_tag=seed_tag,
         title_prefix=title_prefix,
@@ -407,9 +435,119 @@ def build_seed_plan(seed_tag: str, *, now: datetime | None = None) -> SeedPlan:
         task_projects=task_projects,
         tasks=tasks,
         settings=settings,
+        files=_scaled_files(scale),
     )
 
 
+_SCALED_TOPICS = (
+    "retrieval",
+    "onboarding",
+    "offline sync",
+    "pricing",
+    "search ranking",
+    "mobile layout",
+    "release process",
+    "customer interviews",
+)
+_SCALED_FILE_KINDS = (
+    ("pdf", "application/pdf", ("viewer_pdf", "thumb_png", "ai_md")),
+    (
+        "docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ("viewer_pdf", "ai_md"),
+    ),
+    ("png", "image/png", ("image_original", "thumb_png", "ai_md")),
+    ("csv", "text/csv", ("viewer_json", "ai_md")),
+)
+
+
+def _scaled_body(topic: str, index: int) -> str:
+    paragraphs = [
+        f"Notes on {topic}, entry {index}. Capture what changed, why it matters "
+        "and which follow-ups are still open."
+        for _ in range(3)
+    ]
+    items = "\n".join(f"- Follow-up {index}.{step} for {topic}" for step in range(5))
+    return "\n\n".join(paragraphs) + f"\n\n## Follow-ups\n{items}\n"
+
+
+def _scaled_notes(seed_tag: str, folders: list[str], scale: int) -> list[SeedNote]:
+    notes = []
+    for index in range(scale):
+        topic = _SCALED_TOPICS[index % len(_SCALED_TOPICS)]
+        # Nest a level below the fixed folders so the tree has some depth.
+        folder = f"{folders[index % len(folders)]}/Batch {index // 100:02d}"
+        title = f"{topic.capitalize()} note {index:05d}"
+        notes.append(
+            SeedNote(
+                title=title,
+                content=f"# {title}\n\n{_scaled_body(topic, index)}",
+                folder=folder,
+                pinned=index % 250 == 0,
+                tags=[seed_tag, topic.replace(" ", "-")],
+            )
+        )
+    return notes
+
+
+def _scaled_websites(
+    seed_tag: str, title_prefix: str, timestamp: datetime, scale: int
+) -> list[SeedWebsite]:
+    websites = []
+    for index in range(scale):
+        topic = _SCALED_TOPICS[index % len(_SCALED_TOPICS)]
+        url = f"https://example.com/articles/{topic.replace(' ', '-')}/{index:05d}"
+        websites.append(
+            SeedWebsite(
+                url=url,
+                url_full=url,
+                title=f"{title_prefix}Article {index:05d} on {topic}",
+                content=f"# Article {index:05d}\n\n{_scaled_body(topic, index)}",
+                source=seed_tag,
+                saved_at=timestamp - timedelta(hours=index),
+                published_at=timestamp - timedelta(days=index % 365),
+                archived=index % 10 == 9,
+            )
+        )
+    return websites
+
+
+def _scaled_tasks(
+    task_projects: list[SeedTaskProject], today: date, scale: int
+) -> list[SeedTask]:
+    tasks = []
+    for index in range(scale):
+        project = task_projects[index % len(task_projects)]
+        deadline = today + timedelta(days=index % 14) if index % 3 else None
+        tasks.append(
+            SeedTask(
+                title=f"Generated task {index:05d}",
+                project_key=project.key,
+                group_key=project.group_key,
+                deadline=deadline,
+                notes=f"Generated for load testing ({project.title}).",
+            )
+        )
+    return tasks
+
+
+def _scaled_files(scale: int) -> list[SeedFile]:
+    files = []
+    for index in range(scale):
+        extension, mime, derivatives = _SCALED_FILE_KINDS[
+            index % len(_SCALED_FILE_KINDS)
+        ]
+        files.append(
+            SeedFile(
+                filename=f"document-{index:05d}.{extension}",
+                mime=mime,
+                size_bytes=20_000 + (index * 7919) % 2_000_000,
+                derivatives=derivatives,
+            )
+        )
+    return files
+
+
 def _select_seed_skills() -> list[str] | None:
     try:
         from api.services.skill_catalog_service import SkillCatalogService
@@ -11,6 +11,7 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from api.models.conversation import Conversation
+from api.models.file_ingestion import FileDerivative, IngestedFile
 from api.models.note import Note
 from api.models.task import Task
 from api.models.task_group import TaskGroup
@@ -18,6 +19,7 @@ from api.models.task_project import TaskProject
 from api.models.user_memory import UserMemory
 from api.models.user_settings import UserSettings
 from api.services.conversation_service import ConversationService
+from api.services.file_ingestion_service import FileIngestionService
 from api.services.memory_service import MemoryService
 from api.services.notes_service import NotesService
 from api.services.notes_workspace_service import NotesWorkspaceService
@@ -45,15 +47,18 @@ class SeedSummary:
     tasks: int = 0
     settings: int = 0
     scratchpad: int = 0
+    files: int = 0
 
 
 class TestDataService:
     """Service to seed and clear demo content for a user."""
 
     @staticmethod
-    def build_seed_plan(seed_tag: str, *, now: datetime | None = None) -> SeedPlan:
+    def build_seed_plan(
+        seed_tag: str, *, now: datetime | None = None, scale: int = 0
+    ) -> SeedPlan:
         """Build a deterministic seed plan."""
-        return build_seed_plan(seed_tag, now=now)
+        return build_seed_plan(seed_tag, now=now, scale=scale)
 
     @staticmethod
     def seed_user_data(db: Session, user_id: str, plan: SeedPlan) -> SeedSummary:
@@ -93,7 +98,8 @@ class TestDataService:
 
         website_ids: list[uuid.UUID] = []
         for website in plan.websites:
-            created_website = WebsitesService.save_website(
+            # Upsert so a reseed revives websites a previous delete soft-deleted.
+            created_website = WebsitesService.upsert_website(
                 db,
                 user_id,
                 url=website.url,
@@ -107,6 +113,8 @@ class TestDataService:
                 archived=website.archived,
             )
             website_ids.append(created_website.id)
+            if website.archived and not created_website.is_archived:
+                WebsitesService.update_archived(db, user_id, created_website.id, True)
             if website.pinned:
                 WebsitesService.update_pinned(db, user_id, created_website.id, True)
 
@@ -128,11 +136,14 @@ class TestDataService:
             )
             memory_ids.append(created_memory.id)
 
+        # source_id is unique per user (it doubles as an import key) and
+        # deleted rows keep theirs, so scope ids to this seeding run.
+        source_prefix = f"{plan.seed_tag}:{uuid.uuid4().hex[:8]}"
         group_map: dict[str, str] = {}
         project_map: dict[str, str] = {}
         for group in plan.task_groups:
             created_group = TaskService.create_task_group(
-                db, user_id, group.title, source_id=plan.seed_tag
+                db, user_id, group.title, source_id=f"{source_prefix}:group:{group.key}"
             )
             group_map[group.key] = str(created_group.id)
 
@@ -145,12 +156,12 @@ class TestDataService:
                 group_id=group_id,
                 status=project.status,
                 notes=project.notes,
-                source_id=plan.seed_tag,
+                source_id=f"{source_prefix}:project:{project.key}",
             )
             project_map[project.key] = str(created_project.id)
 
         task_ids: list[uuid.UUID] = []
-        for task in plan.tasks:
+        for index, task in enumerate(plan.tasks):
             project_id = project_map.get(task.project_key) if task.project_key else None
             group_id = group_map.get(task.group_key) if task.group_key else None
             created_task = TaskService.create_task(
@@ -167,10 +178,12 @@ class TestDataService:
                 repeat_template=task.repeat_template,
                 repeat_template_id=None,
                 next_instance_date=task.next_instance_date,
-                source_id=plan.seed_tag,
+                source_id=f"{source_prefix}:task:{index}",
             )
             task_ids.append(created_task.id)
 
+        file_ids = TestDataService._seed_files(db, user_id, plan)
+
         db.commit()
 
         snapshot = TestDataService._build_tasks_snapshot(
@@ -202,6 +215,7 @@ class TestDataService:
             tasks=len(task_ids),
             settings=1,
             scratchpad=1,
+            files=len(file_ids),
         )
 
     @staticmethod
@@ -218,6 +232,7 @@ class TestDataService:
             tasks=len(targets["tasks"]),
             settings=1 if targets["settings"] else 0,
             scratchpad=1 if targets["scratchpad"] else 0,
+            files=len(targets["files"]),
         )
 
     @staticmethod
@@ -225,7 +240,7 @@ class TestDataService:
         """Delete seed data for a user."""
         targets = TestDataService._collect_seed_targets(db, user_id, plan)
 
-        for note in targets["notes"]:
+        for note in [*targets["notes"], *targets["folder_markers"]]:
             NotesService.delete_note(db, user_id, note.id)
 
         if targets["scratchpad"]:
@@ -249,6 +264,9 @@ class TestDataService:
         for memory in targets["memories"]:
             MemoryService.delete_memory(db, user_id, memory.id)
 
+        for record in targets["files"]:
+            FileIngestionService.soft_delete_file(db, record.id)
+
         for task in targets["tasks"]:
             TaskService.delete_task(db, user_id, str(task.id))
         for project in targets["task_projects"]:
@@ -284,6 +302,7 @@ class TestDataService:
             tasks=len(targets["tasks"]),
             settings=1 if targets["settings"] else 0,
             scratchpad=1 if targets["scratchpad"] else 0,
+            files=len(targets["files"]),
         )
 
     @staticmethod
@@ -295,6 +314,7 @@ class TestDataService:
         folder_set = set(plan.folders)
 
         notes: list[Note] = []
+        folder_markers: list[Note] = []
         for note in NotesService.list_notes(db, user_id):
             if note.title == SCRATCHPAD_TITLE:
                 continue
@@ -305,7 +325,7 @@ class TestDataService:
                 notes.append(note)
                 continue
             if metadata.get("folder_marker") and folder in folder_set:
-                notes.append(note)
+                folder_markers.append(note)
 
         websites = [
             website
@@ -331,19 +351,42 @@ class TestDataService:
             .all()
         )
 
+        source_prefix = f"{seed_tag}:"
         task_groups = (
             db.query(TaskGroup)
-            .filter(TaskGroup.user_id == user_id, TaskGroup.source_id == seed_tag)
+            .filter(
+                TaskGroup.user_id == user_id,
+                TaskGroup.source_id.startswith(source_prefix, autoescape=True),
+                TaskGroup.deleted_at.is_(None),
+            )
             .all()
         )
         task_projects = (
             db.query(TaskProject)
-            .filter(TaskProject.user_id == user_id, TaskProject.source_id == seed_tag)
+            .filter(
+                TaskProject.user_id == user_id,
+                TaskProject.source_id.startswith(source_prefix, autoescape=True),
+                TaskProject.deleted_at.is_(None),
+            )
             .all()
         )
         tasks = (
             db.query(Task)
-            .filter(Task.user_id == user_id, Task.source_id == seed_tag)
+            .filter(
+                Task.user_id == user_id,
+                Task.source_id.startswith(source_prefix, autoescape=True),
+                Task.deleted_at.is_(None),
+            )
+            .all()
+        )
+
+        files = (
+            db.query(IngestedFile)
+            .filter(
+                IngestedFile.user_id == user_id,
+                IngestedFile.deleted_at.is_(None),
+                IngestedFile.source_metadata["seed_tag"].astext == seed_tag,
+            )
             .all()
         )
 
@@ -363,6 +406,7 @@ class TestDataService:
 
         return {
             "notes": notes,
+            "folder_markers": folder_markers,
             "websites": websites,
             "conversations": conversations,
             "memories": memories,
@@ -371,8 +415,44 @@ class TestDataService:
             "tasks": tasks,
             "settings": settings,
             "scratchpad": scratchpad_note,
+            "files": files,
         }
 
+    @staticmethod
+    def _seed_files(db: Session, user_id: str, plan: SeedPlan) -> list[uuid.UUID]:
+        """Create already-processed ingestion records (no stored objects)."""
+        file_ids: list[uuid.UUID] = []
+        for seed_file in plan.files:
+            record, _ = FileIngestionService.create_ingestion(
+                db,
+                user_id,
+                filename_original=seed_file.filename,
+                mime_original=seed_file.mime,
+                size_bytes=seed_file.size_bytes,
+                source_metadata={"seed_tag": plan.seed_tag},
+            )
+            prefix = f"{user_id}/files/{record.id}"
+            for kind in seed_file.derivatives:
+                is_ai_md = kind == "ai_md"
+                db.add(
+                    FileDerivative(
+                        file_id=record.id,
+                        kind=kind,
+                        storage_key=(
+                            f"{prefix}/ai/ai.md"
+                            if is_ai_md
+                            else f"{prefix}/derivatives/{kind}"
+                        ),
+                        mime="text/markdown" if is_ai_md else seed_file.mime,
+                        size_bytes=seed_file.size_bytes // 4,
+                    )
+                )
+            FileIngestionService.update_job_status(
+                db, record.id, status="ready", stage="ready"
+            )
+            file_ids.append(record.id)
+        return file_ids
+
     @staticmethod
     def _build_tasks_snapshot(
         db: Session,
@@ -5,12 +5,13 @@ import time
 from typing import Any
 
 from api.config import settings
-from api.executors.skill_executor import SkillExecutor
+from api.executors.skill_executor import SkillExecutor, get_skill_executor
 from api.metrics import tool_execution_duration_seconds, tool_executions_total
 from api.security.audit_logger import AuditLogger
 from api.security.path_validator import PathValidator
 from api.services.tools.definitions import get_tool_definitions
 from api.services.tools.execution_handlers import (
+    handle_local_search,
     handle_memory_tool,
     handle_prompt_preview,
     handle_ui_theme,
@@ -31,9 +32,13 @@ SKILLS_REQUIRING_USER_ID = {
 class ToolMapper:
     """Maps MCP tools to Claude tool definitions."""
 
-    def __init__(self):
-        """Initialize tool registry and path validation."""
-        self.executor = SkillExecutor(settings.skills_dir, settings.workspace_base)
+    def __init__(self, executor: SkillExecutor | None = None):
+        """Initialize tool registry and path validation.
+
+        Args:
+            executor: Optional skill executor. Defaults to the process-wide one.
+        """
+        self.executor = executor or get_skill_executor()
         self.path_validator = PathValidator(
             settings.workspace_base, settings.writable_paths
         )
@@ -44,6 +49,7 @@ class ToolMapper:
 
     def _build_tool_name_maps(self) -> None:
         """Build mappings between safe tool names and display names."""
+        self._claude_tools_cache: dict[frozenset[str] | None, list[dict]] = {}
         self.tool_name_map: dict[str, str] = {}
         self.tool_name_reverse: dict[str, str] = {}
         for display_name in self.tools:
@@ -126,15 +132,20 @@ class ToolMapper:
         self, allowed_skills: list[str] | None = None
     ) -> list[dict[str, Any]]:
         """Convert tool configs to Claude tool schema."""
-        return [
-            {
-                "name": self.tool_name_reverse.get(name, name),
-                "description": config["description"],
-                "input_schema": config["input_schema"],
-            }
-            for name, config in self.tools.items()
-            if self._is_skill_enabled(config.get("skill"), allowed_skills)
-        ]
+        key = frozenset(allowed_skills) if allowed_skills is not None else None
+        cached = self._claude_tools_cache.get(key)
+        if cached is None:
+            cached = [
+                {
+                    "name": self.tool_name_reverse.get(name, name),
+                    "description": config["description"],
+                    "input_schema": config["input_schema"],
+                }
+                for name, config in self.tools.items()
+                if self._is_skill_enabled(config.get("skill"), allowed_skills)
+            ]
+            self._claude_tools_cache[key] = cached
+        return list(cached)
 
     async def execute_tool(
         self,
@@ -212,6 +223,23 @@ class ToolMapper:
                 )
                 return normalized
 
+            # Special case: universal local search
+            if display_name == "Search Local Knowledge":
+                result = await handle_local_search(context, parameters)
+                AuditLogger.log_tool_call(
+                    tool_name=display_name,
+                    parameters=parameters,
+                    duration_ms=(time.time() - start_time) * 1000,
+                    success=result.get("success", False),
+                )
+                normalized = self._normalize_result(result)
+                status = "success" if normalized.get("success") else "error"
+                tool_executions_total.labels(tool_skill, status).inc()
+                tool_execution_duration_seconds.labels(tool_skill).observe(
+                    time.time() - start_time
+                )
+                return normalized
+
             # Validate paths if needed
             if tool_config.get("validate_write"):
                 if "path" in parameters:
@@ -29,6 +29,36 @@ def get_misc_definitions() -> dict:
             "script": None,
             "build_args": None,
         },
+        "Search Local Knowledge": {
+            "description": (
+                "Search the user's saved notes, websites, files, conversations "
+                "and memories at once. Returns results ranked across sources."
+            ),
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "content_types": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": [
+                                "note",
+                                "website",
+                                "file",
+                                "conversation",
+                                "memory",
+                            ],
+                        },
+                    },
+                    "limit": {"type": "integer", "minimum": 1, "maximum": 50},
+                },
+                "required": ["query"],
+            },
+            "skill": "local-search",
+            "script": None,
+            "build_args": None,
+        },
         "Memory Tool": {
             "description": (
                 "Create, update, and manage persistent memory files. "
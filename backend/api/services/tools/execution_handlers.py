@@ -79,3 +79,29 @@ def handle_memory_tool(
     from api.services.memory_tool_handler import MemoryToolHandler
 
     return MemoryToolHandler.execute_command(db, user_id, parameters)
+
+
+async def handle_local_search(
+    context: dict[str, Any] | None, parameters: dict
+) -> dict[str, Any]:
+    """Handle universal local search tool execution.
+
+    Args:
+        context: Tool execution context with user info.
+        parameters: Search parameters (query, content_types, limit).
+
+    Returns:
+        Tool result payload with merged results and provider metrics.
+    """
+    if not context or not context.get("user_id"):
+        return {"success": False, "error": "Missing user context"}
+
+    from api.services.universal_search_service import UniversalSearchService
+
+    data = await UniversalSearchService().search(
+        context["user_id"],
+        str(parameters.get("query") or ""),
+        content_types=parameters.get("content_types"),
+        limit=int(parameters.get("limit") or 10),
+    )
+    return {"success": True, "data": data}
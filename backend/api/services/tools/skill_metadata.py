@@ -68,6 +68,12 @@ SKILL_DISPLAY = {
         "name": "Memory",
         "description": "Store and manage persistent user memories.",
     },
+    "local-search": {
+        "name": "Local Search",
+        "description": (
+            "Search saved notes, websites, files, conversations and memories."
+        ),
+    },
     "tasks": {
         "name": "Tasks",
         "description": "Create, complete, defer, and organize tasks and projects.",
@@ -78,6 +84,7 @@ EXPOSED_SKILLS = {
     "fs",
     "notes",
     "tasks",
+    "local-search",
     "web-save",
     "web-search",
     "memory",
@@ -0,0 +1,338 @@
+"""Content providers for universal local search."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, cast
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.conversation import Conversation
+from api.models.file_ingestion import IngestedFile
+from api.models.note import Note
+from api.models.user_memory import UserMemory
+from api.models.website import Website
+from api.services.semantic_index_service import SemanticIndexService
+from api.services.skill_file_ops_paths import is_profile_images_path
+from api.services.universal_search_service import SearchHit, SearchProvider
+from api.utils.search import (
+    build_text_search_filter,
+    build_text_search_rank,
+    fetch_search_headlines,
+)
+
+SNIPPET_LENGTH = 160
+
+
+def _text_snippet(text: str | None, query: str) -> str | None:
+    """Return a window of text around the first query term match."""
+    if not text:
+        return None
+    lowered = text.lower()
+    start = 0
+    for term in query.lower().split():
+        position = lowered.find(term)
+        if position >= 0:
+            start = max(position - SNIPPET_LENGTH // 4, 0)
+            break
+    snippet = text[start : start + SNIPPET_LENGTH].strip()
+    if start > 0:
+        snippet = f"…{snippet}"
+    if start + SNIPPET_LENGTH < len(text):
+        snippet = f"{snippet}…"
+    return snippet
+
+
+class NotesSearchProvider(SearchProvider):
+    """Ranked full-text search over notes."""
+
+    content_type = "note"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search notes by title and content."""
+        search_vector = Note.__table__.c.search_vector
+        rank = build_text_search_rank(search_vector, query)
+        rows = (
+            db.query(Note, rank)
+            .filter(
+                Note.user_id == user_id,
+                Note.deleted_at.is_(None),
+                build_text_search_filter(
+                    [Note.title, Note.content], query, search_vector=search_vector
+                ),
+            )
+            .order_by(rank.desc(), Note.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        snippets = fetch_search_headlines(
+            db, Note, query, [note.id for note, _ in rows]
+        )
+        return [
+            SearchHit(
+                id=str(note.id),
+                content_type=self.content_type,
+                title=note.title,
+                snippet=snippets.get(note.id),
+                score=float(score or 0.0),
+                updated_at=note.updated_at,
+                metadata={
+                    "folder": (note.metadata_ or {}).get("folder"),
+                    "archived": note.is_archived,
+                },
+            )
+            for note, score in rows
+        ]
+
+
+class WebsitesSearchProvider(SearchProvider):
+    """Ranked full-text search over saved websites."""
+
+    content_type = "website"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search websites by title and content."""
+        search_vector = Website.__table__.c.search_vector
+        rank = build_text_search_rank(search_vector, query)
+        rows = (
+            db.query(Website, rank)
+            .filter(
+                Website.user_id == user_id,
+                Website.deleted_at.is_(None),
+                build_text_search_filter(
+                    [Website.title, Website.content],
+                    query,
+                    search_vector=search_vector,
+                ),
+            )
+            .order_by(rank.desc(), Website.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        snippets = fetch_search_headlines(
+            db, Website, query, [website.id for website, _ in rows]
+        )
+        return [
+            SearchHit(
+                id=str(website.id),
+                content_type=self.content_type,
+                title=website.title,
+                snippet=snippets.get(website.id),
+                score=float(score or 0.0),
+                updated_at=website.updated_at,
+                metadata={
+                    "url": website.url,
+                    "domain": website.domain,
+                    "archived": website.is_archived,
+                },
+            )
+            for website, score in rows
+        ]
+
+
+class FilesSearchProvider(SearchProvider):
+    """Name and path search over ingested files.
+
+    File contents live in object storage, so content matching stays with the
+    file search tool; this provider only reads indexed metadata.
+    """
+
+    content_type = "file"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search files by original filename and path."""
+        records = (
+            db.query(IngestedFile)
+            .filter(
+                IngestedFile.user_id == user_id,
+                IngestedFile.deleted_at.is_(None),
+                build_text_search_filter(
+                    [IngestedFile.filename_original, IngestedFile.path], query
+                ),
+            )
+            .order_by(IngestedFile.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            SearchHit(
+                id=str(record.id),
+                content_type=self.content_type,
+                title=record.filename_original,
+                snippet=record.path,
+                score=0.0,
+                updated_at=record.updated_at,
+                metadata={
+                    "path": record.path,
+                    "mime": record.mime_original,
+                    "size": record.size_bytes,
+                },
+            )
+            for record in records
+            if not (record.path and is_profile_images_path(record.path))
+        ]
+
+
+class ConversationsSearchProvider(SearchProvider):
+    """Search over conversation titles, first messages and transcripts."""
+
+    content_type = "conversation"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search conversations, title and first-message matches first."""
+        base_query = db.query(Conversation).filter(
+            Conversation.user_id == user_id,
+            Conversation.is_archived.is_(False),
+        )
+        title_matches = (
+            base_query.filter(
+                build_text_search_filter(
+                    [Conversation.title, Conversation.first_message], query
+                )
+            )
+            .order_by(Conversation.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        message_matches: list[Conversation] = []
+        if len(title_matches) < limit:
+            message_query = base_query.filter(
+                build_text_search_filter([cast(Conversation.messages, String)], query)
+            )
+            if title_matches:
+                message_query = message_query.filter(
+                    Conversation.id.notin_([item.id for item in title_matches])
+                )
+            message_matches = (
+                message_query.order_by(Conversation.updated_at.desc())
+                .limit(limit - len(title_matches))
+                .all()
+            )
+        # Title/first-message hits outrank transcript-only hits.
+        return [
+            SearchHit(
+                id=str(conversation.id),
+                content_type=self.content_type,
+                title=conversation.title,
+                snippet=_text_snippet(conversation.first_message, query),
+                score=score,
+                updated_at=conversation.updated_at,
+                metadata={"messageCount": conversation.message_count},
+            )
+            for conversations, score in ((title_matches, 1.0), (message_matches, 0.5))
+            for conversation in conversations
+        ]
+
+
+class MemoriesSearchProvider(SearchProvider):
+    """Search over assistant memories, filtered in SQL."""
+
+    content_type = "memory"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search memories by path and content."""
+        memories = (
+            db.query(UserMemory)
+            .filter(
+                UserMemory.user_id == user_id,
+                build_text_search_filter([UserMemory.path, UserMemory.content], query),
+            )
+            .order_by(UserMemory.updated_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [
+            SearchHit(
+                id=str(memory.id),
+                content_type=self.content_type,
+                title=memory.path,
+                snippet=_text_snippet(memory.content, query),
+                score=0.0,
+                updated_at=memory.updated_at,
+                metadata={"path": memory.path},
+            )
+            for memory in memories
+        ]
+
+
+class SemanticSearchProvider(SearchProvider):
+    """Embedding search over notes, websites and file ai.md derivatives.
+
+    Hits carry the source content type, so a document found by both a
+    keyword provider and this one is merged into a single result.
+    """
+
+    content_type = "semantic"
+
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Search the semantic index and attach source titles."""
+        matches = SemanticIndexService.search(db, user_id, query, limit=limit)
+        ids: dict[str, list[uuid.UUID]] = {}
+        for match in matches:
+            ids.setdefault(match.content_type, []).append(match.content_id)
+        sources: dict[tuple[str, uuid.UUID], tuple[str, datetime]] = {}
+        for content_type, model, title_column in (
+            ("note", Note, Note.title),
+            ("website", Website, Website.title),
+            ("file", IngestedFile, IngestedFile.filename_original),
+        ):
+            if not ids.get(content_type):
+                continue
+            for content_id, title, updated_at in db.query(
+                model.id, title_column, model.updated_at
+            ).filter(
+                model.user_id == user_id,
+                model.id.in_(ids[content_type]),
+                model.deleted_at.is_(None),
+            ):
+                sources[(content_type, content_id)] = (title, updated_at)
+        hits = []
+        for match in matches:
+            source = sources.get((match.content_type, match.content_id))
+            if source is None:
+                # Deleted since it was indexed.
+                continue
+            title, updated_at = source
+            hits.append(
+                SearchHit(
+                    id=str(match.content_id),
+                    content_type=match.content_type,
+                    title=title,
+                    snippet=_text_snippet(match.text, query),
+                    score=max(match.score, 0.0),
+                    updated_at=updated_at,
+                    metadata={"chunkIndex": match.chunk_index},
+                )
+            )
+        return hits
+
+
+def default_search_providers() -> list[SearchProvider]:
+    """Return one provider per searchable content type.
+
+    The semantic provider is included when an embedder is configured.
+    """
+    providers: list[SearchProvider] = [
+        NotesSearchProvider(),
+        WebsitesSearchProvider(),
+        FilesSearchProvider(),
+        ConversationsSearchProvider(),
+        MemoriesSearchProvider(),
+    ]
+    if settings.semantic_index_embedder:
+        providers.append(SemanticSearchProvider())
+    return providers
@@ -0,0 +1,334 @@
+"""Parallel local search across notes, websites, files, conversations and memories."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from api.exceptions import BadRequestError
+from api.metrics import universal_search_provider_duration_seconds
+from api.services.skill_file_ops_paths import session_for_user
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+# Providers still running at the deadline are reported as timed out; their
+# queries are bounded by a statement timeout of the same length.
+DEFAULT_SEARCH_DEADLINE_SECONDS = 2.0
+
+
+@dataclass
+class SearchHit:
+    """A single provider result.
+
+    ``score`` is the provider's raw relevance; the service rescales it to
+    0.0-1.0 per provider before merging.
+    """
+
+    id: str
+    content_type: str
+    title: str
+    snippet: str | None
+    score: float
+    updated_at: datetime | None
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the API payload for this hit."""
+        return {
+            "id": self.id,
+            "contentType": self.content_type,
+            "title": self.title,
+            "snippet": self.snippet,
+            "score": round(self.score, 4),
+            "updatedAt": self.updated_at.isoformat() if self.updated_at else None,
+            "metadata": self.metadata,
+        }
+
+
+@dataclass
+class ProviderOutcome:
+    """Hits and timing for one provider run."""
+
+    content_type: str
+    hits: list[SearchHit]
+    latency_ms: float
+    status: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the API payload for this provider's metrics."""
+        return {
+            "contentType": self.content_type,
+            "status": self.status,
+            "count": len(self.hits),
+            "latencyMs": round(self.latency_ms, 1),
+        }
+
+
+class SearchProvider(ABC):
+    """Searches one content type for a user."""
+
+    content_type: str
+
+    @abstractmethod
+    def search(
+        self, db: Session, user_id: str, query: str, *, limit: int
+    ) -> list[SearchHit]:
+        """Return hits for a query, most relevant first.
+
+        Args:
+            db: Database session scoped to the user.
+            user_id: Current user ID.
+            query: Search query string.
+            limit: Max number of hits.
+
+        Returns:
+            Hits ordered by relevance.
+        """
+
+
+def normalize_scores(hits: list[SearchHit]) -> list[SearchHit]:
+    """Rescale a provider's hits to 0.0-1.0 in place.
+
+    Raw scores are divided by the provider's best score. Providers without
+    a usable score (all zero) fall back to reciprocal rank.
+
+    Args:
+        hits: Hits from one provider, most relevant first.
+
+    Returns:
+        The same hits with normalized scores.
+    """
+    best = max((hit.score for hit in hits), default=0.0)
+    for position, hit in enumerate(hits):
+        hit.score = hit.score / best if best > 0 else 1.0 / (position + 1)
+    return hits
+
+
+def merge_hits(outcomes: Sequence[ProviderOutcome], limit: int) -> list[SearchHit]:
+    """Merge normalized provider hits into one ranked list.
+
+    Args:
+        outcomes: Completed provider outcomes.
+        limit: Max number of merged hits.
+
+    Returns:
+        Hits ordered by score, then most recently updated. A record found
+        by several providers appears once, with its best score.
+    """
+    hits = [hit for outcome in outcomes for hit in outcome.hits]
+    hits.sort(
+        key=lambda hit: (
+            hit.score,
+            hit.updated_at.timestamp() if hit.updated_at else 0.0,
+        ),
+        reverse=True,
+    )
+    best: dict[tuple[str, str], SearchHit] = {}
+    for hit in hits:
+        best.setdefault((hit.content_type, hit.id), hit)
+    return list(best.values())[:limit]
+
+
+class UniversalSearchService:
+    """Run search providers concurrently under a deadline and merge results."""
+
+    def __init__(
+        self,
+        providers: Sequence[SearchProvider] | None = None,
+        *,
+        deadline_seconds: float = DEFAULT_SEARCH_DEADLINE_SECONDS,
+        session_factory: Callable[[str], AbstractContextManager[Session]] | None = None,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            providers: Providers to query (defaults to every content type).
+            deadline_seconds: Time budget for the whole search.
+            session_factory: Opens a user-scoped session per provider.
+        """
+        if providers is None:
+            # Imported here: the providers module depends on this one.
+            from api.services.universal_search_providers import (
+                default_search_providers,
+            )
+
+            providers = default_search_providers()
+        self.providers = {provider.content_type: provider for provider in providers}
+        self.deadline_seconds = deadline_seconds
+        self._session_factory = session_factory or session_for_user
+
+    async def search(
+        self,
+        user_id: str,
+        query: str,
+        *,
+        content_types: Sequence[str] | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> dict[str, Any]:
+        """Search every selected provider and return the merged results.
+
+        Args:
+            user_id: Current user ID.
+            query: Search query string.
+            content_types: Content types to search (all when omitted).
+            limit: Max number of merged results.
+
+        Returns:
+            Payload with merged items and per-provider metrics.
+        """
+        result: dict[str, Any] = {}
+        async for event in self.stream(
+            user_id, query, content_types=content_types, limit=limit
+        ):
+            result = event
+        result.pop("type", None)
+        return result
+
+    def stream(
+        self,
+        user_id: str,
+        query: str,
+        *,
+        content_types: Sequence[str] | None = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream each provider's results as they finish, then the merged set.
+
+        Arguments are validated before anything runs, so errors surface
+        before a streaming response starts.
+
+        Args:
+            user_id: Current user ID.
+            query: Search query string.
+            content_types: Content types to search (all when omitted).
+            limit: Max number of results per provider and merged.
+
+        Returns:
+            Async iterator of ``provider`` events in completion order, then
+            one ``complete`` event with the merged items.
+
+        Raises:
+            BadRequestError: If the query is empty or a content type is unknown.
+        """
+        query = (query or "").strip()
+        if not query:
+            raise BadRequestError("query required")
+        providers = self._select_providers(content_types)
+        limit = max(1, min(int(limit), MAX_SEARCH_LIMIT))
+        return self._stream(providers, user_id, query, limit)
+
+    async def _stream(
+        self,
+        providers: list[SearchProvider],
+        user_id: str,
+        query: str,
+        limit: int,
+    ) -> AsyncIterator[dict[str, Any]]:
+        started = time.perf_counter()
+        deadline = started + self.deadline_seconds
+        tasks = {
+            asyncio.create_task(
+                asyncio.to_thread(self._run_provider, provider, user_id, query, limit)
+            ): provider
+            for provider in providers
+        }
+        outcomes: list[ProviderOutcome] = []
+        pending = set(tasks)
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                outcome = task.result()
+                outcomes.append(outcome)
+                yield self._provider_event(outcome)
+
+        for task in pending:
+            # The worker thread finishes on its own; its result is dropped.
+            task.cancel()
+            outcome = ProviderOutcome(
+                content_type=tasks[task].content_type,
+                hits=[],
+                latency_ms=self.deadline_seconds * 1000,
+                status="timeout",
+            )
+            self._observe(outcome)
+            outcomes.append(outcome)
+            yield self._provider_event(outcome)
+
+        yield {
+            "type": "complete",
+            "query": query,
+            "items": [hit.to_dict() for hit in merge_hits(outcomes, limit)],
+            "providers": [outcome.to_dict() for outcome in outcomes],
+            "latencyMs": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _select_providers(
+        self, content_types: Sequence[str] | None
+    ) -> list[SearchProvider]:
+        if not content_types:
+            return list(self.providers.values())
+        unknown = [name for name in content_types if name not in self.providers]
+        if unknown:
+            raise BadRequestError(f"Unknown content type: {', '.join(unknown)}")
+        return [self.providers[name] for name in dict.fromkeys(content_types)]
+
+    def _run_provider(
+        self, provider: SearchProvider, user_id: str, query: str, limit: int
+    ) -> ProviderOutcome:
+        """Run one provider in a worker thread with its own session."""
+        started = time.perf_counter()
+        status = "ok"
+        hits: list[SearchHit] = []
+        try:
+            with self._session_factory(user_id) as db:
+                timeout_ms = int(self.deadline_seconds * 1000)
+                db.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+                hits = normalize_scores(
+                    provider.search(db, user_id, query, limit=limit)
+                )
+        except Exception as exc:
+            status = "error"
+            logger.warning(
+                "Search provider failed",
+                exc_info=exc,
+                extra={"content_type": provider.content_type},
+            )
+        outcome = ProviderOutcome(
+            content_type=provider.content_type,
+            hits=hits,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            status=status,
+        )
+        self._observe(outcome)
+        return outcome
+
+    @staticmethod
+    def _observe(outcome: ProviderOutcome) -> None:
+        universal_search_provider_duration_seconds.labels(
+            outcome.content_type, outcome.status
+        ).observe(outcome.latency_ms / 1000)
+
+    @staticmethod
+    def _provider_event(outcome: ProviderOutcome) -> dict[str, Any]:
+        return {
+            "type": "provider",
+            "provider": outcome.to_dict(),
+            "items": [hit.to_dict() for hit in outcome.hits],
+        }
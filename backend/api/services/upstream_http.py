@@ -0,0 +1,69 @@
+"""Shared pooled HTTP client for third-party lookups (weather, places)."""
+
+from __future__ import annotations
+
+import asyncio
+import ssl
+
+import httpx
+
+from api.config import settings
+
+UPSTREAM_TIMEOUT_SECONDS = 10.0
+UPSTREAM_MAX_CONNECTIONS = 50
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS = 10
+UPSTREAM_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _ssl_verify() -> bool | ssl.SSLContext:
+    """Build the TLS verification setting from app settings.
+
+    Returns:
+        True for default verification, or a configured SSL context.
+    """
+    if settings.disable_ssl_verify:
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        return ssl_context
+    if settings.custom_ca_bundle:
+        return ssl.create_default_context(cafile=settings.custom_ca_bundle)
+    return True
+
+
+def get_upstream_http_client() -> httpx.AsyncClient:
+    """Return the process-wide upstream HTTP client.
+
+    The client keeps a keep-alive pool so repeated lookups reuse TLS
+    connections. A new client is created if the running event loop changed
+    (e.g. between test clients), since pooled connections are loop-bound.
+
+    Returns:
+        Shared AsyncClient instance.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            verify=_ssl_verify(),
+            timeout=httpx.Timeout(UPSTREAM_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=UPSTREAM_MAX_CONNECTIONS,
+                max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            headers={"Accept": "application/json"},
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_upstream_http_client() -> None:
+    """Close the shared upstream client if one was created."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -16,11 +16,16 @@ class UserSettingsService:
     """Service for managing per-user settings."""
 
     UNSET = object()
+    # Session.info key for the per-session settings memo.
+    SESSION_CACHE_KEY = "user_settings_by_user"
 
     @staticmethod
     def get_settings(db: Session, user_id: str) -> UserSettings | None:
         """Fetch settings for a user.
 
+        Records are memoized on the session, so repeated lookups within one
+        request (chat setup, prompt building) cost a single query.
+
         Args:
             db: Database session.
             user_id: Current user ID.
@@ -28,7 +33,21 @@ class UserSettingsService:
         Returns:
             UserSettings record or None.
         """
-        return db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
+        cache = UserSettingsService._session_cache(db)
+        if cache is not None and user_id in cache:
+            return cache[user_id]
+        record = db.query(UserSettings).filter(UserSettings.user_id == user_id).first()
+        if cache is not None and record is not None:
+            cache[user_id] = record
+        return record
+
+    @staticmethod
+    def _session_cache(db: Session) -> dict[str, UserSettings] | None:
+        """Return the settings memo stored on a session, if supported."""
+        info = getattr(db, "info", None)
+        if not isinstance(info, dict):
+            return None
+        return info.setdefault(UserSettingsService.SESSION_CACHE_KEY, {})
 
     @staticmethod
     def get_user_id_for_shortcuts_pat(db: Session, token: str) -> str | None:
@@ -167,12 +186,20 @@ class UserSettingsService:
 
         db.flush()
         db.commit()
+        cache = UserSettingsService._session_cache(db)
+        if cache is not None:
+            cache[user_id] = settings
         return settings
 
     @staticmethod
-    def update_tasks_snapshot(db: Session, user_id: str, snapshot: str) -> None:
-        """Update the tasks AI snapshot if it has changed."""
+    def update_tasks_snapshot(db: Session, user_id: str, snapshot: str) -> bool:
+        """Update the tasks AI snapshot if it has changed.
+
+        Returns:
+            True if the snapshot was written.
+        """
         settings = UserSettingsService.get_settings(db, user_id)
         if settings and settings.tasks_ai_snapshot == snapshot:
-            return
+            return False
         UserSettingsService.upsert_settings(db, user_id, tasks_ai_snapshot=snapshot)
+        return True
@@ -157,7 +157,7 @@ def extract_tags(
 
     content_lower = content.lower()
     title_lower = title.lower()
-    for keyword in PROGRAMMING_KEYWORDS:
+    for keyword in sorted(PROGRAMMING_KEYWORDS):
         if keyword in content_lower or keyword in title_lower:
             tags.append(keyword)
 
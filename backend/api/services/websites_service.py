@@ -13,6 +13,7 @@ from sqlalchemy.orm.attributes import flag_modified
 from api.exceptions import WebsiteNotFoundError
 from api.models.website import Website
 from api.schemas.filters import WebsiteFilters
+from api.services.semantic_index_service import mark_content_changed
 from api.services.website_reading_time import (
     derive_reading_time,
     normalize_reading_time,
@@ -22,9 +23,14 @@ from api.services.websites_utils import (
     extract_domain,
     normalize_url,
 )
+from api.utils.etag import resource_watermark
 from api.utils.metadata_helpers import get_max_pinned_order
 from api.utils.pinned_order import lock_pinned_order
-from api.utils.search import build_text_search_filter
+from api.utils.search import (
+    build_text_search_filter,
+    build_text_search_rank,
+    fetch_search_headlines,
+)
 
 
 class WebsitesService:
@@ -118,6 +124,8 @@ class WebsitesService:
             deleted_at=None,
         )
         db.add(website)
+        db.flush()
+        mark_content_changed(db, user_id, "website", website.id)
         db.commit()
         db.refresh(website)
         return website
@@ -189,6 +197,7 @@ class WebsitesService:
             if website.deleted_at is not None:
                 website.deleted_at = None
             website.updated_at = now
+            mark_content_changed(db, user_id, "website", website.id)
             db.commit()
             db.refresh(website)
             return website
@@ -215,6 +224,8 @@ class WebsitesService:
             deleted_at=None,
         )
         db.add(website)
+        db.flush()
+        mark_content_changed(db, user_id, "website", website.id)
         db.commit()
         db.refresh(website)
         return website
@@ -293,6 +304,8 @@ class WebsitesService:
             flag_modified(website, "metadata_")
 
         website.updated_at = datetime.now(UTC)
+        if content is not None:
+            mark_content_changed(db, user_id, "website", website.id)
         db.commit()
         db.refresh(website)
         return website
@@ -540,6 +553,7 @@ class WebsitesService:
         now = datetime.now(UTC)
         website.deleted_at = now
         website.updated_at = now
+        mark_content_changed(db, user_id, "website", website.id)
         db.commit()
         return website
 
@@ -667,6 +681,19 @@ class WebsitesService:
 
         return query.all()
 
+    @staticmethod
+    def list_version(db: Session, user_id: str) -> tuple:
+        """Return a change marker for the websites list.
+
+        Args:
+            db: Database session.
+            user_id: Current user ID.
+
+        Returns:
+            Watermark tuple suitable for build_etag.
+        """
+        return resource_watermark(db, Website, user_id)
+
     @staticmethod
     def archived_summary(db: Session, user_id: str) -> dict[str, object]:
         """Return archived website count and last updated timestamp."""
@@ -727,7 +754,7 @@ class WebsitesService:
         query: str,
         limit: int = 50,
     ) -> list[Website]:
-        """Search websites by title or content.
+        """Search websites by title or content, most relevant first.
 
         Args:
             db: Database session.
@@ -738,6 +765,7 @@ class WebsitesService:
         Returns:
             List of matching websites.
         """
+        search_vector = Website.__table__.c.search_vector
         return (
             db.query(Website)
             .filter(
@@ -746,9 +774,33 @@ class WebsitesService:
                 build_text_search_filter(
                     [Website.title, Website.content],
                     query,
+                    search_vector=search_vector,
                 ),
             )
-            .order_by(Website.updated_at.desc())
+            .order_by(
+                build_text_search_rank(search_vector, query).desc(),
+                Website.updated_at.desc(),
+            )
             .limit(limit)
             .all()
         )
+
+    @staticmethod
+    def search_snippets(
+        db: Session,
+        query: str,
+        websites: list[Website],
+    ) -> dict[uuid.UUID, str]:
+        """Return highlighted content snippets for search results.
+
+        Args:
+            db: Database session.
+            query: Search query string.
+            websites: Websites returned by search_websites.
+
+        Returns:
+            Mapping of website ID to snippet text.
+        """
+        return fetch_search_headlines(
+            db, Website, query, [site.id for site in websites]
+        )
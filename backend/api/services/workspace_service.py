@@ -43,6 +43,17 @@ class WorkspaceService(ABC, Generic[T]):
     ) -> list[T]:
         """Search items for a user."""
 
+    @classmethod
+    def _search_snippets(
+        cls,
+        db: Session,
+        user_id: str,
+        query: str,
+        items: list[T],
+    ) -> dict[Any, str]:
+        """Return highlighted snippets keyed by item ID (none by default)."""
+        return {}
+
     @classmethod
     @abstractmethod
     def _item_to_dict(cls, item: T, **kwargs: Any) -> dict[str, Any]:
@@ -74,5 +85,12 @@ class WorkspaceService(ABC, Generic[T]):
     ) -> dict[str, list[dict[str, Any]]]:
         """Search items and return UI-friendly results."""
         items = cls._search_items(db, user_id, query, limit=limit, **kwargs)
-        results = [cls._item_to_dict(item, **kwargs) for item in items]
+        snippets = cls._search_snippets(db, user_id, query, items)
+        results = []
+        for item in items:
+            result = cls._item_to_dict(item, **kwargs)
+            snippet = snippets.get(getattr(item, "id", None))
+            if snippet:
+                result["snippet"] = snippet
+            results.append(result)
         return {"items": results}
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -13,6 +15,49 @@ from api.config import settings
 
 _jwks_cache: dict[str, Any] | None = None
 _jwks_expires_at: float = 0.0
+# Public key objects parsed from the current JWKS, keyed by (alg, kid).
+_jwk_key_cache: dict[tuple[str, str], Any] = {}
+# sha256(token) -> (claims, exp) for tokens that already passed validation.
+_verified_token_cache: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+VERIFIED_TOKEN_CACHE_MAX_ENTRIES = 4096
+
+
+def clear_token_caches() -> None:
+    """Drop cached JWKS keys and verified tokens."""
+    global _jwks_cache, _jwks_expires_at
+    _jwks_cache = None
+    _jwks_expires_at = 0.0
+    _jwk_key_cache.clear()
+    _verified_token_cache.clear()
+
+
+def _token_cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _get_verified_claims(token: str) -> dict[str, Any] | None:
+    cache_key = _token_cache_key(token)
+    cached = _verified_token_cache.get(cache_key)
+    if not cached:
+        return None
+    claims, expires_at = cached
+    if time.time() >= expires_at:
+        _verified_token_cache.pop(cache_key, None)
+        return None
+    _verified_token_cache.move_to_end(cache_key)
+    return claims
+
+
+def _remember_verified_claims(token: str, claims: dict[str, Any]) -> None:
+    exp = claims.get("exp")
+    if not isinstance(exp, int | float):
+        # Tokens without an expiry are re-verified every time.
+        return
+    cache_key = _token_cache_key(token)
+    _verified_token_cache[cache_key] = (claims, float(exp))
+    _verified_token_cache.move_to_end(cache_key)
+    while len(_verified_token_cache) > VERIFIED_TOKEN_CACHE_MAX_ENTRIES:
+        _verified_token_cache.popitem(last=False)
 
 
 class JWTValidationError(Exception):
@@ -42,6 +87,7 @@ class SupabaseJWTValidator:
             data = response.json()
 
         _jwks_cache = data
+        _jwk_key_cache.clear()
         _jwks_expires_at = now + settings.jwks_cache_ttl_seconds
         return data
 
@@ -65,6 +111,15 @@ class SupabaseJWTValidator:
         if not token:
             raise JWTValidationError("Missing token.")
 
+        cached_claims = _get_verified_claims(token)
+        if cached_claims is not None:
+            return cached_claims
+
+        claims = await self._validate_uncached(token)
+        _remember_verified_claims(token, claims)
+        return claims
+
+    async def _validate_uncached(self, token: str) -> dict[str, Any]:
         jwks = await self._fetch_jwks()
         try:
             header = jwt.get_unverified_header(token)
@@ -98,7 +153,11 @@ class SupabaseJWTValidator:
         keys = jwks.get("keys", [])
 
         def decode_with_key(jwk: dict[str, Any]) -> dict[str, Any]:
-            public_key = algorithm.from_jwk(json.dumps(jwk))
+            key_id = jwk.get("kid") or json.dumps(jwk, sort_keys=True)
+            public_key = _jwk_key_cache.get((alg, key_id))
+            if public_key is None:
+                public_key = algorithm.from_jwk(json.dumps(jwk))
+                _jwk_key_cache[(alg, key_id)] = public_key
             return jwt.decode(
                 token,
                 public_key,
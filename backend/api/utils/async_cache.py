@@ -0,0 +1,125 @@
+"""Bounded async TTL cache with request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncTTLCache(Generic[T]):
+    """LRU cache whose misses are loaded once per key (single-flight).
+
+    Concurrent callers that miss on the same key await one shared load
+    instead of each calling the upstream. Failed loads are not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum entries kept before evicting the oldest.
+            ttl_seconds: Maximum age of an entry.
+            clock: Monotonic time source (overridable in tests).
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[T]] = {}
+
+    def get(self, key: Hashable) -> T | None:
+        """Return a fresh cached value, or None on a miss.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None.
+        """
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        stored_at, value = cached
+        if self._clock() - stored_at >= self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        """Store a value, evicting the least recently used entry.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, loading it once on a miss.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine factory that fetches the value.
+
+        Returns:
+            Cached or freshly loaded value.
+
+        Raises:
+            Exception: Whatever the loader raised, shared by all waiters.
+        """
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The leading caller was cancelled; take over the load.
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so a failure nobody awaited is not logged as lost.
+            future.exception()
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
@@ -0,0 +1,19 @@
+"""Content hashing helpers for change detection."""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def compute_content_hash(content: str | None) -> str:
+    """Return the hex SHA-256 digest of UTF-8 encoded content.
+
+    Matches Postgres `encode(sha256(convert_to(content, 'UTF8')), 'hex')`.
+
+    Args:
+        content: Text content (None is treated as empty).
+
+    Returns:
+        Lowercase hex digest.
+    """
+    return hashlib.sha256((content or "").encode("utf-8")).hexdigest()
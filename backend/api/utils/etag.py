@@ -0,0 +1,98 @@
+"""ETag helpers for conditional GETs on polled list endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+# Clients must revalidate each poll, but may reuse the body on a 304.
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def resource_watermark(db: Session, model: Any, user_id: str) -> tuple:
+    """Return a cheap change marker for a user's rows in a soft-deleted table.
+
+    The marker changes when a row is created, updated, soft-deleted or hard
+    deleted, provided writes bump ``updated_at`` (as the sync endpoints
+    already require).
+
+    Args:
+        db: Database session.
+        model: Model with user_id, updated_at and deleted_at columns.
+        user_id: Current user ID.
+
+    Returns:
+        Tuple of (active row count, max updated_at, max deleted_at).
+    """
+    count, last_updated, last_deleted = db.execute(
+        select(
+            func.count().filter(model.deleted_at.is_(None)),
+            func.max(model.updated_at),
+            func.max(model.deleted_at),
+        ).where(model.user_id == user_id)
+    ).one()
+    return int(count or 0), last_updated, last_deleted
+
+
+def build_etag(*parts: object) -> str:
+    """Build a weak ETag from version parts.
+
+    Args:
+        parts: Values identifying the resource version.
+
+    Returns:
+        Quoted weak ETag string.
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match matches the ETag.
+
+    Uses weak comparison, as RFC 9110 requires for If-None-Match.
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag for the resource.
+
+    Returns:
+        True when the client already has this version.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in header.split(",")
+    )
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str
+) -> Response | None:
+    """Short-circuit with 304 if the client has the current version.
+
+    Sets ETag and Cache-Control on the outgoing response either way.
+
+    Args:
+        request: Incoming request.
+        response: Response the endpoint will return on a 200.
+        etag: Current ETag for the resource.
+
+    Returns:
+        A 304 response to return immediately, or None to build the body.
+    """
+    headers = {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
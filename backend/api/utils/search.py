@@ -2,10 +2,41 @@
 
 from __future__ import annotations
 
+import re
+import uuid
 from collections.abc import Iterable
 from typing import Any
 
-from sqlalchemy import or_
+from sqlalchemy import ColumnElement, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+# Text search configuration used by the generated search_vector columns.
+TEXT_SEARCH_CONFIG = "english"
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, "
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_tsquery(query: str) -> ColumnElement[Any] | None:
+    """Build a prefix-matching tsquery for every word in the query.
+
+    Args:
+        query: Raw user search string.
+
+    Returns:
+        tsquery expression ANDing each term as a prefix, or None if the query
+        has no word characters.
+    """
+    terms = _TERM_PATTERN.findall(query)
+    if not terms:
+        return None
+    return func.to_tsquery(
+        literal(TEXT_SEARCH_CONFIG).cast(REGCONFIG),
+        " & ".join(f"{term}:*" for term in terms),
+    )
 
 
 def build_text_search_filter(
@@ -13,18 +44,83 @@ def build_text_search_filter(
     query: str,
     *,
     case_sensitive: bool = False,
+    search_vector: Any | None = None,
 ):
     """Build a SQLAlchemy filter for text search across fields.
 
+    With a ``search_vector`` column the filter matches the GIN-indexed
+    tsvector, falling back to ``ILIKE '%q%'`` (trigram-indexed in Postgres)
+    for substrings inside words.
+
     Args:
         fields: SQLAlchemy columns or expressions to search.
         query: Search query string.
         case_sensitive: Whether to perform case-sensitive search.
+        search_vector: Optional tsvector column covering the fields.
 
     Returns:
         SQLAlchemy filter expression combining fields with OR.
     """
     search_term = f"%{query}%"
     if case_sensitive:
-        return or_(*(field.like(search_term) for field in fields))
-    return or_(*(field.ilike(search_term) for field in fields))
+        clauses = [field.like(search_term) for field in fields]
+    else:
+        clauses = [field.ilike(search_term) for field in fields]
+    tsquery = build_tsquery(query) if search_vector is not None else None
+    if tsquery is not None:
+        clauses.insert(0, search_vector.op("@@")(tsquery))
+    return or_(*clauses)
+
+
+def build_text_search_rank(search_vector: Any, query: str) -> ColumnElement[Any]:
+    """Build a relevance score for ordering search results.
+
+    Args:
+        search_vector: tsvector column.
+        query: Search query string.
+
+    Returns:
+        ts_rank_cd expression (0 when the query has no terms).
+    """
+    tsquery = build_tsquery(query)
+    if tsquery is None:
+        return literal(0.0)
+    return func.ts_rank_cd(search_vector, tsquery)
+
+
+def fetch_search_headlines(
+    db: Session,
+    model: Any,
+    query: str,
+    ids: Iterable[uuid.UUID],
+) -> dict[uuid.UUID, str]:
+    """Return highlighted content snippets for matched rows.
+
+    Runs after the ranked, limited search so ``ts_headline`` only parses the
+    rows being returned.
+
+    Args:
+        db: Database session.
+        model: Model with ``id`` and ``content`` columns.
+        query: Search query string.
+        ids: IDs of the rows to build snippets for.
+
+    Returns:
+        Mapping of row ID to snippet text with ``<mark>`` highlights.
+    """
+    id_list = list(ids)
+    tsquery = build_tsquery(query)
+    if not id_list or tsquery is None:
+        return {}
+    rows = db.execute(
+        select(
+            model.id,
+            func.ts_headline(
+                literal(TEXT_SEARCH_CONFIG).cast(REGCONFIG),
+                model.content,
+                tsquery,
+                HEADLINE_OPTIONS,
+            ),
+        ).where(model.id.in_(id_list))
+    ).all()
+    return {row_id: snippet for row_id, snippet in rows if snippet}
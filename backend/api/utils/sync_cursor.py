@@ -0,0 +1,50 @@
+"""Opaque keyset cursors for paginated sync responses."""
+
+from __future__ import annotations
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from api.exceptions import BadRequestError
+
+
+def encode_sync_cursor(updated_at: datetime, item_id: uuid.UUID | str) -> str:
+    """Encode an (updated_at, id) position into an opaque cursor string.
+
+    Args:
+        updated_at: Timestamp of the last item returned.
+        item_id: ID of the last item returned.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    raw = json.dumps({"u": updated_at.isoformat(), "id": str(item_id)})
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sync_cursor(value: str | None) -> tuple[datetime, uuid.UUID] | None:
+    """Decode a cursor produced by encode_sync_cursor.
+
+    Args:
+        value: Cursor string, or None.
+
+    Returns:
+        Tuple of (updated_at, id), or None if no cursor was provided.
+
+    Raises:
+        BadRequestError: If the cursor is malformed.
+    """
+    if not value:
+        return None
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        updated_at = datetime.fromisoformat(payload["u"])
+        item_id = uuid.UUID(payload["id"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise BadRequestError("Invalid cursor") from exc
+    if updated_at.tzinfo is None:
+        raise BadRequestError("Invalid cursor")
+    return updated_at, item_id
@@ -0,0 +1,218 @@
+"""Local stand-ins for the Anthropic and OpenAI APIs used under load tests.
+
+One HTTP server answers both APIs so the app can run without network access:
+
+- ``POST /v1/messages``: Anthropic Messages, streamed (SSE) or not. Streams
+  wait ``first_token_ms`` before the first text delta and ``token_ms``
+  between deltas, so chat latency includes a realistic model delay.
+- ``POST /v1/embeddings``: OpenAI embeddings with deterministic vectors.
+
+Point the SDKs at it with ``ANTHROPIC_BASE_URL`` and ``OPENAI_BASE_URL``
+(see ``upstream_environment``). R2 needs no server: the app's local storage
+backend stands in for it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+STUB_TEXT = (
+    "Here is a short answer from the local model stand-in. It streams a fixed "
+    "reply word by word so chat latency can be measured without the real API."
+)
+DEFAULT_EMBEDDING_DIMENSIONS = 512
+
+
+def _embedding(text: str, dimensions: int) -> list[float]:
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    values = [
+        digest[index % len(digest)] / 255.0 - 0.5 + index * 1e-4
+        for index in range(dimensions)
+    ]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    return [value / norm for value in values]
+
+
+class _UpstreamHandler(BaseHTTPRequestHandler):
+    server: StubUpstreams
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b"{}"
+        return json.loads(raw or b"{}")
+
+    def _send_json(self, payload: dict[str, Any], status: int = 200) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0].rstrip("/")
+        self.server.record_request(path)
+        payload = self._read_json()
+        if path.endswith("/messages"):
+            if payload.get("stream"):
+                self._stream_message(payload)
+            else:
+                self._send_json(self._message(payload, STUB_TEXT))
+            return
+        if path.endswith("/embeddings"):
+            self._embeddings(payload)
+            return
+        self._send_json({"error": {"message": f"Not stubbed: {path}"}}, status=404)
+
+    def _message(self, payload: dict[str, Any], text: str) -> dict[str, Any]:
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": payload.get("model", "stub"),
+            "content": [{"type": "text", "text": text}] if text else [],
+            "stop_reason": "end_turn" if text else None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": 100, "output_tokens": len(text.split())},
+        }
+
+    def _stream_message(self, payload: dict[str, Any]) -> None:
+        # No Content-Length: the body ends when the connection closes.
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def emit(event: dict[str, Any]) -> None:
+            data = json.dumps(event)
+            self.wfile.write(f"event: {event['type']}\ndata: {data}\n\n".encode())
+            self.wfile.flush()
+
+        words = STUB_TEXT.split(" ")
+        emit({"type": "message_start", "message": self._message(payload, "")})
+        emit(
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            }
+        )
+        time.sleep(self.server.first_token_ms / 1000)
+        for index, word in enumerate(words):
+            if index:
+                time.sleep(self.server.token_ms / 1000)
+            emit(
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {
+                        "type": "text_delta",
+                        "text": word if index == 0 else f" {word}",
+                    },
+                }
+            )
+        emit({"type": "content_block_stop", "index": 0})
+        emit(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": len(words)},
+            }
+        )
+        emit({"type": "message_stop"})
+
+    def _embeddings(self, payload: dict[str, Any]) -> None:
+        inputs = payload.get("input") or []
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = int(payload.get("dimensions") or DEFAULT_EMBEDDING_DIMENSIONS)
+        self._send_json(
+            {
+                "object": "list",
+                "model": payload.get("model", "stub"),
+                "data": [
+                    {
+                        "object": "embedding",
+                        "index": index,
+                        "embedding": _embedding(str(text), dimensions),
+                    }
+                    for index, text in enumerate(inputs)
+                ],
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            }
+        )
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+
+class StubUpstreams(ThreadingHTTPServer):
+    """Anthropic and OpenAI stand-in with configurable model latency."""
+
+    daemon_threads = True
+
+    def __init__(self, *, first_token_ms: float = 300.0, token_ms: float = 10.0):
+        """Bind to an ephemeral localhost port.
+
+        Args:
+            first_token_ms: Delay before the first streamed text delta.
+            token_ms: Delay between streamed text deltas.
+        """
+        super().__init__(("127.0.0.1", 0), _UpstreamHandler)
+        self.first_token_ms = first_token_ms
+        self.token_ms = token_ms
+        self.requests: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """Server root URL (without the ``/v1`` prefix)."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record_request(self, path: str) -> None:
+        """Count a request by path."""
+        with self._lock:
+            self.requests[path] += 1
+
+    def start(self) -> StubUpstreams:
+        """Serve from a daemon thread.
+
+        Returns:
+            The server, for chaining.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+
+
+def upstream_environment(upstreams: StubUpstreams) -> dict[str, str]:
+    """Environment variables that point the SDKs at the stand-ins.
+
+    Args:
+        upstreams: Running stand-in server.
+
+    Returns:
+        Variables to merge into ``os.environ`` before the app starts.
+    """
+    return {
+        "ANTHROPIC_BASE_URL": upstreams.base_url,
+        "ANTHROPIC_API_KEY": "stub-anthropic-key",
+        "OPENAI_BASE_URL": f"{upstreams.base_url}/v1",
+        "OPENAI_API_KEY": "stub-openai-key",
+    }
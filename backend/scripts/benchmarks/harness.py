@@ -0,0 +1,211 @@
+"""Measurement, result storage and comparison shared by the benchmarks."""
+
+from __future__ import annotations
+
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return value / divisor
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+@dataclass
+class StageSample:
+    """One timed run of a stage.
+
+    ``peak_rss_mb`` is the process high-water mark after the stage and
+    ``rss_growth_mb`` how far the stage raised it, so run each case in a
+    fresh process to keep stages comparable.
+    """
+
+    wall_ms: float
+    cpu_ms: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    output_bytes: int | None = None
+
+
+def measure(fn: Callable[[], Any]) -> tuple[Any, StageSample]:
+    """Run a callable and measure wall time, CPU time and RSS.
+
+    CPU time includes child processes (e.g. pdftoppm) started by the stage.
+
+    Args:
+        fn: Zero-argument callable to measure.
+
+    Returns:
+        The callable's result and its StageSample.
+    """
+    rss_before = _max_rss_mb()
+    cpu_before = _cpu_seconds()
+    started = time.perf_counter()
+    result = fn()
+    wall = time.perf_counter() - started
+    cpu = _cpu_seconds() - cpu_before
+    rss_after = _max_rss_mb()
+    return result, StageSample(
+        wall_ms=wall * 1000,
+        cpu_ms=cpu * 1000,
+        peak_rss_mb=rss_after,
+        rss_growth_mb=rss_after - rss_before,
+    )
+
+
+def distribution(values: list[float]) -> dict[str, float]:
+    """Summarize repeated measurements.
+
+    Args:
+        values: One measurement per repeat.
+
+    Returns:
+        Min, median, p95 and max, rounded to microseconds for milliseconds.
+    """
+    p95 = (
+        statistics.quantiles(values, n=20, method="inclusive")[18]
+        if len(values) > 1
+        else values[0]
+    )
+    return {
+        "min": round(min(values), 3),
+        "median": round(statistics.median(values), 3),
+        "p95": round(p95, 3),
+        "max": round(max(values), 3),
+    }
+
+
+def summarize(samples: list[StageSample]) -> dict[str, Any]:
+    """Aggregate repeated samples of one stage.
+
+    Args:
+        samples: Samples from each repeat.
+
+    Returns:
+        Wall and CPU time distributions and the worst memory figures.
+    """
+    return {
+        "wall_ms": distribution([sample.wall_ms for sample in samples]),
+        "cpu_ms": distribution([sample.cpu_ms for sample in samples]),
+        "peak_rss_mb": round(max(sample.peak_rss_mb for sample in samples), 2),
+        "rss_growth_mb": round(max(sample.rss_growth_mb for sample in samples), 2),
+        "output_bytes": samples[-1].output_bytes,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def build_results(benchmark: str, cases: dict[str, Any], **options: Any) -> dict:
+    """Wrap case results with the metadata needed to compare runs.
+
+    Args:
+        benchmark: Benchmark name.
+        cases: Per-case results.
+        options: Run options (scale, repeat, ...).
+
+    Returns:
+        JSON-serializable results document.
+    """
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "benchmark": benchmark,
+        "created_at": datetime.now(UTC).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": options,
+        "cases": cases,
+    }
+
+
+def write_results(path: Path, results: dict) -> None:
+    """Write results as stable, diff-friendly JSON.
+
+    Args:
+        path: Output file.
+        results: Results document.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def compare_results(
+    baseline: dict, current: dict, *, threshold: float, min_delta_ms: float = 5.0
+) -> list[dict[str, Any]]:
+    """Compare median wall times per case and stage.
+
+    Args:
+        baseline: Earlier results document.
+        current: New results document.
+        threshold: Relative slowdown that counts as a regression (0.2 = 20%).
+        min_delta_ms: Absolute slowdown below which a change is noise.
+
+    Returns:
+        One row per stage present in both runs, with a ``regression`` flag.
+    """
+    rows = []
+    for case, case_result in current["cases"].items():
+        baseline_case = baseline.get("cases", {}).get(case)
+        if not baseline_case:
+            continue
+        for stage, stage_result in case_result["stages"].items():
+            baseline_stage = baseline_case["stages"].get(stage)
+            if not baseline_stage:
+                continue
+            before = baseline_stage["wall_ms"]["median"]
+            after = stage_result["wall_ms"]["median"]
+            change = (after - before) / before if before else 0.0
+            rows.append(
+                {
+                    "case": case,
+                    "stage": stage,
+                    "baseline_ms": before,
+                    "current_ms": after,
+                    "change": round(change, 4),
+                    "regression": change > threshold and after - before > min_delta_ms,
+                }
+            )
+    return rows
+
+
+def print_comparison(rows: list[dict[str, Any]]) -> None:
+    """Print a comparison table to stdout."""
+    for row in rows:
+        marker = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['case']:<24} {row['stage']:<10} "
+            f"{row['baseline_ms']:>10.1f}ms -> {row['current_ms']:>10.1f}ms "
+            f"({row['change']:+.1%}){marker}"
+        )
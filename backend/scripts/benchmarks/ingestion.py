@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Benchmark the ingestion worker's per-file pipeline stages.
+
+Generates a deterministic corpus (text-heavy, table-heavy and many-page
+PDFs, DOCX, PPTX, XLSX with merged cells, a large CSV and images) and runs
+each file through the worker's extraction, thumbnail, ai.md and storage
+steps against LocalStorage. Every case/repeat runs in a fresh process so
+peak RSS is attributable to that case.
+
+LibreOffice conversion of DOCX/PPTX is not measured; those cases time the
+text extraction only. PDF thumbnails are skipped when pdftoppm is missing.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.ingestion --output results/ingestion.json
+    python -m scripts.benchmarks.ingestion --output new.json \
+        --compare results/ingestion.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from scripts.benchmarks.harness import (
+    StageSample,
+    build_results,
+    compare_results,
+    measure,
+    print_comparison,
+    summarize,
+    write_results,
+)
+from scripts.benchmarks.ingestion_corpus import CORPUS, CorpusFile, generate_corpus
+
+BENCHMARK_NAME = "ingestion"
+DEFAULT_CORPUS_DIR = Path(tempfile.gettempdir()) / "sidebar-benchmarks" / "ingestion"
+
+_VIEWER_KINDS = {
+    "pdf": "viewer_pdf",
+    "docx": "viewer_pdf",
+    "pptx": "viewer_pdf",
+    "spreadsheet": "viewer_json",
+    "image": "image_original",
+}
+
+
+def run_case(corpus_file: CorpusFile) -> dict[str, Any]:
+    """Run one corpus file through the pipeline stages.
+
+    Intended to run in a fresh process (see ``_run_isolated``).
+
+    Args:
+        corpus_file: Input file.
+
+    Returns:
+        Stage samples keyed by stage name, plus skipped stages with reasons.
+    """
+    # The worker imports settings, which require an API key to be set.
+    os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark-placeholder")
+    from api.models.file_ingestion import IngestedFile
+    from api.services.storage.local import LocalStorage
+    from workers import ingestion_worker as worker
+
+    source = corpus_file.path
+    record = IngestedFile(
+        id=uuid4(),
+        user_id="benchmark",
+        filename_original=source.name,
+        mime_original=corpus_file.mime,
+        size_bytes=source.stat().st_size,
+        sha256=None,
+        created_at=datetime.now(UTC),
+    )
+    stages: dict[str, StageSample] = {}
+    skipped: dict[str, str] = {}
+
+    def extract() -> str:
+        if corpus_file.kind == "pdf":
+            return worker._extract_pdf_text(source)
+        if corpus_file.kind == "docx":
+            return worker._extract_docx_text(source)
+        if corpus_file.kind == "pptx":
+            return worker._extract_pptx_text(source)
+        data = worker._extract_spreadsheet_data(source, corpus_file.mime, source.name)
+        return json.dumps(data, ensure_ascii=False)
+
+    if corpus_file.kind == "image":
+        text = "Image file. No text extraction available."
+        skipped["extract"] = "no text extraction for images"
+    else:
+        text, stages["extract"] = measure(extract)
+        stages["extract"].output_bytes = len(text.encode("utf-8"))
+
+    with tempfile.TemporaryDirectory(prefix="sidebar-bench-") as workdir:
+        thumb_bytes = None
+        if corpus_file.kind == "image":
+            thumb_bytes, stages["thumbnail"] = measure(
+                lambda: worker._generate_image_thumbnail(source)
+            )
+        elif corpus_file.kind == "pdf":
+            if shutil.which("pdftoppm"):
+                thumb_bytes, stages["thumbnail"] = measure(
+                    lambda: worker._generate_pdf_thumbnail(
+                        source, Path(workdir) / "derived"
+                    )
+                )
+            else:
+                skipped["thumbnail"] = "pdftoppm not installed"
+        elif corpus_file.kind in {"docx", "pptx"}:
+            skipped["thumbnail"] = "requires LibreOffice conversion"
+        if "thumbnail" in stages:
+            stages["thumbnail"].output_bytes = len(thumb_bytes or b"")
+
+        viewer_kind = _VIEWER_KINDS[corpus_file.kind]
+        ai_md, stages["ai_md"] = measure(
+            lambda: worker._build_ai_md_payload(record, viewer_kind, text)
+        )
+        stages["ai_md"].output_bytes = ai_md.size_bytes
+
+        def store() -> int:
+            prefix = worker._storage_prefix(record)
+            derivatives = [
+                worker._make_payload(
+                    viewer_kind,
+                    f"{prefix}/derivatives/viewer",
+                    corpus_file.mime,
+                    source.read_bytes(),
+                ),
+                ai_md,
+            ]
+            if thumb_bytes:
+                derivatives.append(
+                    worker._make_payload(
+                        "thumb_png",
+                        f"{prefix}/derivatives/thumb.png",
+                        "image/png",
+                        thumb_bytes,
+                    )
+                )
+            storage = LocalStorage(Path(workdir) / "storage")
+            worker._write_derivatives_atomically(storage, record, derivatives)
+            return sum(item.size_bytes for item in derivatives)
+
+        stored, stages["store"] = measure(store)
+        stages["store"].output_bytes = stored
+
+    return {
+        "stages": {name: asdict(sample) for name, sample in stages.items()},
+        "skipped": skipped,
+    }
+
+
+def _run_isolated(corpus_file: CorpusFile) -> dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=context, max_tasks_per_child=1
+    ) as pool:
+        return pool.submit(run_case, corpus_file).result()
+
+
+def run_benchmark(
+    corpus_dir: Path,
+    *,
+    scale: int = 1,
+    repeat: int = 3,
+    seed: int = 1234,
+    cases: list[str] | None = None,
+) -> dict[str, Any]:
+    """Generate the corpus and benchmark every case.
+
+    Args:
+        corpus_dir: Where generated inputs are cached.
+        scale: Corpus size multiplier.
+        repeat: Runs per case; medians are reported.
+        seed: Corpus random seed.
+        cases: Subset of case names (all when omitted).
+
+    Returns:
+        Results document (see ``harness.build_results``).
+    """
+    files = generate_corpus(corpus_dir, scale=scale, seed=seed, names=cases)
+    results: dict[str, Any] = {}
+    for corpus_file in files:
+        runs = [_run_isolated(corpus_file) for _ in range(repeat)]
+        stage_names = runs[0]["stages"].keys()
+        results[corpus_file.name] = {
+            "input_bytes": corpus_file.path.stat().st_size,
+            "mime": corpus_file.mime,
+            "stages": {
+                stage: summarize([StageSample(**run["stages"][stage]) for run in runs])
+                for stage in stage_names
+            },
+            "skipped": runs[0]["skipped"],
+        }
+        print(_format_case(corpus_file.name, results[corpus_file.name]), flush=True)
+    return build_results(BENCHMARK_NAME, results, scale=scale, repeat=repeat, seed=seed)
+
+
+def _format_case(name: str, case: dict[str, Any]) -> str:
+    parts = [
+        f"{stage}={result['wall_ms']['median']:.1f}ms"
+        for stage, result in case["stages"].items()
+    ]
+    peak = max(result["peak_rss_mb"] for result in case["stages"].values())
+    return f"{name:<20} {' '.join(parts)} peak_rss={peak:.0f}MB"
+
+
+def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the ingestion pipeline.")
+    parser.add_argument(
+        "--output", required=True, help="Where to write the JSON results."
+    )
+    parser.add_argument("--scale", type=int, default=1, help="Corpus size multiplier.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case.")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus random seed.")
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(CORPUS),
+        help="Only run this case (repeatable).",
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        default=str(DEFAULT_CORPUS_DIR),
+        help="Directory for generated inputs (reused between runs).",
+    )
+    parser.add_argument("--compare", help="Baseline results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that fails --compare (default: 0.2).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmark(
+        Path(args.corpus_dir),
+        scale=args.scale,
+        repeat=args.repeat,
+        seed=args.seed,
+        cases=args.case,
+    )
+    write_results(Path(args.output), results)
+    if not args.compare:
+        return 0
+    baseline = json.loads(Path(args.compare).read_text())
+    rows = compare_results(baseline, results, threshold=args.threshold)
+    print_comparison(rows)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
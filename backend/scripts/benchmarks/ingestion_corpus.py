@@ -0,0 +1,302 @@
+"""Deterministic synthetic documents for the ingestion benchmark."""
+
+from __future__ import annotations
+
+import csv
+import io
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+WORDS = (
+    "quarterly revenue growth forecast margin customer retention churn pipeline "
+    "budget roadmap launch hiring analysis latency throughput storage migration "
+    "contract renewal region market segment survey feedback incident review "
+    "design prototype release milestone dependency vendor invoice audit policy"
+).split()
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+
+@dataclass(frozen=True)
+class CorpusFile:
+    """A generated input file."""
+
+    name: str
+    path: Path
+    mime: str
+    kind: str
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _pdf_text(x: float, y: float, text: str, size: int = 10) -> str:
+    return f"BT /F1 {size} Tf {x:.1f} {y:.1f} Td ({_pdf_escape(text)}) Tj ET"
+
+
+def build_pdf(pages: list[list[str]]) -> bytes:
+    """Assemble a PDF from per-page content-stream operators.
+
+    Uses the built-in Helvetica font, so no font embedding is needed.
+
+    Args:
+        pages: Content stream operators for each page.
+
+    Returns:
+        PDF file bytes.
+    """
+    objects: list[bytes] = []
+    page_ids = [4 + index * 2 for index in range(len(pages))]
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode())
+    objects.append(
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>"
+    )
+    for page_id, operators in zip(page_ids, pages, strict=True):
+        objects.append(
+            (
+                f"<< /Type /Page /Parent 2 0 R "
+                f"/MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                f"/Resources << /Font << /F1 3 0 R >> >> "
+                f"/Contents {page_id + 1} 0 R >>"
+            ).encode()
+        )
+        stream = "\n".join(operators).encode("latin-1", errors="replace")
+        objects.append(
+            b"<< /Length "
+            + str(len(stream)).encode()
+            + b" >>\nstream\n"
+            + stream
+            + b"\nendstream"
+        )
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+    xref_offset = output.tell()
+    output.write(f"xref\n0 {len(objects) + 1}\n".encode())
+    output.write(b"0000000000 65535 f \n")
+    for offset in offsets:
+        output.write(f"{offset:010d} 00000 n \n".encode())
+    output.write(
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n".encode()
+    )
+    return output.getvalue()
+
+
+def _text_page(rng: random.Random, lines: int) -> list[str]:
+    operators = [_pdf_text(72, 740, _sentence(rng, 6), size=16)]
+    y = 710.0
+    for _ in range(lines):
+        operators.append(_pdf_text(72, y, _sentence(rng, 12)))
+        y -= 13
+    return operators
+
+
+def _table_page(rng: random.Random, rows: int, columns: int) -> list[str]:
+    left, top, cell_width, cell_height = 50.0, 720.0, 85.0, 18.0
+    right = left + columns * cell_width
+    bottom = top - (rows + 1) * cell_height
+    operators = [_pdf_text(left, top + 20, _sentence(rng, 5), size=14), "0.5 w"]
+    for row in range(rows + 2):
+        y = top - row * cell_height
+        operators.append(f"{left:.1f} {y:.1f} m {right:.1f} {y:.1f} l S")
+    for column in range(columns + 1):
+        x = left + column * cell_width
+        operators.append(f"{x:.1f} {top:.1f} m {x:.1f} {bottom:.1f} l S")
+    for row in range(rows + 1):
+        y = top - row * cell_height - 13
+        for column in range(columns):
+            value = (
+                f"{rng.choice(WORDS)} {column}"
+                if row == 0
+                else f"{rng.randint(0, 99999) / 100:.2f}"
+            )
+            operators.append(
+                _pdf_text(left + column * cell_width + 4, y, value, size=8)
+            )
+    return operators
+
+
+def _write_pdf_text_heavy(path: Path, rng: random.Random, scale: int) -> None:
+    path.write_bytes(build_pdf([_text_page(rng, 50) for _ in range(20 * scale)]))
+
+
+def _write_pdf_table_heavy(path: Path, rng: random.Random, scale: int) -> None:
+    path.write_bytes(build_pdf([_table_page(rng, 30, 6) for _ in range(10 * scale)]))
+
+
+def _write_pdf_many_pages(path: Path, rng: random.Random, scale: int) -> None:
+    path.write_bytes(build_pdf([_text_page(rng, 4) for _ in range(200 * scale)]))
+
+
+def _write_docx(path: Path, rng: random.Random, scale: int) -> None:
+    from docx import Document
+
+    document = Document()
+    for section in range(20 * scale):
+        document.add_heading(_sentence(rng, 4), level=2)
+        for _ in range(5):
+            document.add_paragraph(_sentence(rng, 40))
+        if section % 4 == 0:
+            table = document.add_table(rows=10, cols=5)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = rng.choice(WORDS)
+    document.save(str(path))
+
+
+def _write_pptx(path: Path, rng: random.Random, scale: int) -> None:
+    from pptx import Presentation
+
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]
+    for _ in range(30 * scale):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = _sentence(rng, 5)
+        body = slide.placeholders[1].text_frame
+        body.text = _sentence(rng, 10)
+        for _ in range(4):
+            body.add_paragraph().text = _sentence(rng, 10)
+    presentation.save(str(path))
+
+
+def _write_xlsx_merged(path: Path, rng: random.Random, scale: int) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    for sheet_index in range(3):
+        sheet = workbook.active if sheet_index == 0 else workbook.create_sheet()
+        sheet.title = f"Region {sheet_index + 1}"
+        # Two-level merged header over groups of three columns.
+        for group in range(4):
+            column = group * 3 + 1
+            sheet.cell(row=1, column=column, value=f"Quarter {group + 1}")
+            sheet.merge_cells(
+                start_row=1, start_column=column, end_row=1, end_column=column + 2
+            )
+            for offset, label in enumerate(("Plan", "Actual", "Delta")):
+                sheet.cell(row=2, column=column + offset, value=label)
+        for row in range(3, 3 + 2000 * scale):
+            for column in range(1, 13):
+                sheet.cell(row=row, column=column, value=rng.randint(0, 100000))
+            if row % 50 == 0:
+                sheet.merge_cells(
+                    start_row=row, start_column=1, end_row=row, end_column=12
+                )
+    workbook.save(str(path))
+
+
+def _write_csv_large(path: Path, rng: random.Random, scale: int) -> None:
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "date", "region", "product", "units", "revenue"])
+        for row in range(100_000 * scale):
+            writer.writerow(
+                [
+                    row,
+                    f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    rng.choice(WORDS),
+                    rng.choice(WORDS),
+                    rng.randint(1, 500),
+                    f"{rng.random() * 10000:.2f}",
+                ]
+            )
+
+
+def _write_image(path: Path, rng: random.Random, scale: int, fmt: str) -> None:
+    from PIL import Image
+
+    width, height = 4000 * scale, 3000 * scale
+    # Noise blocks resized up: realistic compressed size without a slow loop.
+    noise = Image.frombytes(
+        "RGB", (400, 300), bytes(rng.getrandbits(8) for _ in range(400 * 300 * 3))
+    )
+    noise.resize((width, height), Image.Resampling.BILINEAR).save(str(path), fmt)
+
+
+CORPUS: dict[str, tuple[str, str, str, Callable[[Path, random.Random, int], None]]] = {
+    "pdf_text_heavy": ("pdf", ".pdf", "application/pdf", _write_pdf_text_heavy),
+    "pdf_table_heavy": ("pdf", ".pdf", "application/pdf", _write_pdf_table_heavy),
+    "pdf_many_pages": ("pdf", ".pdf", "application/pdf", _write_pdf_many_pages),
+    "docx_report": (
+        "docx",
+        ".docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        _write_docx,
+    ),
+    "pptx_deck": (
+        "pptx",
+        ".pptx",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        _write_pptx,
+    ),
+    "xlsx_merged": (
+        "spreadsheet",
+        ".xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        _write_xlsx_merged,
+    ),
+    "csv_large": ("spreadsheet", ".csv", "text/csv", _write_csv_large),
+    "image_png": (
+        "image",
+        ".png",
+        "image/png",
+        lambda path, rng, scale: _write_image(path, rng, scale, "PNG"),
+    ),
+    "image_jpeg": (
+        "image",
+        ".jpg",
+        "image/jpeg",
+        lambda path, rng, scale: _write_image(path, rng, scale, "JPEG"),
+    ),
+}
+
+
+def generate_corpus(
+    directory: Path,
+    *,
+    scale: int = 1,
+    seed: int = 1234,
+    names: list[str] | None = None,
+) -> list[CorpusFile]:
+    """Generate (or reuse) the benchmark corpus.
+
+    Files are seeded per case, so the same scale and seed always produce
+    identical inputs. Existing files are reused.
+
+    Args:
+        directory: Where to write the files.
+        scale: Size multiplier for every case.
+        seed: Base random seed.
+        names: Subset of CORPUS case names (all when omitted).
+
+    Returns:
+        Generated files in CORPUS order.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    files = []
+    for name, (kind, suffix, mime, writer) in CORPUS.items():
+        if names and name not in names:
+            continue
+        path = directory / f"{name}-x{scale}{suffix}"
+        if not path.exists():
+            partial = path.with_suffix(path.suffix + ".tmp")
+            writer(partial, random.Random(f"{seed}:{name}"), scale)
+            partial.rename(path)
+        files.append(CorpusFile(name=name, path=path, mime=mime, kind=kind))
+    return files
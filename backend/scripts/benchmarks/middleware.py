@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""Benchmark per-request overhead of the API middleware stack.
+
+Drives a minimal FastAPI app in-process (direct ASGI calls, no sockets) with
+three middleware stacks and reports the time each request spends in them:
+
+- ``bare``: no middleware, the baseline every overhead is measured from.
+- ``base_http``: auth, metrics and deprecation as ``BaseHTTPMiddleware`` /
+  ``@app.middleware("http")`` layers, as the app used to install them.
+- ``asgi``: the pure ASGI middlewares from ``api.middleware`` in the order
+  ``api.main`` installs them.
+
+Both stacks do the same work (auth in dev mode, Prometheus observations,
+Server-Timing), so the difference is the ``call_next`` plumbing. Each case
+is a JSON endpoint and a small streaming response.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.middleware --output results/middleware.json
+    python -m scripts.benchmarks.middleware --output new.json \
+        --compare results/middleware.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import Message
+
+from scripts.benchmarks.harness import (
+    StageSample,
+    build_results,
+    compare_results,
+    measure,
+    print_comparison,
+    summarize,
+    write_results,
+)
+
+BENCHMARK_NAME = "middleware"
+STACKS = ("bare", "base_http", "asgi")
+CASES = {"json": "/api/v1/ping", "stream": "/api/v1/stream"}
+STREAM_CHUNKS = 20
+
+
+def _legacy_middleware(app: FastAPI) -> None:
+    """Install the BaseHTTPMiddleware equivalents of api.middleware."""
+    from api.config import settings
+    from api.middleware.auth import _authenticate
+    from api.middleware.deprecation import _deprecated_prefix
+    from api.middleware.metrics import _observe
+    from api.request_stats import server_timing_header, track_request
+
+    class LegacyDeprecation(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            match = _deprecated_prefix(request.url.path)
+            response = await call_next(request)
+            if match:
+                response.headers["X-API-Deprecated"] = "true"
+                response.headers["X-API-Deprecated-Path"] = match[0]
+                response.headers["X-API-New-Path"] = match[1]
+                response.headers["X-API-Sunset-Date"] = "2026-06-01"
+            return response
+
+    class LegacyMetrics(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            with track_request() as stats:
+                start_time = time.time()
+                response = await call_next(request)
+                duration = time.time() - start_time
+            _observe(request.scope, response.status_code, duration, stats)
+            if settings.app_env not in {"prod", "production"}:
+                response.headers["Server-Timing"] = server_timing_header(
+                    stats, duration
+                )
+            return response
+
+    app.add_middleware(LegacyDeprecation)
+    app.add_middleware(LegacyMetrics)
+
+    @app.middleware("http")
+    async def legacy_auth(request: Request, call_next):
+        error = await _authenticate(request.scope)
+        if error is not None:
+            return error
+        return await call_next(request)
+
+
+def build_app(stack: str) -> FastAPI:
+    """Build the benchmark app with one middleware stack.
+
+    Args:
+        stack: One of STACKS.
+
+    Returns:
+        FastAPI app serving the CASES endpoints.
+    """
+    import api.db  # noqa: F401  (api.auth must not be the first api.db importer)
+    from api.middleware.auth import AuthMiddleware
+    from api.middleware.deprecation import DeprecationMiddleware
+    from api.middleware.metrics import MetricsMiddleware
+
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/api/v1/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for index in range(STREAM_CHUNKS):
+                yield f"data: {index}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    if stack == "base_http":
+        _legacy_middleware(app)
+    elif stack == "asgi":
+        app.add_middleware(DeprecationMiddleware)
+        app.add_middleware(MetricsMiddleware)
+        app.add_middleware(AuthMiddleware)
+    elif stack != "bare":
+        raise ValueError(f"Unknown stack: {stack}")
+    return app
+
+
+@contextmanager
+def _dev_auth() -> Iterator[None]:
+    # Auth runs in dev mode so no JWT validation skews the comparison.
+    from api.config import settings
+
+    saved = settings.auth_dev_mode, settings.app_env
+    settings.auth_dev_mode, settings.app_env = True, "local"
+    try:
+        yield
+    finally:
+        settings.auth_dev_mode, settings.app_env = saved
+
+
+async def _request(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    status = 0
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def _drive(app: FastAPI, path: str, requests: int) -> None:
+    for _ in range(requests):
+        status = await _request(app, path)
+        if status != 200:
+            raise RuntimeError(f"{path} returned {status}")
+
+
+def run_stage(
+    loop: asyncio.AbstractEventLoop,
+    app: FastAPI,
+    path: str,
+    *,
+    requests: int,
+    repeat: int,
+    warmup: int,
+) -> dict[str, Any]:
+    """Time one stack on one endpoint.
+
+    Args:
+        loop: Event loop to drive the app on.
+        app: App from build_app.
+        path: Endpoint path.
+        requests: Requests per timed sample.
+        repeat: Timed samples.
+        warmup: Untimed requests before the first sample.
+
+    Returns:
+        ``harness.summarize`` of per-request wall and CPU time.
+    """
+    loop.run_until_complete(_drive(app, path, warmup))
+    samples = []
+    for _ in range(repeat):
+        _, sample = measure(
+            lambda: loop.run_until_complete(_drive(app, path, requests))
+        )
+        samples.append(
+            StageSample(
+                wall_ms=sample.wall_ms / requests,
+                cpu_ms=sample.cpu_ms / requests,
+                peak_rss_mb=sample.peak_rss_mb,
+                rss_growth_mb=sample.rss_growth_mb,
+            )
+        )
+    return summarize(samples)
+
+
+def run_benchmark(
+    *, requests: int = 2000, repeat: int = 5, warmup: int = 200
+) -> dict[str, Any]:
+    """Measure every stack on every case.
+
+    Args:
+        requests: Requests per timed sample.
+        repeat: Timed samples per stack and case.
+        warmup: Untimed requests per stack and case.
+
+    Returns:
+        Results document (see ``harness.build_results``). Each case also
+        reports ``overhead_us``: median per-request time above ``bare``.
+    """
+    results: dict[str, Any] = {}
+    apps = {stack: build_app(stack) for stack in STACKS}
+    loop = asyncio.new_event_loop()
+    try:
+        with _dev_auth():
+            for case, path in CASES.items():
+                stages = {
+                    stack: run_stage(
+                        loop,
+                        app,
+                        path,
+                        requests=requests,
+                        repeat=repeat,
+                        warmup=warmup,
+                    )
+                    for stack, app in apps.items()
+                }
+                bare = stages["bare"]["wall_ms"]["median"]
+                results[case] = {
+                    "path": path,
+                    "stages": stages,
+                    "overhead_us": {
+                        stack: round((stage["wall_ms"]["median"] - bare) * 1000, 1)
+                        for stack, stage in stages.items()
+                        if stack != "bare"
+                    },
+                }
+                print(_format_case(case, results[case]), flush=True)
+    finally:
+        loop.close()
+    return build_results(
+        BENCHMARK_NAME, results, requests=requests, repeat=repeat, warmup=warmup
+    )
+
+
+def _format_case(name: str, case: dict[str, Any]) -> str:
+    bare = case["stages"]["bare"]["wall_ms"]["median"] * 1000
+    parts = [f"bare={bare:.0f}us"] + [
+        f"{stack}=+{overhead:.0f}us" for stack, overhead in case["overhead_us"].items()
+    ]
+    return f"{name:<8} {' '.join(parts)}"
+
+
+def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-request middleware overhead."
+    )
+    parser.add_argument(
+        "--output", required=True, help="Where to write the JSON results."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Requests per timed sample."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per stack.")
+    parser.add_argument(
+        "--warmup", type=int, default=200, help="Untimed requests per stack."
+    )
+    parser.add_argument("--compare", help="Baseline results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that fails --compare (default: 0.2).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmark(
+        requests=args.requests, repeat=args.repeat, warmup=args.warmup
+    )
+    write_results(Path(args.output), results)
+    if not args.compare:
+        return 0
+    baseline = json.loads(Path(args.compare).read_text())
+    # Per-request times are microseconds; the harness default noise floor is 5ms.
+    rows = compare_results(
+        baseline, results, threshold=args.threshold, min_delta_ms=0.005
+    )
+    print_comparison(rows)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""Benchmark ``parse_url_local`` against a recorded page corpus.
+
+Each snapshot in fixtures/web_save is replayed through a local HTTP proxy,
+so the parser runs unmodified with the original hostnames (site-specific
+extractors and rules still apply) and nothing reaches the network.
+Playwright rendering is replaced by the recorded DOM.
+
+Per parse, the harness times the fetch, metadata, rules, readability,
+cleanup, markdown and YouTube phases by wrapping the parser's
+collaborators, and counts HTML parses (BeautifulSoup and lxml). Outputs
+are compared with fixtures/web_save/expected so optimizations can be
+checked for behaviour changes.
+
+Usage (from backend/):
+    python -m scripts.benchmarks.web_save --output results/web_save.json
+    python -m scripts.benchmarks.web_save --output new.json \
+        --compare results/web_save.json
+    python -m scripts.benchmarks.web_save --update-expected
+    python -m scripts.benchmarks.web_save --record URL --name NAME \
+        --category news
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import functools
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from scripts.benchmarks.harness import (
+    build_results,
+    compare_results,
+    distribution,
+    print_comparison,
+    write_results,
+)
+from scripts.benchmarks.web_save_replay import (
+    CORPUS_DIR,
+    PageSnapshot,
+    build_routes,
+    load_manifest,
+    record_snapshot,
+    replay_proxy,
+)
+
+BENCHMARK_NAME = "web_save"
+EXPECTED_DIR_NAME = "expected"
+SAVED_AT_RE = re.compile(r"^saved_at: .*\n", re.MULTILINE)
+
+# Names looked up on api.services.web_save_parser at call time.
+PHASE_FUNCTIONS: dict[str, tuple[str, ...]] = {
+    "fetch": (
+        "fetch_html",
+        "fetch_substack_body_html",
+        "render_html_with_playwright",
+    ),
+    "metadata": ("extract_metadata", "resolve_favicon_url"),
+    "rules": ("extract_metadata_overrides",),
+    "readability": (
+        "extract_openai_body_html",
+        "extract_wired_body_html",
+        "extract_verge_body_html",
+    ),
+    "cleanup": (
+        "apply_include_reinsertion",
+        "filter_non_content_images",
+        "polish_article_html",
+        "normalize_image_sources",
+        "normalize_link_sources",
+        "normalize_image_captions",
+        "prepend_hero_image",
+        "simplify_linked_images",
+        "cleanup_verge_markdown",
+        "cleanup_gizmodo_markdown",
+        "cleanup_youtube_markdown",
+        "cleanup_openai_markdown",
+        "dedupe_markdown_images",
+        "wrap_gallery_blocks",
+    ),
+    "markdown": ("html_to_markdown",),
+    "youtube": (
+        "replace_youtube_iframes_with_placeholders",
+        "insert_youtube_placeholders",
+        "replace_youtube_placeholders",
+        "extract_youtube_anchors_from_jsonld",
+        "_merge_youtube_anchors",
+        "build_youtube_anchor_map",
+        "insert_youtube_after_anchors",
+        "extract_youtube_embed_urls_from_dom",
+        "extract_youtube_video_ids_from_html",
+    ),
+}
+RULE_ENGINE_METHODS = ("match_rules", "apply_rules", "apply_rules_tree")
+LXML_PARSERS = (
+    "fromstring",
+    "document_fromstring",
+    "fragment_fromstring",
+    "fragments_fromstring",
+)
+
+
+class PhaseTimer:
+    """Accumulates time per phase and HTML parse counts for one parse.
+
+    Only the outermost instrumented call is timed, so a phase calling
+    another instrumented function is not double counted.
+    """
+
+    def __init__(self) -> None:
+        """Start with empty totals."""
+        self.phase_ms: dict[str, float] = defaultdict(float)
+        self.phase_calls: Counter[str] = Counter()
+        self.parses: Counter[str] = Counter()
+        self._active_phase: str | None = None
+        self._parsing = False
+
+    def reset(self) -> None:
+        """Clear totals before the next parse."""
+        self.phase_ms.clear()
+        self.phase_calls.clear()
+        self.parses.clear()
+
+    def timed(self, phase: str, fn: Callable) -> Callable:
+        """Wrap a callable so its time is charged to ``phase``."""
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if self._active_phase is not None:
+                return fn(*args, **kwargs)
+            self._active_phase = phase
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.phase_ms[phase] += (time.perf_counter() - started) * 1000
+                self.phase_calls[phase] += 1
+                self._active_phase = None
+
+        return wrapper
+
+    def counted(self, parser: str, fn: Callable) -> Callable:
+        """Wrap an HTML parser entry point to count top-level parses."""
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if self._parsing:
+                return fn(*args, **kwargs)
+            self._parsing = True
+            try:
+                self.parses[parser] += 1
+                return fn(*args, **kwargs)
+            finally:
+                self._parsing = False
+
+        return wrapper
+
+
+def _replayed_render(url: str, **_: Any) -> tuple[str, str]:
+    import requests
+
+    from api.services.web_save_constants import USER_AGENT
+
+    response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
+    if not response.ok:
+        raise RuntimeError(f"No recorded render for {url}")
+    return response.text, str(response.url)
+
+
+@contextmanager
+def instrument_parser(timer: PhaseTimer) -> Iterator[None]:
+    """Patch the parser's collaborators with timing and counting wrappers.
+
+    Args:
+        timer: Receives the measurements.
+
+    Yields:
+        None; originals are restored on exit.
+    """
+    import bs4
+    import lxml.html
+    from readability import Document
+
+    from api.services import web_save_parser
+    from api.services.web_save_rules import RuleEngine
+
+    patches: list[tuple[object, str, Callable]] = []
+    for phase, names in PHASE_FUNCTIONS.items():
+        for name in names:
+            original = getattr(web_save_parser, name)
+            if name == "render_html_with_playwright":
+                original = _replayed_render
+            patches.append((web_save_parser, name, timer.timed(phase, original)))
+    for name in RULE_ENGINE_METHODS:
+        patches.append(
+            (RuleEngine, name, timer.timed("rules", getattr(RuleEngine, name)))
+        )
+    patches.append((Document, "summary", timer.timed("readability", Document.summary)))
+    patches.append(
+        (
+            bs4.BeautifulSoup,
+            "__init__",
+            timer.counted("beautifulsoup", bs4.BeautifulSoup.__init__),
+        )
+    )
+    for name in LXML_PARSERS:
+        patches.append(
+            (lxml.html, name, timer.counted("lxml", getattr(lxml.html, name)))
+        )
+
+    originals = [(target, name, getattr(target, name)) for target, name, _ in patches]
+    try:
+        for target, name, replacement in patches:
+            setattr(target, name, replacement)
+        yield
+    finally:
+        for target, name, original in originals:
+            setattr(target, name, original)
+
+
+def normalize_output(content: str) -> str:
+    """Drop the per-run ``saved_at`` timestamp from parsed content."""
+    return SAVED_AT_RE.sub("", content)
+
+
+def _parse_once(snapshot: PageSnapshot, timer: PhaseTimer) -> tuple[str, float]:
+    from api.services.web_save_parser import parse_url_local
+
+    timer.reset()
+    started = time.perf_counter()
+    try:
+        page = parse_url_local(snapshot.replay_url)
+        output = f"# title: {page.title}\n{normalize_output(page.content)}"
+    except Exception as exc:
+        output = f"# error: {type(exc).__name__}: {exc}\n"
+    return output, (time.perf_counter() - started) * 1000
+
+
+def run_snapshot(
+    snapshot: PageSnapshot, timer: PhaseTimer, *, repeat: int, warmup: int
+) -> tuple[dict[str, Any], str]:
+    """Parse one snapshot repeatedly and summarize the phases.
+
+    Args:
+        snapshot: Corpus entry.
+        timer: Instrumentation installed by instrument_parser.
+        repeat: Measured parses.
+        warmup: Unmeasured parses first (rule loading, caches).
+
+    Returns:
+        Case results and the normalized output of the last parse.
+    """
+    for _ in range(warmup):
+        _parse_once(snapshot, timer)
+
+    totals: list[float] = []
+    phase_samples: dict[str, list[float]] = defaultdict(list)
+    outputs: set[str] = set()
+    output = ""
+    for _ in range(repeat):
+        output, total_ms = _parse_once(snapshot, timer)
+        outputs.add(output)
+        totals.append(total_ms)
+        for phase in PHASE_FUNCTIONS:
+            phase_samples[phase].append(timer.phase_ms.get(phase, 0.0))
+        phase_samples["other"].append(total_ms - sum(timer.phase_ms.values()))
+
+    stages: dict[str, Any] = {"total": {"wall_ms": distribution(totals)}}
+    for phase, samples in phase_samples.items():
+        stages[phase] = {
+            "wall_ms": distribution(samples),
+            "calls": timer.phase_calls.get(phase, 0),
+        }
+    case = {
+        "category": snapshot.category,
+        "url": snapshot.url,
+        "stages": stages,
+        "parse_counts": dict(sorted(timer.parses.items())),
+        "output_sha256": hashlib.sha256(output.encode("utf-8")).hexdigest(),
+        "deterministic": len(outputs) == 1,
+    }
+    return case, output
+
+
+def _aggregate_phases(cases: dict[str, Any]) -> dict[str, Any]:
+    medians: dict[str, list[float]] = defaultdict(list)
+    for case in cases.values():
+        for stage, result in case["stages"].items():
+            medians[stage].append(result["wall_ms"]["median"])
+    return {stage: distribution(values) for stage, values in medians.items()}
+
+
+def check_expected(
+    name: str, output: str, expected_dir: Path, *, update: bool
+) -> str | None:
+    """Compare an output with its golden file.
+
+    Args:
+        name: Case name.
+        output: Normalized parse output.
+        expected_dir: Directory of golden outputs.
+        update: Rewrite the golden file instead of comparing.
+
+    Returns:
+        A unified diff when the output changed, otherwise None.
+    """
+    path = expected_dir / f"{name}.md"
+    if update or not path.exists():
+        expected_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(output)
+        return None
+    expected = path.read_text()
+    if expected == output:
+        return None
+    return "".join(
+        difflib.unified_diff(
+            expected.splitlines(keepends=True),
+            output.splitlines(keepends=True),
+            fromfile=f"expected/{name}.md",
+            tofile=f"actual/{name}.md",
+        )
+    )
+
+
+def run_benchmark(
+    corpus_dir: Path = CORPUS_DIR,
+    *,
+    repeat: int = 5,
+    warmup: int = 1,
+    cases: list[str] | None = None,
+    update_expected: bool = False,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Replay the corpus through parse_url_local.
+
+    Args:
+        corpus_dir: Corpus directory.
+        repeat: Measured parses per snapshot.
+        warmup: Unmeasured parses per snapshot.
+        cases: Subset of case names (all when omitted).
+        update_expected: Rewrite golden outputs.
+
+    Returns:
+        The results document and unified diffs for changed outputs.
+    """
+    snapshots = [
+        snapshot
+        for snapshot in load_manifest(corpus_dir)
+        if not cases or snapshot.name in cases
+    ]
+    timer = PhaseTimer()
+    results: dict[str, Any] = {}
+    diffs: dict[str, str] = {}
+    with replay_proxy(build_routes(snapshots, corpus_dir)) as server:
+        with instrument_parser(timer):
+            for snapshot in snapshots:
+                before = len(server.requests)
+                case, output = run_snapshot(
+                    snapshot, timer, repeat=repeat, warmup=warmup
+                )
+                case["requests_per_parse"] = (len(server.requests) - before) // (
+                    repeat + warmup
+                )
+                diff = check_expected(
+                    snapshot.name,
+                    output,
+                    corpus_dir / EXPECTED_DIR_NAME,
+                    update=update_expected,
+                )
+                case["matches_expected"] = diff is None
+                if diff:
+                    diffs[snapshot.name] = diff
+                results[snapshot.name] = case
+                print(_format_case(snapshot.name, case), flush=True)
+
+    document = build_results(BENCHMARK_NAME, results, repeat=repeat, warmup=warmup)
+    document["phases"] = _aggregate_phases(results)
+    return document, diffs
+
+
+def _format_case(name: str, case: dict[str, Any]) -> str:
+    stages = case["stages"]
+    parts = [
+        f"{stage}={result['wall_ms']['median']:.1f}ms"
+        for stage, result in stages.items()
+    ]
+    parses = " ".join(f"{key}={value}" for key, value in case["parse_counts"].items())
+    flag = "" if case["matches_expected"] and case["deterministic"] else "  CHANGED"
+    return f"{name:<20} {' '.join(parts)} parses[{parses}]{flag}"
+
+
+def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark web-save parsing.")
+    parser.add_argument("--output", help="Where to write the JSON results.")
+    parser.add_argument("--repeat", type=int, default=5, help="Parses per page.")
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Unmeasured parses per page."
+    )
+    parser.add_argument(
+        "--case", action="append", help="Only run this case (repeatable)."
+    )
+    parser.add_argument(
+        "--corpus-dir", default=str(CORPUS_DIR), help="Snapshot corpus directory."
+    )
+    parser.add_argument(
+        "--update-expected",
+        action="store_true",
+        help="Rewrite golden outputs after an intended behaviour change.",
+    )
+    parser.add_argument("--compare", help="Baseline results JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that fails --compare (default: 0.2).",
+    )
+    parser.add_argument("--record", metavar="URL", help="Record a live page.")
+    parser.add_argument("--name", help="Case name for --record.")
+    parser.add_argument("--category", default="news", help="Category for --record.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    args = parse_args(argv)
+    corpus_dir = Path(args.corpus_dir)
+    if args.record:
+        if not args.name:
+            print("--record requires --name", file=sys.stderr)
+            return 2
+        entry = record_snapshot(args.record, args.name, args.category, corpus_dir)
+        print(f"Recorded {entry.name} -> {entry.snapshot}")
+        return 0
+
+    results, diffs = run_benchmark(
+        corpus_dir,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        cases=args.case,
+        update_expected=args.update_expected,
+    )
+    if args.output:
+        write_results(Path(args.output), results)
+    for diff in diffs.values():
+        print(diff)
+    failed = bool(diffs) or not all(
+        case["deterministic"] for case in results["cases"].values()
+    )
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        rows = compare_results(baseline, results, threshold=args.threshold)
+        print_comparison(rows)
+        failed = failed or any(row["regression"] for row in rows)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
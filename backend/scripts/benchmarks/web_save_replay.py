@@ -0,0 +1,240 @@
+"""Recorded page snapshots and a local HTTP stand-in that replays them."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import yaml
+
+CORPUS_DIR = Path(__file__).resolve().parent / "fixtures" / "web_save"
+MANIFEST_NAME = "manifest.yaml"
+_PROXY_ENV = ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy")
+_NO_PROXY_ENV = ("NO_PROXY", "no_proxy")
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    """One recorded page and the extra responses its parse requests."""
+
+    name: str
+    category: str
+    url: str
+    snapshot: str
+    extra: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def replay_url(self) -> str:
+        """URL to parse during replay (plain HTTP so the proxy can serve it)."""
+        parts = urlsplit(self.url)
+        return parts._replace(scheme="http").geturl()
+
+
+def load_manifest(corpus_dir: Path = CORPUS_DIR) -> list[PageSnapshot]:
+    """Load the corpus manifest.
+
+    Args:
+        corpus_dir: Corpus directory containing manifest.yaml.
+
+    Returns:
+        Snapshots in manifest order.
+    """
+    payload = yaml.safe_load((corpus_dir / MANIFEST_NAME).read_text()) or []
+    return [PageSnapshot(**entry) for entry in payload]
+
+
+def _route_key(url: str) -> str:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return f"{parts.netloc.lower()}{path}"
+
+
+def build_routes(
+    snapshots: list[PageSnapshot], corpus_dir: Path = CORPUS_DIR
+) -> dict[str, Path]:
+    """Map host+path to snapshot files for every page and extra response.
+
+    Args:
+        snapshots: Corpus entries.
+        corpus_dir: Corpus directory.
+
+    Returns:
+        Route table for ReplayServer.
+    """
+    routes: dict[str, Path] = {}
+    for snapshot in snapshots:
+        routes[_route_key(snapshot.url)] = corpus_dir / snapshot.snapshot
+        host = urlsplit(snapshot.url).netloc
+        for path, filename in snapshot.extra.items():
+            routes[_route_key(f"http://{host}{path}")] = corpus_dir / filename
+    return routes
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+
+    def _respond(self, include_body: bool) -> None:
+        # Proxied requests carry the absolute URL in the request line.
+        target = self.path if "://" in self.path else f"http://{self.headers['Host']}"
+        path = self.server.routes.get(_route_key(target))
+        self.server.record_request(target)
+        if path is None:
+            self.send_error(404, "Not recorded")
+            return
+        body = path.read_bytes()
+        content_type = (
+            "application/json" if path.suffix == ".json" else "text/html; charset=utf-8"
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond(include_body=True)
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._respond(include_body=False)
+
+    def do_CONNECT(self) -> None:  # noqa: N802
+        # HTTPS would leave the replay; refuse so nothing reaches the network.
+        self.server.record_request(f"https://{self.path}")
+        self.send_error(403, "HTTPS is not replayed")
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """Forward proxy that serves recorded responses and nothing else."""
+
+    daemon_threads = True
+
+    def __init__(self, routes: dict[str, Path]) -> None:
+        """Bind to an ephemeral localhost port.
+
+        Args:
+            routes: Route table from build_routes.
+        """
+        super().__init__(("127.0.0.1", 0), _ReplayHandler)
+        self.routes = routes
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def proxy_url(self) -> str:
+        """Proxy URL for HTTP(S)_PROXY."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record_request(self, url: str) -> None:
+        """Remember a requested URL (for request counts)."""
+        with self._lock:
+            self.requests.append(url)
+
+
+@contextmanager
+def replay_proxy(routes: dict[str, Path]) -> Iterator[ReplayServer]:
+    """Run a ReplayServer and route ``requests`` traffic through it.
+
+    Args:
+        routes: Route table from build_routes.
+
+    Yields:
+        The running server.
+    """
+    server = ReplayServer(routes)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    saved = {name: os.environ.get(name) for name in _PROXY_ENV + _NO_PROXY_ENV}
+    try:
+        for name in _PROXY_ENV:
+            os.environ[name] = server.proxy_url
+        for name in _NO_PROXY_ENV:
+            os.environ.pop(name, None)
+        yield server
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        server.shutdown()
+        server.server_close()
+
+
+def record_snapshot(
+    url: str,
+    name: str,
+    category: str,
+    corpus_dir: Path = CORPUS_DIR,
+) -> PageSnapshot:
+    """Fetch a live page into the corpus and add it to the manifest.
+
+    Substack posts also record the post API response the parser requests.
+
+    Args:
+        url: Page URL.
+        name: Case name (file stem).
+        category: Corpus category (news, substack, ...).
+        corpus_dir: Corpus directory.
+
+    Returns:
+        The new manifest entry.
+    """
+    import requests
+
+    from api.services.web_save_constants import USER_AGENT
+    from api.services.web_save_parser import ensure_url
+
+    url = ensure_url(url)
+    headers = {"User-Agent": USER_AGENT}
+    response = requests.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    snapshot_dir = corpus_dir / "snapshots"
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    (snapshot_dir / f"{name}.html").write_text(response.text)
+
+    extra: dict[str, str] = {}
+    final_url = str(response.url)
+    parts = urlsplit(final_url)
+    if "substack" in response.text.lower() and "/p/" in parts.path:
+        slug = parts.path.split("/p/")[-1].strip("/")
+        api_path = f"/api/v1/posts/{slug}"
+        api_response = requests.get(
+            f"{parts.scheme}://{parts.netloc}{api_path}", headers=headers, timeout=30
+        )
+        if api_response.ok:
+            (snapshot_dir / f"{name}.api.json").write_text(
+                json.dumps(api_response.json(), indent=2)
+            )
+            extra[api_path] = f"snapshots/{name}.api.json"
+
+    entry = PageSnapshot(
+        name=name,
+        category=category,
+        url=final_url,
+        snapshot=f"snapshots/{name}.html",
+        extra=extra,
+    )
+    manifest_path = corpus_dir / MANIFEST_NAME
+    existing = (
+        yaml.safe_load(manifest_path.read_text()) if manifest_path.exists() else []
+    )
+    existing = [item for item in existing or [] if item["name"] != name]
+    existing.append(
+        {key: value for key, value in asdict(entry).items() if value or key != "extra"}
+    )
+    manifest_path.write_text(yaml.safe_dump(existing, sort_keys=False))
+    return entry
@@ -6,6 +6,7 @@ Usage:
     uv run backend/scripts/seed_test_user_data.py --user-id <uuid> --dry-run
     uv run backend/scripts/seed_test_user_data.py --user-id <uuid> --delete
     uv run backend/scripts/seed_test_user_data.py --user-id <uuid> --delete --dry-run
+    uv run backend/scripts/seed_test_user_data.py --user-id <uuid> --scale 2000
 """
 
 from __future__ import annotations
@@ -33,15 +34,22 @@ logger = logging.getLogger(__name__)
 
 
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(
-        description="Seed or delete test data for a user."
-    )
+    parser = argparse.ArgumentParser(description="Seed or delete test data for a user.")
     parser.add_argument("--user-id", required=True, help="User UUID to target.")
     parser.add_argument(
         "--seed-tag",
         default="seed:test-data",
         help="Marker used to tag seed data.",
     )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=0,
+        help=(
+            "Generate this many extra notes, websites, tasks and files "
+            "(for load testing)."
+        ),
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -75,7 +83,7 @@ def validate_user_id(value: str) -> str:
 def log_summary(prefix: str, summary: object) -> None:
     logger.info(
         "%s notes=%s websites=%s conversations=%s memories=%s tasks=%s projects=%s "
-        "groups=%s settings=%s scratchpad=%s",
+        "groups=%s settings=%s scratchpad=%s files=%s",
         prefix,
         getattr(summary, "notes"),
         getattr(summary, "websites"),
@@ -86,6 +94,7 @@ def log_summary(prefix: str, summary: object) -> None:
         getattr(summary, "task_groups"),
         getattr(summary, "settings"),
         getattr(summary, "scratchpad"),
+        getattr(summary, "files"),
     )
 
 
@@ -99,7 +108,11 @@ def main(argv: Iterable[str] | None = None) -> int:
         logger.error(str(exc))
         return 2
 
-    plan = build_seed_plan(args.seed_tag)
+    if args.scale < 0:
+        logger.error("scale must be zero or positive.")
+        return 2
+
+    plan = build_seed_plan(args.seed_tag, scale=args.scale)
 
     if args.dry_run and not args.delete:
         summary = SimpleNamespace(
@@ -112,6 +125,7 @@ def main(argv: Iterable[str] | None = None) -> int:
             tasks=len(plan.tasks),
             settings=1,
             scratchpad=1,
+            files=len(plan.files),
         )
         log_summary("Dry-run seed plan:", summary)
         return 0
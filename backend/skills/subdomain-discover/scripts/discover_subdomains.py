@@ -13,11 +13,15 @@ import argparse
 import asyncio
 import json
 import re
+import secrets
 import sys
 import time
+from collections.abc import Awaitable, Callable
 from urllib.parse import urlparse
 
 import aiohttp
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
 from lxml import etree
 
@@ -29,6 +33,28 @@ def normalize_domain(domain: str) -> str:
     return domain
 
 
+class RateLimiter:
+    """Async limiter that spaces calls to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Sleep until the next call slot is available."""
+        if not self.interval:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
 class SubdomainScanner:
     """Handles subdomain discovery using multiple techniques."""
 
@@ -38,11 +64,20 @@ class SubdomainScanner:
         timeout: float = 10.0,
         dns_timeout: float = 5.0,
         verbose: bool = False,
+        dns_concurrency: int = 50,
+        dns_rate: float = 200.0,
+        nameservers: list[str] | None = None,
+        dns_port: int = 53,
     ):
         self.domain = domain
         self.timeout = timeout
         self.dns_timeout = dns_timeout
         self.verbose = verbose
+        self.dns_concurrency = max(1, dns_concurrency)
+        self.dns_rate = dns_rate
+        self.nameservers = nameservers
+        self.dns_port = dns_port
+        self.wildcard_ips: set[str] = set()
         self.discovered_subdomains: set[str] = set()
 
     def log(self, message: str):
@@ -50,30 +85,88 @@ class SubdomainScanner:
         if self.verbose:
             print(message, file=sys.stderr)
 
-    async def scan_dns_bruteforce(self, wordlist: list[str]) -> set[str]:
-        """Bruteforce subdomain discovery using common subdomain names."""
-        subdomains = set()
-        resolver = dns.resolver.Resolver()
+    def _build_resolver(self) -> dns.asyncresolver.Resolver:
+        """Create an async resolver honouring timeout and nameserver options."""
+        if self.nameservers:
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = list(self.nameservers)
+        else:
+            resolver = dns.asyncresolver.Resolver()
+        resolver.port = self.dns_port
         resolver.timeout = self.dns_timeout
         resolver.lifetime = self.dns_timeout
+        return resolver
+
+    async def _resolve_a(
+        self, resolver: dns.asyncresolver.Resolver, name: str
+    ) -> set[str] | None:
+        """Resolve A records for a name, returning None when it does not resolve."""
+        try:
+            answer = await resolver.resolve(name, "A")
+        except dns.exception.DNSException:
+            # NXDOMAIN, NoAnswer, NoNameservers and Timeout all land here
+            return None
+        return {rdata.to_text() for rdata in answer}
+
+    async def detect_wildcard_dns(
+        self,
+        resolve: Callable[[str], Awaitable[set[str] | None]],
+        probes: int = 2,
+    ) -> set[str]:
+        """Detect wildcard DNS by resolving random labels under the domain.
+
+        Returns:
+            Addresses served for non-existent names (empty when no wildcard).
+        """
+        wildcard_ips: set[str] = set()
+        labels = [f"wc-{secrets.token_hex(8)}" for _ in range(probes)]
+        results = await asyncio.gather(
+            *(resolve(f"{label}.{self.domain}") for label in labels)
+        )
+        for ips in results:
+            if ips:
+                wildcard_ips.update(ips)
+        if wildcard_ips:
+            self.log(f"Wildcard DNS detected: {', '.join(sorted(wildcard_ips))}")
+        return wildcard_ips
+
+    async def scan_dns_bruteforce(self, wordlist: list[str]) -> set[str]:
+        """Bruteforce subdomain discovery using common subdomain names.
+
+        Lookups run concurrently, bounded by `dns_concurrency` in-flight queries
+        and spaced to at most `dns_rate` queries per second. Names whose answers
+        only contain wildcard addresses are discarded.
+        """
+        subdomains = set()
+        resolver = self._build_resolver()
+        semaphore = asyncio.Semaphore(self.dns_concurrency)
+        limiter = RateLimiter(self.dns_rate)
+
+        async def resolve(name: str) -> set[str] | None:
+            async with semaphore:
+                await limiter.wait()
+                return await self._resolve_a(resolver, name)
 
-        self.log(f"DNS bruteforce: testing {len(wordlist)} subdomain names...")
+        self.wildcard_ips = await self.detect_wildcard_dns(resolve)
+
+        self.log(
+            f"DNS bruteforce: testing {len(wordlist)} subdomain names "
+            f"({self.dns_concurrency} concurrent)..."
+        )
 
-        for word in wordlist:
+        async def check(word: str) -> str | None:
             subdomain = f"{word}.{self.domain}"
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, resolver.resolve, subdomain, "A"
-                )
-                subdomains.add(subdomain)
-                self.log(f"  Found: {subdomain}")
-            except (
-                dns.resolver.NXDOMAIN,
-                dns.resolver.NoAnswer,
-                dns.resolver.Timeout,
-                Exception,
-            ):
-                continue
+            ips = await resolve(subdomain)
+            if not ips:
+                return None
+            if self.wildcard_ips and ips <= self.wildcard_ips:
+                return None
+            self.log(f"  Found: {subdomain}")
+            return subdomain
+
+        words = list(dict.fromkeys(word.strip().lower() for word in wordlist))
+        results = await asyncio.gather(*(check(word) for word in words if word))
+        subdomains.update(result for result in results if result)
 
         return subdomains
 
@@ -956,6 +1049,30 @@ Examples:
         default=5.0,
         help="DNS resolution timeout in seconds (default: 5.0)",
     )
+    parser.add_argument(
+        "--dns-concurrency",
+        type=int,
+        default=50,
+        help="Maximum in-flight DNS queries during bruteforce (default: 50)",
+    )
+    parser.add_argument(
+        "--dns-rate",
+        type=float,
+        default=200.0,
+        help="Maximum DNS queries per second, 0 for unlimited (default: 200)",
+    )
+    parser.add_argument(
+        "--nameserver",
+        action="append",
+        dest="nameservers",
+        help="DNS server IP to query (repeatable, default: system resolvers)",
+    )
+    parser.add_argument(
+        "--dns-port",
+        type=int,
+        default=53,
+        help="DNS server port (default: 53)",
+    )
     parser.add_argument(
         "--json", action="store_true", help="Output results in JSON format"
     )
@@ -1010,6 +1127,10 @@ Examples:
             timeout=args.timeout,
             dns_timeout=args.dns_timeout,
             verbose=args.verbose,
+            dns_concurrency=args.dns_concurrency,
+            dns_rate=args.dns_rate,
+            nameservers=args.nameservers,
+            dns_port=args.dns_port,
         )
         subdomains = await scanner.discover_subdomains(
             wordlist, apply_filters=not args.no_filter
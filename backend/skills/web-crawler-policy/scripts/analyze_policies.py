@@ -10,12 +10,15 @@ import argparse
 import asyncio
 import builtins
 import csv
+import hashlib
 import json
 import os
 import re
 import sys
 import tempfile
+import time
 from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -67,6 +70,22 @@ except ImportError:
 # Default output directory (R2)
 DEFAULT_OUTPUT_DIR = "Reports"
 
+# Fetch pipeline defaults
+DEFAULT_MAX_CONCURRENCY = 20
+DEFAULT_PER_HOST_LIMIT = 2
+DEFAULT_CACHE_TTL = 3600.0
+
+
+def default_cache_dir() -> Path:
+    """Resolve the on-disk policy cache location."""
+    override = os.getenv("CRAWLER_POLICY_CACHE_DIR")
+    if override:
+        return Path(override)
+    workspace = os.getenv("WORKSPACE_BASE")
+    if workspace:
+        return Path(workspace) / ".cache" / "crawler-policy"
+    return Path(tempfile.gettempdir()) / "sidebar-crawler-policy-cache"
+
 
 def _slugify(value: str) -> str:
     cleaned = re.sub(r"[^a-zA-Z0-9]+", "_", value.strip())
@@ -115,6 +134,91 @@ def normalize_domain(domain: str) -> str:
     return cleaned
 
 
+class PolicyFetchCache:
+    """On-disk HTTP cache for policy files with conditional GET support.
+
+    Each URL is stored as a JSON entry holding the last status, body and the
+    ETag/Last-Modified validators. Entries younger than `ttl` seconds are
+    reused without touching the network; older entries are revalidated with
+    If-None-Match/If-Modified-Since so unchanged files cost a 304 round-trip.
+    Missing files (404 etc.) are cached too so dead hosts are not re-probed.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_CACHE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _entry_path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return the cached entry for a URL, if any."""
+        path = self._entry_path(url)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("url") != url:
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Return True when an entry can be reused without revalidation."""
+        return time.time() - float(entry.get("fetched_at", 0)) < self.ttl
+
+    def conditional_headers(self, entry: dict[str, Any] | None) -> dict[str, str]:
+        """Build conditional request headers from a cached entry."""
+        headers: dict[str, str] = {}
+        if not entry or entry.get("status") != 200:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        status: int,
+        content: str | None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> dict[str, Any]:
+        """Write an entry to disk and return it."""
+        entry = {
+            "url": url,
+            "status": status,
+            "content": content,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        path = self._entry_path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError:
+            pass
+        return entry
+
+    def touch(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Refresh an entry's timestamp after a 304 revalidation."""
+        return self.store(
+            entry["url"],
+            entry["status"],
+            entry.get("content"),
+            entry.get("etag"),
+            entry.get("last_modified"),
+        )
+
+
 class RobotsAnalyzer:
     """Analyzes robots.txt and llms.txt files and extracts crawler permissions."""
 
@@ -125,51 +229,93 @@ class RobotsAnalyzer:
         output_dir: Path = DEFAULT_OUTPUT_DIR,
         main_domain: str = "",
         check_llms: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        cache: PolicyFetchCache | None = None,
     ):
         self.timeout = timeout
         self.save_robots = save_robots
         self.check_llms = check_llms
         self.output_dir = output_dir
         self.main_domain = main_domain
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.cache = cache
         self.robots_data: dict[str, dict] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def _fetch_url(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> tuple[int, str | None]:
+        """Fetch a URL through the cache and concurrency limit.
+
+        Returns:
+            Tuple of (status, content). Content is None unless status is 200.
+
+        Raises:
+            aiohttp.ClientError: On connection failures (never cached).
+            TimeoutError: When the request times out.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if self.cache and entry and self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return entry["status"], entry.get("content")
+
+        headers = self.cache.conditional_headers(entry) if self.cache else {}
+        semaphore = self._semaphore or asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            async with session.get(
+                url, timeout=self.timeout, headers=headers
+            ) as response:
+                if response.status == 304 and entry:
+                    self.cache.touch(entry)
+                    self.cache.revalidated += 1
+                    return entry["status"], entry.get("content")
+                content = await response.text() if response.status == 200 else None
+                if self.cache:
+                    self.cache.misses += 1
+                    self.cache.store(
+                        url,
+                        response.status,
+                        content,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+                return response.status, content
 
-    async def fetch_robots_txt(
-        self, session: aiohttp.ClientSession, domain: str
+    async def _fetch_policy_file(
+        self,
+        session: aiohttp.ClientSession,
+        domain: str,
+        filename: str,
+        validate: Callable[[str], bool] | None = None,
     ) -> str | None:
-        """Fetch robots.txt content for a domain."""
-        protocols = ["https", "http"]
-
-        for protocol in protocols:
-            robots_url = f"{protocol}://{domain}/robots.txt"
+        """Fetch a policy file over https, falling back to http."""
+        for protocol in ("https", "http"):
+            url = f"{protocol}://{domain}/{filename}"
             try:
-                async with session.get(robots_url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        return content
+                status, content = await self._fetch_url(session, url)
             except (TimeoutError, aiohttp.ClientError, Exception):
                 continue
-
+            if status == 200 and content is not None:
+                if validate is None or validate(content):
+                    return content
         return None
 
+    async def fetch_robots_txt(
+        self, session: aiohttp.ClientSession, domain: str
+    ) -> str | None:
+        """Fetch robots.txt content for a domain."""
+        return await self._fetch_policy_file(session, domain, "robots.txt")
+
     async def fetch_llms_txt(
         self, session: aiohttp.ClientSession, domain: str
     ) -> str | None:
         """Fetch llms.txt content for a domain."""
-        protocols = ["https", "http"]
-
-        for protocol in protocols:
-            llms_url = f"{protocol}://{domain}/llms.txt"
-            try:
-                async with session.get(llms_url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        # Validate that this looks like a real llms.txt file, not HTML
-                        if self._is_valid_llms_txt(content):
-                            return content
-            except (TimeoutError, aiohttp.ClientError, Exception):
-                continue
-
-        return None
+        # Validate that this looks like a real llms.txt file, not HTML
+        return await self._fetch_policy_file(
+            session, domain, "llms.txt", validate=self._is_valid_llms_txt
+        )
 
     def _is_valid_llms_txt(self, content: str) -> bool:
         """Check if content looks like a valid llms.txt file, not HTML or other formats."""
@@ -357,13 +503,15 @@ class RobotsAnalyzer:
         self, session: aiohttp.ClientSession, domain: str
     ) -> dict:
         """Analyze robots.txt and llms.txt for a single domain."""
-        # Fetch robots.txt
-        robots_content = await self.fetch_robots_txt(session, domain)
-
-        # Fetch llms.txt if enabled
+        # Fetch robots.txt and (if enabled) llms.txt concurrently
         llms_content = None
         if self.check_llms:
-            llms_content = await self.fetch_llms_txt(session, domain)
+            robots_content, llms_content = await asyncio.gather(
+                self.fetch_robots_txt(session, domain),
+                self.fetch_llms_txt(session, domain),
+            )
+        else:
+            robots_content = await self.fetch_robots_txt(session, domain)
 
         # Handle case where neither file exists
         if robots_content is None and (not self.check_llms or llms_content is None):
@@ -411,7 +559,11 @@ class RobotsAnalyzer:
 
     async def analyze_all_domains(self, domains: set[str]) -> dict[str, dict]:
         """Analyze robots.txt for all provided domains."""
-        async with aiohttp.ClientSession() as session:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency, limit_per_host=self.per_host_limit
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
             tasks = [self.analyze_domain_robots(session, domain) for domain in domains]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -1197,6 +1349,31 @@ Requirements:
     parser.add_argument(
         "--no-llms", action="store_true", help="Skip checking llms.txt files"
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum concurrent policy fetches (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--per-host-limit",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help=f"Maximum connections per host (default: {DEFAULT_PER_HOST_LIMIT})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the policy fetch cache (default: $CRAWLER_POLICY_CACHE_DIR or workspace .cache)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Seconds to reuse cached files without revalidation (default: {DEFAULT_CACHE_TTL:.0f})",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the policy fetch cache"
+    )
     parser.add_argument(
         "--save-robots",
         action="store_true",
@@ -1351,8 +1528,22 @@ Requirements:
             output_dir=output_dir,
             main_domain=main_domain,
             check_llms=not args.no_llms,
+            max_concurrency=args.max_concurrency,
+            per_host_limit=args.per_host_limit,
+            cache=None
+            if args.no_cache
+            else PolicyFetchCache(
+                Path(args.cache_dir) if args.cache_dir else default_cache_dir(),
+                ttl=args.cache_ttl,
+            ),
         )
         robots_data = await analyzer.analyze_all_domains(domains_to_analyze)
+        if analyzer.cache:
+            print(
+                f"Policy cache: {analyzer.cache.hits} fresh, "
+                f"{analyzer.cache.revalidated} revalidated, "
+                f"{analyzer.cache.misses} fetched"
+            )
 
         # Update domains to match consolidated results
         domains_to_analyze = set(robots_data.keys())
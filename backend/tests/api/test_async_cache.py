@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from api.utils.async_cache import AsyncTTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_coalesces_and_expires():
+    clock = FakeClock()
+    cache: AsyncTTLCache[int] = AsyncTTLCache(
+        max_entries=10, ttl_seconds=60, clock=clock
+    )
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+    assert results == [1] * 5
+    assert calls == 1
+
+    clock.now = 61
+    assert await cache.get_or_load("k", loader) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_shares_errors_without_caching():
+    cache: AsyncTTLCache[str] = AsyncTTLCache(max_entries=10, ttl_seconds=60)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        cache.get_or_load("k", failing),
+        cache.get_or_load("k", failing),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert calls == 1
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used():
+    cache: AsyncTTLCache[int] = AsyncTTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
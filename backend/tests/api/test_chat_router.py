@@ -21,7 +21,7 @@ class FakeClaudeClient:
 
 
 def test_stream_chat_emits_token_and_complete(test_client, monkeypatch):
-    monkeypatch.setattr(chat_router, "ClaudeClient", FakeClaudeClient)
+    monkeypatch.setattr(app.state, "claude_client", FakeClaudeClient())
 
     response = test_client.post(
         "/api/chat/stream",
@@ -84,3 +84,9 @@ def test_generate_title_logs_failure(test_client, test_db, monkeypatch, caplog):
         "Title generation failed, using fallback" in record.message
         for record in caplog.records
     )
+
+
+def test_lifespan_shares_claude_client_and_executor(test_client):
+    state = test_client.app.state
+    assert state.claude_client.tool_mapper is state.tool_mapper
+    assert state.tool_mapper.executor is state.executor
@@ -313,3 +313,80 @@ async def test_stream_with_tools_emits_error_on_exception():
     assert output[-1]["type"] == "error"
     assert output[-1]["error"] == "boom"
     assert dummy_db.rolled_back is True
+
+
+class SchemaToolMapper(DummyToolMapper):
+    def get_claude_tools(self, allowed_skills=None):
+        return [
+            {"name": "first", "description": "", "input_schema": {}},
+            {"name": "last", "description": "", "input_schema": {}},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_stream_with_tools_places_prompt_cache_breakpoints():
+    events = [SimpleNamespace(type="message_stop")]
+    client = FakeClient(events)
+    history = [
+        {"role": "user", "content": "Earlier question"},
+        {"role": "assistant", "content": [{"type": "text", "text": "Answer"}]},
+    ]
+
+    async for _event in stream_with_tools(
+        client=client,
+        tool_mapper=SchemaToolMapper(),
+        model="test-model",
+        message="Hi",
+        conversation_history=history,
+        system_prompt=[
+            {"type": "text", "text": "stable", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "volatile"},
+        ],
+        allowed_skills=[],
+    ):
+        pass
+
+    args = client.messages.called_args
+    assert "cache_control" not in args["tools"][0]
+    assert args["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert args["system"][1] == {"type": "text", "text": "volatile"}
+    sent = args["messages"]
+    assert sent[0] == {"role": "user", "content": "Earlier question"}
+    assert sent[1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert sent[2]["content"] == [
+        {"type": "text", "text": "Hi", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert history[1]["content"] == [{"type": "text", "text": "Answer"}]
+    assert history[2] == {"role": "user", "content": "Hi"}
+
+
+@pytest.mark.asyncio
+async def test_stream_with_tools_records_prompt_cache_usage():
+    from api.metrics import chat_prompt_tokens_total
+
+    def _value(label):
+        return chat_prompt_tokens_total.labels(cache=label)._value.get()
+
+    before = {label: _value(label) for label in ("read", "write", "miss")}
+    usage = SimpleNamespace(
+        input_tokens=12, cache_read_input_tokens=900, cache_creation_input_tokens=0
+    )
+    events = [
+        SimpleNamespace(type="message_start", message=SimpleNamespace(usage=usage)),
+        SimpleNamespace(type="message_stop"),
+    ]
+
+    async for _event in stream_with_tools(
+        client=FakeClient(events),
+        tool_mapper=DummyToolMapper(),
+        model="test-model",
+        message="Hi",
+        conversation_history=[],
+        system_prompt="plain",
+        allowed_skills=[],
+    ):
+        pass
+
+    assert _value("read") - before["read"] == 900
+    assert _value("miss") - before["miss"] == 12
+    assert _value("write") == before["write"]
@@ -116,3 +116,14 @@ def test_ingestion_meta_syncs_failed_transcript_status(test_client, test_db):
     assert transcripts[video_id]["status"] == "failed"
     assert transcripts[video_id]["file_id"] == str(file_id)
     assert transcripts[video_id]["error"] == "Download failed"
+
+
+def test_ingestion_list_conditional_get(test_client):
+    first = test_client.get("/api/v1/files", headers=_auth_headers())
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = test_client.get(
+        "/api/v1/files", headers={**_auth_headers(), "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
@@ -0,0 +1,95 @@
+"""Tests for the pure ASGI middlewares."""
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from api.config import settings
+from api.middleware.auth import AuthMiddleware
+from api.middleware.deprecation import DeprecationMiddleware
+from api.middleware.metrics import MetricsMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/api/notes/whoami")
+    async def whoami(request: Request) -> dict[str, str | None]:
+        return {"user_id": getattr(request.state, "user_id", None)}
+
+    @app.get("/api/v1/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for index in range(3):
+                yield f"data: {index}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app.add_middleware(DeprecationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(AuthMiddleware)
+    return app
+
+
+def test_auth_rejects_missing_header_and_skips_health(monkeypatch):
+    monkeypatch.setattr(settings, "auth_dev_mode", False)
+    client = TestClient(_build_app())
+
+    missing = client.get("/api/notes/whoami")
+    assert missing.status_code == 401
+    assert missing.headers["WWW-Authenticate"] == "Bearer"
+    assert missing.json()["error"]["code"] == "MISSING_AUTHORIZATION"
+
+    malformed = client.get("/api/notes/whoami", headers={"Authorization": "Basic abc"})
+    assert malformed.status_code == 401
+    assert malformed.json()["error"]["code"] == "INVALID_AUTHORIZATION"
+
+    assert client.get("/api/health").status_code == 200
+
+
+def test_auth_sets_user_id_from_validated_token(monkeypatch):
+    monkeypatch.setattr(settings, "auth_dev_mode", False)
+    monkeypatch.setattr(settings, "supabase_url", "https://project.supabase.co")
+
+    async def validate_token(self, token):
+        return {"sub": f"user-for-{token}"}
+
+    monkeypatch.setattr(
+        "api.middleware.auth.SupabaseJWTValidator.validate_token", validate_token
+    )
+    client = TestClient(_build_app())
+
+    response = client.get("/api/notes/whoami", headers={"Authorization": "Bearer t1"})
+
+    assert response.status_code == 200
+    assert response.json() == {"user_id": "user-for-t1"}
+
+
+def test_legacy_paths_get_deprecation_headers(monkeypatch):
+    monkeypatch.setattr(settings, "auth_dev_mode", True)
+    monkeypatch.setattr(settings, "app_env", "local")
+    client = TestClient(_build_app())
+
+    response = client.get("/api/notes/whoami")
+
+    assert response.headers["X-API-Deprecated"] == "true"
+    assert response.headers["X-API-Deprecated-Path"] == "/api/notes"
+    assert response.headers["X-API-New-Path"] == "/api/v1/notes"
+    assert "Server-Timing" in response.headers
+
+
+def test_streaming_responses_pass_through_unchanged(monkeypatch):
+    monkeypatch.setattr(settings, "auth_dev_mode", True)
+    monkeypatch.setattr(settings, "app_env", "local")
+    client = TestClient(_build_app())
+
+    response = client.get("/api/v1/stream")
+
+    assert response.status_code == 200
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert "X-API-Deprecated" not in response.headers
+    assert response.headers["Server-Timing"].startswith("db;dur=")
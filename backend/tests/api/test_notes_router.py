@@ -107,3 +107,54 @@ def test_notes_pin_move_archive(test_client):
         headers=_auth_headers(),
     )
     assert archive.status_code == 200
+
+
+def test_notes_sync_content_requires_ids(test_client):
+    response = test_client.post(
+        "/api/notes/sync/content", json={}, headers=_auth_headers()
+    )
+    assert response.status_code == 400
+    assert error_message(response) == "ids required"
+
+
+def test_notes_tree_conditional_get(test_client, test_db, monkeypatch):
+    from api.services.notes_workspace_service import NotesWorkspaceService
+
+    note = Note(
+        id=uuid.uuid4(),
+        user_id=DEFAULT_USER_ID,
+        title="Tree Note",
+        content="# Tree Note",
+        metadata_={"folder": "", "pinned": False},
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+    test_db.add(note)
+    test_db.commit()
+
+    first = test_client.get("/api/notes/tree", headers=_auth_headers())
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    def fail_tree(*_args, **_kwargs):
+        raise AssertionError("tree should not be rebuilt on a 304")
+
+    monkeypatch.setattr(NotesWorkspaceService, "list_tree", fail_tree)
+    cached = test_client.get(
+        "/api/notes/tree", headers={**_auth_headers(), "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    monkeypatch.undo()
+
+    rename = test_client.patch(
+        f"/api/notes/{note.id}/rename",
+        json={"newName": "Renamed Tree Note.md"},
+        headers=_auth_headers(),
+    )
+    assert rename.status_code == 200
+    changed = test_client.get(
+        "/api/notes/tree", headers={**_auth_headers(), "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
@@ -146,3 +146,72 @@ def test_update_note_conflict(db_session):
             "# Title\n\nUpdated",
             client_updated_at=stale,
         )
+
+
+def test_create_note_sets_content_hash(db_session):
+    from api.utils.content_hash import compute_content_hash
+
+    note = NotesService.create_note(db_session, "test_user", "# Hash\n\nBody")
+    assert note.content_hash == compute_content_hash("# Hash\n\nBody")
+
+
+def test_update_note_unchanged_content_is_noop(db_session):
+    note = NotesService.create_note(db_session, "test_user", "# Same\n\nBody")
+    original_updated_at = note.updated_at
+    stale = original_updated_at - timedelta(seconds=10)
+
+    updated = NotesService.update_note(
+        db_session,
+        "test_user",
+        note.id,
+        "# Same\n\nBody",
+        client_updated_at=stale,
+    )
+
+    assert updated.updated_at == original_updated_at
+    assert updated.content == "# Same\n\nBody"
+
+
+def test_patch_note_content_applies_edits(db_session):
+    from api.utils.content_hash import compute_content_hash
+
+    original = "# Café\n\nfirst line\nsecond line\n"
+    note = NotesService.create_note(db_session, "test_user", original)
+    edits = [
+        {"start": 8, "end": 13, "text": "1st"},
+        {"start": 19, "end": 25, "text": "2nd"},
+        {"start": len(original), "end": len(original), "text": "third ✓\n"},
+    ]
+    expected = "# Café\n\n1st line\n2nd line\nthird ✓\n"
+
+    patched = NotesService.patch_note_content(
+        db_session,
+        "test_user",
+        note.id,
+        note.content_hash,
+        edits,
+        content_hash=compute_content_hash(expected),
+    )
+
+    assert patched.content_hash == compute_content_hash(expected)
+    db_session.expire_all()
+    fetched = NotesService.get_note(db_session, "test_user", note.id)
+    assert fetched.content == expected
+    assert fetched.content_hash == compute_content_hash(expected)
+
+
+def test_patch_note_content_rejects_stale_base_hash(db_session):
+    note = NotesService.create_note(db_session, "test_user", "# Base\n\nBody")
+
+    with pytest.raises(ConflictError) as exc_info:
+        NotesService.patch_note_content(
+            db_session,
+            "test_user",
+            note.id,
+            "0" * 64,
+            [{"start": 0, "end": 0, "text": "x"}],
+        )
+
+    conflict = exc_info.value.details["conflict"]
+    assert conflict["reason"] == "base_hash_mismatch"
+    assert conflict["serverNote"]["content"] == "# Base\n\nBody"
@@ -1,9 +1,37 @@
+import uuid
 from datetime import UTC, datetime
 from types import SimpleNamespace
 
 import pytest
+from api.db.base import Base
+from api.models.note import Note
 from api.services import notes_workspace_service as service_module
+from api.services.notes_service import NotesService
 from api.services.notes_workspace_service import NotesWorkspaceService
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def db_session(test_db_engine):
+    connection = test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    )
+    schema = f"test_{uuid.uuid4().hex}"
+
+    connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    connection.execute(text(f'SET search_path TO "{schema}"'))
+    Base.metadata.create_all(bind=connection)
+
+    Session = sessionmaker(bind=connection)
+    session = Session()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
 
 
 class FakeQuery:
@@ -81,14 +109,43 @@ def test_create_folder_returns_exists_when_present():
     assert db.added == []
 
 
-def test_rename_folder_updates_notes(monkeypatch):
-    note = _note(folder="Old/Child")
-    db = FakeDB([note])
+def _folders(db_session, user_id="user-1"):
+    db_session.expire_all()
+    notes = db_session.query(Note).filter(Note.user_id == user_id).all()
+    return {note.title: note.metadata_.get("folder") for note in notes}
+
+
+def test_rename_folder_updates_notes(db_session):
+    NotesService.create_note(db_session, "user-1", "body", title="A", folder="Old")
+    NotesService.create_note(
+        db_session, "user-1", "body", title="B", folder="Old/Child"
+    )
+    NotesService.create_note(db_session, "user-1", "body", title="C", folder="Older")
+    NotesService.create_note(db_session, "user-2", "body", title="D", folder="Old")
+
+    result = NotesWorkspaceService.rename_folder(db_session, "user-1", "Old", "New")
 
-    result = NotesWorkspaceService.rename_folder(db, "user-1", "Old", "New")
     assert result["newPath"] == "folder:New"
-    assert note.metadata_["folder"] == "New/Child"
-    assert db.commits == 1
+    assert _folders(db_session) == {"A": "New", "B": "New/Child", "C": "Older"}
+    assert _folders(db_session, "user-2") == {"D": "Old"}
+
+
+def test_move_folder_updates_nested_notes(db_session):
+    note = NotesService.create_note(
+        db_session, "user-1", "body", title="A", folder="Work/50%/Deep"
+    )
+    NotesService.create_note(db_session, "user-1", "body", title="B", folder="Work/50x")
+    before = note.updated_at
+
+    result = NotesWorkspaceService.move_folder(
+        db_session, "user-1", "Work/50%", "Archive"
+    )
+
+    assert result["newPath"] == "folder:Archive/50%"
+    assert _folders(db_session) == {"A": "Archive/50%/Deep", "B": "Work/50x"}
+    db_session.refresh(note)
+    assert note.metadata_["pinned"] is False
+    assert note.updated_at > before
 
 
 def test_move_folder_rejects_invalid_destination():
@@ -52,6 +52,58 @@ def test_notes_sync_conflict(test_db_engine):
         connection.close()
 
 
+def test_notes_sync_paginates_initial_sync(test_db_engine):
+    connection, session, schema = _make_session(test_db_engine)
+    try:
+        created = [
+            NotesService.create_note(session, "user-1", f"# Note {index}\n\nBody")
+            for index in range(5)
+        ]
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            result = NotesSyncService.sync_operations(
+                session,
+                "user-1",
+                {"last_sync": None, "limit": 2, "cursor": cursor},
+            )
+            pages += 1
+            seen.extend(note.id for note in result.updated_notes)
+            cursor = result.next_cursor
+            if cursor is None:
+                break
+        assert pages == 3
+        assert sorted(seen) == sorted(note.id for note in created)
+        assert len(set(seen)) == len(seen)
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
+def test_notes_sync_metadata_only_and_content_batch(test_db_engine):
+    connection, session, schema = _make_session(test_db_engine)
+    try:
+        note = NotesService.create_note(session, "user-1", "# Title\n\nBody")
+        session.expunge_all()
+        result = NotesSyncService.sync_operations(
+            session,
+            "user-1",
+            {"last_sync": None, "include_content": False},
+        )
+        assert result.include_content is False
+        assert [item.id for item in result.updated_notes] == [note.id]
+        assert "content" not in result.updated_notes[0].__dict__
+
+        notes = NotesSyncService.get_notes_content(session, "user-1", [str(note.id)])
+        assert [item.content for item in notes] == ["# Title\n\nBody"]
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
 def test_websites_sync_conflict(test_db_engine):
     connection, session, schema = _make_session(test_db_engine)
     try:
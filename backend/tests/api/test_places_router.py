@@ -2,8 +2,9 @@ import pytest
 from api.config import settings
 from api.exceptions import ExternalServiceError
 from api.routers import places as places_router
+from api.services.upstream_http import close_upstream_http_client
 
-from tests.helpers import error_message
+from tests.helpers import StubUpstream, error_message
 
 
 def _auth_headers() -> dict[str, str]:
@@ -28,23 +29,84 @@ def test_places_autocomplete_short_input_returns_empty(test_client, monkeypatch)
     assert response.json()["predictions"] == []
 
 
-def test_places_handles_invalid_json(monkeypatch):
-    class FakeResponse:
-        def __init__(self, payload: bytes):
-            self._payload = payload
+@pytest.fixture(autouse=True)
+def _clear_places_caches():
+    for cache in (
+        places_router._autocomplete_cache,
+        places_router._details_cache,
+        places_router._reverse_cache,
+    ):
+        cache.clear()
+    yield
 
-        def read(self):
-            return self._payload
 
-        def __enter__(self):
-            return self
+@pytest.fixture
+def google_places(monkeypatch):
+    stub = StubUpstream(
+        {
+            "/autocomplete/json": {
+                "status": "OK",
+                "predictions": [
+                    {"description": "London, UK", "place_id": "place-london"}
+                ],
+            },
+            "/nearbysearch/json": {
+                "status": "OK",
+                "results": [{"place_id": "place-london"}],
+            },
+            "/details/json": {
+                "status": "OK",
+                "result": {
+                    "address_components": [
+                        {"long_name": "London", "types": ["locality"]},
+                        {"long_name": "United Kingdom", "types": ["country"]},
+                    ]
+                },
+            },
+        }
+    )
+    monkeypatch.setattr(settings, "google_places_api_key", "test-key")
+    monkeypatch.setattr(places_router, "GOOGLE_PLACES_BASE_URL", stub.base_url)
+    yield stub
+    stub.close()
+
+
+def test_places_autocomplete_is_cached(test_client, google_places):
+    for query in ("London", "london "):
+        response = test_client.get(
+            "/api/places/autocomplete",
+            params={"input": query},
+            headers=_auth_headers(),
+        )
+        assert response.status_code == 200
+        assert response.json()["predictions"][0]["place_id"] == "place-london"
+
+    assert len(google_places.requests) == 1
+    path, query = google_places.requests[0]
+    assert path == "/autocomplete/json"
+    assert query["key"] == ["test-key"]
+
+
+def test_places_reverse_caches_lookup_and_details(test_client, google_places):
+    for lat, lng in ((51.50731, -0.12771), (51.50729, -0.12769), (51.6, -0.2)):
+        response = test_client.get(
+            "/api/places/reverse",
+            params={"lat": lat, "lng": lng},
+            headers=_auth_headers(),
+        )
+        assert response.status_code == 200
+        assert response.json()["label"] == "London, United Kingdom"
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    paths = [path for path, _ in google_places.requests]
+    assert paths.count("/nearbysearch/json") == 2
+    assert paths.count("/details/json") == 1
 
-    def fake_urlopen(*_args, **_kwargs):
-        return FakeResponse(b"{invalid")
 
-    monkeypatch.setattr(places_router, "urlopen", fake_urlopen)
-    with pytest.raises(ExternalServiceError):
-        places_router._fetch_autocomplete("London")
+@pytest.mark.asyncio
+async def test_places_handles_invalid_json(google_places):
+    google_places.routes["/autocomplete/json"] = b"{invalid"
+    try:
+        with pytest.raises(ExternalServiceError):
+            await places_router._fetch_autocomplete("London")
+    finally:
+        await close_upstream_http_client()
@@ -1,11 +1,29 @@
+import uuid
 from datetime import UTC, datetime, timedelta
 
+import pytest
 from api.db.base import Base
 from api.models.conversation import Conversation
+from api.models.file_ingestion import FileDerivative, IngestedFile
 from api.models.note import Note
 from api.models.user_settings import UserSettings
 from api.models.website import Website
+from api.services import prompt_context_service as prompt_context_module
 from api.services.prompt_context_service import PromptContextService
+from api.services.recent_activity_cache import (
+    MemoryRecentActivityCache,
+    RedisRecentActivityCache,
+    get_recent_activity_cache,
+)
+from api.services.user_settings_service import UserSettingsService
+from sqlalchemy import text
+
+
+@pytest.fixture(autouse=True)
+def _clear_recent_activity_cache():
+    get_recent_activity_cache().clear()
+    yield
+    get_recent_activity_cache().clear()
 
 
 def test_prompt_context_service_order_and_truncation(test_db):
@@ -72,14 +90,69 @@ def test_prompt_context_service_order_and_truncation(test_db):
     idx_guidance = system_prompt.index("<context_guidance>")
     idx_open = system_prompt.index("<current_open>")
     idx_recent = system_prompt.index("<recent_activity>")
-    assert idx_message < idx_guidance < idx_open < idx_recent
+    assert idx_guidance < idx_message < idx_open < idx_recent
 
     assert len(system_prompt) <= PromptContextService.MAX_SYSTEM_PROMPT_CHARS
     assert "I use macOS." in first_message
 
 
+def test_prompt_blocks_keep_volatile_context_out_of_cached_prefix(test_db):
+    Base.metadata.create_all(bind=test_db.connection())
+    user_id = "user-blocks"
+    test_db.add(UserSettings(user_id=user_id, name="Sam"))
+    test_db.commit()
+
+    def build(now):
+        return PromptContextService.build_prompt_blocks(
+            db=test_db,
+            user_id=user_id,
+            open_context=None,
+            attachments=None,
+            user_agent=None,
+            current_weather={"temperature_c": 10},
+            now=now,
+        )[0]
+
+    first = build(datetime(2025, 1, 2, 12, 0, tzinfo=UTC))
+    second = build(datetime(2025, 1, 2, 15, 30, tzinfo=UTC))
+
+    assert first[0] == second[0]
+    assert first[0]["cache_control"] == {"type": "ephemeral"}
+    assert "<context_guidance>" in first[0]["text"]
+    assert "Current time" not in first[0]["text"]
+    assert "cache_control" not in first[1]
+    assert first[1]["text"].startswith("<message_context>")
+    assert "12:00 UTC" in first[1]["text"]
+    assert "15:30 UTC" in second[1]["text"]
+
+
+def test_stable_prompt_cache_invalidated_by_settings_update(test_db):
+    Base.metadata.create_all(bind=test_db.connection())
+    PromptContextService._stable_prompt_cache.clear()
+    user_id = "user-stable"
+    UserSettingsService.upsert_settings(test_db, user_id, name="Sam")
+    now = datetime(2025, 1, 2, 12, 0, tzinfo=UTC)
+
+    def stable_text():
+        blocks, _ = PromptContextService.build_prompt_blocks(
+            db=test_db,
+            user_id=user_id,
+            open_context=None,
+            attachments=None,
+            user_agent=None,
+            now=now,
+        )
+        return blocks[0]["text"]
+
+    assert "Sam's personal AI assistant" in stable_text()
+    assert user_id in PromptContextService._stable_prompt_cache
+
+    UserSettingsService.upsert_settings(test_db, user_id, name="Alex")
+
+    assert "Alex's personal AI assistant" in stable_text()
+
+
 def test_recent_activity_cache_hit(test_db):
-    PromptContextService._recent_activity_cache.clear()
     Base.metadata.create_all(bind=test_db.connection())
     now = datetime(2025, 2, 1, 9, 0, tzinfo=UTC)
     user_id = "user-1"
@@ -98,14 +171,15 @@ def test_recent_activity_cache_hit(test_db):
         test_db, user_id, now
     )
 
-    new_note = Note(
-        user_id=user_id,
-        title="Late Add",
-        content="Extra",
-        metadata_={"folder": "work"},
-        last_opened_at=now + timedelta(minutes=1),
+    # Raw SQL bypasses ORM change tracking, so the cached entry is served.
+    test_db.execute(
+        text(
+            "INSERT INTO notes (id, user_id, title, content, metadata, "
+            "last_opened_at, created_at, updated_at) VALUES (:id, :user_id, "
+            "'Late Add', 'Extra', '{}', :opened, :opened, :opened)"
+        ),
+        {"id": uuid.uuid4(), "user_id": user_id, "opened": now},
     )
-    test_db.add(new_note)
     test_db.commit()
 
     cached_notes, _, _, _ = PromptContextService._get_recent_activity(
@@ -116,8 +190,67 @@ def test_recent_activity_cache_hit(test_db):
     assert {item["title"] for item in cached_notes} == {"Morning Notes"}
 
 
+def test_recent_activity_invalidated_when_items_open(test_db):
+    Base.metadata.create_all(bind=test_db.connection())
+    now = datetime(2025, 2, 1, 9, 0, tzinfo=UTC)
+    user_id = "user-1"
+
+    note = Note(
+        user_id=user_id,
+        title="Morning Notes",
+        content="Note body",
+        metadata_={"folder": "work"},
+        last_opened_at=now,
+    )
+    website = Website(
+        user_id=user_id,
+        url="https://example.com",
+        url_full="",
+        domain="example.com",
+        title="Docs",
+        content="Website body",
+    )
+    test_db.add_all([note, website])
+    test_db.commit()
+
+    _, websites, _, _ = PromptContextService._get_recent_activity(test_db, user_id, now)
+    assert websites == []
+
+    website.last_opened_at = now + timedelta(minutes=1)
+    test_db.commit()
+
+    notes, websites, _, _ = PromptContextService._get_recent_activity(
+        test_db, user_id, now + timedelta(minutes=1)
+    )
+    assert [item["title"] for item in notes] == ["Morning Notes"]
+    assert notes[0]["folder"] == "work"
+    assert websites == [
+        {
+            "id": str(website.id),
+            "title": "Docs",
+            "last_opened_at": (now + timedelta(minutes=1)).isoformat(),
+            "domain": "example.com",
+            "url": "https://example.com",
+        }
+    ]
+
+
+def test_memory_recent_activity_cache_is_bounded():
+    cache = MemoryRecentActivityCache(max_entries=2, ttl=timedelta(minutes=5))
+    now = datetime(2025, 2, 1, 9, 0, tzinfo=UTC)
+    empty = ([], [], [], [])
+
+    cache.set("a", now, empty)
+    cache.set("b", now, empty)
+    assert cache.get("a", now) == empty
+    cache.set("c", now, empty)
+
+    assert cache.get("b", now) is None
+    assert cache.get("a", now) == empty
+    assert len(cache) == 2
+
+
 def test_recent_activity_cache_expiry(test_db):
-    PromptContextService._recent_activity_cache.clear()
     Base.metadata.create_all(bind=test_db.connection())
     now = datetime(2025, 2, 1, 9, 0, tzinfo=UTC)
     user_id = "user-1"
@@ -153,3 +286,115 @@ def test_recent_activity_cache_expiry(test_db):
         "Morning Notes",
         "Afternoon Notes",
     }
+
+
+class RangeStorage:
+    def __init__(self, objects):
+        self.objects = objects
+        self.full_reads = []
+        self.range_reads = []
+
+    def get_object(self, key):
+        self.full_reads.append(key)
+        return self.objects[key]
+
+    def get_object_range(self, key, start, end):
+        self.range_reads.append((key, start, end))
+        return self.objects[key][start : end + 1]
+
+
+def _add_file_with_ai_md(test_db, user_id, filename, body, sha):
+    record = IngestedFile(
+        user_id=user_id,
+        filename_original=filename,
+        mime_original="text/plain",
+        size_bytes=len(body),
+    )
+    test_db.add(record)
+    test_db.flush()
+    test_db.add(
+        FileDerivative(
+            file_id=record.id,
+            kind="ai_md",
+            storage_key=f"{user_id}/files/{record.id}/ai.md",
+            mime="text/markdown",
+            size_bytes=len(body),
+            sha256=sha,
+        )
+    )
+    test_db.flush()
+    return record
+
+
+def test_file_contexts_use_ranged_reads_and_prefix_cache(test_db, monkeypatch):
+    Base.metadata.create_all(bind=test_db.connection())
+    PromptContextService._content_prefix_cache.clear()
+    user_id = "user-files"
+    large_body = ("é" * 50_000).encode("utf-8")
+    small_body = b"short transcript"
+    large = _add_file_with_ai_md(test_db, user_id, "big.md", large_body, "sha-big")
+    small = _add_file_with_ai_md(test_db, user_id, "small.md", small_body, "sha-small")
+    storage = RangeStorage(
+        {
+            f"{user_id}/files/{large.id}/ai.md": large_body,
+            f"{user_id}/files/{small.id}/ai.md": small_body,
+        }
+    )
+    monkeypatch.setattr(prompt_context_module, "get_storage_backend", lambda: storage)
+
+    open_file, attachments = PromptContextService._resolve_file_contexts(
+        test_db,
+        user_id,
+        {"id": str(small.id), "category": "documents"},
+        [
+            {"file_id": str(large.id)},
+            {"file_id": str(uuid.uuid4())},
+            {"file_id": "not-a-uuid"},
+        ],
+    )
+
+    assert open_file["content"] == "short transcript"
+    assert open_file["category"] == "documents"
+    assert [item["filename"] for item in attachments] == ["big.md"]
+    assert attachments[0]["content"] == "é" * PromptContextService.MAX_ATTACHMENT_CHARS
+    max_bytes = PromptContextService.MAX_ATTACHMENT_CHARS * 4
+    assert storage.range_reads == [
+        (f"{user_id}/files/{large.id}/ai.md", 0, max_bytes - 1)
+    ]
+
+    PromptContextService._resolve_file_contexts(
+        test_db, user_id, None, [{"file_id": str(large.id)}]
+    )
+    assert len(storage.range_reads) == 1
+
+
+def test_redis_recent_activity_cache_round_trip():
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+
+        def get(self, key):
+            return self.store.get(key)
+
+        def set(self, key, value, ex=None):
+            self.store[key] = value
+
+        def delete(self, *keys):
+            for key in keys:
+                self.store.pop(key, None)
+
+        def scan_iter(self, pattern):
+            prefix = pattern.rstrip("*")
+            return [key for key in self.store if key.startswith(prefix)]
+
+    client = FakeRedis()
+    cache = RedisRecentActivityCache(client, ttl=timedelta(minutes=5))
+    now = datetime(2025, 2, 1, 9, 0, tzinfo=UTC)
+    items = ([{"id": "n1", "title": "Note"}], [], [], [])
+
+    cache.set("user-1", now, items)
+    assert cache.get("user-1", now + timedelta(minutes=1)) == items
+    assert cache.get("user-1", now + timedelta(minutes=6)) is None
+
+    cache.invalidate({"user-1"})
+    assert cache.get("user-1", now) is None
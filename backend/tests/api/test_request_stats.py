@@ -0,0 +1,80 @@
+"""Tests for per-request resource accounting."""
+
+import re
+from pathlib import Path
+
+from api.config import settings
+from api.metrics import http_request_db_queries
+from api.request_stats import (
+    RequestStats,
+    current_request_stats,
+    record_db_query,
+    server_timing_header,
+    track_request,
+)
+from api.services.storage.local import LocalStorage
+
+
+def _auth_headers() -> dict[str, str]:
+    return {"Authorization": f"Bearer {settings.bearer_token}"}
+
+
+def test_storage_calls_count_against_the_current_request(tmp_path: Path):
+    storage = LocalStorage(tmp_path)
+
+    with track_request() as stats:
+        storage.put_object("notes/a.txt", b"hello")
+        storage.get_object("notes/a.txt")
+        storage.object_exists("notes/a.txt")
+
+    # Outside a request nothing is collected.
+    storage.get_object("notes/a.txt")
+    record_db_query(0.01)
+
+    assert current_request_stats() is None
+    assert stats.storage_operations == 3
+    assert stats.storage_bytes == 10
+    assert stats.db_queries == 0
+
+
+def test_server_timing_header_lists_only_used_resources():
+    stats = RequestStats(db_queries=3, db_seconds=0.0125)
+    assert server_timing_header(stats, 0.05) == (
+        'db;dur=12.5;desc="3 queries", total;dur=50.0'
+    )
+
+    stats.storage_operations = 2
+    stats.storage_bytes = 512
+    stats.skill_executions = 1
+    stats.skill_seconds = 0.2
+    assert server_timing_header(stats, 0.3) == (
+        'db;dur=12.5;desc="3 queries", '
+        'storage;desc="2 ops, 512 bytes", '
+        'skill;dur=200.0;desc="1 runs", '
+        "total;dur=300.0"
+    )
+
+
+def test_metrics_middleware_reports_queries_per_route(test_client):
+    histogram = http_request_db_queries.labels(
+        method="GET", endpoint="/api/v1/notes/tree"
+    )
+    before = histogram._sum.get()
+
+    response = test_client.get("/api/v1/notes/tree", headers=_auth_headers())
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    queries = int(re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', timing).group(1))
+    assert queries > 0
+    assert "total;dur=" in timing
+    assert histogram._sum.get() - before == queries
+
+
+def test_server_timing_header_is_omitted_in_production(test_client, monkeypatch):
+    monkeypatch.setattr(settings, "app_env", "production")
+
+    response = test_client.get("/api/v1/notes/tree", headers=_auth_headers())
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
@@ -0,0 +1,71 @@
+import json
+from datetime import UTC, datetime
+
+from api.config import settings
+from api.db.dependencies import DEFAULT_USER_ID
+from api.models.note import Note
+
+
+def _auth_headers() -> dict[str, str]:
+    return {"Authorization": f"Bearer {settings.bearer_token}"}
+
+
+def _add_note(test_db) -> None:
+    now = datetime.now(UTC)
+    test_db.add(
+        Note(
+            user_id=DEFAULT_USER_ID,
+            title="Universal search note",
+            content="Findable content",
+            metadata_={},
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    test_db.commit()
+
+
+def test_search_returns_merged_results(test_client, test_db):
+    _add_note(test_db)
+
+    response = test_client.post(
+        "/api/v1/search",
+        json={"query": "findable", "contentTypes": ["note", "website"]},
+        headers=_auth_headers(),
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["title"] for item in payload["items"]] == ["Universal search note"]
+    assert {entry["contentType"] for entry in payload["providers"]} == {
+        "note",
+        "website",
+    }
+    assert all("latencyMs" in entry for entry in payload["providers"])
+
+
+def test_search_streams_provider_events(test_client, test_db):
+    _add_note(test_db)
+
+    response = test_client.post(
+        "/api/v1/search",
+        json={"query": "findable", "contentTypes": ["note"], "stream": True},
+        headers=_auth_headers(),
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), block.split("data: ", 1)[1])
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert [name for name, _ in events] == ["provider", "complete"]
+    assert json.loads(events[-1][1])["items"][0]["title"] == "Universal search note"
+
+
+def test_search_rejects_empty_query(test_client):
+    response = test_client.post(
+        "/api/v1/search", json={"query": " "}, headers=_auth_headers()
+    )
+
+    assert response.status_code == 400
@@ -3,7 +3,11 @@
 from datetime import UTC, datetime
 
 from api.models.note import Note
-from api.utils.search import build_text_search_filter
+from api.models.website import Website
+from api.services.notes_workspace_service import NotesWorkspaceService
+from api.services.websites_service import WebsitesService
+from api.utils.search import build_text_search_filter, build_tsquery
+from sqlalchemy import select, text
 
 
 def _create_note(test_db, user_id: str, title: str) -> Note:
@@ -40,3 +44,79 @@ def test_build_text_search_filter_case_sensitive(test_db):
     results = test_db.query(Note).filter(Note.user_id == "user-1", search_filter).all()
 
     assert {note.title for note in results} == {"Alpha"}
+
+
+def _create_note_with_content(test_db, user_id: str, title: str, content: str) -> Note:
+    note = _create_note(test_db, user_id, title)
+    note.content = content
+    test_db.commit()
+    return note
+
+
+def test_notes_search_ranks_and_highlights(test_db):
+    _create_note_with_content(
+        test_db, "user-1", "Groceries", "Remember the kubernetes book"
+    )
+    _create_note_with_content(
+        test_db, "user-1", "Kubernetes upgrades", "Cluster upgrade checklist"
+    )
+    _create_note_with_content(test_db, "user-1", "Unrelated", "Nothing here")
+
+    result = NotesWorkspaceService.search(test_db, "user-1", "kubernet", limit=10)
+    titles = [item["name"] for item in result["items"]]
+
+    assert titles == ["Kubernetes upgrades.md", "Groceries.md"]
+    assert "<mark>kubernetes</mark>" in result["items"][1]["snippet"]
+
+
+def test_text_search_filter_matches_stems_and_substrings(test_db):
+    _create_note_with_content(test_db, "user-1", "Runner", "She was running late")
+    _create_note_with_content(test_db, "user-1", "Alphabet", "Letters")
+
+    search_vector = Note.__table__.c.search_vector
+    stemmed = build_text_search_filter(
+        [Note.title, Note.content], "runs", search_vector=search_vector
+    )
+    substring = build_text_search_filter(
+        [Note.title, Note.content], "phab", search_vector=search_vector
+    )
+
+    assert [
+        note.title
+        for note in test_db.query(Note).filter(Note.user_id == "user-1", stemmed)
+    ] == ["Runner"]
+    assert [
+        note.title
+        for note in test_db.query(Note).filter(Note.user_id == "user-1", substring)
+    ] == ["Alphabet"]
+
+
+def test_websites_search_uses_gin_index(test_db):
+    test_db.add(
+        Website(
+            user_id="user-1",
+            url="https://example.com/postgres",
+            domain="example.com",
+            title="Postgres internals",
+            content="Generalized inverted indexes",
+        )
+    )
+    test_db.commit()
+
+    results = WebsitesService.search_websites(test_db, "user-1", "inverted")
+    snippets = WebsitesService.search_snippets(test_db, "inverted", results)
+    assert [site.title for site in results] == ["Postgres internals"]
+    assert "<mark>inverted</mark>" in snippets[results[0].id]
+
+    test_db.execute(text("SET LOCAL enable_seqscan = off"))
+    search_vector = Website.__table__.c.search_vector
+    statement = select(Website.id).where(
+        search_vector.op("@@")(build_tsquery("inverted"))
+    )
+    compiled = statement.compile(
+        dialect=test_db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = "\n".join(
+        row[0] for row in test_db.execute(text(f"EXPLAIN {compiled}")).all()
+    )
+    assert "idx_websites_search_vector" in plan
@@ -0,0 +1,270 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from api.config import settings
+from api.db.base import Base
+from api.models.note import Note
+from api.models.semantic_chunk import SemanticChunk
+from api.models.website import Website
+from api.services.embeddings import HashingEmbedder, set_embedder
+from api.services.notes_service import NotesService
+from api.services.semantic_index_service import (
+    NumpyVectorIndex,
+    PgVectorIndex,
+    SemanticIndexScheduler,
+    SemanticIndexService,
+    chunk_text,
+    set_semantic_index_scheduler,
+)
+from api.services.universal_search_providers import SemanticSearchProvider
+from sqlalchemy import create_engine, func, text
+from sqlalchemy.orm import sessionmaker
+
+PARAGRAPHS = [
+    f"Paragraph {index} about {topic} with enough words to fill out a chunk. " * 4
+    for index, topic in enumerate(
+        ["sourdough", "hiking", "taxes", "gardening", "chess", "sailing"] * 3
+    )
+]
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        self.embedded: list[str] = []
+
+    def embed_batch(self, texts):
+        self.embedded.extend(texts)
+        return super().embed_batch(texts)
+
+
+@pytest.fixture
+def session_factory(test_db_engine):
+    schema = f"test_{uuid.uuid4().hex}"
+    # public stays on the path for the pgvector type.
+    engine = create_engine(
+        test_db_engine.url,
+        connect_args={"options": f"-csearch_path={schema},public"},
+    )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+        connection.execute(text(f'SET search_path TO "{schema}"'))
+        Base.metadata.create_all(bind=connection)
+        connection.execute(text("RESET search_path"))
+
+    try:
+        yield sessionmaker(bind=engine)
+    finally:
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        engine.dispose()
+
+
+def _add_note(session, user_id: str, title: str, content: str) -> Note:
+    now = datetime.now(UTC)
+    note = Note(
+        user_id=user_id,
+        title=title,
+        content=content,
+        metadata_={},
+        created_at=now,
+        updated_at=now,
+    )
+    session.add(note)
+    session.commit()
+    return note
+
+
+def _chunk_count(session, content_id) -> int:
+    return (
+        session.query(func.count(SemanticChunk.id))
+        .filter(SemanticChunk.content_id == content_id)
+        .scalar()
+    )
+
+
+def test_chunk_text_drops_frontmatter_and_keeps_unedited_chunks():
+    content = "\n\n".join(PARAGRAPHS)
+    chunks = chunk_text(f"---\nfile_id: 1\n---\n\n{content}")
+
+    assert not chunks[0].startswith("---")
+    assert all(len(chunk) <= 1500 for chunk in chunks)
+
+    edited = PARAGRAPHS.copy()
+    edited[-2] = "A rewritten paragraph about chess openings."
+    edited_chunks = chunk_text("\n\n".join(edited))
+
+    assert len(set(chunks) & set(edited_chunks)) >= len(chunks) - 2
+
+
+def test_reindex_embeds_only_changed_chunks(session_factory):
+    embedder = CountingEmbedder()
+    content_id = uuid.uuid4()
+    content = "\n\n".join(PARAGRAPHS)
+
+    with session_factory() as session:
+        first = SemanticIndexService.index_document(
+            session, "user", "note", content_id, content, embedder=embedder
+        )
+        session.commit()
+        total = _chunk_count(session, content_id)
+
+        unchanged = SemanticIndexService.index_document(
+            session, "user", "note", content_id, content, embedder=embedder
+        )
+        edited = content.replace("Paragraph 15 about gardening", "Notes on roses")
+        changed = SemanticIndexService.index_document(
+            session, "user", "note", content_id, edited, embedder=embedder
+        )
+        session.commit()
+
+        assert first == total > 2
+        assert unchanged == 0
+        assert 1 <= changed < total
+        assert _chunk_count(session, content_id) == len(chunk_text(edited))
+
+
+def test_index_documents_batches_embedding_across_documents(session_factory):
+    embedder = CountingEmbedder()
+    documents = [
+        ("note", uuid.uuid4(), f"Document {index}: {PARAGRAPHS[index]}")
+        for index in range(5)
+    ]
+
+    with session_factory() as session:
+        embedded = SemanticIndexService.index_documents(
+            session, "user", documents, embedder=embedder
+        )
+
+    assert embedded == len(embedder.embedded) == 5
+
+
+@pytest.mark.parametrize("index_class", [NumpyVectorIndex, PgVectorIndex])
+def test_search_ranks_closest_document_per_user(session_factory, index_class):
+    embedder = HashingEmbedder()
+    with session_factory() as session:
+        if index_class is PgVectorIndex:
+            if not session.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'")
+            ).scalar():
+                pytest.skip("pgvector is not available")
+            session.execute(text("CREATE EXTENSION IF NOT EXISTS vector SCHEMA public"))
+        bread, sailing, other = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        SemanticIndexService.index_documents(
+            session,
+            "user",
+            [
+                ("note", bread, "\n\n".join(PARAGRAPHS[:1] * 3)),
+                ("website", sailing, PARAGRAPHS[5]),
+            ],
+            embedder=embedder,
+        )
+        SemanticIndexService.index_document(
+            session, "other", "note", other, PARAGRAPHS[0], embedder=embedder
+        )
+        session.commit()
+
+        matches = SemanticIndexService.search(
+            session,
+            "user",
+            "sourdough paragraph",
+            embedder=embedder,
+            index=index_class(),
+        )
+        websites = SemanticIndexService.search(
+            session,
+            "user",
+            "sourdough paragraph",
+            content_types=["website"],
+            embedder=embedder,
+            index=index_class(),
+        )
+
+    assert [match.content_id for match in matches] == [bread, sailing]
+    assert matches[0].score > matches[1].score
+    assert [match.content_id for match in websites] == [sailing]
+
+
+def test_note_changes_are_indexed_after_commit(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "semantic_index_embedder", "local")
+    scheduler = SemanticIndexScheduler(
+        delay_seconds=60, session_factory=session_factory, embedder=HashingEmbedder()
+    )
+    set_semantic_index_scheduler(scheduler)
+    try:
+        with session_factory() as session:
+            note = _add_note(session, "user", "Bread", "Placeholder")
+            NotesService.update_note(session, "user", note.id, PARAGRAPHS[0])
+
+            assert scheduler._pending == {"user": {("note", note.id)}}
+            assert _chunk_count(session, note.id) == 0
+
+        scheduler.flush()
+
+        with session_factory() as session:
+            assert _chunk_count(session, note.id) == 1
+            NotesService.delete_note(session, "user", note.id)
+        scheduler.flush()
+
+        with session_factory() as session:
+            assert _chunk_count(session, note.id) == 0
+    finally:
+        scheduler.shutdown()
+        set_semantic_index_scheduler(None)
+
+
+def test_changes_are_not_tracked_when_indexing_is_disabled(session_factory):
+    scheduler = SemanticIndexScheduler(
+        delay_seconds=60, session_factory=session_factory
+    )
+    set_semantic_index_scheduler(scheduler)
+    try:
+        with session_factory() as session:
+            note = _add_note(session, "user", "Bread", "Placeholder")
+            NotesService.update_note(session, "user", note.id, PARAGRAPHS[0])
+        assert scheduler._pending == {}
+    finally:
+        set_semantic_index_scheduler(None)
+
+
+def test_semantic_provider_returns_live_sources(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "semantic_index_backend", "numpy")
+    embedder = HashingEmbedder()
+    set_embedder(embedder)
+    try:
+        hits = _search_provider(session_factory, embedder)
+    finally:
+        set_embedder(None)
+
+    assert [(hit.content_type, hit.title) for hit in hits] == [("note", "Bread notes")]
+    assert "sourdough" in hits[0].snippet
+
+
+def _search_provider(session_factory, embedder):
+    with session_factory() as session:
+        note = _add_note(session, "user", "Bread notes", PARAGRAPHS[0])
+        now = datetime.now(UTC)
+        website = Website(
+            user_id="user",
+            url="https://example.com/bread",
+            domain="example.com",
+            title="Bread site",
+            content=PARAGRAPHS[0],
+            metadata_={},
+            created_at=now,
+            updated_at=now,
+            deleted_at=now,
+        )
+        session.add(website)
+        session.commit()
+        SemanticIndexService.index_documents(
+            session,
+            "user",
+            [("note", note.id, note.content), ("website", website.id, PARAGRAPHS[0])],
+            embedder=embedder,
+        )
+        session.commit()
+
+        return SemanticSearchProvider().search(session, "user", "sourdough", limit=5)
@@ -0,0 +1,62 @@
+import os
+
+from api.services.skill_catalog_service import SkillCatalogService
+
+
+def _write_skill(root, skill_id, description):
+    skill_dir = root / skill_id
+    skill_dir.mkdir(exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {skill_id}\ndescription: {description}\n---\nBody\n",
+        encoding="utf-8",
+    )
+    return skill_dir / "SKILL.md"
+
+
+def _by_id(skills):
+    return {skill["id"]: skill for skill in skills}
+
+
+def test_list_skills_parses_catalog_once(tmp_path, monkeypatch):
+    _write_skill(tmp_path, "mcp-builder", "Build servers")
+    calls = []
+    original = SkillCatalogService._read_frontmatter
+
+    def counting_read(skill_md):
+        calls.append(skill_md)
+        return original(skill_md)
+
+    monkeypatch.setattr(
+        SkillCatalogService, "_read_frontmatter", staticmethod(counting_read)
+    )
+
+    first = SkillCatalogService.list_skills(tmp_path)
+    _by_id(first)["mcp-builder"]["name"] = "mutated"
+    second = SkillCatalogService.list_skills(tmp_path)
+
+    assert len(calls) == 1
+    assert _by_id(second)["mcp-builder"]["name"] == "MCP Builder"
+
+
+def test_list_skills_reloads_when_skills_change(tmp_path, monkeypatch):
+    skill_md = _write_skill(tmp_path, "skill-creator", "Old")
+    calls = []
+    original = SkillCatalogService._read_frontmatter
+
+    def counting_read(path):
+        calls.append(path.parent.name)
+        return original(path)
+
+    monkeypatch.setattr(
+        SkillCatalogService, "_read_frontmatter", staticmethod(counting_read)
+    )
+    SkillCatalogService.list_skills(tmp_path)
+
+    stat = skill_md.stat()
+    os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    SkillCatalogService.list_skills(tmp_path)
+    assert calls == ["skill-creator", "skill-creator"]
+
+    _write_skill(tmp_path, "mcp-builder", "Added")
+    skills = _by_id(SkillCatalogService.list_skills(tmp_path))
+    assert "mcp-builder" in skills
@@ -0,0 +1,114 @@
+import uuid
+from contextlib import contextmanager
+
+import pytest
+from api.db.base import Base
+from api.models.file_ingestion import IngestedFile
+from api.services import skill_file_ops_ingestion
+from api.services.file_ingestion_service import FileIngestionService
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def db_session(test_db_engine, monkeypatch):
+    connection = test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    )
+    schema = f"test_{uuid.uuid4().hex}"
+
+    connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    connection.execute(text(f'SET search_path TO "{schema}"'))
+    Base.metadata.create_all(bind=connection)
+
+    Session = sessionmaker(bind=connection)
+    session = Session()
+
+    @contextmanager
+    def fake_session_for_user(_user_id):
+        yield session
+
+    monkeypatch.setattr(
+        skill_file_ops_ingestion, "session_for_user", fake_session_for_user
+    )
+
+    try:
+        yield session
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
+def _ingest(db_session, path: str, user_id: str = "user-1") -> IngestedFile:
+    record, _job = FileIngestionService.create_ingestion(
+        db_session,
+        user_id,
+        filename_original=path.rsplit("/", 1)[-1],
+        path=path,
+        mime_original="text/plain",
+        size_bytes=1,
+    )
+    return record
+
+
+def _paths(db_session, user_id: str = "user-1") -> set[str]:
+    db_session.expire_all()
+    return {
+        row.path
+        for row in db_session.query(IngestedFile).filter(
+            IngestedFile.user_id == user_id
+        )
+    }
+
+
+def test_move_directory_rewrites_subtree(db_session):
+    _ingest(db_session, "docs/a.txt")
+    _ingest(db_session, "docs/nested/b.txt")
+    _ingest(db_session, "docs-old/c.txt")
+    _ingest(db_session, "docs/d.txt", user_id="user-2")
+
+    result = skill_file_ops_ingestion.move_path("user-1", "docs", "archive/docs")
+
+    assert result == {
+        "source": "docs",
+        "destination": "archive/docs",
+        "type": "directory",
+    }
+    assert _paths(db_session) == {
+        "archive/docs/a.txt",
+        "archive/docs/nested/b.txt",
+        "docs-old/c.txt",
+    }
+    assert _paths(db_session, "user-2") == {"docs/d.txt"}
+    names = {
+        row.filename_original
+        for row in db_session.query(IngestedFile).filter(
+            IngestedFile.path.like("archive/%")
+        )
+    }
+    assert names == {"a.txt", "b.txt"}
+
+
+def test_move_directory_treats_like_wildcards_literally(db_session):
+    _ingest(db_session, "100%/a.txt")
+    _ingest(db_session, "100x/b.txt")
+
+    skill_file_ops_ingestion.move_path("user-1", "100%", "done")
+
+    assert _paths(db_session) == {"done/a.txt", "100x/b.txt"}
+
+
+def test_move_directory_rejects_existing_destination(db_session):
+    _ingest(db_session, "docs/a.txt")
+    _ingest(db_session, "archive/x.txt")
+
+    with pytest.raises(FileExistsError):
+        skill_file_ops_ingestion.move_path("user-1", "docs", "archive")
+
+    assert _paths(db_session) == {"docs/a.txt", "archive/x.txt"}
+
+
+def test_move_directory_missing_source(db_session):
+    with pytest.raises(FileNotFoundError):
+        skill_file_ops_ingestion.move_path("user-1", "missing", "elsewhere")
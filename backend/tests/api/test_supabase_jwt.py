@@ -0,0 +1,152 @@
+"""Tests for JWT and PAT verification caches."""
+
+import json
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from api import auth, supabase_jwt
+from api.config import settings
+from api.services.settings_service import SettingsService
+from api.services.user_settings_service import UserSettingsService
+from api.supabase_jwt import SupabaseJWTValidator
+from cryptography.hazmat.primitives.asymmetric import ec
+
+SUPABASE_URL = "https://example.supabase.co"
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    supabase_jwt.clear_token_caches()
+    auth.invalidate_shortcuts_pat()
+    yield
+    supabase_jwt.clear_token_caches()
+    auth.invalidate_shortcuts_pat()
+
+
+@pytest.fixture
+def signing_key():
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = json.loads(jwt.algorithms.ECAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": "key-1", "alg": "ES256"})
+    supabase_jwt._jwks_cache = {"keys": [jwk]}
+    supabase_jwt._jwks_expires_at = time.time() + 3600
+    return private_key
+
+
+def _make_token(private_key, exp: float) -> str:
+    return jwt.encode(
+        {
+            "sub": "user-1",
+            "aud": settings.jwt_audience,
+            "iss": settings.jwt_issuer or f"{SUPABASE_URL}/auth/v1",
+            "exp": int(exp),
+        },
+        private_key,
+        algorithm="ES256",
+        headers={"kid": "key-1"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_token_reuses_key_and_claims(signing_key, monkeypatch):
+    calls = {"from_jwk": 0, "decode": 0}
+    original_from_jwk = jwt.algorithms.ECAlgorithm.from_jwk
+    original_decode = jwt.decode
+
+    def counting_from_jwk(data):
+        calls["from_jwk"] += 1
+        return original_from_jwk(data)
+
+    def counting_decode(*args, **kwargs):
+        calls["decode"] += 1
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(
+        jwt.algorithms.ECAlgorithm, "from_jwk", staticmethod(counting_from_jwk)
+    )
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    validator = SupabaseJWTValidator(SUPABASE_URL)
+
+    first = _make_token(signing_key, time.time() + 600)
+    second = _make_token(signing_key, time.time() + 601)
+    assert (await validator.validate_token(first))["sub"] == "user-1"
+    assert (await validator.validate_token(first))["sub"] == "user-1"
+    assert (await validator.validate_token(second))["sub"] == "user-1"
+
+    assert calls == {"from_jwk": 1, "decode": 2}
+
+
+@pytest.mark.asyncio
+async def test_cached_claims_expire_with_token(signing_key, monkeypatch):
+    validator = SupabaseJWTValidator(SUPABASE_URL)
+    token = _make_token(signing_key, time.time() + 600)
+    await validator.validate_token(token)
+    assert supabase_jwt._get_verified_claims(token) is not None
+
+    later = time.time() + 601
+    monkeypatch.setattr(supabase_jwt.time, "time", lambda: later)
+
+    assert supabase_jwt._get_verified_claims(token) is None
+    assert not supabase_jwt._verified_token_cache
+
+
+def test_verified_token_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(supabase_jwt, "VERIFIED_TOKEN_CACHE_MAX_ENTRIES", 2)
+    exp = time.time() + 600
+    for token in ("a", "b", "c"):
+        supabase_jwt._remember_verified_claims(token, {"sub": token, "exp": exp})
+
+    assert supabase_jwt._get_verified_claims("a") is None
+    assert supabase_jwt._get_verified_claims("c") == {"sub": "c", "exp": exp}
+
+
+class _FakeSession:
+    def __init__(self, owners: dict[str, str], counter: dict[str, int]):
+        self.owners = owners
+        self.counter = counter
+        self.token = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        if params and "token" in params:
+            self.token = params["token"]
+            return None
+        self.counter["lookups"] += 1
+        return SimpleNamespace(scalar_one_or_none=lambda: self.owners.get(self.token))
+
+
+def test_shortcuts_pat_lookup_is_cached_until_rotation(monkeypatch):
+    from api.db import session as db_session
+
+    owners = {"sb_pat_old": "user-1"}
+    counter = {"lookups": 0}
+    monkeypatch.setattr(
+        db_session, "SessionLocal", lambda: _FakeSession(owners, counter)
+    )
+
+    assert auth.resolve_shortcuts_pat("sb_pat_old") == "user-1"
+    assert auth.resolve_shortcuts_pat("sb_pat_old") == "user-1"
+    assert counter["lookups"] == 1
+
+    record = SimpleNamespace(shortcuts_pat="sb_pat_old")
+
+    def fake_upsert(db, user_id, **kwargs):
+        owners.pop(record.shortcuts_pat, None)
+        record.shortcuts_pat = kwargs["shortcuts_pat"]
+        owners[record.shortcuts_pat] = user_id
+        return record
+
+    monkeypatch.setattr(UserSettingsService, "get_settings", lambda db, uid: record)
+    monkeypatch.setattr(UserSettingsService, "upsert_settings", fake_upsert)
+    new_token = SettingsService.rotate_shortcuts_pat(None, "user-1")
+
+    assert auth.resolve_shortcuts_pat("sb_pat_old") is None
+    assert auth.resolve_shortcuts_pat(new_token) == "user-1"
+    assert counter["lookups"] == 3
@@ -4,8 +4,10 @@ from datetime import UTC, date, datetime, timedelta
 import pytest
 from api.db.base import Base
 from api.exceptions import TaskNotFoundError
+from api.models.task import Task
 from api.services.task_service import TaskService
 from api.services.task_sync_service import TaskSyncService
+from api.utils.search import build_tsquery
 from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
@@ -321,3 +323,97 @@ def test_sync_operations_conflict(db_session):
     db_session.refresh(task)
     assert task.title == "Original"
     assert result.conflicts
+
+
+def _explain(db_session, query) -> str:
+    compiled = query.statement.compile(
+        dialect=db_session.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    rows = db_session.connection().exec_driver_sql(
+        f"EXPLAIN {compiled}", compiled.params
+    )
+    return "\n".join(row[0] for row in rows)
+
+
+@pytest.fixture
+def task_history(db_session):
+    """A user with years of completed tasks and a handful of open ones."""
+    group = TaskService.create_task_group(db_session, "user", "Work")
+    project = TaskService.create_task_project(
+        db_session, "user", "Alpha", group_id=str(group.id)
+    )
+    db_session.commit()
+    db_session.execute(
+        text(
+            """
+            INSERT INTO tasks (id, user_id, title, status, deadline, completed_at,
+                               repeating, repeat_template, created_at, updated_at)
+            SELECT gen_random_uuid(), owner, 'Done ' || n, 'completed',
+                   current_date - n, now() - n * interval '1 day',
+                   false, false, now(), now()
+            FROM generate_series(1, 5000) AS n,
+                 unnest(ARRAY['user', 'other']) AS owner
+            """
+        )
+    )
+    for index in range(10):
+        TaskService.create_task(
+            db_session,
+            "user",
+            f"Open {index}",
+            deadline=date.today() + timedelta(days=index - 5),
+            project_id=str(project.id) if index % 2 else None,
+            group_id=None if index % 2 else str(group.id),
+        )
+    db_session.commit()
+    db_session.execute(text("ANALYZE tasks"))
+    return group, project
+
+
+@pytest.mark.parametrize("scope", ["today", "upcoming"])
+def test_open_scope_queries_use_partial_index(db_session, task_history, scope):
+    query = TaskService._scope_query(db_session, "user", scope, date.today())
+    plan = _explain(db_session, query)
+
+    assert "idx_tasks_open_user_" in plan
+    assert "Seq Scan on tasks" not in plan
+
+
+def test_inbox_scope_skips_completed_history(db_session, task_history):
+    query = TaskService._scope_query(db_session, "user", "inbox", date.today())
+
+    assert "Seq Scan on tasks" not in _explain(db_session, query)
+
+
+def test_completed_scope_uses_completed_index(db_session, task_history):
+    query = TaskService._scope_query(db_session, "user", "completed", date.today())
+    plan = _explain(db_session, query.limit(50))
+
+    assert "idx_tasks_completed_user_completed_at" in plan
+
+
+def test_group_query_avoids_correlated_subquery(db_session, task_history):
+    group, _project = task_history
+    query = TaskService._group_tasks_query(db_session, "user", str(group.id))
+    plan = _explain(db_session, query)
+
+    assert "EXISTS" not in str(query.statement)
+    assert "Seq Scan on tasks" not in plan
+    filters = [line for line in plan.splitlines() if "Filter:" in line]
+    assert all("hashed SubPlan" in line for line in filters if "SubPlan" in line)
+    titles = {task.title for task in query.all()}
+    assert titles == {f"Open {index}" for index in range(10)}
+
+
+def test_search_tasks_uses_search_vector_index(db_session, task_history):
+    results = TaskService.search_tasks(db_session, "user", "open")
+    assert len(results) == 10
+    assert TaskService.search_tasks(db_session, "user", "pen 3")[0].title == "Open 3"
+
+    db_session.execute(text("SET enable_seqscan = off"))
+    search_vector = Task.__table__.c.search_vector
+    query = db_session.query(Task.id).filter(
+        Task.user_id == "user", search_vector.op("@@")(build_tsquery("open"))
+    )
+    assert "idx_tasks_search_vector" in _explain(db_session, query)
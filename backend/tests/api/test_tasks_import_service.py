@@ -1,11 +1,11 @@
 import uuid
-from datetime import date
+from datetime import UTC, date, datetime
 
 from api.db.base import Base
 from api.models.task import Task
 from api.models.task_project import TaskProject
 from api.services.tasks_import_service import TasksImportService
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.orm import sessionmaker
 
 
@@ -77,3 +77,76 @@ def test_import_from_payload_filters_and_maps(test_db_engine):
         session.close()
         connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
         connection.close()
+
+
+def _task_payload(count, **overrides):
+    return {
+        "tasks": [
+            {
+                "id": f"t{index}",
+                "title": f"Task {index}",
+                "status": "inbox",
+                "updatedAt": "2026-01-01T00:00:00Z",
+                **overrides,
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def test_import_from_payload_batches_round_trips(test_db_engine):
+    session, connection, schema = _build_session(test_db_engine)
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _count)
+    try:
+        stats = TasksImportService.import_from_payload(
+            session, "user", _task_payload(1200, repeating=True)
+        )
+        session.commit()
+
+        assert stats.tasks_imported == 1200
+        # Three lookups, three task batches and one repeat_template_id update.
+        assert len(statements) <= 8
+        assert session.query(Task).count() == 1200
+        assert (
+            session.query(Task).filter(Task.repeat_template_id == Task.id).count()
+            == 1200
+        )
+    finally:
+        event.remove(connection, "before_cursor_execute", _count)
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
+def test_import_from_payload_updates_existing_and_skips_deleted(test_db_engine):
+    session, connection, schema = _build_session(test_db_engine)
+    try:
+        TasksImportService.import_from_payload(session, "user", _task_payload(3))
+        session.commit()
+        deleted = session.query(Task).filter(Task.source_id == "t2").one()
+        deleted.deleted_at = datetime.now(UTC)
+        original_ids = {task.source_id: task.id for task in session.query(Task)}
+        session.commit()
+
+        stats = TasksImportService.import_from_payload(
+            session, "user", _task_payload(4, title="Renamed")
+        )
+        session.commit()
+        session.expire_all()
+
+        assert stats.tasks_imported == 1
+        assert stats.tasks_skipped == 1
+        tasks = {task.source_id: task for task in session.query(Task)}
+        assert tasks["t0"].id == original_ids["t0"]
+        assert tasks["t0"].title == "Renamed"
+        assert tasks["t2"].title == "Task 2"
+        assert tasks["t3"].title == "Renamed"
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
@@ -239,3 +239,38 @@ def test_tasks_create_group_and_project(test_client, test_db):
     project_payload = project_response.json()
     assert project_payload["title"] == "Habits"
     assert project_payload["groupId"] == group_payload["id"]
+
+
+def test_tasks_list_conditional_get(test_client, test_db):
+    task = Task(
+        user_id=DEFAULT_USER_ID,
+        title="Conditional",
+        status="inbox",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+    test_db.add(task)
+    test_db.commit()
+
+    first = test_client.get("/api/v1/tasks/lists/inbox", headers=_auth_headers())
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    conditional = {**_auth_headers(), "If-None-Match": etag}
+
+    assert (
+        test_client.get("/api/v1/tasks/lists/inbox", headers=conditional).status_code
+        == 304
+    )
+    # Each list has its own ETag even when the same rows back it.
+    assert (
+        test_client.get("/api/v1/tasks/lists/upcoming", headers=conditional).status_code
+        == 200
+    )
+
+    task.title = "Conditional (edited)"
+    task.updated_at = datetime.now(UTC) + timedelta(seconds=1)
+    test_db.commit()
+
+    changed = test_client.get("/api/v1/tasks/lists/inbox", headers=conditional)
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
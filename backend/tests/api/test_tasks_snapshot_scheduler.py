@@ -0,0 +1,104 @@
+import uuid
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from api.db.base import Base
+from api.services.task_sync_service import TaskSyncService
+from api.services.tasks_snapshot_scheduler import (
+    TasksSnapshotScheduler,
+    set_tasks_snapshot_scheduler,
+)
+from api.services.user_settings_service import UserSettingsService
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session_factory(test_db_engine):
+    connection = test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    )
+    schema = f"test_{uuid.uuid4().hex}"
+
+    connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    connection.execute(text(f'SET search_path TO "{schema}"'))
+    Base.metadata.create_all(bind=connection)
+
+    try:
+        yield sessionmaker(bind=connection)
+    finally:
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
+@pytest.fixture
+def scheduler(session_factory):
+    clock = {"now": datetime.now(UTC)}
+    instance = TasksSnapshotScheduler(
+        delay_seconds=60,
+        session_factory=session_factory,
+        clock=lambda: clock["now"],
+    )
+    instance.clock = clock
+    set_tasks_snapshot_scheduler(instance)
+    try:
+        yield instance
+    finally:
+        instance.shutdown()
+        set_tasks_snapshot_scheduler(None)
+
+
+def _add(session, title: str) -> None:
+    TaskSyncService.apply_operations(
+        session,
+        "user",
+        [{"op": "add", "title": title, "due_date": date.today().isoformat()}],
+    )
+
+
+def test_task_mutations_schedule_one_debounced_rebuild(session_factory, scheduler):
+    with session_factory() as session:
+        for index in range(3):
+            _add(session, f"Task {index}")
+            session.commit()
+
+        assert list(scheduler._timers) == ["user"]
+        assert UserSettingsService.get_settings(session, "user") is None
+
+    scheduler.flush()
+
+    assert scheduler._timers == {}
+    with session_factory() as session:
+        snapshot = UserSettingsService.get_settings(session, "user").tasks_ai_snapshot
+    assert all(f"Task {index}" in snapshot for index in range(3))
+
+
+def test_rolled_back_mutations_do_not_schedule(session_factory, scheduler):
+    with session_factory() as session:
+        _add(session, "Discarded")
+        session.rollback()
+        session.commit()
+
+    assert scheduler._timers == {}
+
+
+def test_unchanged_snapshot_is_not_rewritten(session_factory, scheduler):
+    with session_factory() as session:
+        _add(session, "Stable")
+        session.commit()
+
+    assert scheduler.refresh("user") is True
+    assert scheduler.refresh("user") is False
+
+
+def test_schedule_if_stale_refreshes_once_per_day(session_factory, scheduler):
+    scheduler.schedule_if_stale("user")
+    assert list(scheduler._timers) == ["user"]
+    scheduler.flush()
+
+    scheduler.schedule_if_stale("user")
+    assert scheduler._timers == {}
+
+    scheduler.clock["now"] += timedelta(days=1)
+    scheduler.schedule_if_stale("user")
+    assert list(scheduler._timers) == ["user"]
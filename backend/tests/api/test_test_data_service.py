@@ -6,6 +6,7 @@ from api.db.base import Base
 from api.models.conversation import Conversation
 from api.models.task import Task
 from api.models.user_memory import UserMemory
+from api.services.file_ingestion_service import FileIngestionService
 from api.services.notes_service import NotesService
 from api.services.test_data_service import TestDataService
 from api.services.websites_service import WebsitesService
@@ -80,7 +81,7 @@ def test_seed_and_delete_round_trip(db_session):
 
     tasks = (
         db_session.query(Task)
-        .filter(Task.user_id == user_id, Task.source_id == plan.seed_tag)
+        .filter(Task.user_id == user_id, Task.source_id.startswith(f"{plan.seed_tag}:"))
         .all()
     )
     assert tasks
@@ -112,9 +113,43 @@ def test_seed_and_delete_round_trip(db_session):
         db_session.query(Task)
         .filter(
             Task.user_id == user_id,
-            Task.source_id == plan.seed_tag,
+            Task.source_id.startswith(f"{plan.seed_tag}:"),
             Task.deleted_at.is_(None),
         )
         .all()
     )
     assert not tasks_after
+
+
+def test_scaled_seed_plan_adds_generated_content():
+    plan = TestDataService.build_seed_plan("seed:test-data", scale=12)
+    base = TestDataService.build_seed_plan("seed:test-data")
+
+    assert len(plan.notes) == len(base.notes) + 12
+    assert len(plan.websites) == len(base.websites) + 12
+    assert len(plan.tasks) == len(base.tasks) + 12
+    assert len(plan.files) == 12
+    assert not base.files
+    assert len({website.url for website in plan.websites}) == len(plan.websites)
+    assert all(site.title.startswith(plan.title_prefix) for site in plan.websites)
+
+
+def test_scaled_seed_can_be_deleted_and_reseeded(db_session):
+    user_id = "test_user"
+    plan = TestDataService.build_seed_plan("seed:test-data", scale=4)
+
+    seeded = TestDataService.seed_user_data(db_session, user_id, plan)
+    assert seeded.files == 4
+    files = FileIngestionService.list_ingestions(db_session, user_id)
+    assert len(files) == 4
+    job = FileIngestionService.get_job(db_session, files[0].id)
+    assert job.status == "ready"
+    assert FileIngestionService.get_derivative(db_session, files[0].id, "ai_md")
+
+    deleted = TestDataService.delete_seed_data(db_session, user_id, plan)
+    assert deleted.files == 4
+    assert deleted.tasks == seeded.tasks
+    assert FileIngestionService.list_ingestions(db_session, user_id) == []
+
+    reseeded = TestDataService.seed_user_data(db_session, user_id, plan)
+    assert reseeded.tasks == seeded.tasks
@@ -153,3 +153,32 @@ async def test_execute_tool_requires_user_id():
     result = await mapper.execute_tool("Read File", {})
     assert result["success"] is False
     assert "requires user_id" in result["error"]
+
+
+def test_tool_mapper_shares_process_executor():
+    assert ToolMapper().executor is ToolMapper().executor
+
+
+def test_get_claude_tools_reuses_schema_per_skill_set():
+    mapper = _build_mapper(
+        {
+            "Write File": {
+                "description": "write file",
+                "input_schema": {},
+                "skill": "fs",
+            },
+            "Save Website": {
+                "description": "save",
+                "input_schema": {},
+                "skill": "web-save",
+            },
+        }
+    )
+
+    first = mapper.get_claude_tools(["fs"])
+    first.append({"name": "mutated"})
+    second = mapper.get_claude_tools(["fs"])
+
+    assert [tool["name"] for tool in second] == ["Write_File"]
+    assert second[0] is first[0]
+    assert len(mapper.get_claude_tools(None)) == 2
@@ -0,0 +1,248 @@
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+import pytest
+from api.db.base import Base
+from api.exceptions import BadRequestError
+from api.models.conversation import Conversation
+from api.models.note import Note
+from api.models.user_memory import UserMemory
+from api.models.website import Website
+from api.services.universal_search_service import (
+    SearchHit,
+    SearchProvider,
+    UniversalSearchService,
+    normalize_scores,
+)
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session_factory(test_db_engine):
+    schema = f"test_{uuid.uuid4().hex}"
+    # Providers run in parallel threads, so they need a pool of their own
+    # connections, all pinned to this schema.
+    engine = create_engine(
+        test_db_engine.url, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+        Base.metadata.create_all(bind=connection)
+
+    session_maker = sessionmaker(bind=engine)
+
+    @contextmanager
+    def factory(_user_id: str):
+        with session_maker() as session:
+            yield session
+
+    try:
+        yield factory
+    finally:
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        engine.dispose()
+
+
+def _seed(session_factory) -> None:
+    now = datetime.now(UTC)
+    with session_factory("user") as db:
+        db.add_all(
+            [
+                Note(
+                    user_id="user",
+                    title="Sourdough starter",
+                    content="Feed the sourdough starter daily. Sourdough loves flour.",
+                    metadata_={"folder": "Kitchen"},
+                    created_at=now,
+                    updated_at=now,
+                ),
+                Note(
+                    user_id="user",
+                    title="Groceries",
+                    content="Flour, eggs and a little sourdough discard",
+                    metadata_={},
+                    created_at=now,
+                    updated_at=now,
+                ),
+                Website(
+                    user_id="user",
+                    url="https://example.com/bread",
+                    domain="example.com",
+                    title="Sourdough basics",
+                    content="A guide to sourdough bread.",
+                    metadata_={},
+                    created_at=now,
+                    updated_at=now,
+                ),
+                Conversation(
+                    user_id="user",
+                    title="Baking plans",
+                    first_message="How do I keep a sourdough starter alive?",
+                    messages=[],
+                    created_at=now,
+                    updated_at=now,
+                ),
+                UserMemory(
+                    user_id="user",
+                    path="/memories/hobbies.md",
+                    content="Bakes sourdough on weekends.",
+                    created_at=now,
+                    updated_at=now,
+                ),
+                Note(
+                    user_id="other",
+                    title="Sourdough secrets",
+                    content="Not yours",
+                    metadata_={},
+                    created_at=now,
+                    updated_at=now,
+                ),
+            ]
+        )
+        db.commit()
+
+
+class _StubProvider(SearchProvider):
+    def __init__(self, content_type, *, delay=0.0, error=None, scores=(1.0,)):
+        self.content_type = content_type
+        self.delay = delay
+        self.error = error
+        self.scores = scores
+
+    def search(self, db, user_id, query, *, limit):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return [
+            SearchHit(
+                id=f"{self.content_type}-{index}",
+                content_type=self.content_type,
+                title=query,
+                snippet=None,
+                score=score,
+                updated_at=None,
+            )
+            for index, score in enumerate(self.scores)
+        ]
+
+
+@contextmanager
+def _no_session(_user_id):
+    class _Session:
+        def execute(self, *_args, **_kwargs):
+            return None
+
+    yield _Session()
+
+
+@pytest.mark.asyncio
+async def test_search_merges_all_providers(session_factory):
+    _seed(session_factory)
+    service = UniversalSearchService(session_factory=session_factory)
+
+    result = await service.search("user", "sourdough")
+
+    assert {item["contentType"] for item in result["items"]} == {
+        "note",
+        "website",
+        "conversation",
+        "memory",
+    }
+    assert all(0.0 < item["score"] <= 1.0 for item in result["items"])
+    assert result["items"] == sorted(
+        result["items"], key=lambda item: item["score"], reverse=True
+    )
+    assert "Sourdough secrets" not in {item["title"] for item in result["items"]}
+    notes = [item for item in result["items"] if item["contentType"] == "note"]
+    assert notes[0]["title"] == "Sourdough starter"
+    assert notes[0]["metadata"]["folder"] == "Kitchen"
+    assert "<mark>" in notes[0]["snippet"]
+    providers = {entry["contentType"]: entry for entry in result["providers"]}
+    assert set(providers) == {"note", "website", "file", "conversation", "memory"}
+    assert all(entry["status"] == "ok" for entry in providers.values())
+    assert providers["file"]["count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_search_filters_content_types(session_factory):
+    _seed(session_factory)
+    service = UniversalSearchService(session_factory=session_factory)
+
+    result = await service.search("user", "sourdough", content_types=["memory"])
+
+    assert [item["contentType"] for item in result["items"]] == ["memory"]
+    assert "weekends" in result["items"][0]["snippet"]
+
+
+@pytest.mark.asyncio
+async def test_slow_provider_is_reported_as_timeout():
+    service = UniversalSearchService(
+        [_StubProvider("note"), _StubProvider("file", delay=1.0)],
+        deadline_seconds=0.2,
+        session_factory=_no_session,
+    )
+
+    started = time.perf_counter()
+    result = await service.search("user", "query")
+
+    assert time.perf_counter() - started < 0.8
+    statuses = {entry["contentType"]: entry["status"] for entry in result["providers"]}
+    assert statuses == {"note": "ok", "file": "timeout"}
+    assert [item["id"] for item in result["items"]] == ["note-0"]
+
+
+@pytest.mark.asyncio
+async def test_failing_provider_does_not_fail_search():
+    service = UniversalSearchService(
+        [_StubProvider("note"), _StubProvider("memory", error=RuntimeError("boom"))],
+        session_factory=_no_session,
+    )
+
+    result = await service.search("user", "query")
+
+    statuses = {entry["contentType"]: entry["status"] for entry in result["providers"]}
+    assert statuses == {"note": "ok", "memory": "error"}
+    assert len(result["items"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_providers_as_they_finish():
+    service = UniversalSearchService(
+        [_StubProvider("note", delay=0.2), _StubProvider("memory")],
+        session_factory=_no_session,
+    )
+
+    events = [event async for event in service.stream("user", "query")]
+
+    assert [event["type"] for event in events] == ["provider", "provider", "complete"]
+    assert events[0]["provider"]["contentType"] == "memory"
+    assert len(events[-1]["items"]) == 2
+
+
+def test_stream_validates_before_running():
+    service = UniversalSearchService(
+        [_StubProvider("note")], session_factory=_no_session
+    )
+
+    with pytest.raises(BadRequestError):
+        service.stream("user", "   ")
+    with pytest.raises(BadRequestError):
+        service.stream("user", "query", content_types=["calendar"])
+
+
+def test_normalize_scores_scales_to_best_or_uses_rank():
+    ranked = normalize_scores(
+        _StubProvider("note", scores=(0.4, 0.1, 0.0)).search(None, "u", "q", limit=3)
+    )
+    unranked = normalize_scores(
+        _StubProvider("file", scores=(0.0, 0.0)).search(None, "u", "q", limit=2)
+    )
+
+    assert [hit.score for hit in ranked] == [1.0, 0.25, 0.0]
+    assert [hit.score for hit in unranked] == [1.0, 0.5]
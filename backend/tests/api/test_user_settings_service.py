@@ -0,0 +1,60 @@
+import uuid
+
+import pytest
+from api.db.base import Base
+from api.services.user_settings_service import UserSettingsService
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def db_session(test_db_engine):
+    connection = test_db_engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    )
+    schema = f"test_{uuid.uuid4().hex}"
+
+    connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    connection.execute(text(f'SET search_path TO "{schema}"'))
+    Base.metadata.create_all(bind=connection)
+
+    Session = sessionmaker(bind=connection)
+    session = Session()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        connection.close()
+
+
+def test_get_settings_memoizes_per_session(db_session):
+    UserSettingsService.upsert_settings(db_session, "user-memo", name="Sam")
+    db_session.info.pop(UserSettingsService.SESSION_CACHE_KEY, None)
+
+    statements = []
+
+    def count(_conn, _cursor, statement, *_args):
+        if "FROM user_settings" in statement:
+            statements.append(statement)
+
+    connection = db_session.get_bind()
+    event.listen(connection, "before_cursor_execute", count)
+    try:
+        first = UserSettingsService.get_settings(db_session, "user-memo")
+        second = UserSettingsService.get_settings(db_session, "user-memo")
+    finally:
+        event.remove(connection, "before_cursor_execute", count)
+
+    assert first is second
+    assert first.name == "Sam"
+    assert len(statements) == 1
+
+
+def test_upsert_settings_refreshes_memo(db_session):
+    assert UserSettingsService.get_settings(db_session, "user-new") is None
+
+    created = UserSettingsService.upsert_settings(db_session, "user-new", name="Ada")
+
+    assert UserSettingsService.get_settings(db_session, "user-new") is created
@@ -1,21 +1,56 @@
+import asyncio
 import time
 
 import pytest
 from api.config import settings
 from api.exceptions import ExternalServiceError
 from api.routers import weather as weather_router
+from api.services.upstream_http import close_upstream_http_client
+
+from tests.helpers import StubUpstream
+
+FORECAST = {
+    "current": {
+        "temperature_2m": 12.5,
+        "apparent_temperature": 11.0,
+        "weather_code": 3,
+        "is_day": 1,
+        "wind_speed_10m": 9.0,
+        "wind_direction_10m": 180,
+        "precipitation": 0.0,
+        "cloud_cover": 75,
+    },
+    "daily": {
+        "weather_code": [3, 61, 2],
+        "temperature_2m_max": [14, 13, 15],
+        "temperature_2m_min": [7, 8, 6],
+        "precipitation_probability_max": [10, 80, 5],
+    },
+}
 
 
 def _auth_headers() -> dict[str, str]:
     return {"Authorization": f"Bearer {settings.bearer_token}"}
 
 
+@pytest.fixture(autouse=True)
+def _clear_weather_cache():
+    weather_router._weather_cache.clear()
+    yield
+    weather_router._weather_cache.clear()
+
+
+@pytest.fixture
+def open_meteo(monkeypatch):
+    stub = StubUpstream({"/v1/forecast": FORECAST}, delay=0.05)
+    monkeypatch.setattr(weather_router, "OPEN_METEO_BASE_URL", stub.base_url)
+    yield stub
+    stub.close()
+
+
 def test_weather_uses_cache(test_client):
     payload = {"temperature_c": 10, "fetched_at": time.time()}
-    weather_router._weather_cache["1.0:2.0"] = {
-        "fetched_at": time.time(),
-        "payload": payload,
-    }
+    weather_router._weather_cache.set("1.0:2.0", payload)
 
     response = test_client.get(
         "/api/weather", params={"lat": 1.0, "lon": 2.0}, headers=_auth_headers()
@@ -24,23 +59,42 @@ def test_weather_uses_cache(test_client):
     assert response.json()["temperature_c"] == 10
 
 
-def test_weather_handles_invalid_json(monkeypatch):
-    class FakeResponse:
-        def __init__(self, payload: bytes):
-            self._payload = payload
+@pytest.mark.asyncio
+async def test_weather_coalesces_concurrent_misses(open_meteo):
+    try:
+        results = await asyncio.gather(
+            *(weather_router._get_cached_weather(51.501, -0.12) for _ in range(5)),
+            weather_router._get_cached_weather(51.5012, -0.1204),
+        )
+    finally:
+        await close_upstream_http_client()
+
+    assert len(open_meteo.requests) == 1
+    assert all(result is results[0] for result in results)
+    assert results[0]["temperature_c"] == 12.5
+    assert results[0]["daily"][1]["precipitation_probability_max"] == 80
 
-        def read(self):
-            return self._payload
 
-        def __enter__(self):
-            return self
+@pytest.mark.asyncio
+async def test_weather_failures_are_not_cached(open_meteo):
+    open_meteo.routes["/v1/forecast"] = {"current": {}}
+    try:
+        with pytest.raises(ExternalServiceError):
+            await weather_router._get_cached_weather(1.0, 2.0)
+        open_meteo.routes["/v1/forecast"] = FORECAST
+        result = await weather_router._get_cached_weather(1.0, 2.0)
+    finally:
+        await close_upstream_http_client()
 
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    assert result["temperature_c"] == 12.5
+    assert len(open_meteo.requests) == 2
 
-    def fake_urlopen(*_args, **_kwargs):
-        return FakeResponse(b"{invalid")
 
-    monkeypatch.setattr(weather_router, "urlopen", fake_urlopen)
-    with pytest.raises(ExternalServiceError):
-        weather_router._fetch_weather(1.0, 2.0)
+@pytest.mark.asyncio
+async def test_weather_handles_invalid_json(open_meteo):
+    open_meteo.routes["/v1/forecast"] = b"{invalid"
+    try:
+        with pytest.raises(ExternalServiceError):
+            await weather_router._fetch_weather(1.0, 2.0)
+    finally:
+        await close_upstream_http_client()
@@ -209,3 +209,28 @@ def test_website_summary_does_not_lazy_load_deferred_content(test_db):
     assert summary["reading_time"] is None
     assert inspect(listed).attrs.content.loaded_value is NO_VALUE
     assert inspect(listed).attrs.reading_time.loaded_value is NO_VALUE
+
+
+def test_websites_list_conditional_get(test_client, test_db):
+    first = test_client.get("/api/websites", headers=_auth_headers())
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    conditional = {**_auth_headers(), "If-None-Match": f'"other", {etag}'}
+    cached = test_client.get("/api/websites", headers=conditional)
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    test_db.add(
+        Website(
+            user_id=DEFAULT_USER_ID,
+            url="https://etag.example.com",
+            url_full="https://etag.example.com",
+            domain="etag.example.com",
+            title="ETag",
+            content="Body",
+        )
+    )
+    test_db.commit()
+    assert test_client.get("/api/websites", headers=conditional).status_code == 200
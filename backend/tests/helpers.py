@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
 
 def error_message(response: Any) -> str:
@@ -11,3 +16,52 @@ def error_message(response: Any) -> str:
     if isinstance(payload, dict):
         return payload.get("message", "")
     return payload or ""
+
+
+class StubUpstream:
+    """Local HTTP server standing in for a third-party JSON API.
+
+    Routes map a path to a response body (dict, str or bytes). Every request
+    is recorded as (path, query) in ``requests``. An optional ``delay`` slows
+    responses so tests can overlap concurrent callers.
+    """
+
+    def __init__(self, routes: dict[str, Any], delay: float = 0.0) -> None:
+        """Start the server on an ephemeral localhost port."""
+        self.routes = routes
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                parts = urlsplit(self.path)
+                stub.requests.append((parts.path, parse_qs(parts.query)))
+                if delay:
+                    time.sleep(delay)
+                body = stub.routes.get(parts.path)
+                if body is None:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if isinstance(body, dict):
+                    body = json.dumps(body)
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def close(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,103 @@
+"""Tests for scripts/benchmarks/api_load.py (API load harness)."""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from anthropic import AsyncAnthropic
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmarks.api_load import compare_queries, parse_mix, run_load  # noqa: E402
+from scripts.benchmarks.api_load_upstreams import (  # noqa: E402
+    StubUpstreams,
+    upstream_environment,
+)
+
+
+def test_stub_upstreams_speak_the_anthropic_protocol():
+    upstreams = StubUpstreams(first_token_ms=1, token_ms=0).start()
+
+    async def stream() -> str:
+        client = AsyncAnthropic(api_key="stub", base_url=upstreams.base_url)
+        async with client.messages.stream(
+            model="stub",
+            max_tokens=64,
+            messages=[{"role": "user", "content": "hi"}],
+        ) as response:
+            message = await response.get_final_message()
+        return message.content[0].text
+
+    try:
+        text = asyncio.run(stream())
+    finally:
+        upstreams.stop()
+
+    assert text.startswith("Here is a short answer")
+    assert upstreams.requests["/v1/messages"] == 1
+
+
+def test_parse_mix_rejects_unknown_routes():
+    assert parse_mix("notes_tree=3,events=0") == {"notes_tree": 3}
+    with pytest.raises(argparse.ArgumentTypeError, match="Unknown route"):
+        parse_mix("websites=1")
+
+
+def test_run_load_reports_latency_and_queries_per_route(test_db, monkeypatch):
+    from api.config import settings
+    from api.db.session import engine
+    from api.main import app
+    from api.services.claude_client import ClaudeClient
+    from api.services.test_data_service import TestDataService
+
+    # Seeding commits many times; keep every transaction on the public schema
+    # the app's own sessions use under TESTING.
+    test_db.info["force_public_search_path"] = True
+    plan = TestDataService.build_seed_plan("seed:load-test", scale=5)
+    TestDataService.seed_user_data(test_db, settings.default_user_id, plan)
+
+    upstreams = StubUpstreams(first_token_ms=1, token_ms=0).start()
+    for name, value in upstream_environment(upstreams).items():
+        monkeypatch.setenv(name, value)
+    # The app lifespan only runs once per process, so build its client here.
+    claude_client = ClaudeClient(settings)
+    monkeypatch.setattr(app.state, "claude_client", claude_client, raising=False)
+    try:
+        results = run_load(
+            app,
+            engine,
+            concurrency=2,
+            duration=2.0,
+            warmup=0.0,
+            sse_hold=0.2,
+            think_ms=0.0,
+            lifespan="off",
+        )
+    finally:
+        asyncio.run(claude_client.aclose())
+        upstreams.stop()
+
+    cases = results["cases"]
+    assert results["benchmark"] == "api_load"
+    assert set(cases) <= {
+        "notes_tree",
+        "tasks_sync",
+        "ingestion_list",
+        "chat_stream",
+        "events",
+    }
+    assert {"notes_tree", "ingestion_list"} <= set(cases)
+    for case in cases.values():
+        assert case["errors"] == 0
+        assert case["latency_ms"]["p99"] >= case["latency_ms"]["p50"] > 0
+        assert case["db_queries"]["mean"] > 0
+    # One job and one derivatives query per listed file on top of the list.
+    assert cases["ingestion_list"]["db_queries"]["p50"] >= 10
+    if "chat_stream" in cases:
+        assert cases["chat_stream"]["first_token_ms"]["p50"] > 0
+
+    regressed = {"cases": {"ingestion_list": {"db_queries": {"mean": 1.0}}}}
+    assert compare_queries(regressed, results)
@@ -0,0 +1,71 @@
+"""Tests for scripts/benchmarks (ingestion benchmark and shared harness)."""
+
+import json
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmarks.harness import compare_results, write_results  # noqa: E402
+from scripts.benchmarks.ingestion import main, run_case  # noqa: E402
+from scripts.benchmarks.ingestion_corpus import generate_corpus  # noqa: E402
+
+
+def test_corpus_is_deterministic(tmp_path):
+    first = generate_corpus(tmp_path / "a", names=["pdf_table_heavy", "csv_large"])
+    second = generate_corpus(tmp_path / "b", names=["pdf_table_heavy", "csv_large"])
+
+    assert [item.name for item in first] == ["pdf_table_heavy", "csv_large"]
+    for left, right in zip(first, second, strict=True):
+        assert left.path.read_bytes() == right.path.read_bytes()
+
+
+def test_run_case_measures_pipeline_stages(tmp_path):
+    (pdf,) = generate_corpus(tmp_path, names=["pdf_table_heavy"])
+
+    result = run_case(pdf)
+
+    assert set(result["stages"]) >= {"extract", "ai_md", "store"}
+    extract = result["stages"]["extract"]
+    assert extract["wall_ms"] > 0
+    assert extract["output_bytes"] > 0
+    assert result["stages"]["store"]["output_bytes"] >= pdf.path.stat().st_size
+
+
+def test_main_writes_results_and_flags_regressions(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--output", str(output), "--repeat", "1"]
+    args += ["--corpus-dir", str(tmp_path / "corpus"), "--case", "xlsx_merged"]
+
+    assert main(args) == 0
+    results = json.loads(output.read_text())
+    assert results["benchmark"] == "ingestion"
+    assert results["options"] == {"repeat": 1, "scale": 1, "seed": 1234}
+    assert set(results["cases"]["xlsx_merged"]["stages"]) == {
+        "extract",
+        "ai_md",
+        "store",
+    }
+
+    # A baseline ten times faster than this run must fail the comparison.
+    baseline = json.loads(output.read_text())
+    for stage in baseline["cases"]["xlsx_merged"]["stages"].values():
+        stage["wall_ms"]["median"] /= 10
+    write_results(tmp_path / "baseline.json", baseline)
+
+    assert main(args + ["--compare", str(tmp_path / "baseline.json")]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_compare_results_ignores_small_absolute_changes():
+    def document(median):
+        stage = {"wall_ms": {"median": median}}
+        return {"cases": {"case": {"stages": {"extract": stage}}}}
+
+    rows = compare_results(document(0.1), document(0.3), threshold=0.2)
+    assert rows[0]["change"] == 2.0
+    assert not rows[0]["regression"]
+
+    rows = compare_results(document(100), document(130), threshold=0.2)
+    assert rows[0]["regression"]
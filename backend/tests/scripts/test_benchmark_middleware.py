@@ -0,0 +1,20 @@
+"""Tests for scripts/benchmarks/middleware.py (middleware overhead)."""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.benchmarks.middleware import STACKS, run_benchmark  # noqa: E402
+
+
+def test_run_benchmark_measures_every_stack_per_case():
+    results = run_benchmark(requests=20, repeat=2, warmup=5)
+
+    assert results["benchmark"] == "middleware"
+    assert set(results["cases"]) == {"json", "stream"}
+    for case in results["cases"].values():
+        assert set(case["stages"]) == set(STACKS)
+        assert all(stage["wall_ms"]["median"] > 0 for stage in case["stages"].values())
+        assert set(case["overhead_us"]) == {"base_http", "asgi"}
@@ -0,0 +1,64 @@
+"""Tests for scripts/benchmarks/web_save.py (replayed web-save benchmark)."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import requests
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.services import web_save_parser  # noqa: E402
+from scripts.benchmarks.web_save import main, run_benchmark  # noqa: E402
+from scripts.benchmarks.web_save_replay import (  # noqa: E402
+    CORPUS_DIR,
+    build_routes,
+    load_manifest,
+    replay_proxy,
+)
+
+
+def test_corpus_matches_expected_outputs():
+    results, diffs = run_benchmark(repeat=1, warmup=0)
+
+    assert diffs == {}
+    assert set(results["cases"]) == {entry.name for entry in load_manifest()}
+    substack = results["cases"]["substack_post"]
+    assert substack["requests_per_parse"] == 2
+    assert substack["parse_counts"]["lxml"] > 0
+    assert set(substack["stages"]) >= {"total", "fetch", "readability", "markdown"}
+    assert results["phases"]["total"]["median"] > 0
+
+
+def test_instrumentation_is_removed_after_run():
+    original = web_save_parser.fetch_html
+
+    run_benchmark(repeat=1, warmup=0, cases=["paywalled_nytimes"])
+
+    assert web_save_parser.fetch_html is original
+
+
+def test_changed_output_fails_with_diff(tmp_path, capsys):
+    corpus_dir = tmp_path / "corpus"
+    shutil.copytree(CORPUS_DIR, corpus_dir)
+    expected = corpus_dir / "expected" / "wired_story.md"
+    expected.write_text(expected.read_text().replace("Solar", "Wind", 1))
+
+    exit_code = main(
+        ["--corpus-dir", str(corpus_dir), "--case", "wired_story", "--repeat", "1"]
+    )
+
+    assert exit_code == 1
+    assert "+# title: Solar" in capsys.readouterr().out
+
+
+def test_replay_proxy_serves_only_recorded_urls():
+    snapshots = load_manifest()
+    with replay_proxy(build_routes(snapshots)) as server:
+        recorded = requests.get(snapshots[0].replay_url, timeout=5)
+        missing = requests.get("http://unrecorded.example.com/", timeout=5)
+
+    assert recorded.status_code == 200
+    assert missing.status_code == 404
+    assert len(server.requests) == 2
@@ -0,0 +1,146 @@
+"""Tests for skills/subdomain-discover/scripts/discover_subdomains.py
+
+Runs the DNS bruteforce against a local stub DNS server.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import dns.message
+import dns.rcode
+import dns.rrset
+import pytest
+
+
+def _load_module():
+    script_path = (
+        Path(__file__).resolve().parents[3]
+        / "skills"
+        / "subdomain-discover"
+        / "scripts"
+        / "discover_subdomains.py"
+    )
+    spec = importlib.util.spec_from_file_location("discover_subdomains", script_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class StubDNSServer(asyncio.DatagramProtocol):
+    """Answers A queries from a static table, NXDOMAIN otherwise."""
+
+    def __init__(self, records, wildcard_ip=None, delay=0.0):
+        self.records = records
+        self.wildcard_ip = wildcard_ip
+        self.delay = delay
+        self.transport = None
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        asyncio.get_running_loop().create_task(self._respond(data, addr))
+
+    async def _respond(self, data, addr):
+        request = dns.message.from_wire(data)
+        question = request.question[0]
+        name = question.name.to_text().rstrip(".")
+        self.queries.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            response = dns.message.make_response(request)
+            ip = self.records.get(name, self.wildcard_ip)
+            if ip:
+                response.answer.append(
+                    dns.rrset.from_text(question.name, 60, "IN", "A", ip)
+                )
+            else:
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            self.transport.sendto(response.to_wire(), addr)
+        finally:
+            self.in_flight -= 1
+
+
+async def _start_stub(**kwargs):
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        lambda: StubDNSServer(**kwargs), local_addr=("127.0.0.1", 0)
+    )
+    return transport, protocol, transport.get_extra_info("sockname")[1]
+
+
+def _scanner(module, port, **kwargs):
+    return module.SubdomainScanner(
+        "example.test",
+        dns_timeout=2.0,
+        nameservers=["127.0.0.1"],
+        dns_port=port,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dns_bruteforce_finds_records_concurrently():
+    module = _load_module()
+    records = {
+        "www.example.test": "192.0.2.1",
+        "api.example.test": "192.0.2.2",
+    }
+    transport, stub, port = await _start_stub(records=records, delay=0.05)
+    try:
+        scanner = _scanner(module, port, dns_concurrency=10, dns_rate=0)
+        wordlist = ["www", "api"] + [f"missing{i}" for i in range(40)]
+        found = await scanner.scan_dns_bruteforce(wordlist)
+    finally:
+        transport.close()
+
+    assert found == {"www.example.test", "api.example.test"}
+    assert 1 < stub.max_in_flight <= 10
+
+
+@pytest.mark.asyncio
+async def test_dns_bruteforce_respects_concurrency_limit():
+    module = _load_module()
+    transport, stub, port = await _start_stub(records={}, delay=0.02)
+    try:
+        scanner = _scanner(module, port, dns_concurrency=1, dns_rate=0)
+        await scanner.scan_dns_bruteforce([f"name{i}" for i in range(5)])
+    finally:
+        transport.close()
+
+    assert stub.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_dns_bruteforce_filters_wildcard_answers():
+    module = _load_module()
+    records = {"shop.example.test": "192.0.2.10"}
+    transport, stub, port = await _start_stub(
+        records=records, wildcard_ip="192.0.2.99"
+    )
+    try:
+        scanner = _scanner(module, port, dns_rate=0)
+        found = await scanner.scan_dns_bruteforce(["www", "shop", "anything"])
+    finally:
+        transport.close()
+
+    assert scanner.wildcard_ips == {"192.0.2.99"}
+    assert found == {"shop.example.test"}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_calls():
+    module = _load_module()
+    limiter = module.RateLimiter(50.0)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*(limiter.wait() for _ in range(5)))
+    assert loop.time() - start >= 0.07
@@ -0,0 +1,139 @@
+"""Tests for skills/web-crawler-policy/scripts/analyze_policies.py
+
+Exercises the cached, concurrency-limited policy fetcher against a local
+aiohttp server.
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+ROBOTS_BODY = "User-agent: *\nDisallow: /private\n"
+LLMS_BODY = "# Example\n\n> Site summary\n\n## Docs\n\n- [Guide](https://example.com/guide)\n"
+
+
+def _analyzer(module, **kwargs):
+    analyzer = module.RobotsAnalyzer(timeout=2.0, **kwargs)
+    # www/non-www consolidation strips ports, which the local server needs
+    analyzer._consolidate_after_analysis = lambda data: data
+    return analyzer
+
+
+def _load_module():
+    script_path = (
+        Path(__file__).resolve().parents[3]
+        / "skills"
+        / "web-crawler-policy"
+        / "scripts"
+        / "analyze_policies.py"
+    )
+    spec = importlib.util.spec_from_file_location("analyze_policies", script_path)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class PolicyServer:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        self.requests.append((request.path, request.headers.get("If-None-Match")))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            bodies = {"/robots.txt": (ROBOTS_BODY, '"r1"'), "/llms.txt": (LLMS_BODY, '"l1"')}
+            if request.path not in bodies:
+                return web.Response(status=404)
+            body, etag = bodies[request.path]
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.Response(text=body, headers={"ETag": etag})
+        finally:
+            self.in_flight -= 1
+
+
+async def _start(server):
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_fetch_uses_conditional_get_on_rerun(tmp_path):
+    module = _load_module()
+    server = PolicyServer()
+    runner, host = await _start(server)
+    try:
+        cache = module.PolicyFetchCache(tmp_path, ttl=0)
+        analyzer = _analyzer(module, cache=cache)
+        first = await analyzer.analyze_all_domains({host})
+        assert first[host]["robots_found"] is True
+        assert first[host]["llms_found"] is True
+        assert cache.misses == 2
+
+        server.requests.clear()
+        rerun_cache = module.PolicyFetchCache(tmp_path, ttl=0)
+        analyzer = _analyzer(module, cache=rerun_cache)
+        second = await analyzer.analyze_all_domains({host})
+    finally:
+        await runner.cleanup()
+
+    assert second[host]["robots_content"] == ROBOTS_BODY
+    assert second[host]["llms_content"] == LLMS_BODY
+    assert rerun_cache.revalidated == 2
+    assert sorted(server.requests) == [("/llms.txt", '"l1"'), ("/robots.txt", '"r1"')]
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_entries_skip_network(tmp_path):
+    module = _load_module()
+    server = PolicyServer()
+    runner, host = await _start(server)
+    try:
+        cache = module.PolicyFetchCache(tmp_path, ttl=3600)
+        await _analyzer(module, cache=cache).analyze_all_domains({host})
+        server.requests.clear()
+        rerun_cache = module.PolicyFetchCache(tmp_path, ttl=3600)
+        result = await _analyzer(module, cache=rerun_cache).analyze_all_domains(
+            {host}
+        )
+    finally:
+        await runner.cleanup()
+
+    assert server.requests == []
+    assert rerun_cache.hits >= 2
+    assert result[host]["robots_found"] is True
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_bounded_by_concurrency_limit():
+    module = _load_module()
+    server = PolicyServer(delay=0.05)
+    runner, host = await _start(server)
+    hostname, port = host.split(":")
+    # Distinct hostnames that all resolve to the local server
+    domains = {f"{hostname}:{port}", f"localhost:{port}"}
+    try:
+        analyzer = _analyzer(module, max_concurrency=1)
+        result = await analyzer.analyze_all_domains(domains)
+    finally:
+        await runner.cleanup()
+
+    assert server.max_in_flight == 1
+    assert len(result) == 2
+    assert all(entry["robots_found"] for entry in result.values())
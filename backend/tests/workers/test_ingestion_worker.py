@@ -151,9 +151,67 @@ def test_process_youtube_job_disables_transcript_upload(test_db, monkeypatch):
 
     monkeypatch.setattr(ingestion_worker, "_transcribe_youtube", fake_transcribe)
     monkeypatch.setattr(
-        ingestion_worker, "_write_derivatives_atomically", lambda *_args, **_kwargs: None
+        ingestion_worker,
+        "_write_derivatives_atomically",
+        lambda *_args, **_kwargs: None,
     )
 
     ingestion_worker._process_youtube_job(test_db, job, record)
 
     assert upload_flags == [False]
+
+
+def test_claim_job_skips_jobs_in_backoff(test_db):
+    waiting_id, due_id = uuid4(), uuid4()
+    _make_ingested_file(test_db, waiting_id)
+    _make_ingested_file(test_db, due_id)
+    now = datetime.now(UTC)
+    test_db.add_all(
+        [
+            FileProcessingJob(
+                file_id=waiting_id,
+                status="queued",
+                stage="queued",
+                attempts=1,
+                updated_at=now - timedelta(minutes=5),
+                lease_expires_at=now + timedelta(seconds=30),
+            ),
+            FileProcessingJob(
+                file_id=due_id,
+                status="queued",
+                stage="queued",
+                attempts=0,
+                updated_at=now,
+            ),
+        ]
+    )
+    test_db.commit()
+
+    job = ingestion_worker._claim_job(test_db, "worker-test")
+
+    assert job.file_id == due_id
+    assert job.status == "processing"
+    assert 0 < ingestion_worker._seconds_until_next_retry(test_db) <= 30
+    assert ingestion_worker._claim_job(test_db, "worker-test") is None
+
+
+def test_create_ingestion_wakes_listening_workers(test_db, test_db_engine):
+    from api.services.file_ingestion_service import FileIngestionService
+
+    listener = ingestion_worker._QueueListener(test_db_engine)
+    try:
+        # The first wait starts listening; nothing is queued yet.
+        assert listener.wait(0.01) is False
+
+        FileIngestionService.create_ingestion(
+            test_db,
+            "test-user",
+            filename_original="sample.pdf",
+            mime_original="application/pdf",
+            size_bytes=123,
+        )
+
+        assert listener.wait(5) is True
+        assert listener.wait(0.01) is False
+    finally:
+        listener.close()
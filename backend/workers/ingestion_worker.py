@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import re
+import select
 import shutil
 import statistics
 import subprocess
@@ -25,9 +26,14 @@ from uuid import uuid4
 
 import pdfplumber
 from api.config import settings
-from api.db.session import SessionLocal, set_session_user_id
+from api.db.session import SessionLocal, engine, set_session_user_id
 from api.models.file_ingestion import FileDerivative, FileProcessingJob, IngestedFile
-from api.services.file_ingestion_service import FileIngestionService
+from api.services.embeddings import get_embedder
+from api.services.file_ingestion_service import (
+    INGESTION_JOBS_CHANNEL,
+    FileIngestionService,
+)
+from api.services.semantic_index_service import SemanticIndexService
 from api.services.storage.service import get_storage_backend
 from api.services.website_transcript_service import WebsiteTranscriptService
 from docx import Document
@@ -37,13 +43,18 @@ from PIL import Image
 from pptx import Presentation
 from pypdf import PdfReader
 from python_calamine import CalamineError, CalamineWorkbook, XmlError, ZipError
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm.attributes import flag_modified
 from tabulate import tabulate
 
 LEASE_SECONDS = 180
 HEARTBEAT_SECONDS = 15
 SLEEP_SECONDS = 2
+# Idle workers wait for a NOTIFY and re-check the queue at least this often.
+# Lower it when the database is behind a transaction-mode pooler, which does
+# not deliver notifications.
+POLL_SECONDS = float(os.getenv("INGESTION_POLL_SECONDS", "30"))
+REQUEUE_INTERVAL_SECONDS = 30
 MAX_ATTEMPTS = 3
 BACKOFF_BASE_SECONDS = 2
 BACKOFF_MAX_SECONDS = 60
@@ -236,6 +247,31 @@ def _build_ai_md_payload(
     )
 
 
+def _index_ai_md(
+    db, record: IngestedFile, derivatives: list[DerivativePayload]
+) -> None:
+    """Embed the ai.md derivative into the semantic index, if enabled.
+
+    Runs in a savepoint so an embedding failure never fails the ingestion job.
+    """
+    embedder = get_embedder()
+    ai_md = next((item for item in derivatives if item.kind == "ai_md"), None)
+    if embedder is None or ai_md is None:
+        return
+    try:
+        with db.begin_nested():
+            SemanticIndexService.index_document(
+                db,
+                str(record.user_id),
+                "file",
+                record.id,
+                ai_md.content.decode("utf-8", errors="ignore"),
+                embedder=embedder,
+            )
+    except Exception as exc:
+        logger.warning("Semantic indexing failed file_id=%s: %s", record.id, exc)
+
+
 class IngestionError(Exception):
     def __init__(self, code: str, message: str, retryable: bool = False):
         super().__init__(message)
@@ -273,6 +309,81 @@ def _claim_job(db, worker_id: str) -> FileProcessingJob | None:
     return job
 
 
+def _seconds_until_next_retry(db) -> float | None:
+    next_retry_at = (
+        db.query(func.min(FileProcessingJob.lease_expires_at))
+        .filter(
+            FileProcessingJob.status == "queued",
+            FileProcessingJob.lease_expires_at.is_not(None),
+        )
+        .scalar()
+    )
+    if next_retry_at is None:
+        return None
+    return max((next_retry_at - _now()).total_seconds(), 0.0)
+
+
+class _QueueListener:
+    """LISTEN for queued-job notifications on a dedicated connection.
+
+    Retries are queued with a future lease and send no notification, so
+    callers cap the wait at the next retry time. If the connection fails
+    the listener falls back to sleeping and reconnects on the next wait.
+    """
+
+    def __init__(self, bind=None) -> None:
+        self._bind = bind if bind is not None else engine
+        self._connection = None
+
+    def _listen(self):
+        raw = self._bind.raw_connection()
+        connection = raw.driver_connection
+        # Keep it out of the pool: it stays in autocommit LISTEN mode.
+        raw.detach()
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {INGESTION_JOBS_CHANNEL}")
+        self._connection = connection
+        return connection
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a job is queued or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if a notification arrived.
+        """
+        if timeout <= 0:
+            return False
+        try:
+            connection = self._connection or self._listen()
+            if not connection.notifies:
+                ready, _, _ = select.select([connection], [], [], timeout)
+                if not ready:
+                    return False
+                connection.poll()
+            notified = bool(connection.notifies)
+            connection.notifies.clear()
+            return notified
+        except Exception:
+            logger.warning("Job notifications unavailable, polling", exc_info=True)
+            self.close()
+            time.sleep(timeout)
+            return False
+
+    def close(self) -> None:
+        """Close the listening connection."""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
 def _refresh_lease(db, job: FileProcessingJob) -> None:
     job.lease_expires_at = _now() + timedelta(seconds=LEASE_SECONDS)
     job.updated_at = _now()
@@ -1735,6 +1846,7 @@ def _process_simple_file(
                         created_at=now,
                     )
                 )
+            _index_ai_md(db, record, derivatives)
             db.commit()
 
 
@@ -1885,6 +1997,7 @@ def _process_youtube_job(db, job: FileProcessingJob, record: IngestedFile) -> No
                                 created_at=now,
                             )
                         )
+                    _index_ai_md(db, record, derivatives)
                     db.commit()
 
                 if transcript_target:
@@ -1956,16 +2069,35 @@ def worker_loop() -> None:
                 _, rest = rest.split("@", 1)
             safe_url = f"{scheme}://{rest}"
         logger.info("Ingestion DB URL: %s", safe_url)
+    listener = _QueueListener()
+    try:
+        _run_jobs(worker_id, worker_user_id, listener)
+    finally:
+        listener.close()
+
+
+def _run_jobs(
+    worker_id: str, worker_user_id: str | None, listener: _QueueListener
+) -> None:
+    # Claim until the queue is empty, then wait for a NOTIFY (or the poll,
+    # retry or requeue deadline). Stalled-job requeue runs on its own timer.
+    next_requeue_at = 0.0
     while True:
         with SessionLocal() as db:
             try:
                 if worker_user_id:
                     set_session_user_id(db, worker_user_id)
-                _requeue_stalled_jobs(db)
+                if time.monotonic() >= next_requeue_at:
+                    _requeue_stalled_jobs(db)
+                    next_requeue_at = time.monotonic() + REQUEUE_INTERVAL_SECONDS
                 job = _claim_job(db, worker_id)
                 if not job:
+                    timeout = min(POLL_SECONDS, next_requeue_at - time.monotonic())
+                    retry_in = _seconds_until_next_retry(db)
+                    if retry_in is not None:
+                        timeout = min(timeout, retry_in)
                     db.rollback()
-                    time.sleep(SLEEP_SECONDS)
+                    listener.wait(timeout)
                     continue
 
                 record: IngestedFile | None = None
@@ -2215,6 +2347,7 @@ def worker_loop() -> None:
                                             created_at=now,
                                         )
                                     )
+                                _index_ai_md(db, record, derivatives)
                                 db.commit()
 
                         db.refresh(job)
@@ -2246,7 +2379,6 @@ def worker_loop() -> None:
                         )
             finally:
                 db.rollback()
-        time.sleep(SLEEP_SECONDS)
 
 
 if __name__ == "__main__":
@@ -2255,4 +2387,4 @@ if __name__ == "__main__":
             worker_loop()
         except Exception:
             logger.exception("Ingestion worker crashed, restarting after delay")
-            time.sleep(2)
+            time.sleep(SLEEP_SECONDS)